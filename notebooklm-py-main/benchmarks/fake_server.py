@@ -0,0 +1,934 @@
+#!/usr/bin/env python3
+"""Fake NotebookLM Server - A local stand-in for load and end-to-end testing.
+
+Implements the endpoints the client talks to, with in-memory state per
+account (the SID cookie):
+
+    GET  /                          homepage with CSRF token and session ID
+    POST .../data/batchexecute      RPCs by RPCMethod (notebooks, sources,
+                                    artifacts, notes, settings)
+    POST .../GenerateFreeFormStreamed
+                                    streamed chat answers
+    POST /upload/_/                 resumable upload protocol (start, then
+                                    "upload, finalize")
+    GET  /media/<artifact_id>       artifact downloads (with Range support)
+    GET  /_fake/stats               request counters as JSON
+
+Latency, failure injection, per-account rate limits, generation quotas and
+how long sources and artifacts take to become ready are all configurable,
+so the client (or an application built on it) can be load-tested without
+touching the real service. The server needs nothing beyond the standard
+library: FakeNotebookLM is a plain ASGI app (usable with httpx.ASGITransport
+or any ASGI server) and start_server() runs it over HTTP/1.1 with asyncio.
+
+Point a client at it through the URL overrides (printed on startup):
+
+    python benchmarks/fake_server.py --port 8765 --latency 0.05 --generation-seconds 30
+    eval "$(python benchmarks/fake_server.py --port 8765 --print-env)"
+    python my_load_test.py
+
+Usage:
+    python benchmarks/fake_server.py
+    python benchmarks/fake_server.py --failure-rate 0.02 --rate-limit 5
+    python benchmarks/fake_server.py --source-seconds 3 --chat-chunks 8 --chat-chunk-delay 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import re
+import secrets
+import sys
+import time
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from pathlib import PurePosixPath
+from typing import Any
+from urllib.parse import parse_qs, unquote
+
+BATCHEXECUTE_PATH = "/_/LabsTailwindUi/data/batchexecute"
+QUERY_PATH = (
+    "/_/LabsTailwindUi/data/google.internal.labs.tailwind.orchestration.v1."
+    "LabsTailwindOrchestrationService/GenerateFreeFormStreamed"
+)
+UPLOAD_PATH = "/upload/_/"
+MEDIA_PATH = "/media/"
+STATS_PATH = "/_fake/stats"
+
+# Marker the client looks for in a null RPC result to detect quota errors
+USER_DISPLAYABLE_ERROR = (
+    "type.googleapis.com/google.internal.labs.tailwind.orchestration.v1.UserDisplayableError"
+)
+
+# Source status codes (SourceStatus) and artifact status codes (ArtifactStatus)
+SOURCE_PROCESSING, SOURCE_READY, SOURCE_PREPARING = 1, 2, 5
+ARTIFACT_PROCESSING, ARTIFACT_COMPLETED = 1, 3
+
+# StudioContentType codes and how their downloads are served
+AUDIO, VIDEO, INFOGRAPHIC, SLIDE_DECK = 1, 3, 7, 8
+ARTIFACT_TITLES = {
+    1: "Audio Overview",
+    2: "Report",
+    3: "Video Overview",
+    4: "Quiz",
+    7: "Infographic",
+    8: "Slide Deck",
+    9: "Data Table",
+}
+MEDIA_TYPES = {
+    AUDIO: ("audio/mp4", b"\x00\x00\x00\x18ftypM4A "),
+    VIDEO: ("video/mp4", b"\x00\x00\x00\x18ftypmp42"),
+    INFOGRAPHIC: ("image/png", b"\x89PNG\r\n\x1a\n"),
+    SLIDE_DECK: ("application/pdf", b"%PDF-1.4\n"),
+}
+
+# SourceType codes by file extension (anything else is treated as a PDF)
+UPLOAD_TYPE_CODES = {
+    ".txt": 4,
+    ".md": 8,
+    ".mp3": 10,
+    ".m4a": 10,
+    ".mp4": 10,
+    ".wav": 10,
+    ".docx": 11,
+    ".jpg": 13,
+    ".jpeg": 13,
+    ".png": 13,
+    ".csv": 16,
+}
+PDF, PASTED_TEXT, WEB_PAGE, YOUTUBE = 3, 4, 5, 9
+
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour knobs for FakeNotebookLM.
+
+    Attributes:
+        latency: Seconds added to every response.
+        jitter: Extra random delay, uniform between 0 and this many seconds.
+        failure_rate: Fraction of API requests answered with failure_status.
+        failure_status: HTTP status of injected failures.
+        rate_limit: Requests per second allowed per account (token bucket with
+            a burst of the same size). Excess requests get a 429 with
+            Retry-After. None disables rate limiting.
+        generation_quota: Artifacts each account may generate before
+            generation returns a quota error. None means unlimited.
+        source_seconds: Seconds an uploaded or added source stays processing.
+        generation_seconds: Seconds an artifact takes to complete.
+        chat_chunks: Number of chunks a chat answer is streamed in.
+        chat_chunk_delay: Seconds between streamed chat chunks.
+        media_bytes: Size of each downloaded artifact file.
+        seed: Seed for jitter and failure injection, for repeatable runs.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    failure_status: int = 500
+    rate_limit: float | None = None
+    generation_quota: int | None = None
+    source_seconds: float = 0.0
+    generation_seconds: float = 5.0
+    chat_chunks: int = 4
+    chat_chunk_delay: float = 0.0
+    media_bytes: int = 64 * 1024
+    seed: int | None = None
+
+
+@dataclass
+class _Source:
+    id: str
+    title: str
+    type_code: int
+    created: float
+    url: str | None = None
+    ready_at: float | None = None  # None until the file upload is finalized
+    size: int = 0
+
+    def row(self, now: float) -> list[Any]:
+        if self.ready_at is None:
+            status = SOURCE_PREPARING
+        else:
+            status = SOURCE_READY if now >= self.ready_at else SOURCE_PROCESSING
+        metadata: list[Any] = [
+            None,
+            self.size,
+            [int(self.created), 0],
+            None,
+            self.type_code,
+            None,
+            None,
+        ]
+        metadata.append([self.url] if self.url else None)
+        return [[self.id], self.title, metadata, [None, status]]
+
+
+@dataclass
+class _Artifact:
+    id: str
+    notebook_id: str
+    type_code: int
+    title: str
+    created: float
+    ready_at: float
+
+    def row(self, now: float, base_url: str) -> list[Any]:
+        done = now >= self.ready_at
+        row: list[Any] = [None] * 19
+        row[0] = self.id
+        row[1] = self.title
+        row[2] = self.type_code
+        row[4] = ARTIFACT_COMPLETED if done else ARTIFACT_PROCESSING
+        row[15] = [int(self.created), 0]
+        if not done or self.type_code not in MEDIA_TYPES:
+            return row
+
+        url = f"{base_url}{MEDIA_PATH}{self.id}"
+        mime_type = MEDIA_TYPES[self.type_code][0]
+        if self.type_code == AUDIO:
+            row[6] = [None, None, None, None, None, [[url, None, mime_type]]]
+        elif self.type_code == VIDEO:
+            row[8] = [[[url, None, mime_type]]]
+        elif self.type_code == SLIDE_DECK:
+            row[16] = [None, self.title, [], url]
+        elif self.type_code == INFOGRAPHIC:
+            row[18] = [None, None, [[None, [url]]]]
+        return row
+
+
+@dataclass
+class _Notebook:
+    id: str
+    title: str
+    created: float
+    sources: dict[str, _Source] = field(default_factory=dict)
+    artifacts: dict[str, _Artifact] = field(default_factory=dict)
+
+    def row(self, now: float, with_sources: bool = False) -> list[Any]:
+        sources = [s.row(now) for s in self.sources.values()] if with_sources else None
+        created = [int(self.created), 0]
+        return [
+            self.title,
+            sources,
+            self.id,
+            None,
+            None,
+            [1, False, True, None, None, created, None, None, created],
+        ]
+
+
+@dataclass
+class _Account:
+    notebooks: dict[str, _Notebook] = field(default_factory=dict)
+    language: str = "en"
+    generated: int = 0
+    tokens: float = 0.0
+    refilled: float = 0.0
+
+
+class RPCFailure(Exception):
+    """Raised by an RPC handler to answer with an "er" entry."""
+
+    def __init__(self, code: int):
+        super().__init__(code)
+        self.code = code
+
+
+class QuotaExceeded(Exception):
+    """Raised by an RPC handler to answer with a UserDisplayableError."""
+
+
+@dataclass
+class _Call:
+    """One RPC inside a batchexecute request."""
+
+    account: _Account
+    params: list[Any]
+    base_url: str
+
+
+Handler = Callable[[_Call], Any]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+
+
+class FakeNotebookLM:
+    """ASGI app standing in for notebooklm.google.com.
+
+    State lives in memory and is kept per account, keyed by the SID cookie.
+    Sources become ready config.source_seconds after their upload finishes
+    and artifacts complete config.generation_seconds after generation
+    starts, measured with time.monotonic(). Counters for every route and
+    response status are kept in ``stats``.
+
+    Example:
+        app = FakeNotebookLM(FakeServerConfig(latency=0.05))
+        server = await start_server(app, port=8765)
+    """
+
+    def __init__(self, config: FakeServerConfig | None = None):
+        self.config = config or FakeServerConfig()
+        self.stats: Counter[str] = Counter()
+        self._accounts: dict[str, _Account] = {}
+        self._artifacts: dict[str, _Artifact] = {}
+        self._uploads: dict[str, _Source] = {}
+        self._csrf_tokens: set[str] = set()
+        self._random = random.Random(self.config.seed)
+        self._reqid = itertools.count(1)
+        self._rpc_handlers: dict[str, Handler] = {
+            "wXbhsf": self._list_notebooks,
+            "CCqFvf": self._create_notebook,
+            "rLM1Ne": self._get_notebook,
+            "s0tc2d": self._rename_notebook,
+            "WWINqb": self._delete_notebook,
+            "izAoDd": self._add_source,
+            "o4cbdc": self._register_file,
+            "tGMBJ": self._delete_source,
+            "R7cb6c": self._generate,
+            "gArtLc": self._list_artifacts,
+            "V5N4be": self._delete_artifact,
+            "cFji9": self._list_notes,
+            "hPTbtc": self._conversation_history,
+            "hT54vc": self._set_settings,
+            "ZwVcOc": self._get_settings,
+        }
+
+    # =========================================================================
+    # ASGI plumbing
+    # =========================================================================
+
+    async def __call__(self, scope: dict[str, Any], receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            while (await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+        request = _Request(scope, await _read_body(receive))
+        route = self._route(request)
+        self.stats[route] += 1
+
+        if route in ("homepage", "stats"):
+            status = await self._dispatch(route, request, send)
+            self.stats[f"http_{status}"] += 1
+            return
+
+        await self._delay()
+        account = self._account(request)
+        retry_after = self._take_token(account)
+        if retry_after is not None:
+            status = await _respond(
+                send, 429, b"Too Many Requests", {"retry-after": str(math.ceil(retry_after))}
+            )
+        elif self._random.random() < self.config.failure_rate:
+            status = await _respond(send, self.config.failure_status, b"Injected failure")
+        else:
+            status = await self._dispatch(route, request, send)
+        self.stats[f"http_{status}"] += 1
+
+    def _route(self, request: _Request) -> str:
+        path = request.path
+        if request.method == "GET" and path == STATS_PATH:
+            return "stats"
+        if request.method == "GET" and path.startswith(MEDIA_PATH):
+            return "download"
+        if request.method == "POST" and path.endswith("/batchexecute"):
+            return "batchexecute"
+        if request.method == "POST" and path.endswith("/GenerateFreeFormStreamed"):
+            return "chat"
+        if request.method == "POST" and path.startswith(UPLOAD_PATH):
+            return "upload"
+        if request.method == "GET":
+            return "homepage"
+        return "unknown"
+
+    async def _dispatch(self, route: str, request: _Request, send: Send) -> int:
+        if route == "homepage":
+            return await self._homepage(request, send)
+        if route == "stats":
+            body = json.dumps(dict(self.stats), sort_keys=True).encode()
+            return await _respond(send, 200, body, {"content-type": "application/json"})
+        if route == "download":
+            return await self._download(request, send)
+        if route == "batchexecute":
+            return await self._batchexecute(request, send)
+        if route == "chat":
+            return await self._chat(request, send)
+        if route == "upload":
+            return await self._upload(request, send)
+        return await _respond(send, 404, b"Not Found")
+
+    async def _delay(self) -> None:
+        delay = self.config.latency
+        if self.config.jitter:
+            delay += self._random.uniform(0, self.config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _account(self, request: _Request) -> _Account:
+        sid = request.cookies.get("SID", "")
+        account = self._accounts.get(sid)
+        if account is None:
+            account = _Account(refilled=time.monotonic())
+            if self.config.rate_limit:
+                account.tokens = max(self.config.rate_limit, 1.0)
+            self._accounts[sid] = account
+        return account
+
+    def _take_token(self, account: _Account) -> float | None:
+        """Spend one request from the account's bucket; return seconds to wait if empty."""
+        rate = self.config.rate_limit
+        if not rate:
+            return None
+        now = time.monotonic()
+        account.tokens = min(max(rate, 1.0), account.tokens + (now - account.refilled) * rate)
+        account.refilled = now
+        if account.tokens < 1.0:
+            return (1.0 - account.tokens) / rate
+        account.tokens -= 1.0
+        return None
+
+    # =========================================================================
+    # Endpoints
+    # =========================================================================
+
+    async def _homepage(self, request: _Request, send: Send) -> int:
+        csrf_token = f"fake-csrf-{secrets.token_hex(8)}"
+        session_id = str(secrets.randbelow(10**19))
+        self._csrf_tokens.add(csrf_token)
+        page = (
+            "<!doctype html><html><head><title>NotebookLM</title><script>"
+            f'window.WIZ_global_data = {{"SNlM0e":"{csrf_token}","FdrFJe":"{session_id}"}};'
+            "</script></head><body></body></html>"
+        )
+        return await _respond(send, 200, page.encode(), {"content-type": "text/html"})
+
+    async def _batchexecute(self, request: _Request, send: Send) -> int:
+        form = request.form()
+        if form.get("at") not in self._csrf_tokens:
+            return await _respond(send, 401, b"Unauthorized")
+        try:
+            calls = json.loads(form["f.req"])[0]
+        except (KeyError, IndexError, TypeError, ValueError):
+            return await _respond(send, 400, b"Bad Request")
+
+        account = self._account(request)
+        chunks = [self._call_rpc(account, rpc, request.base_url) for rpc in calls]
+        chunks.append([["di", 42], ["af.httprm", 41, str(next(self._reqid)), 1]])
+        return await _respond(
+            send,
+            200,
+            (")]}'\n" + _frame(chunks)).encode(),
+            {"content-type": "application/json; charset=utf-8"},
+        )
+
+    def _call_rpc(self, account: _Account, request: list[Any], base_url: str) -> list[Any]:
+        rpc_id, params_json = request[0], request[1]
+        tag = request[3] if len(request) > 3 else "generic"
+        self.stats[f"rpc_{rpc_id}"] += 1
+        handler = self._rpc_handlers.get(rpc_id)
+        try:
+            if handler is None:
+                raise RPCFailure(501)
+            params = json.loads(params_json) if params_json else []
+            result = handler(_Call(account, params, base_url))
+        except RPCFailure as e:
+            return [["er", rpc_id, e.code, None, None, None, tag]]
+        except QuotaExceeded:
+            error = [8, None, [[USER_DISPLAYABLE_ERROR, [None, [[1]]]]]]
+            return [["wrb.fr", rpc_id, None, None, None, error, tag]]
+        except (IndexError, KeyError, TypeError, ValueError):
+            return [["er", rpc_id, 400, None, None, None, tag]]
+        payload = json.dumps(result) if result is not None else None
+        return [["wrb.fr", rpc_id, payload, None, None, None, tag]]
+
+    async def _chat(self, request: _Request, send: Send) -> int:
+        form = request.form()
+        if form.get("at") not in self._csrf_tokens:
+            return await _respond(send, 401, b"Unauthorized")
+        try:
+            params = json.loads(json.loads(form["f.req"])[1])
+            question = params[1]
+        except (KeyError, IndexError, TypeError, ValueError):
+            return await _respond(send, 400, b"Bad Request")
+
+        answer = f"This is a fake answer to the question: {question}"
+        words = answer.split(" ")
+        parts = max(1, min(self.config.chat_chunks, len(words)))
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json; charset=utf-8")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b")]}'\n", "more_body": True})
+        for part in range(1, parts + 1):
+            text = " ".join(words[: len(words) * part // parts])
+            inner: list[Any] = [[text, None, [], None, [[], None, None, [], 1]]]
+            chunk = _frame([[["wrb.fr", None, json.dumps(inner)]]])
+            await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+            if part < parts and self.config.chat_chunk_delay > 0:
+                await asyncio.sleep(self.config.chat_chunk_delay)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+        return 200
+
+    async def _upload(self, request: _Request, send: Send) -> int:
+        command = request.headers.get("x-goog-upload-command", "")
+        if command == "start":
+            try:
+                info = json.loads(request.body)
+                notebook = self._notebook(self._account(request), info["PROJECT_ID"])
+                source = notebook.sources[info["SOURCE_ID"]]
+            except (KeyError, TypeError, ValueError, RPCFailure):
+                return await _respond(send, 400, b"Bad Request")
+            upload_id = uuid.uuid4().hex
+            self._uploads[upload_id] = source
+            upload_url = f"{request.base_url}{UPLOAD_PATH}?upload_id={upload_id}"
+            headers = {"x-goog-upload-status": "active", "x-goog-upload-url": upload_url}
+            return await _respond(send, 200, b"", headers)
+
+        if "upload" in command:
+            upload_id = request.query.get("upload_id", "")
+            uploaded = self._uploads.get(upload_id)
+            if uploaded is None:
+                return await _respond(send, 404, b"Unknown upload")
+            del self._uploads[upload_id]
+            uploaded.size = len(request.body)
+            uploaded.ready_at = time.monotonic() + self.config.source_seconds
+            self.stats["upload_bytes"] += len(request.body)
+            return await _respond(send, 200, b"", {"x-goog-upload-status": "final"})
+
+        return await _respond(send, 400, b"Bad Request")
+
+    async def _download(self, request: _Request, send: Send) -> int:
+        artifact = self._artifacts.get(request.path[len(MEDIA_PATH) :])
+        if (
+            artifact is None
+            or artifact.type_code not in MEDIA_TYPES
+            or time.monotonic() < artifact.ready_at
+        ):
+            return await _respond(send, 404, b"Not Found")
+        mime_type, magic = MEDIA_TYPES[artifact.type_code]
+        body = (magic + b"\0" * self.config.media_bytes)[: max(self.config.media_bytes, len(magic))]
+        headers = {"content-type": mime_type, "etag": f'"{artifact.id}"', "accept-ranges": "bytes"}
+
+        # Open-ended ranges ("bytes=N-"), as sent when resuming a download
+        match = re.fullmatch(r"bytes=(\d+)-", request.headers.get("range", ""))
+        if_range = request.headers.get("if-range")
+        if match and (if_range is None or if_range == headers["etag"]):
+            start = int(match.group(1))
+            if start >= len(body):
+                return await _respond(send, 416, b"", {"content-range": f"bytes */{len(body)}"})
+            headers["content-range"] = f"bytes {start}-{len(body) - 1}/{len(body)}"
+            self.stats["download_resumed"] += 1
+            self.stats["download_bytes"] += len(body) - start
+            return await _respond(send, 206, body[start:], headers)
+
+        self.stats["download_bytes"] += len(body)
+        return await _respond(send, 200, body, headers)
+
+    # =========================================================================
+    # RPC handlers
+    # =========================================================================
+
+    def _notebook(self, account: _Account, notebook_id: str) -> _Notebook:
+        notebook = account.notebooks.get(notebook_id)
+        if notebook is None:
+            raise RPCFailure(404)
+        return notebook
+
+    def _list_notebooks(self, call: _Call) -> Any:
+        now = time.monotonic()
+        return [[nb.row(now) for nb in call.account.notebooks.values()]]
+
+    def _create_notebook(self, call: _Call) -> Any:
+        notebook = _Notebook(id=str(uuid.uuid4()), title=call.params[0] or "", created=time.time())
+        call.account.notebooks[notebook.id] = notebook
+        return notebook.row(time.monotonic())
+
+    def _get_notebook(self, call: _Call) -> Any:
+        notebook = self._notebook(call.account, call.params[0])
+        return [notebook.row(time.monotonic(), with_sources=True)]
+
+    def _rename_notebook(self, call: _Call) -> Any:
+        notebook = self._notebook(call.account, call.params[0])
+        title = call.params[1][0][3][1]
+        if title is not None:
+            notebook.title = title
+        return None
+
+    def _delete_notebook(self, call: _Call) -> Any:
+        for notebook_id in call.params[0]:
+            notebook = call.account.notebooks.pop(notebook_id, None)
+            if notebook is not None:
+                for artifact_id in notebook.artifacts:
+                    self._artifacts.pop(artifact_id, None)
+        return []
+
+    def _add_source(self, call: _Call) -> Any:
+        notebook = self._notebook(call.account, call.params[1])
+        spec = call.params[0][0]
+        if spec[1]:  # [title, content]
+            title, type_code, url = spec[1][0], PASTED_TEXT, None
+        else:
+            url = spec[2][0] if spec[2] else spec[7][0]
+            type_code = YOUTUBE if "youtu" in url else WEB_PAGE
+            title = url
+        source = _Source(
+            id=str(uuid.uuid4()),
+            title=title,
+            type_code=type_code,
+            created=time.time(),
+            url=url,
+            ready_at=time.monotonic() + self.config.source_seconds,
+        )
+        notebook.sources[source.id] = source
+        return [[source.row(time.monotonic())]]
+
+    def _register_file(self, call: _Call) -> Any:
+        notebook = self._notebook(call.account, call.params[1])
+        filename = call.params[0][0][0]
+        source = _Source(
+            id=str(uuid.uuid4()),
+            title=filename,
+            type_code=UPLOAD_TYPE_CODES.get(PurePosixPath(filename).suffix.lower(), PDF),
+            created=time.time(),
+        )
+        notebook.sources[source.id] = source
+        return [[[[source.id], filename]]]
+
+    def _delete_source(self, call: _Call) -> Any:
+        source_id = call.params[0][0][0]
+        for notebook in call.account.notebooks.values():
+            notebook.sources.pop(source_id, None)
+        return []
+
+    def _generate(self, call: _Call) -> Any:
+        notebook = self._notebook(call.account, call.params[1])
+        type_code = call.params[2][2]
+        quota = self.config.generation_quota
+        if quota is not None and call.account.generated >= quota:
+            raise QuotaExceeded()
+        call.account.generated += 1
+        now = time.monotonic()
+        artifact = _Artifact(
+            id=str(uuid.uuid4()),
+            notebook_id=notebook.id,
+            type_code=type_code,
+            title=ARTIFACT_TITLES.get(type_code, "Artifact"),
+            created=time.time(),
+            ready_at=now + self.config.generation_seconds,
+        )
+        notebook.artifacts[artifact.id] = artifact
+        self._artifacts[artifact.id] = artifact
+        return [artifact.row(now, call.base_url)]
+
+    def _list_artifacts(self, call: _Call) -> Any:
+        if isinstance(call.params[0], str):
+            # POLL_STUDIO shares this RPC ID; like the real service, answer
+            # with null so the client falls back to listing
+            return None
+        notebook = self._notebook(call.account, call.params[1])
+        now = time.monotonic()
+        return [[a.row(now, call.base_url) for a in notebook.artifacts.values()]]
+
+    def _delete_artifact(self, call: _Call) -> Any:
+        artifact = self._artifacts.pop(call.params[1], None)
+        if artifact is not None:
+            notebook = call.account.notebooks.get(artifact.notebook_id)
+            if notebook is not None:
+                notebook.artifacts.pop(artifact.id, None)
+        return []
+
+    def _list_notes(self, call: _Call) -> Any:
+        self._notebook(call.account, call.params[0])
+        return [[]]
+
+    def _conversation_history(self, call: _Call) -> Any:
+        return [[]]
+
+    def _set_settings(self, call: _Call) -> Any:
+        call.account.language = call.params[0][0][1][0][4][0]
+        return [None, None, [None, None, None, None, [call.account.language]]]
+
+    def _get_settings(self, call: _Call) -> Any:
+        return [[None, None, [None, None, None, None, [call.account.language]]]]
+
+
+class _Request:
+    """The parts of an ASGI HTTP request the endpoints need."""
+
+    def __init__(self, scope: dict[str, Any], body: bytes):
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self.body = body
+        self.query = {
+            k: v[0] for k, v in parse_qs(scope.get("query_string", b"").decode("latin-1")).items()
+        }
+        self.headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        self.cookies: dict[str, str] = {}
+        for pair in self.headers.get("cookie", "").split(";"):
+            name, _, value = pair.strip().partition("=")
+            if name:
+                self.cookies[name] = value
+        host = self.headers.get("host")
+        if not host and scope.get("server"):
+            host = "{}:{}".format(*scope["server"])
+        self.base_url = f"{scope.get('scheme', 'http')}://{host or 'localhost'}"
+
+    def form(self) -> dict[str, str]:
+        return {k: v[0] for k, v in parse_qs(self.body.decode()).items()}
+
+
+async def _read_body(receive: Receive) -> bytes:
+    parts = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        parts.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return b"".join(parts)
+
+
+async def _respond(
+    send: Send, status: int, body: bytes, headers: dict[str, str] | None = None
+) -> int:
+    raw_headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in (headers or {}).items()]
+    raw_headers.append((b"content-length", str(len(body)).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+    await send({"type": "http.response.body", "body": body})
+    return status
+
+
+def _frame(chunks: list[Any]) -> str:
+    """Encode chunks in the length-prefixed rt=c format."""
+    parts = []
+    for chunk in chunks:
+        payload = json.dumps(chunk, separators=(",", ":"))
+        parts.append(f"\n{len(payload) + 1}\n{payload}")
+    parts.append("\n")
+    return "".join(parts)
+
+
+# =============================================================================
+# HTTP/1.1 server
+# =============================================================================
+
+
+async def start_server(
+    app: Callable[..., Awaitable[None]], host: str = "127.0.0.1", port: int = 8765
+) -> asyncio.Server:
+    """Serve an ASGI app over plain HTTP/1.1 with keep-alive.
+
+    Minimal by design (no TLS, no upgrades, no 100-continue), but enough for
+    httpx clients, including chunked request bodies and streamed responses.
+    Pass port=0 to pick a free port; read it from server.sockets.
+
+    Returns:
+        The started asyncio.Server.
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while await _serve_one(app, reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+async def _serve_one(
+    app: Callable[..., Awaitable[None]],
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> bool:
+    """Serve one request from the connection; return False once it should close."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return False
+    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+    headers: list[tuple[bytes, bytes]] = []
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers.append((name.strip().lower().encode("latin-1"), value.strip().encode("latin-1")))
+    header_map = dict(headers)
+
+    if header_map.get(b"transfer-encoding", b"").lower() == b"chunked":
+        parts = []
+        while size := int((await reader.readline()).split(b";")[0], 16):
+            parts.append(await reader.readexactly(size))
+            await reader.readline()
+        while await reader.readline() not in (b"\r\n", b"\n", b""):
+            pass  # trailers
+        body = b"".join(parts)
+    else:
+        body = await reader.readexactly(int(header_map.get(b"content-length", b"0")))
+
+    path, _, query = target.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": unquote(path),
+        "raw_path": path.encode("latin-1"),
+        "query_string": query.encode("latin-1"),
+        "headers": headers,
+        "server": writer.get_extra_info("sockname")[:2],
+        "client": (writer.get_extra_info("peername") or ("", 0))[:2],
+    }
+    received = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    chunked = True
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal chunked
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n".encode("latin-1")]
+            for name, value in message.get("headers", []):
+                if name.lower() == b"content-length":
+                    chunked = False
+                lines.append(name + b": " + value + b"\r\n")
+            if chunked:
+                lines.append(b"transfer-encoding: chunked\r\n")
+            lines.append(b"\r\n")
+            writer.write(b"".join(lines))
+        elif message["type"] == "http.response.body":
+            data = message.get("body", b"")
+            more = message.get("more_body", False)
+            if not chunked:
+                writer.write(data)
+            else:
+                if data:
+                    writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+                if not more:
+                    writer.write(b"0\r\n\r\n")
+            await writer.drain()
+
+    await app(scope, receive, send)
+    return header_map.get(b"connection", b"").lower() != b"close"
+
+
+def client_env(base_url: str, sid: str = "fake-sid") -> dict[str, str]:
+    """Environment variables that point NotebookLMClient at a fake server.
+
+    Args:
+        base_url: Server root, e.g. "http://127.0.0.1:8765".
+        sid: SID cookie for the inline auth JSON. Use a different value per
+            simulated account.
+
+    Returns:
+        NOTEBOOKLM_* URL overrides, inline auth and a disabled token cache.
+    """
+    base_url = base_url.rstrip("/")
+    auth = {"cookies": [{"name": "SID", "value": sid, "domain": ".google.com", "path": "/"}]}
+    return {
+        "NOTEBOOKLM_HOMEPAGE_URL": f"{base_url}/",
+        "NOTEBOOKLM_BATCHEXECUTE_URL": f"{base_url}{BATCHEXECUTE_PATH}",
+        "NOTEBOOKLM_QUERY_URL": f"{base_url}{QUERY_PATH}",
+        "NOTEBOOKLM_UPLOAD_URL": f"{base_url}{UPLOAD_PATH}",
+        "NOTEBOOKLM_AUTH_JSON": json.dumps(auth),
+        "NOTEBOOKLM_TOKEN_CACHE": "0",
+    }
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run a local stand-in for NotebookLM")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra delay (seconds)")
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="Fraction of requests that fail"
+    )
+    parser.add_argument(
+        "--failure-status", type=int, default=500, help="HTTP status of injected failures"
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, help="Requests per second per account before 429s"
+    )
+    parser.add_argument("--generation-quota", type=int, help="Artifacts per account")
+    parser.add_argument(
+        "--source-seconds", type=float, default=0.0, help="Time for sources to be ready"
+    )
+    parser.add_argument(
+        "--generation-seconds", type=float, default=5.0, help="Time for artifacts to complete"
+    )
+    parser.add_argument("--chat-chunks", type=int, default=4, help="Chunks per chat answer")
+    parser.add_argument(
+        "--chat-chunk-delay", type=float, default=0.0, help="Seconds between chat chunks"
+    )
+    parser.add_argument(
+        "--media-bytes", type=int, default=64 * 1024, help="Size of downloaded files"
+    )
+    parser.add_argument("--seed", type=int, help="Seed for jitter and failure injection")
+    parser.add_argument(
+        "--print-env", action="store_true", help="Print client environment exports and exit"
+    )
+    args = parser.parse_args()
+
+    base_url = f"http://{args.host}:{args.port}"
+    exports = "\n".join(f"export {k}='{v}'" for k, v in client_env(base_url).items())
+    if args.print_env:
+        print(exports)
+        return 0
+
+    config = FakeServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        rate_limit=args.rate_limit,
+        generation_quota=args.generation_quota,
+        source_seconds=args.source_seconds,
+        generation_seconds=args.generation_seconds,
+        chat_chunks=args.chat_chunks,
+        chat_chunk_delay=args.chat_chunk_delay,
+        media_bytes=args.media_bytes,
+        seed=args.seed,
+    )
+    app = FakeNotebookLM(config)
+
+    async def serve() -> None:
+        server = await start_server(app, args.host, args.port)
+        print(f"Fake NotebookLM listening on {base_url}")
+        print("Point clients at it with:")
+        print(exports)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print(json.dumps(dict(app.stats), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
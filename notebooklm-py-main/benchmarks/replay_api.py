@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""API Replay Benchmark - Time the sub-APIs against recorded cassettes, offline.
+
+Replays the VCR cassettes in tests/cassettes/ through the real client code
+path (NotebookLMClient -> sub-API -> ClientCore -> PooledTransport) with the
+network layer replaced by an in-memory transport, so request building,
+response decoding and result parsing are measured without network access.
+
+Each scenario runs with the buffered decoder and again with the incremental
+one (stream_responses=True), and for each it reports:
+
+    wall        best and median time per call over --repeat passes
+    throughput  response bytes decoded per second (best pass)
+    peak        peak traced memory during one call (tracemalloc)
+    retained    memory still allocated after the call (tracemalloc)
+
+Results can be saved as JSON and compared between commits:
+
+    python benchmarks/replay_api.py --output before.json
+    git checkout my-branch
+    python benchmarks/replay_api.py --output after.json --compare before.json
+
+With --compare the script exits with status 1 if any scenario's best wall
+time regressed by more than --threshold percent.
+
+Usage:
+    python benchmarks/replay_api.py
+    python benchmarks/replay_api.py --repeat 200 --mode stream
+    python benchmarks/replay_api.py --scenario chat.ask --output chat.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import yaml
+
+from notebooklm import NotebookLMClient
+from notebooklm.auth import AuthTokens
+
+ROOT = Path(__file__).resolve().parent.parent
+CASSETTES_DIR = ROOT / "tests" / "cassettes"
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# IDs only shape the request; responses are matched by RPC ID or URL path
+NOTEBOOK_ID = "167481cd-23a3-4331-9a45-c8948900bf91"
+SOURCE_ID = "benchmark-source"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One sub-API call replayed from one cassette."""
+
+    name: str
+    cassette: str
+    call: Callable[[NotebookLMClient], Awaitable[Any]]
+
+
+SCENARIOS = [
+    Scenario("notebooks.list", "real_api_list_notebooks.yaml", lambda c: c.notebooks.list()),
+    Scenario("sources.list", "real_api_list_sources.yaml", lambda c: c.sources.list(NOTEBOOK_ID)),
+    Scenario(
+        "artifacts.list",
+        "real_api_list_artifacts.yaml",
+        lambda c: c.artifacts.list(NOTEBOOK_ID),
+    ),
+    Scenario(
+        "chat.ask",
+        "chat_ask.yaml",
+        lambda c: c.chat.ask(NOTEBOOK_ID, "What are the key themes?"),
+    ),
+    Scenario(
+        "sources.get_fulltext",
+        "sources_get_fulltext.yaml",
+        lambda c: c.sources.get_fulltext(NOTEBOOK_ID, SOURCE_ID),
+    ),
+]
+
+
+@dataclass
+class Result:
+    """Measurements for one scenario (times in milliseconds per call)."""
+
+    scenario: str
+    cassette: str
+    stream: bool
+    repeat: int
+    requests: int
+    response_bytes: int
+    best_ms: float
+    median_ms: float
+    throughput_mib_s: float
+    peak_kib: float
+    retained_kib: float
+
+
+def _route(request: httpx.Request) -> str:
+    """Key a request by its batchexecute RPC ID, or by URL path for other endpoints."""
+    return request.url.params.get("rpcids") or request.url.path
+
+
+class Replay:
+    """Serves a cassette's recorded responses in place of the network.
+
+    Responses are queued per route and rotated, so the same cassette can be
+    replayed any number of times. The homepage fetch is skipped (tokens are
+    passed to the client directly), so GET / interactions are ignored.
+    """
+
+    def __init__(self, cassette: Path):
+        data = yaml.load(cassette.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
+        self._routes: dict[str, deque[tuple[int, str, bytes]]] = defaultdict(deque)
+        for interaction in data.get("interactions", []):
+            request = httpx.Request(interaction["request"]["method"], interaction["request"]["uri"])
+            if request.method == "GET" and request.url.path == "/":
+                continue
+            response = interaction["response"]
+            content_type = response.get("headers", {}).get("Content-Type", ["text/plain"])[0]
+            body = response["body"]["string"]
+            self._routes[_route(request)].append(
+                (
+                    response["status"]["code"],
+                    content_type,
+                    body.encode() if isinstance(body, str) else body,
+                )
+            )
+        self.requests = 0
+        self.response_bytes = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        queue = self._routes.get(_route(request))
+        if not queue:
+            raise httpx.ConnectError(f"No recorded response for {request.url}", request=request)
+        status, content_type, body = queue[0]
+        queue.rotate(-1)
+        self.requests += 1
+        self.response_bytes += len(body)
+        return httpx.Response(status, headers={"Content-Type": content_type}, content=body)
+
+
+async def _measure(scenario: Scenario, cassettes_dir: Path, repeat: int, stream: bool) -> Result:
+    replay = Replay(cassettes_dir / scenario.cassette)
+
+    async def handle(transport: Any, request: httpx.Request) -> httpx.Response:
+        return await replay.handle_async_request(request)
+
+    auth = AuthTokens(cookies={"SID": "benchmark"}, csrf_token="csrf", session_id="session")
+    with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", handle):
+        async with NotebookLMClient(auth, stream_responses=stream) as client:
+            # Warm-up: first-call imports and caches shouldn't count
+            await scenario.call(client)
+            requests_per_call = replay.requests
+            bytes_per_call = replay.response_bytes
+
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                await scenario.call(client)
+                timings.append(time.perf_counter() - start)
+
+            tracemalloc.start()
+            try:
+                baseline, _ = tracemalloc.get_traced_memory()
+                await scenario.call(client)
+                retained, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+    best = min(timings)
+    return Result(
+        scenario=scenario.name,
+        cassette=scenario.cassette,
+        stream=stream,
+        repeat=repeat,
+        requests=requests_per_call,
+        response_bytes=bytes_per_call,
+        best_ms=best * 1000,
+        median_ms=statistics.median(timings) * 1000,
+        throughput_mib_s=bytes_per_call / best / (1024 * 1024),
+        peak_kib=(peak - baseline) / 1024,
+        retained_kib=(retained - baseline) / 1024,
+    )
+
+
+MODES = {"buffered": (False,), "stream": (True,), "both": (False, True)}
+
+
+def run_suite(
+    scenarios: list[Scenario],
+    cassettes_dir: Path = CASSETTES_DIR,
+    repeat: int = 50,
+    streams: tuple[bool, ...] = MODES["both"],
+) -> list[Result]:
+    """Run each scenario in each decoder mode and return the measurements."""
+    return [
+        asyncio.run(_measure(s, cassettes_dir, repeat, stream))
+        for s in scenarios
+        for stream in streams
+    ]
+
+
+def _label(scenario: str, stream: bool) -> str:
+    return f"{scenario} (stream)" if stream else scenario
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def save(results: list[Result], path: Path) -> None:
+    """Write results plus enough context to tell runs apart."""
+    payload = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(r) for r in results],
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(results: list[Result], baseline_path: Path, threshold: float) -> bool:
+    """Print changes against a saved run. Returns False if anything regressed."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    # Runs saved before both modes were measured have no "stream" field
+    before = {
+        (r["scenario"], r.get("stream", baseline.get("stream_responses", False))): r
+        for r in baseline["results"]
+    }
+    print(f"Compared with {baseline_path} (commit {baseline.get('commit') or 'unknown'})")
+    ok = True
+    for result in results:
+        label = _label(result.scenario, result.stream)
+        old = before.get((result.scenario, result.stream))
+        if old is None:
+            print(f"  {label:<31} new scenario")
+            continue
+        change = (result.best_ms - old["best_ms"]) / old["best_ms"] * 100
+        peak_change = result.peak_kib - old["peak_kib"]
+        marker = ""
+        if change > threshold:
+            marker = "  REGRESSION"
+            ok = False
+        print(
+            f"  {label:<31} {old['best_ms']:8.3f} -> {result.best_ms:8.3f} ms "
+            f"({change:+6.1f}%)  peak {peak_change:+8.1f} KiB{marker}"
+        )
+    return ok
+
+
+def main() -> int:
+    """Main entry point."""
+    names = [s.name for s in SCENARIOS]
+    parser = argparse.ArgumentParser(description="Benchmark sub-APIs against recorded cassettes")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed calls per scenario")
+    parser.add_argument(
+        "--scenario", action="append", choices=names, help="Only run this scenario (repeatable)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=list(MODES),
+        default="both",
+        help="Decoder to measure: buffered, stream (stream_responses) or both (default)",
+    )
+    parser.add_argument("--output", type=Path, help="Save results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results of an earlier run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20.0,
+        help="Percent slowdown of best wall time counted as a regression (default: 20)",
+    )
+    parser.add_argument(
+        "--cassettes", type=Path, default=CASSETTES_DIR, help="Directory of VCR cassettes"
+    )
+    args = parser.parse_args()
+
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    results = run_suite(scenarios, args.cassettes, args.repeat, MODES[args.mode])
+
+    print(f"repeat={args.repeat} mode={args.mode}")
+    print("=" * 95)
+    print(
+        f"{'scenario':<31} {'reqs':>4} {'KiB':>8} {'best ms':>9} {'median ms':>10} "
+        f"{'MiB/s':>8} {'peak KiB':>9} {'kept KiB':>9}"
+    )
+    for r in results:
+        print(
+            f"{_label(r.scenario, r.stream):<31} {r.requests:>4} {r.response_bytes / 1024:>8.1f} "
+            f"{r.best_ms:>9.3f} {r.median_ms:>10.3f} {r.throughput_mib_s:>8.1f} "
+            f"{r.peak_kib:>9.1f} {r.retained_kib:>9.1f}"
+        )
+
+    if args.output:
+        save(results, args.output)
+        print(f"Saved results to {args.output}")
+    if args.compare and not compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
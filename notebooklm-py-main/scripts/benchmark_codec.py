@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Codec Benchmark - Compare JSON backends on one poll-sized RPC round.
+
+Mirrors the wire work per RPC: params and envelope encode, then chunk and
+inner-result decode, on a LIST_ARTIFACTS-shaped result of many small nested
+lists. Every installed backend in notebooklm.rpc.codec.BACKENDS is timed and
+compared with the standard library.
+
+Usage:
+    python scripts/benchmark_codec.py
+    python scripts/benchmark_codec.py --repeat 10 --number 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+import time
+from collections.abc import Callable
+
+from notebooklm.rpc import codec
+
+# Shaped like a LIST_ARTIFACTS poll result: many small nested lists
+POLL_RESULT = [
+    [
+        [f"artifact-{i:04d}", f"Artifact title {i} – ünïcode", 4, [[["src-a"]], [["src-b"]]], 3]
+        + [None] * 10
+        + [[1736000000 + i, 123000000]]
+        for i in range(200)
+    ]
+]
+
+CHUNK = json.dumps([["wrb.fr", "gArtLc", json.dumps(POLL_RESULT), None, None, None, "generic"]])
+
+
+def round_trip() -> None:
+    envelope = [[["gArtLc", codec.dumps(POLL_RESULT), None, "generic"]]]
+    codec.dumps(envelope)
+    codec.loads(codec.loads(CHUNK)[0][2])
+
+
+def best_of(fn: Callable[[], None], repeat: int, number: int) -> float:
+    """Return the best per-call wall time (seconds) of ``repeat`` runs of ``number`` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON codec backends")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs (best is kept)")
+    parser.add_argument("--number", type=int, default=50, help="Round trips per run")
+    args = parser.parse_args()
+
+    backends = [b for b in codec.BACKENDS if b == "json" or importlib.util.find_spec(b)]
+    previous = codec.get_backend()
+    timings = {}
+    try:
+        for backend in backends:
+            codec.set_backend(backend)
+            timings[backend] = best_of(round_trip, args.repeat, args.number)
+    finally:
+        codec.set_backend(previous)
+
+    stdlib = timings["json"]
+    print(f"Backends: {', '.join(backends)}, repeat={args.repeat}, number={args.number}")
+    print("=" * 60)
+    for backend, elapsed in timings.items():
+        print(f"  {backend:<8} {elapsed * 1e6:8.1f} us/call  {stdlib / elapsed:6.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Decoder Benchmark - Compare response decoding strategies on recorded traffic.
+
+Replays every batchexecute response stored in tests/cassettes/ through:
+
+    legacy   parse_chunked_response() + collect_rpc_ids() + extract_rpc_result()
+             (what decode_response() did before ResponseIndex)
+    indexed  ResponseIndex(...).result() (what decode_response() does now)
+
+Two workloads are timed:
+
+    recorded     each response as recorded (one wrb.fr entry per body)
+    multiplexed  groups of --group responses concatenated into one body, the
+                 shape a multiplexed rpc_batch() response has, with each RPC
+                 ID looked up from a freshly decoded body
+
+Both strategies decode the same RPC ID from the same response body, and the
+results are checked for equality before timing.
+
+Usage:
+    python scripts/benchmark_decoder.py
+    python scripts/benchmark_decoder.py --repeat 50 --group 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from notebooklm.rpc import RPCError
+from notebooklm.rpc.decoder import (
+    ResponseIndex,
+    collect_rpc_ids,
+    extract_rpc_result,
+    parse_chunked_response,
+    strip_anti_xssi,
+)
+
+CASSETTES_DIR = Path(__file__).parent.parent / "tests" / "cassettes"
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_responses(cassettes_dir: Path) -> list[tuple[str, str]]:
+    """Return (rpc_id, raw_body) for every batchexecute call in the cassettes."""
+    responses = []
+    for path in sorted(cassettes_dir.glob("*.yaml")):
+        data = yaml.load(path.read_text(), Loader=_YAML_LOADER)
+        for interaction in data.get("interactions", []):
+            uri = interaction["request"]["uri"]
+            if "batchexecute" not in uri or "rpcids=" not in uri:
+                continue
+            rpc_id = uri.split("rpcids=")[1].split("&")[0]
+            responses.append((rpc_id, interaction["response"]["body"]["string"]))
+    return responses
+
+
+def multiplex(responses: list[tuple[str, str]], group: int) -> list[tuple[str, str]]:
+    """Concatenate ``group`` responses per body; emit one lookup per member."""
+    cases = []
+    for start in range(0, len(responses), group):
+        members = responses[start : start + group]
+        body = ")]}'\n" + "".join(strip_anti_xssi(raw) for _, raw in members)
+        cases.extend((rpc_id, body) for rpc_id, _ in members)
+    return cases
+
+
+def decode_legacy(raw_response: str, rpc_id: str) -> Any:
+    cleaned = strip_anti_xssi(raw_response)
+    chunks = parse_chunked_response(cleaned)
+    _preview = cleaned[:500]
+    _found_ids = collect_rpc_ids(chunks)
+    return extract_rpc_result(chunks, rpc_id)
+
+
+def decode_indexed(raw_response: str, rpc_id: str) -> Any:
+    return ResponseIndex(raw_response).result(rpc_id, allow_null=True)
+
+
+def _safe(decode: Callable[[str, str], Any], raw_response: str, rpc_id: str) -> Any:
+    try:
+        return decode(raw_response, rpc_id)
+    except RPCError as e:
+        return ("error", type(e).__name__, e.code)
+
+
+def time_strategy(
+    decode: Callable[[str, str], Any], responses: list[tuple[str, str]], repeat: int
+) -> float:
+    """Return the best wall time (seconds) of ``repeat`` passes over all responses."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for rpc_id, body in responses:
+            _safe(decode, body, rpc_id)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark batchexecute response decoding")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed passes (best is kept)")
+    parser.add_argument("--group", type=int, default=4, help="Responses per multiplexed body")
+    parser.add_argument(
+        "--cassettes", type=Path, default=CASSETTES_DIR, help="Directory of VCR cassettes"
+    )
+    args = parser.parse_args()
+
+    responses = load_responses(args.cassettes)
+    if not responses:
+        print(f"No batchexecute responses found in {args.cassettes}")
+        return 1
+
+    workloads = {
+        "recorded": responses,
+        "multiplexed": multiplex(responses, args.group),
+    }
+
+    for workload, cases in workloads.items():
+        mismatches = [
+            rpc_id
+            for rpc_id, body in cases
+            if _safe(decode_legacy, body, rpc_id) != _safe(decode_indexed, body, rpc_id)
+        ]
+        if mismatches:
+            print(f"RESULT: FAIL - {workload}: decoders disagree for {sorted(set(mismatches))}")
+            return 1
+
+    total_bytes = sum(len(body) for _, body in responses)
+    print(f"Responses: {len(responses)} ({total_bytes / 1024:.1f} KiB), repeat={args.repeat}")
+    print("=" * 60)
+
+    for workload, cases in workloads.items():
+        legacy = time_strategy(decode_legacy, cases, args.repeat)
+        indexed = time_strategy(decode_indexed, cases, args.repeat)
+
+        print(f"{workload} ({len(cases)} lookups)")
+        for name, elapsed in (("legacy", legacy), ("indexed", indexed)):
+            per_call = elapsed / len(cases) * 1e6
+            print(f"  {name:<8} {elapsed * 1000:8.2f} ms/pass  {per_call:8.1f} us/lookup")
+        print(f"  speedup  {legacy / indexed:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,90 +18,222 @@ from ._logging import configure_logging
 
 configure_logging()
 
-# Version sourced from pyproject.toml via importlib.metadata
+import importlib
 import logging
-from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
 _logger = logging.getLogger(__name__)
 
-try:
-    __version__ = version("notebooklm-py")
-except PackageNotFoundError:
-    __version__ = "0.0.0.dev0"  # Fallback when package is not installed
-    _logger.debug(
-        "Package 'notebooklm-py' not found in metadata. "
-        "Using fallback version '%s'. This is normal during development.",
-        __version__,
+if TYPE_CHECKING:
+    # Public API: Sync facade, account pooling, connection, caching, pacing and retry configuration
+    from ._artifact_cache import ArtifactCache
+    from ._cache import ResponseCache
+    from ._governor import RateGovernor, RateLimit
+    from ._metrics import MetricsAggregator, MetricsHook, RequestMetrics
+    from ._pool import AccountHealth, NotebookLMClientPool
+    from ._recorder import FlightRecord, FlightRecorder
+    from ._retry import RetryPolicy
+    from ._sync import SyncNotebookLMClient
+    from ._transport import ConnectionStats
+
+    # Public API: Authentication
+    from .auth import DEFAULT_STORAGE_PATH, AuthTokens
+
+    # Public API: Client
+    from .client import NotebookLMClient
+
+    # Public API: RPC errors (needed for exception handling)
+    from .rpc import (
+        AuthError,
+        ClientError,
+        NetworkError,
+        RateLimitError,
+        RPCError,
+        RPCTimeoutError,
+        ServerError,
+    )
+
+    # Public API: Types and dataclasses
+    from .types import (
+        Artifact,
+        ArtifactDownloadError,
+        ArtifactError,
+        ArtifactNotFoundError,
+        ArtifactNotReadyError,
+        ArtifactParseError,
+        AskResult,
+        AudioFormat,
+        AudioLength,
+        ChatGoal,
+        ChatMode,
+        ChatReference,
+        ChatResponseLength,
+        ConversationTurn,
+        DownloadResult,
+        DriveMimeType,
+        ExportType,
+        GenerationStatus,
+        InfographicDetail,
+        InfographicOrientation,
+        Note,
+        Notebook,
+        NotebookDescription,
+        QuizDifficulty,
+        QuizQuantity,
+        ReportFormat,
+        ReportSuggestion,
+        SlideDeckFormat,
+        SlideDeckLength,
+        Source,
+        # Exceptions
+        SourceAddError,
+        SourceError,
+        SourceFulltext,
+        SourceNotFoundError,
+        SourceProcessingError,
+        SourceStatus,
+        SourceTimeoutError,
+        SourceType,
+        # Enums for configuration
+        StudioContentType,
+        SuggestedTopic,
+        VideoFormat,
+        VideoStyle,
     )
 
-# Public API: Authentication
-from .auth import DEFAULT_STORAGE_PATH, AuthTokens
-
-# Public API: Client
-from .client import NotebookLMClient
-
-# Public API: RPC errors (needed for exception handling)
-from .rpc import (
-    AuthError,
-    ClientError,
-    NetworkError,
-    RateLimitError,
-    RPCError,
-    RPCTimeoutError,
-    ServerError,
-)
-
-# Public API: Types and dataclasses
-from .types import (
-    Artifact,
-    ArtifactDownloadError,
-    ArtifactError,
-    ArtifactNotFoundError,
-    ArtifactNotReadyError,
-    ArtifactParseError,
-    AskResult,
-    AudioFormat,
-    AudioLength,
-    ChatGoal,
-    ChatMode,
-    ChatReference,
-    ChatResponseLength,
-    ConversationTurn,
-    DriveMimeType,
-    ExportType,
-    GenerationStatus,
-    InfographicDetail,
-    InfographicOrientation,
-    Note,
-    Notebook,
-    NotebookDescription,
-    QuizDifficulty,
-    QuizQuantity,
-    ReportFormat,
-    ReportSuggestion,
-    SlideDeckFormat,
-    SlideDeckLength,
-    Source,
+# Public names and the submodule defining each. They are imported on first
+# access (PEP 562), so e.g. `from notebooklm import RPCError` doesn't load
+# httpx and the client; `from notebooklm import X` works as before.
+_LAZY_ATTRS = {
+    # Client (main entry point)
+    "NotebookLMClient": "client",
+    "SyncNotebookLMClient": "_sync",
+    "NotebookLMClientPool": "_pool",
+    "AccountHealth": "_pool",
+    "RetryPolicy": "_retry",
+    "RateGovernor": "_governor",
+    "RateLimit": "_governor",
+    "ConnectionStats": "_transport",
+    "ResponseCache": "_cache",
+    "ArtifactCache": "_artifact_cache",
+    "MetricsHook": "_metrics",
+    "MetricsAggregator": "_metrics",
+    "RequestMetrics": "_metrics",
+    "FlightRecorder": "_recorder",
+    "FlightRecord": "_recorder",
+    # Auth
+    "AuthTokens": "auth",
+    "DEFAULT_STORAGE_PATH": "auth",
+    # Types
+    "Notebook": "types",
+    "NotebookDescription": "types",
+    "SuggestedTopic": "types",
+    "Source": "types",
+    "SourceFulltext": "types",
+    "Artifact": "types",
+    "GenerationStatus": "types",
+    "ReportSuggestion": "types",
+    "DownloadResult": "types",
+    "Note": "types",
+    "ConversationTurn": "types",
+    "ChatReference": "types",
+    "AskResult": "types",
+    "ChatMode": "types",
     # Exceptions
-    SourceAddError,
-    SourceError,
-    SourceFulltext,
-    SourceNotFoundError,
-    SourceProcessingError,
-    SourceStatus,
-    SourceTimeoutError,
-    SourceType,
-    # Enums for configuration
-    StudioContentType,
-    SuggestedTopic,
-    VideoFormat,
-    VideoStyle,
-)
+    "SourceError": "types",
+    "SourceAddError": "types",
+    "SourceProcessingError": "types",
+    "SourceTimeoutError": "types",
+    "SourceNotFoundError": "types",
+    "ArtifactError": "types",
+    "ArtifactNotFoundError": "types",
+    "ArtifactNotReadyError": "types",
+    "ArtifactParseError": "types",
+    "ArtifactDownloadError": "types",
+    "RPCError": "rpc",
+    "AuthError": "rpc",
+    "NetworkError": "rpc",
+    "RPCTimeoutError": "rpc",
+    "RateLimitError": "rpc",
+    "ServerError": "rpc",
+    "ClientError": "rpc",
+    # Enums
+    "StudioContentType": "types",
+    "AudioFormat": "types",
+    "AudioLength": "types",
+    "VideoFormat": "types",
+    "VideoStyle": "types",
+    "QuizQuantity": "types",
+    "QuizDifficulty": "types",
+    "InfographicOrientation": "types",
+    "InfographicDetail": "types",
+    "SlideDeckFormat": "types",
+    "SlideDeckLength": "types",
+    "ReportFormat": "types",
+    "ChatGoal": "types",
+    "ChatResponseLength": "types",
+    "DriveMimeType": "types",
+    "ExportType": "types",
+    "SourceStatus": "types",
+    "SourceType": "types",
+}
+
+# Submodules that used to be loaded by importing the package
+_SUBMODULES = {"auth", "client", "paths", "rpc", "types"}
+
+
+def _get_version() -> str:
+    # Version sourced from pyproject.toml via importlib.metadata
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("notebooklm-py")
+    except PackageNotFoundError:
+        fallback = "0.0.0.dev0"  # Fallback when package is not installed
+        _logger.debug(
+            "Package 'notebooklm-py' not found in metadata. "
+            "Using fallback version '%s'. This is normal during development.",
+            fallback,
+        )
+        return fallback
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        value: Any = _get_version()
+    elif name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "__version__",
     # Client (main entry point)
     "NotebookLMClient",
+    "SyncNotebookLMClient",
+    "NotebookLMClientPool",
+    "AccountHealth",
+    "RetryPolicy",
+    "RateGovernor",
+    "RateLimit",
+    "ConnectionStats",
+    "ResponseCache",
+    "ArtifactCache",
+    "MetricsHook",
+    "MetricsAggregator",
+    "RequestMetrics",
+    "FlightRecorder",
+    "FlightRecord",
     # Auth
     "AuthTokens",
     "DEFAULT_STORAGE_PATH",
@@ -114,6 +246,7 @@ __all__ = [
     "Artifact",
     "GenerationStatus",
     "ReportSuggestion",
+    "DownloadResult",
     "Note",
     "ConversationTurn",
     "ChatReference",
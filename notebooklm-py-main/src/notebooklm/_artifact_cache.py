@@ -0,0 +1,386 @@
+"""Content-addressed on-disk cache of downloaded artifact files."""
+
+import contextlib
+import hashlib
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from .paths import get_artifact_cache_dir
+from .rpc import codec
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV = "NOTEBOOKLM_ARTIFACT_CACHE"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+# linux/fs.h FICLONE: share the source's extents (copy-on-write)
+_FICLONE = 0x40049409
+_SIZE = re.compile(r"(\d+)\s*([kmg]?)i?b?")
+_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3}
+
+
+def _parse_size(value: str) -> int:
+    """Parse a byte count such as "500000", "800M" or "2GiB"."""
+    match = _SIZE.fullmatch(value.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid size: {value!r}")
+    return int(match.group(1)) * _UNITS[match.group(2)]
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    """Clone src to dst without copying data. Raises OSError if unsupported."""
+    if sys.platform != "linux":
+        raise OSError("reflinks are only attempted on Linux")
+
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            dst.unlink()
+            raise
+
+
+def _place(src: Path, dst: Path) -> str:
+    """Put a copy of src at dst, cheapest method first. Returns the method used.
+
+    Tries a reflink (copy-on-write, independent file), then a hardlink
+    (shared inode), then a plain copy.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        try:
+            _reflink(src, tmp)
+            method = "reflink"
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            try:
+                os.link(src, tmp)
+                method = "hardlink"
+            except OSError:
+                shutil.copyfile(src, tmp)
+                method = "copy"
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return method
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` (created if missing) across processes."""
+    with open(path, "a+b") as f:
+        _lock(f)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock(f: IO[bytes]) -> None:
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:  # LK_LOCK gives up after ~10s; keep waiting
+                continue
+
+    def _unlock(f: IO[bytes]) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(f: IO[bytes]) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(f: IO[bytes]) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _valid_entry(entry: Any) -> bool:
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("hash"), str)
+        and isinstance(entry.get("size"), int)
+    )
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """On-disk cache of downloaded artifact files (audio, video, slides, ...).
+
+    Files are stored once under ``objects/`` by SHA-256 of their content, and
+    ``index.json`` maps each artifact ID to its content hash, size, media URL
+    and HTTP validators (ETag, Last-Modified). A download of an artifact
+    already in the cache from the same URL is served by reflinking,
+    hardlinking or, across filesystems, copying the stored file to the
+    output path instead of fetching it again. Completed artifacts never
+    change, so entries are not revalidated with the server.
+
+    The least recently used entries are evicted once the stored files
+    exceed ``max_bytes``. Methods do blocking file I/O; the client calls
+    them from a worker thread. Several processes may share a directory:
+    every read-modify-write of the index (and any eviction) happens under
+    an exclusive lock on ``.lock`` in the directory, the index is rewritten
+    atomically, and an entry whose file has gone missing or changed size is
+    treated as a miss. Malformed index entries are ignored.
+
+    Note:
+        With hardlinks the output file and the cached file are the same
+        inode, so editing a downloaded file in place also changes the cached
+        copy. The size check catches most such edits.
+
+    Example:
+        cache = ArtifactCache(max_bytes=5 * 1024**3)
+        async with await NotebookLMClient.from_storage(artifact_cache=cache) as client:
+            await client.artifacts.download_slide_deck(nb_id, "deck.pdf")
+        print(cache.stats)
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory. Defaults to ``artifact_cache/`` in
+                NOTEBOOKLM_HOME.
+            max_bytes: Byte budget for stored files (least recently used
+                evicted first). A file larger than the budget is not cached.
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must not be negative, got {max_bytes}")
+        self.directory = Path(directory) if directory else get_artifact_cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+
+    @classmethod
+    def from_env(cls) -> "ArtifactCache | None":
+        """Create a cache if NOTEBOOKLM_ARTIFACT_CACHE is set.
+
+        The variable may be "1"/"true" for the default budget or a byte
+        budget such as "800M" or "5G". Returns None if unset or "0".
+        """
+        value = os.environ.get(CACHE_ENV, "").strip().lower()
+        if value in ("", "0", "false", "no"):
+            return None
+        if value in ("1", "true", "yes"):
+            return cls()
+        try:
+            return cls(max_bytes=_parse_size(value))
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", CACHE_ENV, value)
+            return None
+
+    @property
+    def _index_path(self) -> Path:
+        return self.directory / "index.json"
+
+    @contextlib.contextmanager
+    def _locked(self, create: bool = False) -> Iterator[bool]:
+        """Lock the index against other threads and processes.
+
+        Yields False (without taking the file lock) if the directory does
+        not exist and ``create`` is False, i.e. there is nothing to read.
+        """
+        with self._lock:
+            if create:
+                self.directory.mkdir(parents=True, exist_ok=True)
+            elif not self.directory.is_dir():
+                yield False
+                return
+            with _file_lock(self.directory / ".lock"):
+                yield True
+
+    def _object_path(self, digest: str) -> Path:
+        return self.directory / "objects" / digest[:2] / digest
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = codec.loads(self._index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable artifact cache index: %s", e)
+            return {}
+        entries = data.get("artifacts") if isinstance(data, dict) else None
+        if not isinstance(entries, dict):
+            return {}
+        return {k: v for k, v in entries.items() if _valid_entry(v)}
+
+    def _save(self, entries: dict[str, dict[str, Any]]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=".index.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(codec.dumps({"version": 1, "artifacts": entries}))
+            os.replace(tmp_name, self._index_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+
+    def restore(self, artifact_id: str, url: str, output_path: str | Path) -> bool:
+        """Place the cached file for an artifact at output_path.
+
+        Args:
+            artifact_id: The artifact ID.
+            url: The media URL the artifact would be downloaded from.
+            output_path: Where to put the file (replaced if it exists).
+
+        Returns:
+            True on a hit, False if the artifact must be downloaded.
+        """
+        with self._locked() as exists:
+            entries = self._load() if exists else {}
+            entry = entries.get(artifact_id)
+            if entry is None or entry.get("url") != url:
+                self.misses += 1
+                return False
+            blob = self._object_path(entry["hash"])
+            try:
+                intact = blob.stat().st_size == entry["size"]
+            except OSError:
+                intact = False
+            if not intact:
+                logger.debug("Dropping stale artifact cache entry %s", artifact_id)
+                del entries[artifact_id]
+                self._remove_unreferenced(entry["hash"], entries)
+                self._save(entries)
+                self.misses += 1
+                return False
+
+            output = Path(output_path)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            method = _place(blob, output)
+            entry["last_used"] = time.time()
+            # Most recently used last, so equal timestamps still sort by use
+            entries[artifact_id] = entries.pop(artifact_id)
+            self._save(entries)
+            self.hits += 1
+            self.bytes_saved += entry["size"]
+        logger.debug("Artifact %s served from cache (%s)", artifact_id, method)
+        return True
+
+    def store(
+        self,
+        artifact_id: str,
+        url: str,
+        path: str | Path,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Add a downloaded file to the cache and evict down to the budget.
+
+        Args:
+            artifact_id: The artifact ID.
+            url: The media URL it was downloaded from.
+            path: The downloaded file.
+            etag: ETag the server sent with the file, if any.
+            last_modified: Last-Modified the server sent, if any.
+        """
+        source = Path(path)
+        size = source.stat().st_size
+        if size > self.max_bytes:
+            logger.debug("Not caching artifact %s: %d bytes exceeds budget", artifact_id, size)
+            return
+        digest = _sha256(source)
+        blob = self._object_path(digest)
+
+        with self._locked(create=True):
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                _place(source, blob)
+            entries = self._load()
+            previous = entries.pop(artifact_id, None)
+            entries[artifact_id] = {
+                "hash": digest,
+                "size": size,
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "last_used": time.time(),
+            }
+            if previous and previous["hash"] != digest:
+                self._remove_unreferenced(previous["hash"], entries)
+            self._evict(entries, keep=artifact_id)
+            self._save(entries)
+
+    def _evict(self, entries: dict[str, dict[str, Any]], keep: str) -> None:
+        """Drop least recently used entries until stored files fit the budget."""
+        sizes = {e["hash"]: e["size"] for e in entries.values()}
+        total = sum(sizes.values())
+        by_age = sorted(entries, key=lambda k: entries[k].get("last_used", 0))
+        for artifact_id in by_age:
+            if total <= self.max_bytes:
+                break
+            if artifact_id == keep:
+                continue
+            entry = entries.pop(artifact_id)
+            self.evictions += 1
+            if self._remove_unreferenced(entry["hash"], entries):
+                total -= entry["size"]
+        logger.debug("Artifact cache holds %d bytes in %d entries", total, len(entries))
+
+    def _remove_unreferenced(self, digest: str, entries: dict[str, dict[str, Any]]) -> bool:
+        """Delete a stored file no entry refers to any more. Returns True if removed."""
+        if any(e["hash"] == digest for e in entries.values()):
+            return False
+        with contextlib.suppress(FileNotFoundError):
+            self._object_path(digest).unlink()
+        return True
+
+    def clear(self) -> None:
+        """Remove every cached file and the index."""
+        with self._locked() as exists:
+            if exists:
+                self._index_path.unlink(missing_ok=True)
+                shutil.rmtree(self.directory / "objects", ignore_errors=True)
+        # The lock file goes last; a process that opened it meanwhile just
+        # starts a fresh cache
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __len__(self) -> int:
+        with self._locked() as exists:
+            return len(self._load()) if exists else 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters: hits, misses, evictions, bytes saved and current entries and size."""
+        with self._locked() as exists:
+            entries = self._load() if exists else {}
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bytes_saved": self.bytes_saved,
+            "entries": len(entries),
+            "bytes": sum({e["hash"]: e["size"] for e in entries.values()}.values()),
+        }
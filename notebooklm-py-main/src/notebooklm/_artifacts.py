@@ -7,18 +7,22 @@ Quizzes, Flashcards, Infographics, Slide Decks, Data Tables, and Mind Maps.
 
 import asyncio
 import builtins
+import contextlib
 import csv
 import html
 import json
 import logging
+import os
 import re
+import time
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from ._core import ClientCore
-from .auth import load_httpx_cookies
+from ._governor import RateGovernor
 from .rpc import (
     ArtifactStatus,
     AudioFormat,
@@ -37,6 +41,7 @@ from .rpc import (
     VideoFormat,
     VideoStyle,
     artifact_status_to_str,
+    codec,
 )
 from .types import (
     Artifact,
@@ -44,12 +49,24 @@ from .types import (
     ArtifactNotFoundError,
     ArtifactNotReadyError,
     ArtifactParseError,
+    DownloadResult,
     GenerationStatus,
     ReportSuggestion,
 )
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from a download response and written to disk at a time
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Attempts per download (including the first); each retry resumes where
+# the previous one stopped. Retry n waits DOWNLOAD_RETRY_DELAY * 2 ** (n - 1).
+DOWNLOAD_MAX_ATTEMPTS = 3
+DOWNLOAD_RETRY_DELAY = 1.0
+
+# Files fetched at once by _download_urls_batch()
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
 # Media artifact types that require URL availability before reporting completion
 _MEDIA_ARTIFACT_TYPES = frozenset(
     {
@@ -79,7 +96,63 @@ def _extract_app_data(html_content: str) -> dict:
 
     encoded_json = match.group(1)
     decoded_json = html.unescape(encoded_json)
-    return json.loads(decoded_json)
+    return codec.loads(decoded_json)
+
+
+def _partial_paths(path: Path) -> tuple[Path, Path]:
+    """The in-progress file for a download to path and its metadata sidecar."""
+    return path.with_name(f".{path.name}.part"), path.with_name(f".{path.name}.part.json")
+
+
+def _load_partial(part: Path, sidecar: Path, url: str) -> tuple[int, dict[str, Any]]:
+    """Return the bytes already downloaded from url into part, and the sidecar.
+
+    Returns (0, {}) when there is nothing to resume: no partial file, a
+    sidecar for another URL, or a partial file not shorter than the length
+    the server announced.
+    """
+    try:
+        meta = json.loads(sidecar.read_text(encoding="utf-8"))
+        size = part.stat().st_size
+    except (OSError, ValueError):
+        return 0, {}
+    if not isinstance(meta, dict) or meta.get("url") != url:
+        return 0, {}
+    length = meta.get("length")
+    if isinstance(length, int) and size >= length:
+        return 0, {}
+    return size, meta
+
+
+def _discard_partial(part: Path, sidecar: Path) -> None:
+    for stale in (part, sidecar):
+        with contextlib.suppress(FileNotFoundError):
+            stale.unlink()
+
+
+def _range_matches(content_range: str | None, offset: int, length: int | None) -> bool:
+    """Check a Content-Range header continues a partial file of offset bytes."""
+    match = re.fullmatch(r"bytes (\d+)-\d+/(\d+|\*)", (content_range or "").strip())
+    if not match or int(match.group(1)) != offset:
+        return False
+    return length is None or match.group(2) in ("*", str(length))
+
+
+async def _write_chunks(part: Path, offset: int, chunks: AsyncIterator[bytes]) -> int:
+    """Write chunks to part, appending after offset bytes or truncating if 0.
+
+    File operations run in a worker thread so large downloads don't block
+    the event loop. Returns the size of part afterwards.
+    """
+    size = offset
+    f = await asyncio.to_thread(open, part, "ab" if offset else "wb")
+    try:
+        async for chunk in chunks:
+            await asyncio.to_thread(f.write, chunk)
+            size += len(chunk)
+    finally:
+        await asyncio.to_thread(f.close)
+    return size
 
 
 def _format_quiz_markdown(title: str, questions: list[dict]) -> str:
@@ -900,7 +973,7 @@ class ArtifactsAPI:
                 # Parse the mind map JSON
                 if isinstance(mind_map_json, str):
                     try:
-                        mind_map_data = json_module.loads(mind_map_json)
+                        mind_map_data = codec.loads(mind_map_json)
                     except json_module.JSONDecodeError:
                         mind_map_data = mind_map_json
                         mind_map_json = str(mind_map_json)
@@ -998,7 +1071,7 @@ class ArtifactsAPI:
                     details="Could not extract download URL",
                 )
 
-            return await self._download_url(url, output_path)
+            return await self._download_url(url, output_path, artifact_id=audio_art[0])
 
         except (IndexError, TypeError) as e:
             raise ArtifactParseError(
@@ -1081,7 +1154,7 @@ class ArtifactsAPI:
             if not url:
                 raise ArtifactDownloadError("media", details="Could not extract download URL")
 
-            return await self._download_url(url, output_path)
+            return await self._download_url(url, output_path, artifact_id=video_art[0])
 
         except (IndexError, TypeError) as e:
             raise ArtifactParseError(
@@ -1145,7 +1218,7 @@ class ArtifactsAPI:
                 raise ArtifactParseError("infographic", details="Could not find metadata")
 
             url = metadata[2][0][1][0]
-            return await self._download_url(url, output_path)
+            return await self._download_url(url, output_path, artifact_id=info_art[0])
 
         except (IndexError, TypeError) as e:
             raise ArtifactParseError(
@@ -1201,7 +1274,7 @@ class ArtifactsAPI:
             if not isinstance(pdf_url, str) or not pdf_url.startswith("http"):
                 raise ArtifactDownloadError("slide_deck", details="Could not find PDF download URL")
 
-            return await self._download_url(pdf_url, output_path)
+            return await self._download_url(pdf_url, output_path, artifact_id=slide_art[0])
 
         except (IndexError, TypeError) as e:
             raise ArtifactParseError(
@@ -1426,7 +1499,7 @@ class ArtifactsAPI:
             if not isinstance(json_string, str):
                 raise ArtifactParseError("mind_map_content", details="Invalid structure")
 
-            json_data = json.loads(json_string)
+            json_data = codec.loads(json_string)
 
             output = Path(output_path)
             output.parent.mkdir(parents=True, exist_ok=True)
@@ -1586,6 +1659,11 @@ class ArtifactsAPI:
         Returns:
             GenerationStatus with current status.
         """
+        # Status polls must see server changes immediately, never cached listings
+        with self._core.fresh_reads():
+            return await self._poll_status(notebook_id, task_id)
+
+    async def _poll_status(self, notebook_id: str, task_id: str) -> GenerationStatus:
         # POLL_STUDIO RPC is unreliable - use list as fallback
         params = [task_id, notebook_id, [2]]
         try:
@@ -1601,28 +1679,7 @@ class ArtifactsAPI:
 
         if result is None:
             artifacts_data = await self._list_raw(notebook_id)
-            for art in artifacts_data:
-                if len(art) > 0 and art[0] == task_id:
-                    status_code = art[4] if len(art) > 4 else 0
-                    artifact_type = art[2] if len(art) > 2 else 0
-
-                    # For media artifacts, verify URL availability before reporting completion.
-                    # The API may set status=COMPLETED before media URLs are populated.
-                    if status_code == ArtifactStatus.COMPLETED:
-                        if not self._is_media_ready(art, artifact_type):
-                            type_name = self._get_artifact_type_name(artifact_type)
-                            logger.debug(
-                                "Artifact %s (type=%s) status=COMPLETED but media not ready, "
-                                "continuing poll",
-                                task_id,
-                                type_name,
-                            )
-                            # Downgrade to PROCESSING to continue polling
-                            status_code = ArtifactStatus.PROCESSING
-
-                    status = artifact_status_to_str(status_code)
-                    return GenerationStatus(task_id=task_id, status=status)
-            return GenerationStatus(task_id=task_id, status="pending")
+            return self._status_from_listing(task_id, artifacts_data)
 
         status = result[1] if len(result) > 1 else "unknown"
         url = result[2] if len(result) > 2 else None
@@ -1630,6 +1687,33 @@ class ArtifactsAPI:
 
         return GenerationStatus(task_id=task_id, status=status, url=url, error=error)
 
+    def _status_from_listing(
+        self, task_id: str, artifacts_data: builtins.list[Any]
+    ) -> GenerationStatus:
+        """Resolve a task's status from a raw artifact listing (see _list_raw())."""
+        for art in artifacts_data:
+            if len(art) > 0 and art[0] == task_id:
+                status_code = art[4] if len(art) > 4 else 0
+                artifact_type = art[2] if len(art) > 2 else 0
+
+                # For media artifacts, verify URL availability before reporting completion.
+                # The API may set status=COMPLETED before media URLs are populated.
+                if status_code == ArtifactStatus.COMPLETED:
+                    if not self._is_media_ready(art, artifact_type):
+                        type_name = self._get_artifact_type_name(artifact_type)
+                        logger.debug(
+                            "Artifact %s (type=%s) status=COMPLETED but media not ready, "
+                            "continuing poll",
+                            task_id,
+                            type_name,
+                        )
+                        # Downgrade to PROCESSING to continue polling
+                        status_code = ArtifactStatus.PROCESSING
+
+                status = artifact_status_to_str(status_code)
+                return GenerationStatus(task_id=task_id, status=status)
+        return GenerationStatus(task_id=task_id, status="pending")
+
     async def wait_for_completion(
         self,
         notebook_id: str,
@@ -1690,6 +1774,75 @@ class ArtifactsAPI:
             # Exponential backoff: double the interval up to max_interval
             current_interval = min(current_interval * 2, max_interval)
 
+    async def wait_for_many(
+        self,
+        notebook_id: str,
+        task_ids: builtins.list[str],
+        initial_interval: float = 2.0,
+        max_interval: float = 10.0,
+        timeout: float = 300.0,
+    ) -> AsyncIterator[GenerationStatus]:
+        """Wait for several generation tasks in one notebook to finish.
+
+        Instead of polling each task separately, lists the notebook's
+        artifacts once per interval and resolves every pending task from
+        that listing (media artifacts count as complete only once their URLs
+        are populated). Polling backs off exponentially as in
+        wait_for_completion().
+
+        Args:
+            notebook_id: The notebook ID.
+            task_ids: The task/artifact IDs to wait for.
+            initial_interval: Initial seconds between listings.
+            max_interval: Maximum seconds between listings.
+            timeout: Maximum seconds to wait for all tasks.
+
+        Yields:
+            The final GenerationStatus of each task (completed or failed),
+            in the order the tasks finish.
+
+        Raises:
+            TimeoutError: If tasks are still running after timeout; those
+                already finished have been yielded.
+
+        Example:
+            statuses = [await client.artifacts.generate_audio(nb_id) for _ in range(3)]
+            async for status in client.artifacts.wait_for_many(
+                nb_id, [s.task_id for s in statuses]
+            ):
+                print(status.task_id, status.status)
+        """
+        pending = list(dict.fromkeys(task_ids))
+        start_time = asyncio.get_running_loop().time()
+        current_interval = initial_interval
+
+        while pending:
+            # Status polls must see server changes immediately, never cached listings
+            with self._core.fresh_reads():
+                artifacts_data = await self._list_raw(notebook_id)
+
+            for task_id in builtins.list(pending):
+                status = self._status_from_listing(task_id, artifacts_data)
+                if status.is_complete or status.is_failed:
+                    pending.remove(task_id)
+                    yield status
+            if not pending:
+                return
+
+            elapsed = asyncio.get_running_loop().time() - start_time
+            if elapsed > timeout:
+                raise TimeoutError(
+                    f"{len(pending)} task(s) timed out after {timeout}s: {', '.join(pending)}"
+                )
+
+            # Clamp sleep duration to respect timeout
+            sleep_duration = min(current_interval, timeout - elapsed)
+            if sleep_duration > 0:
+                await asyncio.sleep(sleep_duration)
+
+            # Exponential backoff: double the interval up to max_interval
+            current_interval = min(current_interval * 2, max_interval)
+
     # =========================================================================
     # Export Operations
     # =========================================================================
@@ -1925,75 +2078,210 @@ class ArtifactsAPI:
         return candidates[0]
 
     async def _download_urls_batch(
-        self, urls_and_paths: builtins.list[tuple[str, str]]
-    ) -> builtins.list[str]:
-        """Download multiple files using httpx with proper cookie handling.
+        self,
+        urls_and_paths: builtins.list[tuple[str, str]],
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    ) -> builtins.list[DownloadResult]:
+        """Download multiple files in parallel over the shared download client.
+
+        At most `concurrency` files are in flight at once; all of them share
+        the pooled cookie-aware client, so connections are reused and the
+        download rate limit still applies.
 
         Args:
             urls_and_paths: List of (url, output_path) tuples.
+            concurrency: Maximum number of simultaneous downloads.
 
         Returns:
-            List of successfully downloaded output paths.
+            One DownloadResult per input, in the same order. Failed files have
+            success=False and the error message.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+            ArtifactDownloadError: If the server returned HTML (auth expired);
+                remaining downloads are cancelled.
+            FileNotFoundError: If the storage file doesn't exist.
         """
-        downloaded: list[str] = []
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
 
-        # Load cookies with domain info for cross-domain redirect handling
-        cookies = load_httpx_cookies()
+        # Created up front so missing cookies fail the batch, not every file
+        self._core.get_download_client()
+        slots = asyncio.Semaphore(concurrency)
 
-        async with httpx.AsyncClient(
-            cookies=cookies,
-            follow_redirects=True,
-            timeout=60.0,
-        ) as client:
-            for url, output_path in urls_and_paths:
+        async def fetch(url: str, output_path: str) -> DownloadResult:
+            async with slots:
+                start = time.monotonic()
                 try:
-                    response = await client.get(url)
-                    response.raise_for_status()
-
-                    content_type = response.headers.get("content-type", "")
-                    if "text/html" in content_type:
-                        raise ArtifactDownloadError(
-                            "media", details="Received HTML instead of media file"
-                        )
-
-                    output_file = Path(output_path)
-                    output_file.parent.mkdir(parents=True, exist_ok=True)
-                    output_file.write_bytes(response.content)
-                    downloaded.append(output_path)
-                    logger.debug("Downloaded %s (%d bytes)", url[:60], len(response.content))
-
-                except (httpx.HTTPError, ValueError) as e:
+                    download = await self._stream_to_file(url, output_path)
+                except (httpx.HTTPError, ValueError, OSError) as e:
                     logger.warning("Download failed for %s: %s", url[:60], e)
+                    return DownloadResult(
+                        url=url,
+                        path=output_path,
+                        success=False,
+                        duration=time.monotonic() - start,
+                        error=str(e),
+                    )
+            return DownloadResult(
+                url=url,
+                path=output_path,
+                success=True,
+                bytes_written=download["size"],
+                duration=time.monotonic() - start,
+            )
 
-        return downloaded
+        tasks = [asyncio.ensure_future(fetch(url, path)) for url, path in urls_and_paths]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled downloads close their partial files
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
-    async def _download_url(self, url: str, output_path: str) -> str:
+    async def _download_url(
+        self, url: str, output_path: str, artifact_id: str | None = None
+    ) -> str:
         """Download a file from URL using httpx with proper cookie handling.
 
+        With an artifact cache configured, a file already cached for
+        artifact_id and url is linked into place instead of downloaded, and
+        a fresh download is added to the cache. Cache errors are logged and
+        never fail the download.
+
         Args:
             url: URL to download from.
             output_path: Path to save the file.
+            artifact_id: ID of the artifact the file belongs to (cache key).
 
         Returns:
             The output path on success.
 
         Raises:
-            ValueError: If download fails or authentication expired.
+            ArtifactDownloadError: If authentication expired.
+            httpx.HTTPError: If the download fails.
+        """
+        cache = self._core.artifact_cache
+        if cache is not None and artifact_id:
+            try:
+                if await asyncio.to_thread(cache.restore, artifact_id, url, output_path):
+                    return output_path
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning(
+                    "Artifact cache lookup failed for %s, downloading instead: %s", artifact_id, e
+                )
+
+        download = await self._stream_to_file(url, output_path)
+
+        if cache is not None and artifact_id:
+            try:
+                await asyncio.to_thread(
+                    cache.store,
+                    artifact_id,
+                    url,
+                    output_path,
+                    etag=download.get("etag"),
+                    last_modified=download.get("last_modified"),
+                )
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning("Could not cache artifact %s: %s", artifact_id, e)
+        return output_path
+
+    async def _stream_to_file(self, url: str, output_path: str) -> dict[str, Any]:
+        """Stream a download to disk, resuming interrupted transfers.
+
+        The body is written in DOWNLOAD_CHUNK_SIZE pieces, off the event loop,
+        to `.<name>.part` next to output_path, beside a `.<name>.part.json`
+        sidecar holding the URL, expected length and validators (ETag,
+        Last-Modified). The finished file is renamed into place, so an
+        existing file at output_path is only ever replaced by a complete one.
+
+        A partial file left for the same URL, by a dropped connection or an
+        earlier process, is continued with a Range request guarded by
+        If-Range; a server that ignores the range answers 200 and the file
+        is fetched from the start. Dropped connections are retried up to
+        DOWNLOAD_MAX_ATTEMPTS times in total, each retry resuming.
+
+        Args:
+            url: URL to download from.
+            output_path: Path to save the file.
+
+        Returns:
+            The download's metadata: url, length, etag and last_modified as
+            sent by the server, and the size of the file in bytes.
+
+        Raises:
+            ArtifactDownloadError: If the server returned HTML (auth expired).
+            httpx.HTTPError: If the request fails.
+            OSError: If the file cannot be written.
         """
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load cookies with domain info for cross-domain redirect handling
-        cookies = load_httpx_cookies()
+        attempt = 1
+        while True:
+            try:
+                download = await self._fetch_to_part(url, output_file)
+            except httpx.TransportError as e:
+                if attempt >= DOWNLOAD_MAX_ATTEMPTS:
+                    raise
+                delay = DOWNLOAD_RETRY_DELAY * 2 ** (attempt - 1)
+                logger.warning(
+                    "Download of %s interrupted (%s), resuming in %.1fs", url[:60], e, delay
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            # None: the partial file was stale and has been discarded
+            if download is not None:
+                logger.debug("Downloaded %s (%d bytes)", url[:60], download["size"])
+                return download
+
+    async def _fetch_to_part(self, url: str, output_file: Path) -> dict[str, Any] | None:
+        """Make one download request, continuing any partial file for url.
 
-        async with httpx.AsyncClient(
-            cookies=cookies,
-            follow_redirects=True,
-            timeout=60.0,
-        ) as client:
-            response = await client.get(url)
+        Returns:
+            The metadata of the completed download (see _stream_to_file), or
+            None if the server rejected the range of the partial file, which
+            was then discarded.
+        """
+        part, sidecar = _partial_paths(output_file)
+        offset, meta = await asyncio.to_thread(_load_partial, part, sidecar, url)
+        headers: dict[str, str] = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            validator = meta.get("etag") or meta.get("last_modified")
+            if validator:
+                headers["If-Range"] = validator
+
+        # Shared client with domain-scoped cookies for cross-domain redirects
+        client = self._core.get_download_client()
+        async with (
+            self._core.measure(RateGovernor.DOWNLOAD) as metrics,
+            self._core.throttle(RateGovernor.DOWNLOAD),
+            client.stream(
+                "GET", url, headers=headers, timeout=60.0, extensions=metrics.extensions
+            ) as response,
+        ):
+            metrics.record(response)
+            resumed = offset > 0 and response.status_code == 206
+            if offset and (
+                response.status_code == 416
+                or (
+                    resumed
+                    and not _range_matches(
+                        response.headers.get("content-range"), offset, meta.get("length")
+                    )
+                )
+            ):
+                logger.debug("Partial download of %s no longer matches, starting over", url[:60])
+                await asyncio.to_thread(_discard_partial, part, sidecar)
+                return None
             response.raise_for_status()
 
+            # Checked before reading the body: a login page means expired auth
             content_type = response.headers.get("content-type", "")
             if "text/html" in content_type:
                 raise ArtifactDownloadError(
@@ -2002,9 +2290,33 @@ class ArtifactsAPI:
                     "Authentication may have expired. Run 'notebooklm login'.",
                 )
 
-            output_file.write_bytes(response.content)
-            logger.debug("Downloaded %s (%d bytes)", url[:60], len(response.content))
-            return output_path
+            if resumed:
+                logger.debug("Resuming %s at byte %d", url[:60], offset)
+            else:
+                # Range ignored or fresh download: record what a resume checks
+                offset = 0
+                etag = response.headers.get("etag")
+                content_length = response.headers.get("content-length")
+                meta = {
+                    "url": url,
+                    "length": (
+                        int(content_length)
+                        if content_length
+                        and content_length.isdigit()
+                        and "content-encoding" not in response.headers
+                        else None
+                    ),
+                    # Weak ETags can't be used with If-Range
+                    "etag": etag if etag and not etag.startswith("W/") else None,
+                    "last_modified": response.headers.get("last-modified"),
+                }
+                await asyncio.to_thread(sidecar.write_text, json.dumps(meta), encoding="utf-8")
+
+            size = await _write_chunks(part, offset, response.aiter_bytes(DOWNLOAD_CHUNK_SIZE))
+
+        await asyncio.to_thread(os.replace, part, output_file)
+        await asyncio.to_thread(_discard_partial, part, sidecar)
+        return {**meta, "size": size}
 
     def _parse_generation_result(self, result: Any) -> GenerationStatus:
         """Parse generation API result into GenerationStatus.
@@ -0,0 +1,165 @@
+"""Read-through TTL cache for listing RPCs."""
+
+import logging
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any
+
+from .rpc import RPCMethod, codec
+
+logger = logging.getLogger(__name__)
+
+# Listings that are re-fetched by many operations (artifacts.get, download_*,
+# sources.get, ...). TTLs are in seconds.
+DEFAULT_TTLS: dict[RPCMethod, float] = {
+    RPCMethod.LIST_NOTEBOOKS: 30.0,
+    RPCMethod.GET_NOTEBOOK: 15.0,
+    RPCMethod.LIST_ARTIFACTS: 10.0,
+    RPCMethod.GET_NOTES_AND_MIND_MAPS: 15.0,
+}
+
+# Methods that never change server state. Any other RPC is treated as a
+# mutation and invalidates cached entries for its notebook.
+READ_ONLY_METHODS: frozenset[RPCMethod] = frozenset(
+    {
+        RPCMethod.LIST_NOTEBOOKS,
+        RPCMethod.GET_NOTEBOOK,
+        RPCMethod.GET_SOURCE,
+        RPCMethod.CHECK_SOURCE_FRESHNESS,
+        RPCMethod.SUMMARIZE,
+        RPCMethod.GET_SOURCE_GUIDE,
+        RPCMethod.GET_SUGGESTED_REPORTS,
+        RPCMethod.GET_AUDIO,
+        RPCMethod.LIST_ARTIFACTS,
+        RPCMethod.GET_ARTIFACT,
+        RPCMethod.POLL_RESEARCH,
+        RPCMethod.GET_NOTES_AND_MIND_MAPS,
+        RPCMethod.LIST_ARTIFACTS_ALT,
+        RPCMethod.GET_INTERACTIVE_HTML,
+        RPCMethod.GET_CONVERSATION_HISTORY,
+        RPCMethod.GET_SHARE_STATUS,
+        RPCMethod.GET_USER_SETTINGS,
+    }
+)
+
+_NOTEBOOK_PATH = re.compile(r"^/notebook/([^/?#]+)")
+
+CacheKey = tuple[RPCMethod, str, str, bool]
+
+
+def notebook_id_from_path(source_path: str) -> str | None:
+    """Return the notebook ID from a ``/notebook/{id}`` source path, if any."""
+    match = _NOTEBOOK_PATH.match(source_path)
+    return match.group(1) if match else None
+
+
+class ResponseCache:
+    """Read-through cache for RPC results, keyed by method, params and source path.
+
+    Results of methods with a TTL are kept for that many seconds. Any RPC
+    outside READ_ONLY_METHODS invalidates the entries of the notebook it
+    targets (taken from its ``/notebook/{id}`` source path) plus account-wide
+    listings such as LIST_NOTEBOOKS; mutations without a notebook clear the
+    whole cache.
+
+    Results are stored serialized, so callers never share mutable objects
+    with the cache. A read that was in flight while an invalidation happened
+    is not stored.
+
+    Example:
+        cache = ResponseCache(ttls={RPCMethod.LIST_NOTEBOOKS: 60})
+        async with await NotebookLMClient.from_storage(response_cache=cache) as client:
+            ...
+        print(cache.stats)
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[RPCMethod, float] | None = None,
+        max_entries: int = 512,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttls: Seconds to keep results per method. Methods not listed are
+                not cached. Defaults to DEFAULT_TTLS.
+            max_entries: Maximum number of cached results (oldest evicted first).
+        """
+        self.ttls: dict[RPCMethod, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        # key -> (expires_at, notebook_id, serialized result)
+        self._entries: OrderedDict[CacheKey, tuple[float, str | None, str]] = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def is_cached(self, method: RPCMethod) -> bool:
+        """Return True if results of ``method`` are cached."""
+        return self.ttls.get(method, 0) > 0
+
+    @staticmethod
+    def key(method: RPCMethod, params: list[Any], source_path: str, allow_null: bool) -> CacheKey:
+        """Build the cache key for an RPC."""
+        return (method, codec.dumps(params), source_path, allow_null)
+
+    def get(self, key: CacheKey) -> tuple[bool, Any]:
+        """Look up a result.
+
+        Returns:
+            Tuple of (hit, result). ``result`` is a fresh copy on a hit.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self.hits += 1
+                return True, codec.loads(entry[2])
+            del self._entries[key]
+        self.misses += 1
+        return False, None
+
+    def put(self, key: CacheKey, result: Any, generation: int) -> None:
+        """Store a result fetched when the cache was at ``generation``.
+
+        Skipped if an invalidation happened since, because the result may
+        predate the mutation that caused it.
+        """
+        if generation != self.generation:
+            return
+        method, _, source_path, _ = key
+        expires_at = time.monotonic() + self.ttls[method]
+        self._entries[key] = (expires_at, notebook_id_from_path(source_path), codec.dumps(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, notebook_id: str | None = None) -> None:
+        """Drop cached results.
+
+        Args:
+            notebook_id: Drop entries for this notebook and account-wide
+                listings. If None, drop everything.
+        """
+        self.generation += 1
+        self.invalidations += 1
+        if notebook_id is None:
+            self._entries.clear()
+        else:
+            for key in [k for k, v in self._entries.items() if v[1] in (None, notebook_id)]:
+                del self._entries[key]
+        logger.debug("Response cache invalidated for %s", notebook_id or "all notebooks")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters: hits, misses, invalidations and current entry count."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+        }
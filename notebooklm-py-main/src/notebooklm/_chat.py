@@ -13,7 +13,8 @@ from typing import Any
 from urllib.parse import quote, urlencode
 
 from ._core import ClientCore
-from .rpc import QUERY_URL, RPCMethod
+from ._governor import RateGovernor
+from .rpc import QUERY_URL, RPCMethod, codec
 from .types import AskResult, ChatReference, ConversationTurn
 
 logger = logging.getLogger(__name__)
@@ -111,9 +112,9 @@ class ChatAPI:
             conversation_id,
         ]
 
-        params_json = json.dumps(params, separators=(",", ":"))
+        params_json = codec.dumps(params)
         f_req = [None, params_json]
-        f_req_json = json.dumps(f_req, separators=(",", ":"))
+        f_req_json = codec.dumps(f_req)
 
         encoded_req = quote(f_req_json, safe="")
 
@@ -138,8 +139,13 @@ class ChatAPI:
         url = f"{QUERY_URL}?{query_string}"
 
         http_client = self._core.get_http_client()
-        response = await http_client.post(url, content=body)
-        response.raise_for_status()
+        async with self._core.measure(
+            RateGovernor.CHAT, f"/notebook/{notebook_id}", body
+        ) as metrics:
+            async with self._core.throttle(RateGovernor.CHAT):
+                response = await http_client.post(url, content=body, extensions=metrics.extensions)
+            metrics.record(response)
+            response.raise_for_status()
 
         answer_text, references = self._parse_ask_response_with_references(response.text)
 
@@ -328,7 +334,7 @@ class ChatAPI:
     def _extract_answer_from_chunk(self, json_str: str) -> tuple[str | None, bool]:
         """Extract answer text from a response chunk."""
         try:
-            data = json.loads(json_str)
+            data = codec.loads(json_str)
         except json.JSONDecodeError:
             return None, False
 
@@ -346,7 +352,7 @@ class ChatAPI:
                 continue
 
             try:
-                inner_data = json.loads(inner_json)
+                inner_data = codec.loads(inner_json)
                 if isinstance(inner_data, list) and len(inner_data) > 0:
                     first = inner_data[0]
                     if isinstance(first, list) and len(first) > 0:
@@ -441,7 +447,7 @@ class ChatAPI:
         refs: list[ChatReference] = []
 
         try:
-            data = json.loads(json_str)
+            data = codec.loads(json_str)
         except json.JSONDecodeError:
             return None, False, refs
 
@@ -459,7 +465,7 @@ class ChatAPI:
                 continue
 
             try:
-                inner_data = json.loads(inner_json)
+                inner_data = codec.loads(inner_json)
                 if isinstance(inner_data, list) and len(inner_data) > 0:
                     first = inner_data[0]
                     if isinstance(first, list) and len(first) > 0:
@@ -4,13 +4,31 @@ import asyncio
 import logging
 import time
 from collections import OrderedDict
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Iterator, Sequence
+from contextlib import (
+    AbstractAsyncContextManager,
+    AsyncExitStack,
+    asynccontextmanager,
+    contextmanager,
+    nullcontext,
+    suppress,
+)
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import Any, cast
 from urllib.parse import urlencode
 
 import httpx
 
-from .auth import AuthTokens
+from ._artifact_cache import ArtifactCache
+from ._cache import READ_ONLY_METHODS, ResponseCache, notebook_id_from_path
+from ._governor import RateGovernor
+from ._metrics import Instrumentation, MetricsHook, RequestMetrics
+from ._recorder import FlightRecorder
+from ._retry import RetryPolicy
+from ._transport import DEFAULT_LIMITS, ConnectionStats, PooledTransport
+from .auth import AuthTokens, load_httpx_cookies
+from .paths import get_flight_recorder_path
 from .rpc import (
     BATCHEXECUTE_URL,
     AuthError,
@@ -22,7 +40,11 @@ from .rpc import (
     RPCTimeoutError,
     ServerError,
     build_request_body,
+    codec,
+    decode_batch_response,
     decode_response,
+    decode_response_stream,
+    encode_rpc_batch,
     encode_rpc_request,
 )
 
@@ -34,6 +56,13 @@ MAX_CONVERSATION_CACHE_SIZE = 100
 # Default HTTP timeout in seconds
 DEFAULT_TIMEOUT = 30.0
 
+# Upper bound in seconds on how long a failed background token refresh waits
+# before trying again
+TOKEN_REFRESH_RETRY_DELAY = 60.0
+
+# Set inside ClientCore.fresh_reads(): cached reads go to the network instead
+_fresh_reads: ContextVar[bool] = ContextVar("notebooklm_fresh_reads", default=False)
+
 # Auth error detection patterns (case-insensitive)
 AUTH_ERROR_PATTERNS = (
     "authentication",
@@ -74,6 +103,104 @@ def is_auth_error(error: Exception) -> bool:
     return False
 
 
+@dataclass
+class RPCCall:
+    """A single call within a multiplexed batchexecute request.
+
+    Attributes:
+        method: The RPC method to call.
+        params: Parameters for the RPC call (nested list structure).
+        allow_null: If True, a null result is returned as None instead of raising.
+    """
+
+    method: RPCMethod
+    params: list[Any] = field(default_factory=list)
+    allow_null: bool = False
+
+
+_PENDING = object()
+
+
+class BatchCallResult:
+    """Handle for one call queued on an RPCBatch.
+
+    The value becomes available once the enclosing ``async with`` block exits.
+    """
+
+    def __init__(self, call: RPCCall):
+        self.call = call
+        self._value: Any = _PENDING
+        self._error: RPCError | None = None
+
+    @property
+    def done(self) -> bool:
+        """True once the batch has been sent and this call resolved."""
+        return self._value is not _PENDING or self._error is not None
+
+    def result(self) -> Any:
+        """Return the decoded result, or raise this call's RPCError.
+
+        Raises:
+            RuntimeError: If the batch has not been sent yet.
+            RPCError: If this call failed.
+        """
+        if self._error is not None:
+            raise self._error
+        if self._value is _PENDING:
+            raise RuntimeError("Batch has not been sent yet. Read results after 'async with'.")
+        return self._value
+
+    def _resolve(self, value: Any) -> None:
+        if isinstance(value, RPCError):
+            self._error = value
+        else:
+            self._value = value
+
+
+class RPCBatch:
+    """Async context manager that sends queued calls as one batchexecute request.
+
+    Created by ClientCore.batch(). Nothing is sent until the block exits; if
+    the block raises, the queued calls are discarded.
+    """
+
+    def __init__(self, core: "ClientCore", source_path: str = "/"):
+        self._core = core
+        self._source_path = source_path
+        self._pending: list[BatchCallResult] = []
+
+    def add(
+        self, method: RPCMethod, params: list[Any], allow_null: bool = False
+    ) -> BatchCallResult:
+        """Queue a call on this batch.
+
+        Args:
+            method: The RPC method to call.
+            params: Parameters for the RPC call.
+            allow_null: If True, don't raise error when response is null.
+
+        Returns:
+            A BatchCallResult whose result() is available after the block exits.
+        """
+        handle = BatchCallResult(RPCCall(method, params, allow_null))
+        self._pending.append(handle)
+        return handle
+
+    async def __aenter__(self) -> "RPCBatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None or not self._pending:
+            return
+        results = await self._core.rpc_batch(
+            [h.call for h in self._pending],
+            source_path=self._source_path,
+            return_exceptions=True,
+        )
+        for handle, value in zip(self._pending, results, strict=True):
+            handle._resolve(value)
+
+
 class ClientCore:
     """Core client infrastructure for HTTP and RPC operations.
 
@@ -93,6 +220,17 @@ class ClientCore:
         timeout: float = DEFAULT_TIMEOUT,
         refresh_callback: Callable[[], Awaitable[AuthTokens]] | None = None,
         refresh_retry_delay: float = 0.2,
+        stream_responses: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_governor: RateGovernor | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        coalesce_reads: bool = True,
+        response_cache: ResponseCache | None = None,
+        metrics: MetricsHook | None = None,
+        flight_recorder: FlightRecorder | None = None,
+        token_refresh_interval: float | None = None,
+        artifact_cache: ArtifactCache | None = None,
     ):
         """Initialize the core client.
 
@@ -102,13 +240,84 @@ class ClientCore:
             refresh_callback: Optional async callback to refresh auth tokens on failure.
                 If provided, rpc_call will automatically retry once after refreshing.
             refresh_retry_delay: Delay in seconds before retrying after refresh.
+            stream_responses: If True, rpc_call decodes the response body
+                incrementally as it arrives and returns as soon as the
+                requested result is found, instead of buffering the whole body.
+            retry_policy: Optional policy for retrying transient failures
+                (rate limits, server errors, timeouts, network errors) in
+                rpc_call. If None, only the auth refresh retry is performed.
+            rate_governor: Optional governor that paces every outgoing request
+                (RPCs, chat, uploads, downloads). If None, requests are sent
+                immediately.
+            limits: Connection pool limits (max connections, keep-alive pool
+                size and expiry). Defaults to DEFAULT_LIMITS.
+            http2: If True, negotiate HTTP/2 so concurrent requests share a
+                single multiplexed connection. Requires the ``h2`` package.
+            coalesce_reads: If True, concurrent rpc_call()s of a read-only
+                method with identical params and source path share a single
+                network request and its result. A read issued after a
+                mutation of the same notebook completes never joins a
+                request sent before it.
+            response_cache: Optional read-through cache for listing RPCs.
+                Mutating RPCs invalidate it automatically.
+            metrics: Optional hook notified before and after every HTTP
+                request (RPCs, chat, uploads, downloads).
+            flight_recorder: Optional FlightRecorder keeping the most recent
+                requests. If None and NOTEBOOKLM_FLIGHT_RECORDER is set, one
+                is created and spooled to NOTEBOOKLM_HOME on close().
+            token_refresh_interval: If set, a background task calls
+                refresh_callback whenever the tokens are this many seconds
+                old (counted from open() or the last refresh), so requests
+                don't have to fail before tokens are refreshed. Requires
+                refresh_callback.
+            artifact_cache: Optional on-disk cache of downloaded artifact
+                files. If None and NOTEBOOKLM_ARTIFACT_CACHE is set, one is
+                created under NOTEBOOKLM_HOME.
+
+        Raises:
+            ValueError: If token_refresh_interval is not positive or is set
+                without a refresh_callback.
         """
+        if token_refresh_interval is not None:
+            if token_refresh_interval <= 0:
+                raise ValueError(
+                    f"token_refresh_interval must be positive, got {token_refresh_interval}"
+                )
+            if refresh_callback is None:
+                raise ValueError("token_refresh_interval requires a refresh_callback")
         self.auth = auth
         self._timeout = timeout
+        self._stream_responses = stream_responses
+        self._retry_policy = retry_policy
+        self._rate_governor = rate_governor
+        self._limits = limits or DEFAULT_LIMITS
+        self._http2 = http2
+        self._transport: PooledTransport | None = None
+        self._coalesce_reads = coalesce_reads
+        self._response_cache = response_cache
+        if artifact_cache is None:
+            artifact_cache = ArtifactCache.from_env()
+        self.artifact_cache = artifact_cache
+        self._spool_flight_recorder = flight_recorder is None
+        if flight_recorder is None:
+            flight_recorder = FlightRecorder.from_env()
+        self.flight_recorder = flight_recorder
+        hooks = [hook for hook in (metrics, flight_recorder) if hook is not None]
+        self._instrumentation = Instrumentation(*hooks) if hooks else None
+        # In-flight read-only calls keyed by (method, params JSON, source_path, allow_null),
+        # with the response cache generation taken before each was sent
+        self._flights: dict[tuple[RPCMethod, str, str, bool], tuple[asyncio.Future[Any], int]] = {}
+        self.coalesced_calls = 0
+        # Pooled clients for the upload and download hosts, created on first use
+        self._upload_client: httpx.AsyncClient | None = None
+        self._download_client: httpx.AsyncClient | None = None
         self._refresh_callback = refresh_callback
         self._refresh_retry_delay = refresh_retry_delay
         self._refresh_lock: asyncio.Lock | None = asyncio.Lock() if refresh_callback else None
         self._refresh_task: asyncio.Task[AuthTokens] | None = None
+        self._token_refresh_interval = token_refresh_interval
+        self._token_refresher: asyncio.Task[None] | None = None
+        self._auth_refreshed_at = 0.0
         self._http_client: httpx.AsyncClient | None = None
         # Request ID counter for chat API (must be unique per request)
         self._reqid_counter: int = 100000
@@ -121,28 +330,59 @@ class ClientCore:
         Called automatically by NotebookLMClient.__aenter__.
         """
         if self._http_client is None:
+            self._transport = PooledTransport(limits=self._limits, http2=self._http2)
             self._http_client = httpx.AsyncClient(
+                transport=self._transport,
                 headers={
                     "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
                     "Cookie": self.auth.cookie_header,
                 },
                 timeout=self._timeout,
             )
+            self._auth_refreshed_at = time.monotonic()
+            if self._token_refresh_interval is not None:
+                self._token_refresher = asyncio.create_task(self._refresh_tokens_periodically())
 
     async def close(self) -> None:
         """Close the HTTP client connection.
 
         Called automatically by NotebookLMClient.__aexit__.
         """
+        for task in (self._token_refresher, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError, Exception):
+                    await task
+        self._token_refresher = None
+        for client in (self._upload_client, self._download_client):
+            if client:
+                await client.aclose()
+        self._upload_client = None
+        self._download_client = None
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
+        if self._spool_flight_recorder and self.flight_recorder is not None:
+            try:
+                self.flight_recorder.spool(get_flight_recorder_path())
+            except OSError as e:
+                logger.warning("Failed to save flight recorder: %s", e)
 
     @property
     def is_open(self) -> bool:
         """Check if the HTTP client is open."""
         return self._http_client is not None
 
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Connection-reuse counters for the current HTTP client.
+
+        Counters start at zero each time the client is opened.
+        """
+        if self._transport is None:
+            return ConnectionStats()
+        return self._transport.stats
+
     def update_auth_headers(self) -> None:
         """Update HTTP client headers with current auth tokens.
 
@@ -155,6 +395,7 @@ class ClientCore:
         if not self._http_client:
             raise RuntimeError("Client not initialized. Use 'async with' context.")
         self._http_client.headers["Cookie"] = self.auth.cookie_header
+        self._auth_refreshed_at = time.monotonic()
 
     def _build_url(self, rpc_method: RPCMethod, source_path: str = "/") -> str:
         """Build the batchexecute URL for an RPC call.
@@ -166,14 +407,110 @@ class ClientCore:
         Returns:
             Full URL with query parameters.
         """
+        return self._build_url_for_ids(rpc_method.value, source_path)
+
+    def _build_url_for_ids(self, rpcids: str, source_path: str = "/") -> str:
+        """Build the batchexecute URL for one or more comma-joined RPC IDs."""
         params = {
-            "rpcids": rpc_method.value,
+            "rpcids": rpcids,
             "source-path": source_path,
             "f.sid": self.auth.session_id,
             "rt": "c",
         }
         return f"{BATCHEXECUTE_URL}?{urlencode(params)}"
 
+    def _map_http_error(
+        self,
+        error: httpx.HTTPStatusError | httpx.RequestError,
+        label: str,
+        rpc_id: str,
+        elapsed: float,
+    ) -> RPCError:
+        """Map an httpx failure to the matching RPCError subclass.
+
+        Args:
+            error: The HTTP status or transport error raised by httpx.
+            label: Human-readable call name for messages (e.g., "LIST_NOTEBOOKS").
+            rpc_id: RPC ID(s) to attach to the raised error.
+            elapsed: Seconds spent before the failure (for logging).
+
+        Returns:
+            The RPCError to raise (caller chains it with ``from error``).
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            logger.error("RPC %s failed after %.3fs: HTTP %s", label, elapsed, status)
+
+            # Map HTTP status codes to appropriate exception types
+            if status == 429:
+                # Rate limiting - extract retry-after if available
+                retry_after = None
+                retry_after_header = error.response.headers.get("retry-after")
+                if retry_after_header:
+                    try:
+                        retry_after = int(retry_after_header)
+                    except ValueError:
+                        pass
+                msg = f"API rate limit exceeded calling {label}"
+                if retry_after:
+                    msg += f". Retry after {retry_after} seconds"
+                return RateLimitError(msg, rpc_id=rpc_id, retry_after=retry_after)
+
+            if 500 <= status < 600:
+                return ServerError(
+                    f"Server error {status} calling {label}: {error.response.reason_phrase}",
+                    rpc_id=rpc_id,
+                    status_code=status,
+                )
+
+            if 400 <= status < 500 and status not in (401, 403):
+                return ClientError(
+                    f"Client error {status} calling {label}: {error.response.reason_phrase}",
+                    rpc_id=rpc_id,
+                    status_code=status,
+                )
+
+            # 401/403 or other: Generic RPCError (handled by auth retry)
+            return RPCError(
+                f"HTTP {status} calling {label}: {error.response.reason_phrase}",
+                rpc_id=rpc_id,
+            )
+
+        # Network/connection errors
+        logger.error("RPC %s failed after %.3fs: %s", label, elapsed, error)
+
+        # Check ConnectTimeout first (more specific than general TimeoutException)
+        if isinstance(error, httpx.ConnectTimeout):
+            return NetworkError(
+                f"Connection timed out calling {label}: {error}",
+                rpc_id=rpc_id,
+                original_error=error,
+            )
+
+        # Timeout errors (general timeouts, not connection timeouts)
+        if isinstance(error, httpx.TimeoutException):
+            return RPCTimeoutError(
+                f"Request timed out calling {label}",
+                rpc_id=rpc_id,
+                timeout_seconds=self._timeout,
+                original_error=error,
+            )
+
+        # Connection errors (DNS, network unavailable, etc., excluding ConnectTimeout)
+        if isinstance(error, httpx.ConnectError):
+            return NetworkError(
+                f"Connection failed calling {label}: {error}",
+                rpc_id=rpc_id,
+                original_error=error,
+            )
+
+        # Other request errors
+        return NetworkError(
+            f"Request failed calling {label}: {error}",
+            rpc_id=rpc_id,
+            original_error=error,
+        )
+
     async def rpc_call(
         self,
         method: RPCMethod,
@@ -185,7 +522,10 @@ class ClientCore:
         """Make an RPC call to the NotebookLM API.
 
         Automatically refreshes authentication tokens and retries once if an
-        auth failure is detected and a refresh_callback was provided.
+        auth failure is detected and a refresh_callback was provided. If a
+        retry_policy was provided, transient failures are also retried with
+        backoff according to that policy. If a response_cache was provided,
+        cached reads are answered from it and other calls invalidate it.
 
         Args:
             method: The RPC method to call.
@@ -202,6 +542,147 @@ class ClientCore:
             httpx.HTTPStatusError: If HTTP request fails.
             RPCError: If RPC call fails or returns unexpected data.
         """
+        if _is_retry:
+            # The outer call handles coalescing, caching and invalidation
+            return await self._rpc_call_with_retries(
+                method, params, source_path, allow_null, _is_retry
+            )
+
+        if method not in READ_ONLY_METHODS:
+            try:
+                return await self._rpc_call_with_retries(method, params, source_path, allow_null)
+            finally:
+                self._forget_reads(source_path)
+
+        cache = self._response_cache
+        if cache is None or not cache.is_cached(method):
+            result, _ = await self._coalesced_call(method, params, source_path, allow_null)
+            return result
+
+        key = cache.key(method, params, source_path, allow_null)
+        if not _fresh_reads.get():
+            hit, value = cache.get(key)
+            if hit:
+                logger.debug("RPC %s served from cache", method.name)
+                return value
+        result, generation = await self._coalesced_call(method, params, source_path, allow_null)
+        cache.put(key, result, generation)
+        return result
+
+    async def _coalesced_call(
+        self,
+        method: RPCMethod,
+        params: list[Any],
+        source_path: str = "/",
+        allow_null: bool = False,
+    ) -> tuple[Any, int]:
+        """Make a read-only RPC call, sharing one request among identical concurrent reads.
+
+        See rpc_call() for arguments and exceptions.
+
+        Returns:
+            Tuple of (result, generation), where generation is the response
+            cache generation taken before the request that produced the
+            result was sent. A caller joining an earlier request gets that
+            request's generation, so ResponseCache.put() skips the result
+            if an invalidation happened after it was sent.
+        """
+        generation = self._response_cache.generation if self._response_cache is not None else 0
+        if not self._coalesce_reads or method not in READ_ONLY_METHODS:
+            result = await self._rpc_call_with_retries(method, params, source_path, allow_null)
+            return result, generation
+
+        key = (method, codec.dumps(params), source_path, allow_null)
+        entry = self._flights.get(key)
+        if entry is None:
+            request = asyncio.ensure_future(
+                self._rpc_call_with_retries(method, params, source_path, allow_null)
+            )
+            entry = (request, generation)
+            self._flights[key] = entry
+            request.add_done_callback(lambda f: self._end_flight(key, f))
+        else:
+            self.coalesced_calls += 1
+            logger.debug("RPC %s joined an identical in-flight call", method.name)
+        flight, generation = entry
+        # Shield so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(flight), generation
+
+    def _end_flight(self, key: tuple[RPCMethod, str, str, bool], flight: asyncio.Future) -> None:
+        entry = self._flights.get(key)
+        if entry is not None and entry[0] is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            flight.exception()  # mark retrieved in case every caller was cancelled
+
+    def _forget_reads(self, source_path: str) -> None:
+        """Forget reads a mutation on ``source_path`` may have made stale.
+
+        Drops the cached results and in-flight reads of the mutated notebook
+        plus account-wide ones (every notebook if the path names none), so
+        reads issued from now on start a new request instead of joining one
+        sent before the mutation. Callers already waiting on a dropped
+        request still get its result.
+        """
+        notebook_id = notebook_id_from_path(source_path)
+        for key in list(self._flights):
+            if notebook_id is None or notebook_id_from_path(key[2]) in (None, notebook_id):
+                del self._flights[key]
+        if self._response_cache is not None:
+            self._response_cache.invalidate(notebook_id)
+
+    async def _rpc_call_with_retries(
+        self,
+        method: RPCMethod,
+        params: list[Any],
+        source_path: str = "/",
+        allow_null: bool = False,
+        _is_retry: bool = False,
+    ) -> Any:
+        """Make an RPC call, retrying transient failures per the retry policy.
+
+        See rpc_call() for arguments and exceptions.
+        """
+        policy = self._retry_policy
+        if policy is None or _is_retry:
+            return await self._rpc_call_once(method, params, source_path, allow_null, _is_retry)
+
+        first_attempt = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return await self._rpc_call_once(
+                    method, params, source_path, allow_null, _retries=attempt - 1
+                )
+            except RPCError as e:
+                delay = policy.next_delay(method, e, attempt, time.monotonic() - first_attempt)
+                if delay is None:
+                    raise
+                logger.warning(
+                    "RPC %s failed (%s), retrying in %.1fs (attempt %d of %d)",
+                    method.name,
+                    type(e).__name__,
+                    delay,
+                    attempt + 1,
+                    policy.attempts_for(e),
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _rpc_call_once(
+        self,
+        method: RPCMethod,
+        params: list[Any],
+        source_path: str = "/",
+        allow_null: bool = False,
+        _is_retry: bool = False,
+        _retries: int = 0,
+    ) -> Any:
+        """Make a single RPC attempt (plus the auth refresh retry).
+
+        See rpc_call() for arguments and exceptions. ``_retries`` is the
+        number of earlier policy attempts, reported to the metrics hook.
+        """
         if not self._http_client:
             raise RuntimeError("Client not initialized. Use 'async with' context.")
 
@@ -211,12 +692,42 @@ class ClientCore:
         url = self._build_url(method, source_path)
         rpc_request = encode_rpc_request(method, params)
         body = build_request_body(rpc_request, self.auth.csrf_token)
+        metrics = self.metrics_start(
+            method.name, source_path, body, _retries + (1 if _is_retry else 0)
+        )
+        extensions = metrics.extensions if metrics is not None else None
 
+        # A streamed body is read after send() returns, so the rate governor
+        # slot is held until it has been consumed
+        slot = AsyncExitStack()
         try:
-            response = await self._http_client.post(url, content=body)
+            try:
+                await slot.enter_async_context(self.throttle(method))
+                if self._stream_responses:
+                    request = self._http_client.build_request(
+                        "POST", url, content=body, extensions=extensions
+                    )
+                    response = await self._http_client.send(request, stream=True)
+                elif extensions:
+                    response = await self._http_client.post(
+                        url, content=body, extensions=extensions
+                    )
+                else:
+                    response = await self._http_client.post(url, content=body)
+            except BaseException:
+                await slot.aclose()
+                raise
+            if not self._stream_responses:
+                await slot.aclose()
+            if metrics is not None:
+                metrics.record(response)
             response.raise_for_status()
         except (httpx.HTTPStatusError, httpx.RequestError) as e:
             elapsed = time.perf_counter() - start
+            if self._stream_responses and isinstance(e, httpx.HTTPStatusError):
+                await e.response.aclose()
+            await slot.aclose()
+            self.metrics_finish(metrics, error=e)
 
             # Check if this is an auth error and we can retry
             if not _is_retry and self._refresh_callback and is_auth_error(e):
@@ -226,93 +737,27 @@ class ClientCore:
                 if refreshed is not None:
                     return refreshed
 
-            if isinstance(e, httpx.HTTPStatusError):
-                status = e.response.status_code
-                logger.error(
-                    "RPC %s failed after %.3fs: HTTP %s",
-                    method.name,
-                    elapsed,
-                    status,
-                )
-
-                # Map HTTP status codes to appropriate exception types
-                if status == 429:
-                    # Rate limiting - extract retry-after if available
-                    retry_after = None
-                    retry_after_header = e.response.headers.get("retry-after")
-                    if retry_after_header:
-                        try:
-                            retry_after = int(retry_after_header)
-                        except ValueError:
-                            pass
-                    msg = f"API rate limit exceeded calling {method.name}"
-                    if retry_after:
-                        msg += f". Retry after {retry_after} seconds"
-                    raise RateLimitError(msg, rpc_id=method.value, retry_after=retry_after) from e
-
-                if 500 <= status < 600:
-                    raise ServerError(
-                        f"Server error {status} calling {method.name}: {e.response.reason_phrase}",
-                        rpc_id=method.value,
-                        status_code=status,
-                    ) from e
-
-                if 400 <= status < 500 and status not in (401, 403):
-                    raise ClientError(
-                        f"Client error {status} calling {method.name}: {e.response.reason_phrase}",
-                        rpc_id=method.value,
-                        status_code=status,
-                    ) from e
-
-                # 401/403 or other: Generic RPCError (handled by auth retry above)
-                raise RPCError(
-                    f"HTTP {status} calling {method.name}: {e.response.reason_phrase}",
-                    rpc_id=method.value,
-                ) from e
-
-            # Network/connection errors
-            else:
-                logger.error("RPC %s failed after %.3fs: %s", method.name, elapsed, e)
-
-                # Check ConnectTimeout first (more specific than general TimeoutException)
-                if isinstance(e, httpx.ConnectTimeout):
-                    raise NetworkError(
-                        f"Connection timed out calling {method.name}: {e}",
-                        rpc_id=method.value,
-                        original_error=e,
-                    ) from e
-
-                # Timeout errors (general timeouts, not connection timeouts)
-                if isinstance(e, httpx.TimeoutException):
-                    raise RPCTimeoutError(
-                        f"Request timed out calling {method.name}",
-                        rpc_id=method.value,
-                        timeout_seconds=self._timeout,
-                        original_error=e,
-                    ) from e
-
-                # Connection errors (DNS, network unavailable, etc., excluding ConnectTimeout)
-                if isinstance(e, httpx.ConnectError):
-                    raise NetworkError(
-                        f"Connection failed calling {method.name}: {e}",
-                        rpc_id=method.value,
-                        original_error=e,
-                    ) from e
-
-                # Other request errors
-                raise NetworkError(
-                    f"Request failed calling {method.name}: {e}",
-                    rpc_id=method.value,
-                    original_error=e,
-                ) from e
+            raise self._map_http_error(e, method.name, method.value, elapsed) from e
 
         try:
-            result = decode_response(response.text, method.value, allow_null=allow_null)
+            if self._stream_responses:
+                # Closing early drops the unread tail (usually just trailer chunks)
+                try:
+                    result = await decode_response_stream(
+                        response.aiter_bytes(), method.value, allow_null=allow_null
+                    )
+                finally:
+                    await response.aclose()
+                    await slot.aclose()
+            else:
+                result = decode_response(response.text, method.value, allow_null=allow_null)
             elapsed = time.perf_counter() - start
             logger.debug("RPC %s completed in %.3fs", method.name, elapsed)
+            self.metrics_finish(metrics, response)
             return result
         except RPCError as e:
             elapsed = time.perf_counter() - start
+            self.metrics_finish(metrics, response, error=e)
 
             # Check if this is an auth error and we can retry
             if not _is_retry and self._refresh_callback and is_auth_error(e):
@@ -324,46 +769,234 @@ class ClientCore:
 
             logger.error("RPC %s failed after %.3fs", method.name, elapsed)
             raise
+        except httpx.RequestError as e:
+            # Streaming mode: the body read failed part-way through
+            elapsed = time.perf_counter() - start
+            self.metrics_finish(metrics, response, error=e)
+            raise self._map_http_error(e, method.name, method.value, elapsed) from e
         except Exception as e:
             elapsed = time.perf_counter() - start
+            self.metrics_finish(metrics, response, error=e)
             logger.error("RPC %s failed after %.3fs: %s", method.name, elapsed, e)
             raise RPCError(
                 f"Failed to decode response for {method.name}: {e}",
                 rpc_id=method.value,
             ) from e
 
-    async def _try_refresh_and_retry(
+    async def rpc_batch(
         self,
-        method: RPCMethod,
-        params: list[Any],
-        source_path: str,
-        allow_null: bool,
-        original_error: Exception,
-    ) -> Any | None:
-        """Attempt to refresh auth tokens and retry the RPC call.
-
-        Uses a shared task pattern to ensure only one refresh operation runs
-        at a time. Concurrent callers wait on the same task, preventing
-        redundant refresh calls under high concurrency.
+        calls: Sequence["RPCCall | tuple[RPCMethod, list[Any]]"],
+        source_path: str = "/",
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Make several RPC calls in a single batchexecute round trip.
+
+        The calls are packed into one request with a comma-joined ``rpcids``
+        query parameter, and the response is split back out per call. All
+        calls share the same ``source_path``, so batch calls that target the
+        same notebook.
+
+        Automatically refreshes authentication tokens and retries the whole
+        batch once if an auth failure is detected and a refresh_callback was
+        provided. If a retry_policy was provided, a failure of the batch
+        request as a whole is retried when every call in it is safe to
+        replay; per-call errors in a delivered response are not retried.
+        Batch responses are always buffered (stream_responses does not
+        apply) and never served from the response_cache, but a batch
+        containing a mutation invalidates the cache like rpc_call() does.
 
         Args:
-            method: The RPC method to retry.
-            params: Original parameters.
-            source_path: Original source path.
-            allow_null: Original allow_null setting.
-            original_error: The auth error that triggered this retry.
+            calls: RPCCall objects or (method, params) tuples, in order.
+            source_path: The source path parameter (usually /notebook/{id}).
+            return_exceptions: If True, per-call RPCErrors are returned in
+                place of results instead of being raised.
 
         Returns:
-            The RPC result if retry succeeds, None if refresh failed.
+            List of decoded results aligned with ``calls``.
 
         Raises:
-            The original error (with refresh error as cause) if refresh fails.
+            RuntimeError: If client is not initialized (not in context manager).
+            RPCError: If the HTTP request fails, or (unless return_exceptions
+                is True) the first per-call error in request order.
+
+        Example:
+            notebook, artifacts = await core.rpc_batch(
+                [
+                    RPCCall(RPCMethod.GET_NOTEBOOK, [notebook_id, None, [2], None, 0]),
+                    RPCCall(RPCMethod.LIST_ARTIFACTS, [[2], notebook_id], allow_null=True),
+                ],
+                source_path=f"/notebook/{notebook_id}",
+            )
         """
-        logger.info(
-            "RPC %s auth error detected, attempting token refresh",
-            method.name,
+        if not self._http_client:
+            raise RuntimeError("Client not initialized. Use 'async with' context.")
+
+        batch = [c if isinstance(c, RPCCall) else RPCCall(*c) for c in calls]
+        if not batch:
+            return []
+
+        if len(batch) == 1:
+            # A batch of one is a plain call; keep the regular "generic" envelope
+            call = batch[0]
+            try:
+                result = await self.rpc_call(call.method, call.params, source_path, call.allow_null)
+            except RPCError as e:
+                if not return_exceptions:
+                    raise
+                return [e]
+            return [result]
+
+        try:
+            results = await self._rpc_batch_with_retries(batch, source_path)
+        finally:
+            if any(c.method not in READ_ONLY_METHODS for c in batch):
+                self._forget_reads(source_path)
+
+        errors = [r for r in results if isinstance(r, RPCError)]
+        if errors and not return_exceptions:
+            raise errors[0]
+        return results
+
+    async def _rpc_batch_with_retries(self, batch: list[RPCCall], source_path: str) -> list[Any]:
+        """Send a batch, retrying transient failures per the retry policy.
+
+        See rpc_batch() for arguments. Returns results with per-call errors
+        in place.
+        """
+        policy = self._retry_policy
+        if policy is None:
+            return await self._rpc_batch_once(batch, source_path)
+
+        first_attempt = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return await self._rpc_batch_once(batch, source_path, _retries=attempt - 1)
+            except RPCError as e:
+                delay = None
+                if all(policy.is_retry_safe(c.method, e) for c in batch):
+                    delay = policy.next_delay(
+                        batch[0].method, e, attempt, time.monotonic() - first_attempt
+                    )
+                if delay is None:
+                    raise
+                logger.warning(
+                    "RPC batch failed (%s), retrying in %.1fs (attempt %d of %d)",
+                    type(e).__name__,
+                    delay,
+                    attempt + 1,
+                    policy.attempts_for(e),
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _rpc_batch_once(
+        self,
+        batch: list[RPCCall],
+        source_path: str,
+        _is_retry: bool = False,
+        _retries: int = 0,
+    ) -> list[Any]:
+        """Send a batch once (plus the auth refresh retry).
+
+        See rpc_batch() for arguments. Returns results with per-call errors
+        in place.
+        """
+        if not self._http_client:
+            raise RuntimeError("Client not initialized. Use 'async with' context.")
+
+        start = time.perf_counter()
+        label = f"batch[{','.join(c.method.name for c in batch)}]"
+        rpcids = ",".join(c.method.value for c in batch)
+        logger.debug("RPC %s starting", label)
+
+        url = self._build_url_for_ids(rpcids, source_path)
+        rpc_request = encode_rpc_batch([(c.method, c.params) for c in batch])
+        body = build_request_body(rpc_request, self.auth.csrf_token)
+        metrics = self.metrics_start(label, source_path, body, _retries + (1 if _is_retry else 0))
+
+        try:
+            async with self.throttle(*(c.method for c in batch)):
+                if metrics is not None:
+                    response = await self._http_client.post(
+                        url, content=body, extensions=metrics.extensions
+                    )
+                    metrics.record(response)
+                else:
+                    response = await self._http_client.post(url, content=body)
+            response.raise_for_status()
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            elapsed = time.perf_counter() - start
+            self.metrics_finish(metrics, error=e)
+
+            if not _is_retry and self._refresh_callback and is_auth_error(e):
+                await self._await_token_refresh(label, e)
+                return await self._rpc_batch_once(batch, source_path, _is_retry=True)
+
+            raise self._map_http_error(e, label, rpcids, elapsed) from e
+
+        try:
+            results = decode_batch_response(
+                response.text,
+                [(c.method.value, str(i)) for i, c in enumerate(batch, start=1)],
+                allow_null=[c.allow_null for c in batch],
+            )
+        except RPCError as e:
+            self.metrics_finish(metrics, response, error=e)
+            logger.error("RPC %s failed after %.3fs", label, time.perf_counter() - start)
+            raise
+        except Exception as e:
+            self.metrics_finish(metrics, response, error=e)
+            logger.error("RPC %s failed after %.3fs: %s", label, time.perf_counter() - start, e)
+            raise RPCError(
+                f"Failed to decode response for {label}: {e}",
+                rpc_id=rpcids,
+            ) from e
+
+        self.metrics_finish(metrics, response)
+        errors = [r for r in results if isinstance(r, RPCError)]
+        if (
+            errors
+            and not _is_retry
+            and self._refresh_callback
+            and any(is_auth_error(e) for e in errors)
+        ):
+            await self._await_token_refresh(label, errors[0])
+            return await self._rpc_batch_once(batch, source_path, _is_retry=True)
+
+        elapsed = time.perf_counter() - start
+        logger.debug(
+            "RPC %s completed in %.3fs (%d/%d failed)", label, elapsed, len(errors), len(batch)
         )
+        return results
+
+    def batch(self, source_path: str = "/") -> "RPCBatch":
+        """Collect RPC calls and send them as one batchexecute request.
 
+        Args:
+            source_path: The source path shared by every call in the batch.
+
+        Returns:
+            An RPCBatch async context manager. Calls added inside the block
+            are sent together when the block exits.
+
+        Example:
+            async with core.batch(source_path=f"/notebook/{notebook_id}") as batch:
+                notebook = batch.add(RPCMethod.GET_NOTEBOOK, [notebook_id, None, [2], None, 0])
+                notes = batch.add(RPCMethod.GET_NOTES_AND_MIND_MAPS, [notebook_id])
+            data = notebook.result()
+        """
+        return RPCBatch(self, source_path)
+
+    async def _refresh_tokens(self, label: str) -> None:
+        """Run the refresh callback, joining any refresh already in flight.
+
+        Args:
+            label: What triggered the refresh (for logging).
+
+        Raises:
+            Whatever the refresh callback raised.
+        """
         # This function is only called when _refresh_callback is set
         assert self._refresh_callback is not None
 
@@ -377,7 +1010,7 @@ class ClientCore:
             if self._refresh_task is not None and not self._refresh_task.done():
                 # Another refresh is in progress, wait on it
                 refresh_task = self._refresh_task
-                logger.debug("Waiting on existing refresh task for RPC %s", method.name)
+                logger.debug("Waiting on existing refresh task for %s", label)
             else:
                 # Start a new refresh task
                 # Cast needed: Awaitable → Coroutine for create_task (async funcs return coroutines)
@@ -385,9 +1018,46 @@ class ClientCore:
                 self._refresh_task = asyncio.create_task(coro)
                 refresh_task = self._refresh_task
 
-        # Await refresh outside the lock so other callers can join
+        # Await refresh outside the lock so other callers can join. Shielded so
+        # a cancelled caller doesn't cancel the refresh the others are waiting on.
+        await asyncio.shield(refresh_task)
+
+    async def _refresh_tokens_periodically(self) -> None:
+        """Background task: refresh tokens whenever they reach token_refresh_interval."""
+        interval = self._token_refresh_interval
+        assert interval is not None
+        while True:
+            delay = self._auth_refreshed_at + interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await self._refresh_tokens("scheduled refresh")
+                logger.debug("Auth tokens refreshed in the background")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Background token refresh failed: %s", e)
+                await asyncio.sleep(min(interval, TOKEN_REFRESH_RETRY_DELAY))
+
+    async def _await_token_refresh(self, label: str, original_error: Exception) -> None:
+        """Refresh auth tokens, joining any refresh already in flight.
+
+        Uses a shared task pattern to ensure only one refresh operation runs
+        at a time. Concurrent callers wait on the same task, preventing
+        redundant refresh calls under high concurrency.
+
+        Args:
+            label: Name of the call that triggered the refresh (for logging).
+            original_error: The auth error that triggered the refresh.
+
+        Raises:
+            The original error (with refresh error as cause) if refresh fails.
+        """
+        logger.info("RPC %s auth error detected, attempting token refresh", label)
+
         try:
-            await refresh_task
+            await self._refresh_tokens(label)
         except Exception as refresh_error:
             logger.warning("Token refresh failed: %s", refresh_error)
             raise original_error from refresh_error
@@ -396,11 +1066,132 @@ class ClientCore:
         if self._refresh_retry_delay > 0:
             await asyncio.sleep(self._refresh_retry_delay)
 
-        logger.info("Token refresh successful, retrying RPC %s", method.name)
+        logger.info("Token refresh successful, retrying RPC %s", label)
+
+    async def _try_refresh_and_retry(
+        self,
+        method: RPCMethod,
+        params: list[Any],
+        source_path: str,
+        allow_null: bool,
+        original_error: Exception,
+    ) -> Any | None:
+        """Attempt to refresh auth tokens and retry the RPC call.
+
+        Args:
+            method: The RPC method to retry.
+            params: Original parameters.
+            source_path: Original source path.
+            allow_null: Original allow_null setting.
+            original_error: The auth error that triggered this retry.
+
+        Returns:
+            The RPC result if retry succeeds, None if refresh failed.
+
+        Raises:
+            The original error (with refresh error as cause) if refresh fails.
+        """
+        await self._await_token_refresh(method.name, original_error)
 
         # Retry with refreshed tokens
         return await self.rpc_call(method, params, source_path, allow_null, _is_retry=True)
 
+    def metrics_start(
+        self,
+        method: str,
+        source_path: str = "/",
+        request_body: str | bytes | None = None,
+        retries: int = 0,
+        request_bytes: int | None = None,
+    ) -> RequestMetrics | None:
+        """Report a request to the metrics hooks, if any, and start timing it.
+
+        Args:
+            method: RPC method name or request label.
+            source_path: Notebook path the request targets.
+            request_body: The request body, if sent in one piece.
+            retries: Number of earlier attempts of the same call.
+            request_bytes: Request size; defaults to the length of request_body.
+
+        Returns:
+            The metrics record to pass to metrics_finish(), or None if no
+            hook is configured.
+        """
+        if self._instrumentation is None:
+            return None
+        if request_bytes is None:
+            request_bytes = len(request_body) if request_body is not None else 0
+        return self._instrumentation.start(
+            method, source_path, request_bytes, retries, request_body
+        )
+
+    def metrics_finish(
+        self,
+        metrics: RequestMetrics | None,
+        response: httpx.Response | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Report a request started with metrics_start() as completed or failed."""
+        if metrics is not None and self._instrumentation is not None:
+            self._instrumentation.finish(metrics, response, error)
+
+    @asynccontextmanager
+    async def measure(
+        self,
+        method: str,
+        source_path: str = "/",
+        request_body: str | bytes | None = None,
+        request_bytes: int | None = None,
+    ) -> AsyncIterator[RequestMetrics]:
+        """Report the request made inside this block to the metrics hooks.
+
+        Pass ``metrics.extensions`` to the request and call
+        ``record(response)`` on the yielded object once the response is
+        available. Exceptions raised in the block are reported as errors.
+
+        Args:
+            method: Label for the request, e.g. RateGovernor.CHAT.
+            source_path: Notebook path the request targets.
+            request_body: The request body, if sent in one piece.
+            request_bytes: Request size; defaults to the length of request_body.
+        """
+        metrics = self.metrics_start(method, source_path, request_body, request_bytes=request_bytes)
+        if metrics is None:
+            yield RequestMetrics(method)  # Not reported anywhere
+            return
+        try:
+            yield metrics
+        except BaseException as e:
+            self.metrics_finish(metrics, error=e)
+            raise
+        self.metrics_finish(metrics)
+
+    @contextmanager
+    def fresh_reads(self) -> Iterator[None]:
+        """Bypass cached results for RPCs made inside this block.
+
+        Fresh results still refresh the cache. Used by status polling loops,
+        which must observe changes as soon as the server reports them.
+        """
+        token = _fresh_reads.set(True)
+        try:
+            yield
+        finally:
+            _fresh_reads.reset(token)
+
+    def throttle(self, *keys: str) -> AbstractAsyncContextManager[None]:
+        """Return a context manager that holds a rate governor slot for one request.
+
+        Wrap only the HTTP exchange itself, so auth refresh and retries made
+        while handling the response do not wait on a slot this request holds.
+
+        Args:
+            *keys: RPC methods, or RateGovernor.CHAT/UPLOAD/DOWNLOAD.
+        """
+        if self._rate_governor is None:
+            return nullcontext()
+        return self._rate_governor.acquire(*keys)
+
     def get_http_client(self) -> httpx.AsyncClient:
         """Get the underlying HTTP client for direct requests.
 
@@ -416,6 +1207,47 @@ class ClientCore:
             raise RuntimeError("Client not initialized. Use 'async with' context.")
         return self._http_client
 
+    def get_upload_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the resumable upload host.
+
+        Created on first use and kept open until close(), so consecutive
+        uploads reuse connections. Requests must send their own Cookie header.
+
+        Raises:
+            RuntimeError: If client is not initialized.
+        """
+        if not self._http_client:
+            raise RuntimeError("Client not initialized. Use 'async with' context.")
+        if self._upload_client is None:
+            self._upload_client = httpx.AsyncClient(
+                transport=PooledTransport(limits=self._limits, http2=self._http2),
+                timeout=self._timeout,
+            )
+        return self._upload_client
+
+    def get_download_client(self) -> httpx.AsyncClient:
+        """Get the pooled, cookie-aware HTTP client for artifact downloads.
+
+        Created on first use with domain-scoped cookies from storage (see
+        load_httpx_cookies()) so redirects across Google content hosts stay
+        authenticated. Kept open until close().
+
+        Raises:
+            RuntimeError: If client is not initialized.
+            FileNotFoundError: If the storage file doesn't exist.
+            ValueError: If required cookies are missing.
+        """
+        if not self._http_client:
+            raise RuntimeError("Client not initialized. Use 'async with' context.")
+        if self._download_client is None:
+            self._download_client = httpx.AsyncClient(
+                transport=PooledTransport(limits=self._limits, http2=self._http2),
+                cookies=load_httpx_cookies(),
+                follow_redirects=True,
+                timeout=self._timeout,
+            )
+        return self._download_client
+
     def cache_conversation_turn(
         self, conversation_id: str, query: str, answer: str, turn_number: int
     ) -> None:
@@ -0,0 +1,183 @@
+"""Client-side rate governor for NotebookLM requests."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A token bucket rate: ``rate`` requests per second with bursts up to ``burst``.
+
+    Attributes:
+        rate: Sustained requests per second.
+        burst: Maximum requests allowed back-to-back after an idle period.
+    """
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError(f"rate must be positive, got {self.rate}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations in arrival order.
+
+    reserve() always takes a token immediately, letting the balance go
+    negative, and returns how long the caller must wait before using it.
+    Later callers queue behind earlier ones, so waiting is first-come
+    first-served without holding a lock while sleeping.
+    """
+
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(float(self.limit.burst), self._tokens + elapsed * self.limit.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before it is valid."""
+        self._refill(time.monotonic())
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.limit.rate
+
+    def refund(self) -> None:
+        """Return a reserved token (used when a waiter is cancelled)."""
+        self._refill(time.monotonic())
+        self._tokens = min(float(self.limit.burst), self._tokens + 1)
+
+
+class RateGovernor:
+    """Paces requests so one account stays under Google's quota.
+
+    Every request passes through acquire() with one or more keys: the RPC
+    method for batchexecute calls, or CHAT, UPLOAD and DOWNLOAD for the other
+    endpoints. A request waits for a token from the global bucket, from the
+    bucket of each key that has a limit, and for a free in-flight slot.
+    Waiters are served in arrival order instead of failing.
+
+    Share one governor between clients that use the same account so their
+    requests are paced together.
+
+    Example:
+        governor = RateGovernor(
+            global_limit=RateLimit(rate=5, burst=10),
+            method_limits={RPCMethod.LIST_ARTIFACTS: RateLimit(rate=1, burst=2)},
+            max_in_flight=8,
+        )
+        async with await NotebookLMClient.from_storage(rate_governor=governor) as client:
+            ...
+    """
+
+    CHAT = "chat"
+    UPLOAD = "upload"
+    DOWNLOAD = "download"
+
+    def __init__(
+        self,
+        global_limit: RateLimit | None = None,
+        method_limits: Mapping[str, RateLimit] | None = None,
+        default_method_limit: RateLimit | None = None,
+        max_in_flight: int | None = None,
+    ):
+        """Initialize the governor.
+
+        Args:
+            global_limit: Limit shared by all requests. None for no global limit.
+            method_limits: Per-key limits, keyed by RPCMethod or by CHAT,
+                UPLOAD or DOWNLOAD.
+            default_method_limit: Limit for keys without an entry in
+                method_limits (each key gets its own bucket). None for no limit.
+            max_in_flight: Maximum concurrent requests. None for no cap.
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+
+        self._global = TokenBucket(global_limit) if global_limit else None
+        self._method_limits = dict(method_limits or {})
+        self._default_method_limit = default_method_limit
+        self._buckets: dict[str, TokenBucket] = {}
+        self._max_in_flight = max_in_flight
+        self._slots = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self._in_flight = 0
+        self._requests = 0
+        self._throttled = 0
+        self._wait_seconds = 0.0
+
+    def _bucket_for(self, key: str) -> TokenBucket | None:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            limit = self._method_limits.get(key, self._default_method_limit)
+            if limit is None:
+                return None
+            bucket = self._buckets[key] = TokenBucket(limit)
+        return bucket
+
+    @asynccontextmanager
+    async def acquire(self, *keys: str) -> AsyncIterator[None]:
+        """Wait until a request for ``keys`` may be sent, and hold a slot while it runs.
+
+        Args:
+            *keys: RPC methods (or CHAT/UPLOAD/DOWNLOAD) covered by the request.
+                A multiplexed batch passes every method it contains.
+        """
+        buckets = [b for b in (self._bucket_for(k) for k in dict.fromkeys(keys)) if b]
+        if self._global:
+            buckets.append(self._global)
+
+        start = time.monotonic()
+        delay = max((b.reserve() for b in buckets), default=0.0)
+        try:
+            if delay > 0:
+                logger.debug("Rate governor delaying %s by %.2fs", ",".join(keys), delay)
+                await asyncio.sleep(delay)
+            if self._slots is not None:
+                await self._slots.acquire()
+        except asyncio.CancelledError:
+            # Never sent, so give the reserved tokens back
+            for bucket in buckets:
+                bucket.refund()
+            raise
+        waited = time.monotonic() - start
+        self._requests += 1
+        if waited > 0.001:
+            self._throttled += 1
+            self._wait_seconds += waited
+
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Counters: requests admitted, requests that had to wait, total wait seconds."""
+        return {
+            "requests": self._requests,
+            "throttled": self._throttled,
+            "wait_seconds": self._wait_seconds,
+            "in_flight": self._in_flight,
+        }
@@ -0,0 +1,272 @@
+"""Instrumentation hooks for requests made by the client."""
+
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestMetrics:
+    """Measurements for one HTTP request made by the client.
+
+    Attributes:
+        method: RPC method name (e.g. "LIST_NOTEBOOKS"), "batch[A,B]" for a
+            multiplexed batch, or "chat", "upload", "download".
+        source_path: Notebook path the request targets ("/" if none).
+        request_bytes: Size of the request body (file size for uploads).
+        response_bytes: Bytes received (0 until the response arrives).
+        latency: Seconds from sending the request until the response was
+            decoded or the error was raised (0.0 in on_request).
+        status_code: HTTP status, or None if no response was received.
+        retries: Number of earlier attempts of the same call.
+        error: The exception, for on_error.
+        connect: Seconds spent opening the TCP/TLS connection (0.0 if a
+            pooled connection was reused, None if unknown).
+        ttfb: Seconds from sending the request headers until the response
+            headers arrived (None if unknown).
+        download: Seconds spent reading the response body (None if unknown).
+        decode: Seconds from receiving the response until the request
+            finished, i.e. parsing (None if no response was received).
+        request_body: The request body, when it was sent in one piece.
+    """
+
+    method: str
+    source_path: str = "/"
+    request_bytes: int = 0
+    response_bytes: int = 0
+    latency: float = 0.0
+    status_code: int | None = None
+    retries: int = 0
+    error: BaseException | None = None
+    connect: float | None = None
+    ttfb: float | None = None
+    download: float | None = None
+    decode: float | None = None
+    request_body: str | bytes | None = field(default=None, repr=False, compare=False)
+    _start: float = field(default=0.0, repr=False, compare=False)
+    _received: float = field(default=0.0, repr=False, compare=False)
+    _response: httpx.Response | None = field(default=None, repr=False, compare=False)
+    _marks: dict[str, float] = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def response(self) -> httpx.Response | None:
+        """The HTTP response, once received."""
+        return self._response
+
+    @property
+    def extensions(self) -> dict[str, Any]:
+        """httpx request extensions that time the connection phases.
+
+        Empty for requests that are not being reported, so unmonitored
+        requests pay nothing for tracing.
+        """
+        return {"trace": self._trace} if self._start else {}
+
+    async def _trace(self, event: str, info: dict[str, Any]) -> None:
+        # Event names look like "connection.connect_tcp.started" or
+        # "http11.receive_response_headers.complete"; keep the first of each
+        self._marks.setdefault(event.partition(".")[2], time.perf_counter())
+
+    def _phase(self, started: str, completed: str) -> float | None:
+        if started in self._marks and completed in self._marks:
+            return self._marks[completed] - self._marks[started]
+        return None
+
+    def record(self, response: httpx.Response) -> None:
+        """Attach the HTTP response; status and size are read when the request finishes."""
+        self._response = response
+        self._received = time.perf_counter()
+
+    def _finish(self, response: httpx.Response | None) -> None:
+        now = time.perf_counter()
+        self.latency = now - self._start
+        if response is not None and not self._received:
+            self._received = now
+        if self._received:
+            self.decode = now - self._received
+        self.connect = self._phase("connect_tcp.started", "start_tls.complete")
+        if self.connect is None:
+            self.connect = self._phase("connect_tcp.started", "connect_tcp.complete")
+        if self.connect is None and "send_request_headers.started" in self._marks:
+            self.connect = 0.0  # Reused a pooled connection
+        self.ttfb = self._phase("send_request_headers.started", "receive_response_headers.complete")
+        self.download = self._phase(
+            "receive_response_body.started", "receive_response_body.complete"
+        )
+
+
+class MetricsHook:
+    """Base class for request instrumentation.
+
+    Subclass and override any of the callbacks, then pass an instance as
+    ``NotebookLMClient(metrics=...)``. Callbacks run inline on the event loop,
+    so keep them cheap; exceptions they raise are logged and ignored.
+
+    Example:
+        class StatsdHook(MetricsHook):
+            def on_response(self, m: RequestMetrics) -> None:
+                statsd.timing(f"notebooklm.{m.method}", m.latency * 1000)
+    """
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        """Called before a request is sent."""
+
+    def on_response(self, metrics: RequestMetrics) -> None:
+        """Called after a request completed successfully."""
+
+    def on_error(self, metrics: RequestMetrics) -> None:
+        """Called after a request failed (HTTP, network or RPC error)."""
+
+
+class Instrumentation:
+    """Helper that times one request and reports it to one or more MetricsHooks."""
+
+    def __init__(self, *hooks: MetricsHook):
+        self.hooks = hooks
+
+    def _emit(self, callback: str, metrics: RequestMetrics) -> None:
+        for hook in self.hooks:
+            method: Callable[[RequestMetrics], None] = getattr(hook, callback)
+            try:
+                method(metrics)
+            except Exception:
+                logger.exception("Metrics hook %s failed", method.__qualname__)
+
+    def start(
+        self,
+        method: str,
+        source_path: str = "/",
+        request_bytes: int = 0,
+        retries: int = 0,
+        request_body: str | bytes | None = None,
+    ) -> RequestMetrics:
+        """Report a request as started and return its metrics record."""
+        metrics = RequestMetrics(
+            method=method,
+            source_path=source_path,
+            request_bytes=request_bytes,
+            retries=retries,
+            request_body=request_body,
+        )
+        self._emit("on_request", metrics)
+        metrics._start = time.perf_counter()
+        return metrics
+
+    def finish(
+        self,
+        metrics: RequestMetrics,
+        response: httpx.Response | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Report a request as completed (or failed, if ``error`` is given)."""
+        if response is None:
+            response = metrics._response
+        if response is None and isinstance(error, httpx.HTTPStatusError):
+            response = error.response
+        metrics._finish(response)
+        if response is not None:
+            metrics._response = response
+            metrics.status_code = response.status_code
+            metrics.response_bytes = response.num_bytes_downloaded
+        if error is None:
+            self._emit("on_response", metrics)
+        else:
+            metrics.error = error
+            self._emit("on_error", metrics)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class _MethodStats:
+    count: int = 0
+    errors: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    latencies: deque[float] = field(default_factory=deque)
+
+
+class MetricsAggregator(MetricsHook):
+    """In-memory per-method latency and error statistics.
+
+    Keeps the most recent ``window`` latencies per method for percentiles;
+    counts and byte totals cover every request.
+
+    Example:
+        metrics = MetricsAggregator()
+        async with await NotebookLMClient.from_storage(metrics=metrics) as client:
+            ...
+        for method, s in metrics.summary().items():
+            print(f"{method}: p50={s['p50']:.3f}s p99={s['p99']:.3f}s errors={s['error_rate']:.1%}")
+    """
+
+    def __init__(self, window: int = 10_000):
+        """Initialize the aggregator.
+
+        Args:
+            window: Latency samples kept per method for percentile estimates.
+        """
+        self.window = window
+        self._methods: dict[str, _MethodStats] = {}
+
+    def _stats(self, method: str) -> _MethodStats:
+        stats = self._methods.get(method)
+        if stats is None:
+            stats = self._methods[method] = _MethodStats(latencies=deque(maxlen=self.window))
+        return stats
+
+    def _record(self, metrics: RequestMetrics) -> _MethodStats:
+        stats = self._stats(metrics.method)
+        stats.count += 1
+        stats.request_bytes += metrics.request_bytes
+        stats.response_bytes += metrics.response_bytes
+        stats.latencies.append(metrics.latency)
+        return stats
+
+    def on_response(self, metrics: RequestMetrics) -> None:
+        self._record(metrics)
+
+    def on_error(self, metrics: RequestMetrics) -> None:
+        self._record(metrics).errors += 1
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Return per-method statistics.
+
+        Returns:
+            Dict mapping method to count, errors, error_rate, p50, p95, p99
+            and total_seconds (over the latency window), request_bytes and
+            response_bytes. Methods with the most total time come first.
+        """
+        result = {}
+        for method, stats in self._methods.items():
+            latencies = sorted(stats.latencies)
+            result[method] = {
+                "count": stats.count,
+                "errors": stats.errors,
+                "error_rate": stats.errors / stats.count if stats.count else 0.0,
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "p99": _percentile(latencies, 99),
+                "total_seconds": sum(latencies),
+                "request_bytes": stats.request_bytes,
+                "response_bytes": stats.response_bytes,
+            }
+        return dict(sorted(result.items(), key=lambda item: -item[1]["total_seconds"]))
+
+    def reset(self) -> None:
+        """Discard all collected statistics."""
+        self._methods.clear()
@@ -0,0 +1,275 @@
+"""Spread NotebookLM work across several Google accounts."""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, TypeVar
+
+from .auth import AuthTokens
+from .client import NotebookLMClient
+from .rpc import AuthError, RateLimitError
+from .types import Notebook
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Strategy = Literal["least_loaded", "round_robin"]
+
+# Default seconds an account is skipped after a rate limit or auth failure
+DEFAULT_COOLDOWN = 60.0
+
+# Cap for the cooldown after repeated consecutive failures
+MAX_COOLDOWN = 900.0
+
+
+@dataclass
+class AccountHealth:
+    """Load and health counters for one account in a NotebookLMClientPool.
+
+    Attributes:
+        name: Account label (the storage file name, or "account-N").
+        in_flight: Calls currently running on the account.
+        requests: Calls completed on the account.
+        rate_limits: RateLimitErrors seen.
+        auth_failures: AuthErrors seen.
+        consecutive_failures: Rate limit/auth failures since the last success.
+        cooldown_until: time.monotonic() value until which the account is
+            skipped, or 0.0 if it is available.
+    """
+
+    name: str
+    in_flight: int = 0
+    requests: int = 0
+    rate_limits: int = 0
+    auth_failures: int = 0
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0
+
+    @property
+    def cooling_down(self) -> bool:
+        """Whether the account is currently skipped after a failure."""
+        return self.cooldown_until > time.monotonic()
+
+
+class NotebookLMClientPool:
+    """Distributes calls over several accounts, each with its own client.
+
+    Each call leases an account: by default the one with the fewest calls in
+    flight, or the next one in turn with ``strategy="round_robin"``. Accounts
+    that hit a RateLimitError or AuthError are skipped for a cooldown period
+    that doubles with each consecutive failure. Notebooks belong to the account
+    that created them, so once a notebook is bound to an account (automatically
+    for notebooks returned from run(), or with bind()) every call for that
+    notebook goes to the same account.
+
+    Example:
+        async with await NotebookLMClientPool.from_storage(
+            ["work.json", "personal.json"]
+        ) as pool:
+            nb = await pool.run(lambda c: c.notebooks.create("Report"))
+            await pool.run(
+                lambda c: c.artifacts.generate_audio(nb.id), notebook_id=nb.id
+            )
+    """
+
+    def __init__(
+        self,
+        clients: Sequence[NotebookLMClient],
+        strategy: Strategy = "least_loaded",
+        cooldown: float = DEFAULT_COOLDOWN,
+        names: Sequence[str] | None = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            clients: One client per account. The pool opens and closes them.
+            strategy: "least_loaded" (fewest calls in flight) or "round_robin".
+            cooldown: Seconds an account is skipped after its first rate limit
+                or auth failure. Doubles with each consecutive failure, up to
+                15 minutes. A longer retry_after from the server wins.
+            names: Optional labels for the accounts, used in logs and health().
+
+        Raises:
+            ValueError: If clients is empty, names has the wrong length, or
+                strategy is unknown.
+        """
+        if not clients:
+            raise ValueError("NotebookLMClientPool needs at least one client")
+        if strategy not in ("least_loaded", "round_robin"):
+            raise ValueError(f"Unknown strategy: {strategy!r}")
+        if names is not None and len(names) != len(clients):
+            raise ValueError("names must have one entry per client")
+
+        self._clients = list(clients)
+        self._health = [
+            AccountHealth(name=names[i] if names else f"account-{i}") for i in range(len(clients))
+        ]
+        self._strategy = strategy
+        self._cooldown = cooldown
+        self._turn = itertools.count()
+        self._affinity: dict[str, int] = {}
+        self._exit_stack: AsyncExitStack | None = None
+
+    @classmethod
+    async def from_storage(
+        cls,
+        paths: Sequence[str | Path],
+        strategy: Strategy = "least_loaded",
+        cooldown: float = DEFAULT_COOLDOWN,
+        **kwargs: Any,
+    ) -> "NotebookLMClientPool":
+        """Create a pool with one client per Playwright storage state file.
+
+        Args:
+            paths: storage_state.json files, one per account.
+            strategy: "least_loaded" or "round_robin".
+            cooldown: Seconds to skip an account after a failure.
+            **kwargs: Options passed to every NotebookLMClient()
+                (e.g., timeout=60, retry_policy=RetryPolicy()).
+
+        Returns:
+            NotebookLMClientPool instance (not yet connected).
+        """
+        storage_paths = [Path(p) for p in paths]
+        auths = await asyncio.gather(*(AuthTokens.from_storage(p) for p in storage_paths))
+        return cls(
+            [NotebookLMClient(auth, **kwargs) for auth in auths],
+            strategy=strategy,
+            cooldown=cooldown,
+            names=[p.stem for p in storage_paths],
+        )
+
+    async def __aenter__(self) -> "NotebookLMClientPool":
+        async with AsyncExitStack() as stack:
+            for client in self._clients:
+                await stack.enter_async_context(client)
+            self._exit_stack = stack.pop_all()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every client in the pool."""
+        if self._exit_stack is not None:
+            stack, self._exit_stack = self._exit_stack, None
+            await stack.aclose()
+
+    @property
+    def clients(self) -> list[NotebookLMClient]:
+        """The clients in the pool, one per account."""
+        return list(self._clients)
+
+    def health(self) -> list[AccountHealth]:
+        """Snapshot of load and health counters for each account."""
+        return [AccountHealth(**vars(h)) for h in self._health]
+
+    def bind(self, notebook_id: str, client: NotebookLMClient) -> None:
+        """Route all future calls for notebook_id to client's account.
+
+        Args:
+            notebook_id: Notebook owned by the client's account.
+            client: A client from this pool.
+
+        Raises:
+            ValueError: If client is not part of the pool.
+        """
+        for index, candidate in enumerate(self._clients):
+            if candidate is client:
+                self._affinity[notebook_id] = index
+                return
+        raise ValueError("client is not part of this pool")
+
+    def client_for(self, notebook_id: str) -> NotebookLMClient | None:
+        """Return the client bound to notebook_id, or None if unbound."""
+        index = self._affinity.get(notebook_id)
+        return self._clients[index] if index is not None else None
+
+    def _pick(self) -> int:
+        """Choose an account, preferring ones that aren't cooling down."""
+        available = [i for i, h in enumerate(self._health) if not h.cooling_down]
+        if not available:
+            # Everyone is cooling down: use whoever recovers first
+            return min(range(len(self._health)), key=lambda i: self._health[i].cooldown_until)
+        if self._strategy == "round_robin":
+            return available[next(self._turn) % len(available)]
+        return min(available, key=lambda i: self._health[i].in_flight)
+
+    def _record_failure(self, health: AccountHealth, retry_after: float | None) -> None:
+        health.consecutive_failures += 1
+        cooldown = min(self._cooldown * 2 ** (health.consecutive_failures - 1), MAX_COOLDOWN)
+        if retry_after is not None:
+            cooldown = max(cooldown, retry_after)
+        health.cooldown_until = time.monotonic() + cooldown
+        logger.warning("Account %s cooling down for %.0fs", health.name, cooldown)
+
+    @asynccontextmanager
+    async def lease(self, notebook_id: str | None = None) -> AsyncIterator[NotebookLMClient]:
+        """Borrow a client for a block of calls.
+
+        Waits out the cooldown if the chosen account is cooling down (the
+        notebook's account if it is bound, otherwise every account).
+        RateLimitError and AuthError raised inside the block put the account
+        into cooldown before propagating.
+
+        Args:
+            notebook_id: Notebook the calls are for. Bound notebooks always
+                go to their account.
+
+        Yields:
+            The leased NotebookLMClient.
+        """
+        bound = self._affinity.get(notebook_id) if notebook_id else None
+        index = bound if bound is not None else self._pick()
+        health = self._health[index]
+
+        # Reserve the slot before sleeping so concurrent leases spread out
+        health.in_flight += 1
+        try:
+            wait = health.cooldown_until - time.monotonic()
+            if wait > 0:
+                logger.debug("Waiting %.1fs for account %s to cool down", wait, health.name)
+                await asyncio.sleep(wait)
+            yield self._clients[index]
+        except RateLimitError as e:
+            health.rate_limits += 1
+            self._record_failure(health, e.retry_after)
+            raise
+        except AuthError:
+            health.auth_failures += 1
+            self._record_failure(health, None)
+            raise
+        else:
+            health.consecutive_failures = 0
+        finally:
+            health.in_flight -= 1
+            health.requests += 1
+
+    async def run(
+        self,
+        call: Callable[[NotebookLMClient], Awaitable[T]],
+        notebook_id: str | None = None,
+    ) -> T:
+        """Run call(client) on a leased client.
+
+        A Notebook returned by the call is bound to the account that created
+        it, so follow-up calls with its ID reach the right account.
+
+        Args:
+            call: Coroutine function taking a NotebookLMClient.
+            notebook_id: Notebook the call is for, if any.
+
+        Returns:
+            Whatever call returned.
+        """
+        async with self.lease(notebook_id) as client:
+            result = await call(client)
+        if isinstance(result, Notebook):
+            self.bind(result.id, client)
+        return result
@@ -0,0 +1,220 @@
+"""In-memory flight recorder of recent requests for performance forensics."""
+
+import contextlib
+import dataclasses
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+import httpx
+
+from ._metrics import MetricsHook, RequestMetrics
+from .rpc import codec
+
+logger = logging.getLogger(__name__)
+
+# Records spooled by this variable keep request/response bodies with only the
+# CSRF token redacted, so the spool file is written owner-only
+RECORDER_ENV = "NOTEBOOKLM_FLIGHT_RECORDER"
+DEFAULT_CAPACITY = 256
+DEFAULT_BODY_LIMIT = 2048
+
+# The CSRF token travels in the form body as "at=..."
+_CSRF_PARAM = re.compile(r"(^|&)at=[^&]*")
+
+
+@dataclass
+class FlightRecord:
+    """One recorded request.
+
+    Timings are in seconds; phases that could not be measured are None
+    (see RequestMetrics). Bodies are truncated to the recorder's
+    ``body_limit`` bytes and have the CSRF token redacted.
+    """
+
+    timestamp: float
+    method: str
+    source_path: str
+    outcome: str
+    status_code: int | None
+    error: str | None
+    retries: int
+    request_bytes: int
+    response_bytes: int
+    latency: float
+    connect: float | None
+    ttfb: float | None
+    download: float | None
+    decode: float | None
+    request_body: str | None
+    response_body: str | None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return dataclasses.asdict(self)
+
+
+def _truncate(body: str | bytes | None, limit: int) -> str | None:
+    """Keep at most ``limit`` UTF-8 bytes of a body, never splitting a character."""
+    if body is None:
+        return None
+    data = body.encode("utf-8") if isinstance(body, str) else body
+    cut = min(limit, len(data))
+    # Back off over continuation bytes (0b10xxxxxx) to a character boundary
+    while 0 < cut < len(data) and data[cut] & 0xC0 == 0x80:
+        cut -= 1
+    text = data[:cut].decode("utf-8", errors="replace")
+    if cut < len(data):
+        text += f"...[{len(data) - cut} more bytes]"
+    return text
+
+
+class FlightRecorder(MetricsHook):
+    """Keep the last ``capacity`` requests in a fixed-size ring buffer.
+
+    Each record holds the method, connect/TTFB/download/decode timings,
+    sizes, outcome and truncated request/response bodies. Memory use is
+    bounded by ``capacity * 2 * body_limit`` plus a small per-record
+    overhead.
+
+    Only the CSRF token is redacted: the bodies keep notebook content such
+    as source text, questions and answers, so treat dumps as private.
+
+    Example:
+        recorder = FlightRecorder(capacity=500)
+        async with await NotebookLMClient.from_storage(flight_recorder=recorder) as client:
+            ...
+        recorder.dump("flight.jsonl")
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, body_limit: int = DEFAULT_BODY_LIMIT):
+        """Initialize the recorder.
+
+        Args:
+            capacity: Maximum number of records kept (oldest dropped first).
+            body_limit: Maximum bytes (UTF-8) kept of each request and response body.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.capacity = capacity
+        self.body_limit = body_limit
+        self._records: deque[FlightRecord] = deque(maxlen=capacity)
+
+    @classmethod
+    def from_env(cls) -> "FlightRecorder | None":
+        """Create a recorder if NOTEBOOKLM_FLIGHT_RECORDER is set.
+
+        The variable may be "1"/"true" for the default capacity or a number
+        of records to keep. Returns None if unset or "0".
+        """
+        value = os.environ.get(RECORDER_ENV, "").strip().lower()
+        if value in ("", "0", "false", "no"):
+            return None
+        if value in ("1", "true", "yes"):
+            return cls()
+        try:
+            return cls(capacity=int(value))
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", RECORDER_ENV, value)
+            return None
+
+    def _response_body(self, response: httpx.Response | None) -> str | None:
+        if response is None:
+            return None
+        try:
+            return _truncate(response.content, self.body_limit)
+        except httpx.ResponseNotRead:
+            return None  # Streamed response, consumed incrementally
+
+    def _record(self, metrics: RequestMetrics, outcome: str) -> None:
+        request_body = metrics.request_body
+        if isinstance(request_body, str):
+            request_body = _CSRF_PARAM.sub(r"\1at=REDACTED", request_body)
+        error = metrics.error
+        self._records.append(
+            FlightRecord(
+                timestamp=time.time() - metrics.latency,
+                method=metrics.method,
+                source_path=metrics.source_path,
+                outcome=outcome,
+                status_code=metrics.status_code,
+                error=f"{type(error).__name__}: {error}" if error is not None else None,
+                retries=metrics.retries,
+                request_bytes=metrics.request_bytes,
+                response_bytes=metrics.response_bytes,
+                latency=metrics.latency,
+                connect=metrics.connect,
+                ttfb=metrics.ttfb,
+                download=metrics.download,
+                decode=metrics.decode,
+                request_body=_truncate(request_body, self.body_limit),
+                response_body=self._response_body(metrics.response),
+            )
+        )
+
+    def on_response(self, metrics: RequestMetrics) -> None:
+        self._record(metrics, "ok")
+
+    def on_error(self, metrics: RequestMetrics) -> None:
+        self._record(metrics, "error")
+
+    def records(self) -> list[FlightRecord]:
+        """Return the recorded requests, oldest first."""
+        return list(self._records)
+
+    def clear(self) -> None:
+        """Discard all records."""
+        self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def dump(self, file: str | Path | TextIO | None = None) -> int:
+        """Write the records as JSON Lines, oldest first.
+
+        Args:
+            file: Path or text stream to write to. Defaults to stdout.
+
+        Returns:
+            Number of records written.
+        """
+        lines = [codec.dumps(record.to_dict()) + "\n" for record in self._records]
+        if file is None:
+            sys.stdout.writelines(lines)
+        elif isinstance(file, (str, Path)):
+            Path(file).write_text("".join(lines), encoding="utf-8")
+        else:
+            file.writelines(lines)
+        return len(lines)
+
+    def spool(self, path: Path) -> None:
+        """Append the records to a JSONL file, keeping only the newest ``capacity`` lines.
+
+        Used to carry records across processes (e.g. CLI invocations) for
+        ``notebooklm debug dump``. The file is created owner-only (0600) since
+        it holds request and response bodies. Clears the in-memory buffer.
+        """
+        if not self._records:
+            return
+        lines: deque[str] = deque(maxlen=self.capacity)
+        if path.exists():
+            lines.extend(path.read_text(encoding="utf-8").splitlines(keepends=True))
+        lines.extend(codec.dumps(record.to_dict()) + "\n" for record in self._records)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+        self._records.clear()
@@ -0,0 +1,128 @@
+"""Retry policy for transient RPC failures."""
+
+import logging
+import random
+from dataclasses import dataclass, field
+
+import httpx
+
+from ._cache import READ_ONLY_METHODS
+from .rpc import NetworkError, RateLimitError, RPCMethod, RPCTimeoutError, ServerError
+
+logger = logging.getLogger(__name__)
+
+# Methods that can be replayed without changing server state beyond the first
+# successful call: every read, plus "set to value" updates. Creates, generation
+# requests, imports and deletes are excluded so they are never blindly replayed.
+IDEMPOTENT_METHODS: frozenset[RPCMethod] = READ_ONLY_METHODS | {
+    RPCMethod.RENAME_NOTEBOOK,
+    RPCMethod.UPDATE_SOURCE,
+    RPCMethod.UPDATE_NOTE,
+    RPCMethod.RENAME_ARTIFACT,
+    RPCMethod.SHARE_NOTEBOOK,
+    RPCMethod.REMOVE_RECENTLY_VIEWED,
+}
+
+# Total attempts (including the first) per error class; subclasses not listed
+# inherit the limit of their closest listed base class
+DEFAULT_MAX_ATTEMPTS: dict[type[Exception], int] = {
+    RateLimitError: 5,
+    ServerError: 4,
+    RPCTimeoutError: 3,
+    NetworkError: 3,
+}
+
+
+def _never_reached_server(error: Exception) -> bool:
+    """True if the request was rejected before the server could act on it."""
+    if isinstance(error, RateLimitError):
+        return True
+    if isinstance(error, NetworkError):
+        return isinstance(error.original_error, (httpx.ConnectError, httpx.ConnectTimeout))
+    return False
+
+
+@dataclass
+class RetryPolicy:
+    """Retry configuration for transient RPC failures.
+
+    Delays use exponential backoff with full jitter: attempt ``n`` sleeps a
+    random time in ``[0, min(max_delay, base_delay * 2 ** (n - 1))]``. A
+    RateLimitError's ``retry_after`` is treated as a lower bound.
+
+    Only idempotent methods are retried after server errors, timeouts or
+    dropped connections. Rate limits and failed connects are retried for any
+    method, because the server never acted on the request.
+
+    Attributes:
+        max_attempts: Total attempts (including the first) per error class.
+            Errors whose class is not covered are not retried.
+        base_delay: Backoff base in seconds.
+        max_delay: Upper bound for a single backoff delay in seconds.
+        max_elapsed: Total retry-time budget in seconds, measured from the
+            first attempt. A retry whose delay would exceed it is not made.
+            None disables the budget.
+        idempotent_methods: Methods that are safe to replay.
+
+    Example:
+        policy = RetryPolicy(
+            max_attempts={RateLimitError: 8, ServerError: 3},
+            max_elapsed=600,
+        )
+        async with await NotebookLMClient.from_storage(retry_policy=policy) as client:
+            ...
+    """
+
+    max_attempts: dict[type[Exception], int] = field(
+        default_factory=lambda: dict(DEFAULT_MAX_ATTEMPTS)
+    )
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    max_elapsed: float | None = 300.0
+    idempotent_methods: frozenset[RPCMethod] = IDEMPOTENT_METHODS
+
+    def attempts_for(self, error: Exception) -> int:
+        """Return the maximum number of attempts allowed for this error."""
+        for cls in type(error).__mro__:
+            if cls in self.max_attempts:
+                return self.max_attempts[cls]
+        return 1
+
+    def is_retry_safe(self, method: RPCMethod, error: Exception) -> bool:
+        """Return True if replaying ``method`` after ``error`` cannot duplicate work."""
+        return method in self.idempotent_methods or _never_reached_server(error)
+
+    def backoff(self, attempt: int, error: Exception) -> float:
+        """Return the delay in seconds before retry number ``attempt`` (1-based)."""
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = random.uniform(0, cap)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after:
+            delay = max(delay, float(retry_after))
+        return delay
+
+    def next_delay(
+        self, method: RPCMethod, error: Exception, attempt: int, elapsed: float
+    ) -> float | None:
+        """Decide whether to retry after a failed attempt.
+
+        Args:
+            method: The RPC method that failed.
+            error: The error raised by the attempt.
+            attempt: Number of attempts made so far (1 after the first failure).
+            elapsed: Seconds since the first attempt started.
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up.
+        """
+        if attempt >= self.attempts_for(error):
+            return None
+        if not self.is_retry_safe(method, error):
+            logger.debug("Not retrying non-idempotent RPC %s after %s", method.name, error)
+            return None
+
+        delay = self.backoff(attempt, error)
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            logger.debug("Retry budget exhausted for RPC %s", method.name)
+            return None
+        return delay
@@ -10,11 +10,10 @@ from time import monotonic
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
-import httpx
-
 from ._core import ClientCore
+from ._governor import RateGovernor
 from ._url_utils import is_youtube_url
-from .rpc import UPLOAD_URL, RPCError, RPCMethod
+from .rpc import UPLOAD_URL, RPCError, RPCMethod, codec
 from .rpc.types import SourceStatus, source_type_code_to_str
 from .types import (
     Source,
@@ -211,7 +210,8 @@ class SourcesAPI:
             if elapsed >= timeout:
                 raise SourceTimeoutError(source_id, timeout, last_status)
 
-            source = await self.get(notebook_id, source_id)
+            with self._core.fresh_reads():
+                source = await self.get(notebook_id, source_id)
 
             if source is None:
                 raise SourceNotFoundError(source_id)
@@ -910,8 +910,6 @@ class SourcesAPI:
         source_id: str,
     ) -> str:
         """Start a resumable upload session and get the upload URL."""
-        import json
-
         url = f"{UPLOAD_URL}?authuser=0"
 
         headers = {
@@ -926,7 +924,7 @@ class SourcesAPI:
             "x-goog-upload-protocol": "resumable",
         }
 
-        body = json.dumps(
+        body = codec.dumps(
             {
                 "PROJECT_ID": notebook_id,
                 "SOURCE_NAME": filename,
@@ -934,15 +932,26 @@ class SourcesAPI:
             }
         )
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers, content=body)
+        client = self._core.get_upload_client()
+        async with self._core.measure(
+            RateGovernor.UPLOAD, f"/notebook/{notebook_id}", body
+        ) as metrics:
+            async with self._core.throttle(RateGovernor.UPLOAD):
+                response = await client.post(
+                    url,
+                    headers=headers,
+                    content=body,
+                    timeout=60.0,
+                    extensions=metrics.extensions,
+                )
+            metrics.record(response)
             response.raise_for_status()
 
-            upload_url = response.headers.get("x-goog-upload-url")
-            if not upload_url:
-                raise ValueError("Failed to get upload URL from response headers")
+        upload_url = response.headers.get("x-goog-upload-url")
+        if not upload_url:
+            raise ValueError("Failed to get upload URL from response headers")
 
-            return upload_url
+        return upload_url
 
     async def _upload_file_streaming(self, upload_url: str, file_path: Path) -> None:
         """Stream upload file content to the resumable upload URL.
@@ -971,6 +980,17 @@ class SourcesAPI:
                 while chunk := f.read(65536):  # 64KB chunks
                     yield chunk
 
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.post(upload_url, headers=headers, content=file_stream())
+        client = self._core.get_upload_client()
+        async with self._core.measure(
+            RateGovernor.UPLOAD, request_bytes=file_path.stat().st_size
+        ) as metrics:
+            async with self._core.throttle(RateGovernor.UPLOAD):
+                response = await client.post(
+                    upload_url,
+                    headers=headers,
+                    content=file_stream(),
+                    timeout=300.0,
+                    extensions=metrics.extensions,
+                )
+            metrics.record(response)
             response.raise_for_status()
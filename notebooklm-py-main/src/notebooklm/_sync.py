@@ -0,0 +1,199 @@
+"""Blocking facade over NotebookLMClient for synchronous code."""
+
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+from collections.abc import Coroutine
+from pathlib import Path
+from typing import Any, TypeVar
+
+from ._recorder import FlightRecorder
+from ._transport import ConnectionStats
+from .auth import AuthTokens
+from .client import NotebookLMClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _EventLoopThread:
+    """An event loop running forever in a daemon thread."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="notebooklm-sync", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run coro on the loop and block until it finishes."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "SyncNotebookLMClient cannot be called from its own event loop "
+                "(e.g. from a callback); use the async client there"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def stop(self) -> None:
+        """Stop the loop, wait for the thread and close the loop."""
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class _SyncAPI:
+    """Blocking proxy for one sub-API: coroutine methods run on the client's loop.
+
+    Async iterator methods (e.g. artifacts.wait_for_many) block until
+    exhausted and return a list of everything they yielded.
+    """
+
+    def __init__(self, api: Any, runner: _EventLoopThread):
+        self._api = api
+        self._runner = runner
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if inspect.isasyncgenfunction(attr):
+
+            @functools.wraps(attr)
+            def collect(*args: Any, **kwargs: Any) -> list[Any]:
+                async def drain() -> list[Any]:
+                    return [item async for item in attr(*args, **kwargs)]
+
+                return self._runner.run(drain())
+
+            return collect
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def blocking(*args: Any, **kwargs: Any) -> Any:
+            return self._runner.run(attr(*args, **kwargs))
+
+        return blocking
+
+    def __dir__(self) -> list[str]:
+        return dir(self._api)
+
+    def __repr__(self) -> str:
+        return f"<sync {type(self._api).__name__}>"
+
+
+async def _open_client(auth: AuthTokens, kwargs: dict[str, Any]) -> NotebookLMClient:
+    client = NotebookLMClient(auth, **kwargs)
+    await client.__aenter__()
+    return client
+
+
+class SyncNotebookLMClient:
+    """Synchronous NotebookLM client for scripts, notebooks and WSGI workers.
+
+    Owns one event loop in a background thread and one open NotebookLMClient,
+    so connections, tokens, caches and rate limits persist across calls
+    instead of being rebuilt by an asyncio.run() per call. Every sub-API
+    method has the same signature as on NotebookLMClient but blocks and
+    returns the result (async iterators return a list). Safe to call from several threads; calls run
+    concurrently on the loop. Callbacks passed to the client run on the
+    loop's thread.
+
+    Example:
+        with SyncNotebookLMClient.from_storage() as client:
+            notebooks = client.notebooks.list()
+            result = client.chat.ask(notebooks[0].id, "Summarize this")
+    """
+
+    def __init__(self, auth: AuthTokens, **kwargs: Any):
+        """Open a client for the given tokens.
+
+        Args:
+            auth: Authentication tokens from browser login.
+            **kwargs: Options passed to NotebookLMClient()
+                (e.g., timeout=60, retry_policy=RetryPolicy()).
+        """
+        self._connect(_EventLoopThread(), auth, kwargs)
+
+    @classmethod
+    def from_storage(cls, path: str | Path | None = None, **kwargs: Any) -> "SyncNotebookLMClient":
+        """Open a client from a Playwright storage state file.
+
+        Args:
+            path: Path to storage_state.json. If None, uses default location
+                  (~/.notebooklm/storage_state.json).
+            **kwargs: Options passed to NotebookLMClient().
+
+        Returns:
+            Connected SyncNotebookLMClient.
+        """
+        runner = _EventLoopThread()
+        try:
+            auth = runner.run(AuthTokens.from_storage(Path(path) if path else None))
+        except BaseException:
+            runner.stop()
+            raise
+        client = cls.__new__(cls)
+        client._connect(runner, auth, kwargs)
+        return client
+
+    def _connect(self, runner: _EventLoopThread, auth: AuthTokens, kwargs: dict[str, Any]) -> None:
+        self._runner = runner
+        try:
+            # Build the client on the loop so its locks and tasks belong to it
+            self._client = runner.run(_open_client(auth, kwargs))
+        except BaseException:
+            runner.stop()
+            raise
+        self.notebooks = _SyncAPI(self._client.notebooks, runner)
+        self.sources = _SyncAPI(self._client.sources, runner)
+        self.notes = _SyncAPI(self._client.notes, runner)
+        self.artifacts = _SyncAPI(self._client.artifacts, runner)
+        self.chat = _SyncAPI(self._client.chat, runner)
+        self.research = _SyncAPI(self._client.research, runner)
+        self.settings = _SyncAPI(self._client.settings, runner)
+
+    def __enter__(self) -> "SyncNotebookLMClient":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the client and stop its event loop thread. Safe to call twice."""
+        if self._runner.loop.is_closed():
+            return
+        try:
+            self._runner.run(self._client.__aexit__(None, None, None))
+        finally:
+            self._runner.stop()
+            logger.debug("Closed synchronous NotebookLM client")
+
+    @property
+    def auth(self) -> AuthTokens:
+        """Get the authentication tokens."""
+        return self._client.auth
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the client is connected."""
+        return self._client.is_connected
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Connection-reuse counters for the batchexecute and chat connection pool."""
+        return self._client.connection_stats
+
+    @property
+    def flight_recorder(self) -> FlightRecorder | None:
+        """The flight recorder of recent requests, if enabled."""
+        return self._client.flight_recorder
+
+    def refresh_auth(self) -> AuthTokens:
+        """Refresh the CSRF token and session ID (see NotebookLMClient.refresh_auth)."""
+        return self._runner.run(self._client.refresh_auth())
@@ -0,0 +1,86 @@
+"""Pooled HTTP transport with connection-reuse accounting."""
+
+import weakref
+from dataclasses import dataclass
+
+import httpx
+
+# Tuned for many small concurrent RPCs against a single host: keep enough idle
+# connections around for a busy poller, and keep them long enough to span the
+# gaps between polls (httpx defaults to 5 seconds).
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+@dataclass
+class ConnectionStats:
+    """Counters describing how requests were spread over connections.
+
+    Attributes:
+        requests: Responses received through the transport.
+        new_connections: Requests that were the first on their connection.
+        reused_connections: Requests sent on an already-used connection.
+        http2_requests: Requests served over HTTP/2.
+    """
+
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    http2_requests: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of tracked requests that reused a connection (0.0 if none)."""
+        tracked = self.new_connections + self.reused_connections
+        return self.reused_connections / tracked if tracked else 0.0
+
+
+class PooledTransport(httpx.AsyncHTTPTransport):
+    """AsyncHTTPTransport that records connection reuse in ConnectionStats.
+
+    Connections are identified by the ``network_stream`` response extension
+    that httpcore attaches to every response. Responses without it (e.g. from
+    mocked transports) only count towards ``requests``.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        **kwargs,
+    ):
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "HTTP/2 support requires the 'h2' package. "
+                    'Install it with: pip install "notebooklm-py[http2]"'
+                ) from None
+        super().__init__(limits=limits, http2=http2, **kwargs)
+        self.stats = ConnectionStats()
+        self._seen: weakref.WeakSet = weakref.WeakSet()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await super().handle_async_request(request)
+        stats = self.stats
+        stats.requests += 1
+
+        extensions = response.extensions
+        if extensions.get("http_version") == b"HTTP/2":
+            stats.http2_requests += 1
+
+        stream = extensions.get("network_stream")
+        if stream is not None:
+            try:
+                if stream in self._seen:
+                    stats.reused_connections += 1
+                else:
+                    self._seen.add(stream)
+                    stats.new_connections += 1
+            except TypeError:  # stream type does not support weak references
+                pass
+        return response
@@ -8,7 +8,11 @@ This module provides authentication utilities for the NotebookLM client:
 2. **Token Extraction**: Fetches CSRF (SNlM0e) and session (FdrFJe) tokens from
    the NotebookLM homepage, required for all RPC calls.
 
-3. **Download Cookies**: Provides httpx-compatible cookies with domain info for
+3. **Token Cache**: Keeps fetched tokens in token_cache.json next to the
+   storage file, keyed by a hash of the cookies, so startup can skip the
+   homepage fetch. Stale tokens are replaced by the client's auth refresh.
+
+4. **Download Cookies**: Provides httpx-compatible cookies with domain info for
    authenticated downloads from Google content servers.
 
 Usage:
@@ -17,31 +21,43 @@ Usage:
     async with NotebookLMClient(auth) as client:
         ...
 
-    # For authenticated downloads
-    cookies = load_httpx_cookies()
-    async with httpx.AsyncClient(cookies=cookies) as client:
-        response = await client.get(url)
+    # Authenticated downloads go through the client's pooled, cookie-aware
+    # download client (built from load_httpx_cookies() on first use)
+    async with await NotebookLMClient.from_storage() as client:
+        await client.artifacts.download_audio(notebook_id, "overview.mp4")
 
 Security Notes:
     - Storage state files contain sensitive session cookies
+    - The token cache holds the live CSRF token (SNlM0e) and session ID
+      (FdrFJe) in plaintext, keyed by a hash of the cookies; it is written
+      owner-only (0600) and should be protected like the storage file
     - Path traversal protection is enforced on all file operations
 """
 
+import asyncio
+import contextlib
+import hashlib
 import json
 import logging
 import os
 import re
-from dataclasses import dataclass
+import tempfile
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import httpx
 
 from ._url_utils import contains_google_auth_redirect, is_google_auth_redirect
-from .paths import get_storage_path
+from .paths import get_storage_path, get_token_cache_path
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached CSRF/session token pair is reused before refetching.
+# Tokens that go stale earlier are caught by the client's auth refresh.
+DEFAULT_TOKEN_CACHE_TTL = 3600.0
+
 # Minimum required cookies (must have at least SID for basic auth)
 MINIMUM_REQUIRED_COOKIES = {"SID"}
 
@@ -153,11 +169,14 @@ class AuthTokens:
         cookies: Dict of required Google auth cookies
         csrf_token: CSRF token (SNlM0e) extracted from page
         session_id: Session ID (FdrFJe) extracted from page
+        token_cache_path: Token cache file that refreshed tokens are written
+            back to, or None if tokens are not cached
     """
 
     cookies: dict[str, str]
     csrf_token: str
     session_id: str
+    token_cache_path: Path | None = field(default=None, repr=False, compare=False)
 
     @property
     def cookie_header(self) -> str:
@@ -169,15 +188,20 @@ class AuthTokens:
         return "; ".join(f"{k}={v}" for k, v in self.cookies.items())
 
     @classmethod
-    async def from_storage(cls, path: Path | None = None) -> "AuthTokens":
+    async def from_storage(
+        cls, path: Path | None = None, use_token_cache: bool = True
+    ) -> "AuthTokens":
         """Create AuthTokens from Playwright storage state file.
 
         This is the recommended way to create AuthTokens for programmatic use.
-        It loads cookies from storage and fetches CSRF/session tokens automatically.
+        It loads cookies from storage and fetches CSRF/session tokens automatically,
+        reusing tokens cached by an earlier call with the same cookies.
 
         Args:
             path: Path to storage_state.json. If None, uses default location
                   (~/.notebooklm/storage_state.json).
+            use_token_cache: If True (default), read and write the token cache
+                next to the storage file (see token_cache_path_for()).
 
         Returns:
             Fully initialized AuthTokens ready for API calls.
@@ -193,8 +217,21 @@ class AuthTokens:
                 notebooks = await client.list_notebooks()
         """
         cookies = load_auth_from_storage(path)
-        csrf_token, session_id = await fetch_tokens(cookies)
-        return cls(cookies=cookies, csrf_token=csrf_token, session_id=session_id)
+        cache_path = token_cache_path_for(path) if use_token_cache else None
+        tokens = None
+        if cache_path:
+            tokens = await asyncio.to_thread(load_cached_tokens, cookies, cache_path)
+        if tokens is None:
+            tokens = await fetch_tokens(cookies)
+            if cache_path:
+                await asyncio.to_thread(save_cached_tokens, cookies, *tokens, cache_path)
+        csrf_token, session_id = tokens
+        return cls(
+            cookies=cookies,
+            csrf_token=csrf_token,
+            session_id=session_id,
+            token_cache_path=cache_path,
+        )
 
 
 def _is_google_domain(domain: str) -> bool:
@@ -585,7 +622,9 @@ def load_httpx_cookies(path: Path | None = None) -> "httpx.Cookies":
     return cookies
 
 
-async def fetch_tokens(cookies: dict[str, str]) -> tuple[str, str]:
+async def fetch_tokens(
+    cookies: dict[str, str], client: httpx.AsyncClient | None = None
+) -> tuple[str, str]:
     """Fetch CSRF token and session ID from NotebookLM homepage.
 
     Makes an authenticated request to NotebookLM and extracts the required
@@ -593,6 +632,9 @@ async def fetch_tokens(cookies: dict[str, str]) -> tuple[str, str]:
 
     Args:
         cookies: Dict of Google auth cookies
+        client: Optional open HTTP client to send the request on, so an
+            existing connection pool is reused. If None, a temporary client
+            is created for this request.
 
     Returns:
         Tuple of (csrf_token, session_id)
@@ -601,31 +643,153 @@ async def fetch_tokens(cookies: dict[str, str]) -> tuple[str, str]:
         httpx.HTTPError: If request fails
         ValueError: If tokens cannot be extracted from response
     """
+    if client is None:
+        async with httpx.AsyncClient() as temporary_client:
+            return await fetch_tokens(cookies, temporary_client)
+
     logger.debug("Fetching CSRF and session tokens from NotebookLM")
     cookie_header = "; ".join(f"{k}={v}" for k, v in cookies.items())
 
-    async with httpx.AsyncClient() as client:
-        homepage_url = os.getenv("NOTEBOOKLM_HOMEPAGE_URL", "https://notebooklm.google.com/")
-        response = await client.get(
-            homepage_url,
-            headers={"Cookie": cookie_header},
-            follow_redirects=True,
-            timeout=30.0,
+    homepage_url = os.getenv("NOTEBOOKLM_HOMEPAGE_URL", "https://notebooklm.google.com/")
+    response = await client.get(
+        homepage_url,
+        headers={"Cookie": cookie_header},
+        follow_redirects=True,
+        timeout=30.0,
+    )
+    response.raise_for_status()
+
+    final_url = str(response.url)
+
+    # Check if we were redirected to login
+    if is_google_auth_redirect(final_url):
+        raise ValueError(
+            "Authentication expired or invalid. "
+            "Redirected to: " + final_url + "\n"
+            "Run 'notebooklm login' to re-authenticate."
         )
-        response.raise_for_status()
 
-        final_url = str(response.url)
+    csrf = extract_csrf_from_html(response.text, final_url)
+    session_id = extract_session_id_from_html(response.text, final_url)
 
-        # Check if we were redirected to login
-        if is_google_auth_redirect(final_url):
-            raise ValueError(
-                "Authentication expired or invalid. "
-                "Redirected to: " + final_url + "\n"
-                "Run 'notebooklm login' to re-authenticate."
-            )
+    logger.debug("Authentication tokens obtained successfully")
+    return csrf, session_id
+
+
+# =============================================================================
+# TOKEN CACHE
+# =============================================================================
+
+
+def token_cache_path_for(storage_path: Path | None = None) -> Path | None:
+    """Get the token cache file used with a storage file.
+
+    Args:
+        storage_path: Path to storage_state.json, or None for the default
+            location (or NOTEBOOKLM_AUTH_JSON).
+
+    Returns:
+        token_cache.json next to ``storage_path`` (or in NOTEBOOKLM_HOME),
+        or None if NOTEBOOKLM_TOKEN_CACHE is set to "0".
+    """
+    if os.environ.get("NOTEBOOKLM_TOKEN_CACHE", "").lower() in ("0", "false", "no"):
+        return None
+    if storage_path:
+        return Path(storage_path).with_name("token_cache.json")
+    return get_token_cache_path()
 
-        csrf = extract_csrf_from_html(response.text, final_url)
-        session_id = extract_session_id_from_html(response.text, final_url)
 
-        logger.debug("Authentication tokens obtained successfully")
-        return csrf, session_id
+def _cookie_fingerprint(cookies: dict[str, str]) -> str:
+    """Hash the cookies so the cache never stores their values."""
+    material = "\n".join(f"{name}={value}" for name, value in sorted(cookies.items()))
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _read_token_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(cache_path.read_text())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable token cache %s: %s", cache_path, e)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _is_fresh(entry: Any, now: float, ttl: float) -> bool:
+    try:
+        return now - float(entry["fetched_at"]) <= ttl
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+def load_cached_tokens(
+    cookies: dict[str, str], cache_path: Path, ttl: float = DEFAULT_TOKEN_CACHE_TTL
+) -> tuple[str, str] | None:
+    """Load a cached CSRF token and session ID for these cookies.
+
+    Args:
+        cookies: Dict of Google auth cookies the tokens were fetched with.
+        cache_path: Token cache file.
+        ttl: Maximum age of the cached tokens in seconds.
+
+    Returns:
+        Tuple of (csrf_token, session_id), or None if not cached or expired.
+    """
+    entry = _read_token_cache(cache_path).get(_cookie_fingerprint(cookies))
+    if not isinstance(entry, dict) or not _is_fresh(entry, time.time(), ttl):
+        return None
+    try:
+        csrf_token, session_id = str(entry["csrf_token"]), str(entry["session_id"])
+    except (KeyError, TypeError):
+        return None
+    logger.debug("Using cached authentication tokens from %s", cache_path)
+    return csrf_token, session_id
+
+
+def save_cached_tokens(
+    cookies: dict[str, str],
+    csrf_token: str,
+    session_id: str,
+    cache_path: Path,
+    ttl: float = DEFAULT_TOKEN_CACHE_TTL,
+) -> None:
+    """Store a CSRF token and session ID for these cookies.
+
+    Expired entries are dropped. Failures are logged, never raised, since
+    the cache is only an optimization.
+
+    Args:
+        cookies: Dict of Google auth cookies the tokens were fetched with.
+        csrf_token: CSRF token (SNlM0e).
+        session_id: Session ID (FdrFJe).
+        cache_path: Token cache file.
+        ttl: Age after which other entries are dropped.
+    """
+    now = time.time()
+    entries = {
+        key: entry
+        for key, entry in _read_token_cache(cache_path).items()
+        if _is_fresh(entry, now, ttl)
+    }
+    entries[_cookie_fingerprint(cookies)] = {
+        "csrf_token": csrf_token,
+        "session_id": session_id,
+        "fetched_at": now,
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp creates the file 0600, so the tokens are never readable by others
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(entries))
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.warning("Failed to write token cache %s: %s", cache_path, e)
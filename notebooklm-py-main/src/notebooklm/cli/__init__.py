@@ -11,71 +11,59 @@ Command groups are organized into separate modules:
 - session.py: Session and context commands (login, use, status, clear)
 - notebook.py: Notebook management commands (list, create, delete, rename, share, summary)
 - chat.py: Chat commands (ask, configure, history)
+- debug.py: Debugging commands (dump)
 
-Re-exports from helpers for backward compatibility with tests.
+Re-exports from helpers for backward compatibility with tests. All
+re-exports are imported on first access.
 """
 
-# Command groups (subcommand style)
-from .artifact import artifact
-from .chat import register_chat_commands
-from .download import download
-from .generate import generate
-from .helpers import (
-    # Display
-    ARTIFACT_TYPE_DISPLAY,
-    ARTIFACT_TYPE_MAP,
-    BROWSER_PROFILE_DIR,
-    # Context
-    CONTEXT_FILE,
-    clear_context,
-    # Console
-    console,
-    detect_source_type,
-    get_artifact_type_display,
-    get_auth_tokens,
-    # Auth
-    get_client,
-    get_current_conversation,
-    get_current_notebook,
-    get_source_type_display,
-    handle_auth_error,
-    # Errors
-    handle_error,
-    json_error_response,
-    # Output
-    json_output_response,
-    require_notebook,
-    resolve_artifact_id,
-    resolve_notebook_id,
-    resolve_source_id,
-    # Async
-    run_async,
-    set_current_conversation,
-    set_current_notebook,
-    # Decorators
-    with_client,
-)
-from .language import get_language, language
-from .note import note
-from .notebook import register_notebook_commands
-from .options import (
-    artifact_option,
-    generate_options,
-    json_option,
-    # Individual option decorators
-    notebook_option,
-    output_option,
-    source_option,
-    # Composite decorators
-    standard_options,
-    wait_option,
-)
-from .research import research
+import importlib
+from typing import Any
+
+# Names are resolved on first access (PEP 562) so that importing one command
+# module, e.g. from the lazy CLI group, doesn't import all of them.
+_LAZY_ATTRS = {
+    # Command groups (subcommand style)
+    "source": "source",
+    "artifact": "artifact",
+    "generate": "generate",
+    "download": "download",
+    "note": "note",
+    "skill": "skill",
+    "research": "research",
+    "language": "language",
+    "debug": "debug",
+    # Language config
+    "get_language": "language",
+    # Register functions (top-level command style)
+    "register_session_commands": "session",
+    "register_notebook_commands": "notebook",
+    "register_chat_commands": "chat",
+    # Option decorators
+    "notebook_option": "options",
+    "json_option": "options",
+    "wait_option": "options",
+    "source_option": "options",
+    "artifact_option": "options",
+    "output_option": "options",
+    "standard_options": "options",
+    "generate_options": "options",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Everything else in __all__ comes from helpers
+    module_name = _LAZY_ATTRS.get(name, "helpers" if name in __all__ else None)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# Register functions (top-level command style)
-from .session import register_session_commands
-from .skill import skill
-from .source import source
 
 __all__ = [
     # Command groups (subcommand style)
@@ -87,6 +75,7 @@ __all__ = [
     "skill",
     "research",
     "language",
+    "debug",
     # Language config
     "get_language",
     # Register functions (top-level command style)
@@ -0,0 +1,60 @@
+"""Debugging CLI commands.
+
+Commands:
+    dump    Write recently recorded requests as JSON Lines
+"""
+
+from pathlib import Path
+
+import click
+
+from .._recorder import RECORDER_ENV
+from ..paths import get_flight_recorder_path
+from .helpers import console
+
+
+@click.group()
+def debug():
+    """Inspect recorded client activity for troubleshooting."""
+    pass
+
+
+@debug.command("dump")
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write to this file instead of stdout",
+)
+@click.option("--clear", is_flag=True, help="Delete the recorded requests after dumping")
+def dump(output, clear):
+    """Write recently recorded requests as JSON Lines.
+
+    Each line holds one request: method, connect/TTFB/download/decode
+    timings, sizes, outcome and truncated request/response bodies. Only the
+    CSRF token is redacted; bodies can contain notebook content.
+
+    \b
+    Requests are only recorded while NOTEBOOKLM_FLIGHT_RECORDER is set:
+      NOTEBOOKLM_FLIGHT_RECORDER=1 notebooklm generate audio --wait
+      notebooklm debug dump -o flight.jsonl
+    """
+    path = get_flight_recorder_path()
+    if not path.exists():
+        click.echo(
+            f"No recorded requests. Set {RECORDER_ENV}=1 to record requests "
+            "made by subsequent commands.",
+            err=True,
+        )
+        return
+
+    content = path.read_text(encoding="utf-8")
+    if output:
+        Path(output).write_text(content, encoding="utf-8")
+        console.print(f"Wrote {len(content.splitlines())} requests to {output}")
+    else:
+        click.echo(content, nl=False)
+
+    if clear:
+        path.unlink()
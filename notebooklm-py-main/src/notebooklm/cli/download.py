@@ -12,6 +12,7 @@ Commands:
     flashcards   Download flashcard deck
 """
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Any, TypedDict
@@ -84,6 +85,7 @@ async def _download_artifacts_generic(
     dry_run: bool,
     force: bool,
     no_clobber: bool,
+    parallel: int = 1,
 ) -> dict:
     """
     Generic artifact download implementation.
@@ -108,6 +110,7 @@ async def _download_artifacts_generic(
         dry_run: Preview without downloading
         force: Overwrite existing files
         no_clobber: Skip if file exists
+        parallel: Maximum simultaneous downloads with download_all
 
     Returns:
         Result dictionary with operation details
@@ -119,6 +122,8 @@ async def _download_artifacts_generic(
         raise click.UsageError("Cannot specify both --latest and --earliest")
     if download_all and artifact_id:
         raise click.UsageError("Cannot specify both --all and --artifact")
+    if parallel < 1:
+        raise click.UsageError("--parallel must be at least 1")
 
     # Get notebook and auth
     nb_id = require_notebook(notebook)
@@ -221,15 +226,14 @@ async def _download_artifacts_generic(
 
                 output_dir.mkdir(parents=True, exist_ok=True)
 
-                results = []
+                results: list[dict[str, Any] | None] = []
+                pending: list[tuple[int, ArtifactDict, Path]] = []
                 existing_names: set[str] = set()
                 total = len(type_artifacts)
 
-                for i, artifact in enumerate(type_artifacts, 1):
-                    # Progress indicator
-                    if not json_output:
-                        console.print(f"[dim]Downloading {i}/{total}:[/dim] {artifact['title']}")
-
+                # Names and conflicts are settled up front so parallel
+                # downloads never race for the same path
+                for artifact in type_artifacts:
                     # Generate safe name
                     item_name = artifact_title_to_filename(
                         str(artifact["title"]),
@@ -255,40 +259,52 @@ async def _download_artifacts_generic(
                         )
                         continue
 
-                    # Update if auto-renamed
-                    item_path = resolved_path
-                    item_name = item_path.name
+                    # Placeholder, filled in once the download finishes
+                    pending.append((len(results), artifact, resolved_path))
+                    results.append(None)
 
-                    # Download
-                    try:
-                        # Download using dispatch
-                        await download_fn(nb_id, str(item_path), artifact_id=str(artifact["id"]))
+                slots = asyncio.Semaphore(parallel)
+                started = 0
 
-                        results.append(
-                            {
+                async def _fetch(index: int, artifact: ArtifactDict, item_path: Path) -> None:
+                    nonlocal started
+                    item_name = item_path.name
+                    async with slots:
+                        # Progress indicator
+                        started += 1
+                        if not json_output:
+                            console.print(
+                                f"[dim]Downloading {started}/{len(pending)}:[/dim] "
+                                f"{artifact['title']}"
+                            )
+                        try:
+                            # Download using dispatch
+                            await download_fn(
+                                nb_id, str(item_path), artifact_id=str(artifact["id"])
+                            )
+                            results[index] = {
                                 "id": artifact["id"],
                                 "title": artifact["title"],
                                 "filename": item_name,
                                 "path": str(item_path),
                                 "status": "downloaded",
                             }
-                        )
-                    except Exception as e:
-                        results.append(
-                            {
+                        except Exception as e:
+                            results[index] = {
                                 "id": artifact["id"],
                                 "title": artifact["title"],
                                 "filename": item_name,
                                 "status": "failed",
                                 "error": str(e),
                             }
-                        )
+
+                await asyncio.gather(*(_fetch(*item) for item in pending))
 
                 return {
                     "operation": "download_all",
                     "output_dir": str(output_dir),
                     "total": total,
-                    "results": results,
+                    "results": [r for r in results if r is not None],
                 }
 
             # Single artifact selection
@@ -378,6 +394,7 @@ def _execute_download(
     dry_run: bool,
     force: bool,
     no_clobber: bool,
+    parallel: int = 1,
 ) -> None:
     """Execute download and handle output display."""
     try:
@@ -399,6 +416,7 @@ def _execute_download(
                 dry_run=dry_run,
                 force=force,
                 no_clobber=no_clobber,
+                parallel=parallel,
             )
         )
 
@@ -486,6 +504,12 @@ def _display_download_result(result: dict, artifact_type: str) -> None:
 @click.option("--dry-run", is_flag=True, help="Preview without downloading")
 @click.option("--force", is_flag=True, help="Overwrite existing files")
 @click.option("--no-clobber", is_flag=True, help="Skip if file exists")
+@click.option(
+    "--parallel",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Downloads to run at once with --all (default: 1)",
+)
 @click.pass_context
 def download_audio(ctx, **kwargs):
     """Download audio overview(s) to file.
@@ -522,6 +546,12 @@ def download_audio(ctx, **kwargs):
 @click.option("--dry-run", is_flag=True, help="Preview without downloading")
 @click.option("--force", is_flag=True, help="Overwrite existing files")
 @click.option("--no-clobber", is_flag=True, help="Skip if file exists")
+@click.option(
+    "--parallel",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Downloads to run at once with --all (default: 1)",
+)
 @click.pass_context
 def download_video(ctx, **kwargs):
     """Download video overview(s) to file.
@@ -558,6 +588,12 @@ def download_video(ctx, **kwargs):
 @click.option("--dry-run", is_flag=True, help="Preview without downloading")
 @click.option("--force", is_flag=True, help="Overwrite existing files")
 @click.option("--no-clobber", is_flag=True, help="Skip if file exists")
+@click.option(
+    "--parallel",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Downloads to run at once with --all (default: 1)",
+)
 @click.pass_context
 def download_slide_deck(ctx, **kwargs):
     """Download slide deck(s) as PDF files.
@@ -594,6 +630,12 @@ def download_slide_deck(ctx, **kwargs):
 @click.option("--dry-run", is_flag=True, help="Preview without downloading")
 @click.option("--force", is_flag=True, help="Overwrite existing files")
 @click.option("--no-clobber", is_flag=True, help="Skip if file exists")
+@click.option(
+    "--parallel",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Downloads to run at once with --all (default: 1)",
+)
 @click.pass_context
 def download_infographic(ctx, **kwargs):
     """Download infographic(s) to file.
@@ -665,6 +707,12 @@ def _run_artifact_download(ctx, artifact_type: str, **kwargs) -> None:
 @click.option("--dry-run", is_flag=True, help="Preview without downloading")
 @click.option("--force", is_flag=True, help="Overwrite existing files")
 @click.option("--no-clobber", is_flag=True, help="Skip if file exists")
+@click.option(
+    "--parallel",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Downloads to run at once with --all (default: 1)",
+)
 @click.pass_context
 def download_report(ctx, **kwargs):
     """Download report(s) as markdown files.
@@ -701,6 +749,12 @@ def download_report(ctx, **kwargs):
 @click.option("--dry-run", is_flag=True, help="Preview without downloading")
 @click.option("--force", is_flag=True, help="Overwrite existing files")
 @click.option("--no-clobber", is_flag=True, help="Skip if file exists")
+@click.option(
+    "--parallel",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Downloads to run at once with --all (default: 1)",
+)
 @click.pass_context
 def download_mind_map(ctx, **kwargs):
     """Download mind map(s) as JSON files.
@@ -737,6 +791,12 @@ def download_mind_map(ctx, **kwargs):
 @click.option("--dry-run", is_flag=True, help="Preview without downloading")
 @click.option("--force", is_flag=True, help="Overwrite existing files")
 @click.option("--no-clobber", is_flag=True, help="Skip if file exists")
+@click.option(
+    "--parallel",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Downloads to run at once with --all (default: 1)",
+)
 @click.pass_context
 def download_data_table(ctx, **kwargs):
     """Download data table(s) as CSV files.
@@ -1,14 +1,93 @@
-"""Custom Click group with sectioned help output.
+"""Custom Click groups: lazy command loading and sectioned help output.
 
 Organizes CLI commands into logical sections for better discoverability.
 """
 
+import importlib
 from collections import OrderedDict
 
 import click
 
 
-class SectionedGroup(click.Group):
+class LazyGroup(click.Group):
+    """Click group that imports a command's module only when it is used.
+
+    ``lazy_commands`` maps command names to ``"module:attribute"``, or to a
+    ``("module:attribute", short_help)`` pair whose text is shown in the
+    group's help instead of importing the module to read it. The attribute
+    is either a click command, or a register function that adds several
+    commands to the group (e.g. register_session_commands); every name such
+    a function registers must be listed with it.
+
+    Example:
+        @click.group(
+            cls=LazyGroup,
+            lazy_commands={
+                "source": "notebooklm.cli.source:source",
+                "ask": ("notebooklm.cli.chat:register_chat_commands", "Ask a question."),
+            },
+        )
+        def cli(): ...
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_commands: dict[str, str | tuple[str, str]] | None = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, str] = {}
+        self.lazy_help: dict[str, str] = {}
+        for name, spec in (lazy_commands or {}).items():
+            if isinstance(spec, tuple):
+                spec, self.lazy_help[name] = spec
+            self.lazy_commands[name] = spec
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def listing_help(self, ctx, cmd_name, limit=45):
+        """Return the help listing text for a command, or None if it is hidden or unknown.
+
+        Uses the static text from ``lazy_commands`` when there is one, so
+        listing commands doesn't import them.
+        """
+        if cmd_name in self.lazy_help:
+            return self.lazy_help[cmd_name]
+        cmd = self.get_command(ctx, cmd_name)
+        if cmd is None or cmd.hidden:
+            return None
+        return cmd.get_short_help_str(limit=limit)
+
+    def format_commands(self, ctx, formatter):
+        """List commands using static help text where given, without importing them."""
+        rows = []
+        for name in self.list_commands(ctx):
+            help_text = self.listing_help(ctx, name, limit=formatter.width)
+            if help_text is not None:
+                rows.append((name, help_text))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load(self, cmd_name):
+        module_name, attr = self.lazy_commands[cmd_name].split(":")
+        target = getattr(importlib.import_module(module_name), attr)
+        if isinstance(target, click.Command):
+            self.add_command(target, cmd_name)
+        else:
+            target(self)
+        if cmd_name not in self.commands:
+            raise RuntimeError(f"{self.lazy_commands[cmd_name]} did not register {cmd_name!r}")
+
+
+class SectionedGroup(LazyGroup):
     """Click group that displays commands organized in sections.
 
     Instead of a flat alphabetical list, commands are grouped by function:
@@ -40,17 +119,21 @@ class SectionedGroup(click.Group):
     )
 
     def format_commands(self, ctx, formatter):
-        """Override to display commands in sections."""
-        commands = {name: self.get_command(ctx, name) for name in self.list_commands(ctx)}
+        """Override to display commands in sections.
+
+        Lazy commands are listed with their static help text (for command
+        groups, their subcommands), so ``--help`` imports no command modules.
+        """
+        names = self.list_commands(ctx)
 
         # Regular command sections (show help text)
         for section, cmd_names in self.command_sections.items():
             rows = []
             for name in cmd_names:
-                cmd = commands.get(name)
-                if cmd is not None and not cmd.hidden:
-                    help_text = cmd.get_short_help_str(limit=formatter.width)
-                    rows.append((name, help_text))
+                if name in names:
+                    help_text = self.listing_help(ctx, name, limit=formatter.width)
+                    if help_text is not None:
+                        rows.append((name, help_text))
             if rows:
                 with formatter.section(section):
                     formatter.write_dl(rows)
@@ -59,8 +142,10 @@ class SectionedGroup(click.Group):
         for section, group_names in self.command_groups.items():
             rows = []
             for name in group_names:
-                if name in commands:
-                    cmd = commands[name]
+                if name in self.lazy_help:
+                    rows.append((name, self.lazy_help[name]))
+                elif name in names:
+                    cmd = self.get_command(ctx, name)
                     if isinstance(cmd, click.Group):
                         subcmds = ", ".join(sorted(cmd.list_commands(ctx)))
                         rows.append((name, subcmds))
@@ -71,13 +156,12 @@ class SectionedGroup(click.Group):
         # Safety net: show any commands not in any section
         all_listed = set(sum(self.command_sections.values(), []))
         all_listed |= set(sum(self.command_groups.values(), []))
-        unlisted = [
-            (n, c)
-            for n, c in commands.items()
-            if n not in all_listed and c is not None and not c.hidden
-        ]
+        unlisted = []
+        for name in names:
+            if name not in all_listed:
+                help_text = self.listing_help(ctx, name, limit=formatter.width)
+                if help_text is not None:
+                    unlisted.append((name, help_text))
         if unlisted:
             with formatter.section("Other"):
-                formatter.write_dl(
-                    [(n, c.get_short_help_str(limit=formatter.width)) for n, c in unlisted]
-                )
+                formatter.write_dl(unlisted)
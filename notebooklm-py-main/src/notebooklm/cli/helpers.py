@@ -25,6 +25,9 @@ from ..auth import (
     AuthTokens,
     fetch_tokens,
     load_auth_from_storage,
+    load_cached_tokens,
+    save_cached_tokens,
+    token_cache_path_for,
 )
 from ..paths import get_browser_profile_dir, get_context_path
 
@@ -81,6 +84,9 @@ def run_async(coro):
 def get_client(ctx) -> tuple[dict, str, str]:
     """Get auth components from context.
 
+    Uses the token cache when it holds fresh tokens for these cookies, so the
+    NotebookLM homepage is only fetched when needed.
+
     Args:
         ctx: Click context with optional storage_path in obj
 
@@ -92,7 +98,13 @@ def get_client(ctx) -> tuple[dict, str, str]:
     """
     storage_path = ctx.obj.get("storage_path") if ctx.obj else None
     cookies = load_auth_from_storage(storage_path)
+    cache_path = token_cache_path_for(storage_path)
+    cached = load_cached_tokens(cookies, cache_path) if cache_path else None
+    if cached is not None:
+        return cookies, *cached
     csrf, session_id = run_async(fetch_tokens(cookies))
+    if cache_path:
+        save_cached_tokens(cookies, csrf, session_id, cache_path)
     return cookies, csrf, session_id
 
 
@@ -106,7 +118,13 @@ def get_auth_tokens(ctx) -> AuthTokens:
         AuthTokens ready for client construction
     """
     cookies, csrf, session_id = get_client(ctx)
-    return AuthTokens(cookies=cookies, csrf_token=csrf, session_id=session_id)
+    storage_path = ctx.obj.get("storage_path") if ctx.obj else None
+    return AuthTokens(
+        cookies=cookies,
+        csrf_token=csrf,
+        session_id=session_id,
+        token_cache_path=token_cache_path_for(storage_path),
+    )
 
 
 # =============================================================================
@@ -19,20 +19,32 @@ Example:
         result = await client.chat.ask(notebook_id, "What is this about?")
 """
 
+import asyncio
 import logging
+import os
 import re
 from pathlib import Path
+from typing import Any
 
+import httpx
+
+from ._artifact_cache import ArtifactCache
 from ._artifacts import ArtifactsAPI
+from ._cache import ResponseCache
 from ._chat import ChatAPI
 from ._core import DEFAULT_TIMEOUT, ClientCore
+from ._governor import RateGovernor
+from ._metrics import MetricsHook
 from ._notebooks import NotebooksAPI
 from ._notes import NotesAPI
+from ._recorder import FlightRecorder
 from ._research import ResearchAPI
+from ._retry import RetryPolicy
 from ._settings import SettingsAPI
 from ._sources import SourcesAPI
+from ._transport import ConnectionStats
 from ._url_utils import is_google_auth_redirect
-from .auth import AuthTokens
+from .auth import AuthTokens, save_cached_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -70,16 +82,83 @@ class NotebookLMClient:
         auth: The AuthTokens used for authentication
     """
 
-    def __init__(self, auth: AuthTokens, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        auth: AuthTokens,
+        timeout: float = DEFAULT_TIMEOUT,
+        stream_responses: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_governor: RateGovernor | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        coalesce_reads: bool = True,
+        response_cache: ResponseCache | None = None,
+        metrics: MetricsHook | None = None,
+        flight_recorder: FlightRecorder | None = None,
+        token_refresh_interval: float | None = None,
+        artifact_cache: ArtifactCache | None = None,
+    ):
         """Initialize the NotebookLM client.
 
         Args:
             auth: Authentication tokens from browser login.
             timeout: HTTP request timeout in seconds. Defaults to 30 seconds.
+            stream_responses: If True, decode RPC responses incrementally and
+                stop reading as soon as the requested result arrives. Reduces
+                memory and latency for large listings.
+            retry_policy: Optional RetryPolicy for transient RPC failures
+                (rate limits, 5xx, timeouts, network errors). If None, failed
+                calls are only retried once after an auth refresh.
+            rate_governor: Optional RateGovernor that paces all requests
+                (RPCs, chat, uploads, downloads) client-side. Share one
+                instance across clients using the same account.
+            limits: httpx.Limits for the connection pool (max connections,
+                keep-alive pool size and expiry). Defaults to limits tuned for
+                many small concurrent RPCs.
+            http2: If True, use HTTP/2 so concurrent calls multiplex over one
+                connection. Requires ``pip install "notebooklm-py[http2]"``.
+            coalesce_reads: If True (default), concurrent identical read-only
+                RPCs (same method, params and notebook) share one request.
+                For example, wait_for_sources() on 20 sources polls
+                GET_NOTEBOOK once per interval instead of 20 times.
+            response_cache: Optional ResponseCache for listing RPCs (notebooks,
+                sources, artifacts, notes). Mutations such as add_*, delete,
+                rename and generate_* invalidate the affected notebook.
+            metrics: Optional MetricsHook called before and after every HTTP
+                request with method, sizes, latency, status and retry count.
+                Use MetricsAggregator for per-method latency percentiles.
+            flight_recorder: Optional FlightRecorder keeping the most recent
+                requests (timings, sizes, outcome, truncated bodies) for
+                ``flight_recorder.dump("calls.jsonl")``. If None, one is
+                enabled by setting NOTEBOOKLM_FLIGHT_RECORDER=1.
+            token_refresh_interval: If set, refresh_auth() runs in the
+                background whenever the CSRF token and session ID are this
+                many seconds old, so long-running clients don't hit an
+                expired session first. Stopped by close().
+            artifact_cache: Optional ArtifactCache keeping downloaded audio,
+                video, infographic and slide deck files on disk, so
+                downloading the same artifact again links the cached file
+                instead of fetching it. If None, one is enabled by setting
+                NOTEBOOKLM_ARTIFACT_CACHE=1 (or a byte budget such as 5G).
         """
         # Pass refresh_auth as callback for automatic retry on auth failures
         # Note: refresh_auth calls update_auth_headers internally
-        self._core = ClientCore(auth, timeout=timeout, refresh_callback=self.refresh_auth)
+        self._core = ClientCore(
+            auth,
+            timeout=timeout,
+            refresh_callback=self.refresh_auth,
+            stream_responses=stream_responses,
+            retry_policy=retry_policy,
+            rate_governor=rate_governor,
+            limits=limits,
+            http2=http2,
+            coalesce_reads=coalesce_reads,
+            response_cache=response_cache,
+            metrics=metrics,
+            flight_recorder=flight_recorder,
+            token_refresh_interval=token_refresh_interval,
+            artifact_cache=artifact_cache,
+        )
 
         # Initialize sub-client APIs
         # Note: notes must be initialized before artifacts (artifacts uses notes API)
@@ -112,9 +191,37 @@ class NotebookLMClient:
         """Check if the client is connected."""
         return self._core.is_open
 
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Connection-reuse counters for the batchexecute and chat connection pool.
+
+        Example:
+            stats = client.connection_stats
+            print(f"{stats.reuse_ratio:.0%} of requests reused a connection")
+        """
+        return self._core.connection_stats
+
+    @property
+    def flight_recorder(self) -> FlightRecorder | None:
+        """The flight recorder of recent requests, if enabled.
+
+        Example:
+            client.flight_recorder.dump("slow_generation.jsonl")
+        """
+        return self._core.flight_recorder
+
+    @property
+    def artifact_cache(self) -> ArtifactCache | None:
+        """The on-disk cache of downloaded artifact files, if enabled.
+
+        Example:
+            print(client.artifact_cache.stats)
+        """
+        return self._core.artifact_cache
+
     @classmethod
     async def from_storage(
-        cls, path: str | None = None, timeout: float = DEFAULT_TIMEOUT
+        cls, path: str | None = None, timeout: float = DEFAULT_TIMEOUT, **kwargs: Any
     ) -> "NotebookLMClient":
         """Create a client from Playwright storage state file.
 
@@ -125,6 +232,8 @@ class NotebookLMClient:
             path: Path to storage_state.json. If None, uses default location
                   (~/.notebooklm/storage_state.json).
             timeout: HTTP request timeout in seconds. Defaults to 30 seconds.
+            **kwargs: Additional client options passed to NotebookLMClient()
+                (e.g., stream_responses=True, retry_policy=RetryPolicy()).
 
         Returns:
             NotebookLMClient instance (not yet connected).
@@ -135,13 +244,17 @@ class NotebookLMClient:
         """
         storage_path = Path(path) if path else None
         auth = await AuthTokens.from_storage(storage_path)
-        return cls(auth, timeout=timeout)
+        return cls(auth, timeout=timeout, **kwargs)
 
     async def refresh_auth(self) -> AuthTokens:
         """Refresh authentication tokens by fetching the NotebookLM homepage.
 
         This helps prevent 'Session Expired' errors by obtaining a fresh CSRF
-        token (SNlM0e) and session ID (FdrFJe).
+        token (SNlM0e) and session ID (FdrFJe). The new tokens are written
+        back to the token cache, if the auth tokens came from one.
+
+        Called automatically after auth errors, and periodically when the
+        client was created with ``token_refresh_interval``.
 
         Returns:
             Updated AuthTokens.
@@ -166,7 +279,6 @@ class NotebookLMClient:
                 "Failed to extract CSRF token (SNlM0e). "
                 "Page structure may have changed or authentication expired."
             )
-        self._core.auth.csrf_token = csrf_match.group(1)
 
         # Extract FdrFJe (Session ID) - REQUIRED
         sid_match = re.search(r'"FdrFJe":"([^"]+)"', response.text)
@@ -175,10 +287,23 @@ class NotebookLMClient:
                 "Failed to extract session ID (FdrFJe). "
                 "Page structure may have changed or authentication expired."
             )
+
+        # Swap both tokens together (no await in between) so concurrent
+        # requests never build a body with one old and one new token
+        self._core.auth.csrf_token = csrf_match.group(1)
         self._core.auth.session_id = sid_match.group(1)
 
         # CRITICAL: Update the HTTP client headers with new auth tokens
         # Without this, the client continues using stale credentials
         self._core.update_auth_headers()
 
-        return self._core.auth
+        auth = self._core.auth
+        if auth.token_cache_path:
+            await asyncio.to_thread(
+                save_cached_tokens,
+                auth.cookies,
+                auth.csrf_token,
+                auth.session_id,
+                auth.token_cache_path,
+            )
+        return auth
@@ -14,6 +14,7 @@ Command structure:
   notebooklm download <type>          # Download content
   notebooklm note <command>           # Note operations
   notebooklm research <command>       # Research status/wait
+  notebooklm debug dump               # Dump recently recorded requests
 
 LLM-friendly design:
   # Set context once, then use simple commands
@@ -29,26 +30,65 @@ from pathlib import Path
 import click
 
 from . import __version__
-from .auth import DEFAULT_STORAGE_PATH
-
-# Import command groups from cli package
-from .cli import (
-    artifact,
-    download,
-    generate,
-    language,
-    note,
-    register_chat_commands,
-    register_notebook_commands,
-    # Register functions for top-level commands
-    register_session_commands,
-    research,
-    skill,
-    source,
-)
 from .cli.grouped import SectionedGroup
+from .paths import get_storage_path
+
+# =============================================================================
+# COMMAND REGISTRY
+# =============================================================================
+
+# Command modules are imported only when their command runs, so e.g.
+# `notebooklm status` doesn't load the generate/download/source code. Each
+# entry carries the text shown next to it in `notebooklm --help` (for the
+# command groups, their subcommands), so help doesn't import anything either;
+# tests/unit/cli/test_grouped.py checks it against the commands.
+_SESSION = "notebooklm.cli.session:register_session_commands"
+_NOTEBOOK = "notebooklm.cli.notebook:register_notebook_commands"
+_CHAT = "notebooklm.cli.chat:register_chat_commands"
+_ARTIFACT_TYPES = (
+    "audio, data-table, flashcards, infographic, mind-map, quiz, report, slide-deck, video"
+)
 
-# Import helpers needed for backward compatibility with tests
+LAZY_COMMANDS = {
+    # Top-level commands (registered together by their module)
+    "login": (_SESSION, "Log in to NotebookLM via browser."),
+    "use": (_SESSION, "Set the current notebook context."),
+    "status": (_SESSION, "Show current context (active notebook and conversation)."),
+    "clear": (_SESSION, "Clear current notebook context."),
+    "auth": (_SESSION, "Authentication management commands."),
+    "list": (_NOTEBOOK, "List all notebooks."),
+    "create": (_NOTEBOOK, "Create a new notebook."),
+    "delete": (_NOTEBOOK, "Delete a notebook."),
+    "rename": (_NOTEBOOK, "Rename a notebook."),
+    "share": (_NOTEBOOK, "Toggle notebook sharing."),
+    "summary": (_NOTEBOOK, "Get notebook summary with AI-generated insights."),
+    "ask": (_CHAT, "Ask a notebook a question."),
+    "configure": (_CHAT, "Configure chat persona and response settings."),
+    "history": (_CHAT, "Get conversation history or clear local cache."),
+    # Command groups (subcommand style)
+    "source": (
+        "notebooklm.cli.source:source",
+        "add, add-drive, add-research, delete, fulltext, get, guide, list, refresh, rename, "
+        "stale, wait",
+    ),
+    "artifact": (
+        "notebooklm.cli.artifact:artifact",
+        "delete, export, get, list, poll, rename, suggestions, wait",
+    ),
+    "generate": ("notebooklm.cli.generate:generate", _ARTIFACT_TYPES),
+    "download": ("notebooklm.cli.download:download", _ARTIFACT_TYPES),
+    "note": ("notebooklm.cli.note:note", "create, delete, get, list, rename, save"),
+    "skill": ("notebooklm.cli.skill:skill", "Manage Claude Code skill integration."),
+    "research": ("notebooklm.cli.research:research", "status, wait"),
+    "language": (
+        "notebooklm.cli.language:language",
+        "Manage output language for artifact generation.",
+    ),
+    "debug": (
+        "notebooklm.cli.debug:debug",
+        "Inspect recorded client activity for troubleshooting.",
+    ),
+}
 
 
 # =============================================================================
@@ -56,13 +96,13 @@ from .cli.grouped import SectionedGroup
 # =============================================================================
 
 
-@click.group(cls=SectionedGroup)
+@click.group(cls=SectionedGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(version=__version__, prog_name="NotebookLM CLI")
 @click.option(
     "--storage",
     type=click.Path(exists=False),
     default=None,
-    help=f"Path to storage_state.json (default: {DEFAULT_STORAGE_PATH})",
+    help=f"Path to storage_state.json (default: {get_storage_path()})",
 )
 @click.option(
     "-v",
@@ -94,26 +134,6 @@ def cli(ctx, storage, verbose):
     ctx.obj["storage_path"] = Path(storage) if storage else None
 
 
-# =============================================================================
-# REGISTER COMMANDS
-# =============================================================================
-
-# Register top-level commands from modules
-register_session_commands(cli)
-register_notebook_commands(cli)
-register_chat_commands(cli)
-
-# Register command groups (subcommand style)
-cli.add_command(source)
-cli.add_command(artifact)
-cli.add_command(generate)
-cli.add_command(download)
-cli.add_command(note)
-cli.add_command(skill)
-cli.add_command(research)
-cli.add_command(language)
-
-
 # =============================================================================
 # MAIN ENTRY POINT
 # =============================================================================
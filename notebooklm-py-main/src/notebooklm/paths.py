@@ -8,6 +8,9 @@ All paths are derived from the home directory:
 - storage_state.json: Authentication cookies from Playwright
 - context.json: CLI context (current notebook/conversation)
 - browser_profile/: Playwright browser profile directory
+- token_cache.json: Cached CSRF/session tokens, keyed by a hash of the cookies
+- flight_recorder.jsonl: Recent requests recorded with NOTEBOOKLM_FLIGHT_RECORDER
+- artifact_cache/: Downloaded artifact files cached with NOTEBOOKLM_ARTIFACT_CACHE
 
 Usage:
     from notebooklm.paths import get_home_dir, get_storage_path
@@ -91,6 +94,33 @@ def get_config_path() -> Path:
     return get_home_dir() / "config.json"
 
 
+def get_token_cache_path() -> Path:
+    """Get token_cache.json path.
+
+    Returns:
+        Path to token_cache.json within NOTEBOOKLM_HOME.
+    """
+    return get_home_dir() / "token_cache.json"
+
+
+def get_flight_recorder_path() -> Path:
+    """Get flight_recorder.jsonl path.
+
+    Returns:
+        Path to flight_recorder.jsonl within NOTEBOOKLM_HOME.
+    """
+    return get_home_dir() / "flight_recorder.jsonl"
+
+
+def get_artifact_cache_dir() -> Path:
+    """Get artifact cache directory.
+
+    Returns:
+        Path to artifact_cache/ within NOTEBOOKLM_HOME.
+    """
+    return get_home_dir() / "artifact_cache"
+
+
 def get_path_info() -> dict[str, str]:
     """Get diagnostic info about resolved paths.
 
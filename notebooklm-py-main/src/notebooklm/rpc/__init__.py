@@ -1,22 +1,28 @@
 """RPC protocol implementation for NotebookLM batchexecute API."""
 
+from . import codec
 from .decoder import (
     AuthError,
+    ChunkedResponseStream,
     ClientError,
     NetworkError,
     RateLimitError,
+    ResponseIndex,
     RPCError,
     RPCErrorCode,
     RPCTimeoutError,
     ServerError,
     collect_rpc_ids,
+    decode_batch_response,
     decode_response,
+    decode_response_stream,
+    extract_batch_results,
     extract_rpc_result,
     get_error_message_for_code,
     parse_chunked_response,
     strip_anti_xssi,
 )
-from .encoder import build_request_body, encode_rpc_request
+from .encoder import build_request_body, encode_rpc_batch, encode_rpc_request
 from .types import (
     BATCHEXECUTE_URL,
     QUERY_URL,
@@ -43,6 +49,7 @@ from .types import (
 )
 
 __all__ = [
+    "codec",
     "RPCMethod",
     "BATCHEXECUTE_URL",
     "QUERY_URL",
@@ -66,12 +73,18 @@ __all__ = [
     "DriveMimeType",
     "ExportType",
     "encode_rpc_request",
+    "encode_rpc_batch",
     "build_request_body",
     "strip_anti_xssi",
     "parse_chunked_response",
     "extract_rpc_result",
+    "extract_batch_results",
     "collect_rpc_ids",
     "decode_response",
+    "decode_batch_response",
+    "decode_response_stream",
+    "ChunkedResponseStream",
+    "ResponseIndex",
     # Exceptions
     "RPCError",
     "AuthError",
@@ -0,0 +1,154 @@
+"""JSON codec for batchexecute wire data.
+
+Every request is JSON-encoded twice (params, then the envelope) and every
+response chunk is decoded twice (the chunk, then the inner result string),
+so JSON work dominates high-volume polling. This module picks the fastest
+installed backend once at import time:
+
+    orjson  -> msgspec -> json (stdlib)
+
+Set ``NOTEBOOKLM_JSON_BACKEND`` to ``orjson``, ``msgspec`` or ``json`` to force
+a backend, or call set_backend() at runtime.
+
+All backends produce compact output (no spaces) and raise
+json.JSONDecodeError on invalid input, so callers can keep catching the
+stdlib exception. Inputs the fast backends reject but stdlib json accepts
+(NaN, lone surrogates, integers beyond 64 bits) transparently fall back to
+stdlib json.
+
+Usage:
+    from notebooklm.rpc import codec
+
+    payload = codec.dumps(params)
+    data = codec.loads(payload)
+"""
+
+import json
+import logging
+import os
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Backends in preference order for automatic selection
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _json_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _orjson_codec() -> tuple[Callable[[Any], str], Callable[[str], Any]]:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            return _json_dumps(obj)
+
+    def loads(data: str) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Re-parse with stdlib: accepts NaN/surrogates, else raises its own error
+            return json.loads(data)
+
+    return dumps, loads
+
+
+def _msgspec_codec() -> tuple[Callable[[Any], str], Callable[[str], Any]]:
+    import msgspec
+
+    encode = msgspec.json.encode
+    decode = msgspec.json.decode
+
+    def dumps(obj: Any) -> str:
+        try:
+            return encode(obj).decode("utf-8")
+        except (TypeError, ValueError, OverflowError):
+            return _json_dumps(obj)
+
+    def loads(data: str) -> Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+
+    return dumps, loads
+
+
+_FACTORIES: dict[str, Callable[[], tuple[Callable[[Any], str], Callable[[str], Any]]]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": lambda: (_json_dumps, json.loads),
+}
+
+_backend = "json"
+_dumps: Callable[[Any], str] = _json_dumps
+_loads: Callable[[str], Any] = json.loads
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to compact JSON text (no spaces after separators)."""
+    return _dumps(obj)
+
+
+def loads(data: str) -> Any:
+    """Parse JSON text.
+
+    Raises:
+        json.JSONDecodeError: If ``data`` is not valid JSON.
+    """
+    return _loads(data)
+
+
+def get_backend() -> str:
+    """Return the name of the active JSON backend."""
+    return _backend
+
+
+def set_backend(name: str | None = None) -> str:
+    """Select the JSON backend.
+
+    Args:
+        name: One of BACKENDS, or None/"auto" to pick the fastest installed one.
+
+    Returns:
+        The name of the backend now in use.
+
+    Raises:
+        ValueError: If the name is unknown or the backend is not installed.
+    """
+    global _backend, _dumps, _loads
+
+    if name in (None, "", "auto"):
+        candidates: tuple[str, ...] = BACKENDS
+    elif name in _FACTORIES:
+        candidates = (name,)
+    else:
+        raise ValueError(f"Unknown JSON backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+
+    for candidate in candidates:
+        try:
+            _dumps, _loads = _FACTORIES[candidate]()
+        except ImportError:
+            continue
+        _backend = candidate
+        logger.debug("Using JSON backend: %s", candidate)
+        return candidate
+
+    raise ValueError(f"JSON backend '{name}' is not installed")
+
+
+def _init_backend() -> None:
+    requested = os.environ.get("NOTEBOOKLM_JSON_BACKEND", "auto").strip().lower()
+    try:
+        set_backend(requested)
+    except ValueError as e:
+        logger.warning("%s; falling back to automatic selection", e)
+        set_backend()
+
+
+_init_backend()
@@ -1,11 +1,15 @@
 """Decode RPC responses from NotebookLM batchexecute API."""
 
+import codecs
 import json
 import logging
 import re
+from collections.abc import AsyncIterable
 from enum import IntEnum
 from typing import Any
 
+from . import codec
+
 logger = logging.getLogger(__name__)
 
 
@@ -293,7 +297,7 @@ def parse_chunked_response(response: str) -> list[Any]:
             if i < len(lines):
                 json_str = lines[i]
                 try:
-                    chunk = json.loads(json_str)
+                    chunk = codec.loads(json_str)
                     chunks.append(chunk)
                 except json.JSONDecodeError as e:
                     # Skip malformed chunks but warn
@@ -308,7 +312,7 @@ def parse_chunked_response(response: str) -> list[Any]:
         except ValueError:
             # Not a byte count, try to parse as JSON directly
             try:
-                chunk = json.loads(line)
+                chunk = codec.loads(line)
                 chunks.append(chunk)
             except json.JSONDecodeError as e:
                 # Skip non-JSON lines but warn
@@ -391,6 +395,62 @@ def _contains_user_displayable_error(obj: Any) -> bool:
     return False
 
 
+def _extract_item_result(item: list[Any], rpc_id: str) -> Any:
+    """Decode a single ``er`` or ``wrb.fr`` entry that matches ``rpc_id``.
+
+    Args:
+        item: Response entry whose first two elements are the tag and RPC ID.
+        rpc_id: RPC method ID the entry belongs to (used in error context).
+
+    Returns:
+        The decoded result data (inner JSON is parsed when it is a string).
+
+    Raises:
+        RPCError: If the entry is an ``er`` error entry.
+        RateLimitError: If a null result carries a UserDisplayableError marker.
+    """
+    if item[0] == "er":
+        error_code = item[2] if len(item) > 2 else None
+
+        # Try to get human-readable message for integer error codes
+        if isinstance(error_code, int):
+            error_msg, is_retryable = get_error_message_for_code(error_code)
+            logger.debug(
+                "RPC error code %d for %s: %s (retryable: %s)",
+                error_code,
+                rpc_id,
+                error_msg,
+                is_retryable,
+            )
+        else:
+            error_msg = str(error_code) if error_code else "Unknown error"
+
+        raise RPCError(
+            error_msg,
+            rpc_id=rpc_id,
+            code=error_code,
+        )
+
+    result_data = item[2]
+
+    # Check for embedded UserDisplayableError when result is null
+    # This indicates rate limiting, quota exceeded, or other API restrictions
+    if result_data is None and len(item) > 5 and item[5] is not None:
+        if _contains_user_displayable_error(item[5]):
+            raise RateLimitError(
+                "API rate limit or quota exceeded. Please wait before retrying.",
+                rpc_id=rpc_id,
+                code="USER_DISPLAYABLE_ERROR",
+            )
+
+    if isinstance(result_data, str):
+        try:
+            return codec.loads(result_data)
+        except json.JSONDecodeError:
+            return result_data
+    return result_data
+
+
 def extract_rpc_result(chunks: list[Any], rpc_id: str) -> Any:
     """Extract result data for a specific RPC ID from chunks."""
     for chunk in chunks:
@@ -403,54 +463,279 @@ def extract_rpc_result(chunks: list[Any], rpc_id: str) -> Any:
             if not isinstance(item, list) or len(item) < 3:
                 continue
 
-            if item[0] == "er" and item[1] == rpc_id:
-                error_code = item[2] if len(item) > 2 else None
-
-                # Try to get human-readable message for integer error codes
-                if isinstance(error_code, int):
-                    error_msg, is_retryable = get_error_message_for_code(error_code)
-                    logger.debug(
-                        "RPC error code %d for %s: %s (retryable: %s)",
-                        error_code,
-                        rpc_id,
-                        error_msg,
-                        is_retryable,
-                    )
-                else:
-                    error_msg = str(error_code) if error_code else "Unknown error"
+            if item[0] in ("er", "wrb.fr") and item[1] == rpc_id:
+                return _extract_item_result(item, rpc_id)
+
+    return None
+
+
+def extract_batch_results(chunks: list[Any], requests: list[tuple[str, str]]) -> list[Any]:
+    """Split the results of a multiplexed batchexecute call back out per request.
+
+    Entries are matched to requests by the position tag echoed at index 6 of
+    each ``wrb.fr``/``er`` entry. Entries without a tag fall back to the first
+    unresolved request with the same RPC ID, in request order.
 
-                raise RPCError(
-                    error_msg,
-                    rpc_id=rpc_id,
-                    code=error_code,
+    Errors are returned in place rather than raised, so one failing call does
+    not hide the results of the others.
+
+    Args:
+        chunks: Parsed response chunks from parse_chunked_response().
+        requests: List of (rpc_id, tag) pairs in request order, as encoded
+            by encode_rpc_batch() (tags are "1", "2", ...).
+
+    Returns:
+        List aligned with ``requests``. Each element is the decoded result,
+        an RPCError instance for per-call failures, or None if the response
+        contained no entry for that request.
+    """
+    results: list[Any] = [None] * len(requests)
+    resolved = [False] * len(requests)
+    tag_index = {tag: i for i, (_, tag) in enumerate(requests)}
+
+    for chunk in chunks:
+        if not isinstance(chunk, list):
+            continue
+
+        items = chunk if (chunk and isinstance(chunk[0], list)) else [chunk]
+
+        for item in items:
+            if not isinstance(item, list) or len(item) < 3:
+                continue
+            if item[0] not in ("er", "wrb.fr"):
+                continue
+
+            rpc_id = item[1]
+            tag = item[6] if len(item) > 6 else None
+            index = tag_index.get(tag) if isinstance(tag, str) else None
+            if index is None or requests[index][0] != rpc_id or resolved[index]:
+                index = next(
+                    (
+                        i
+                        for i, (req_id, _) in enumerate(requests)
+                        if req_id == rpc_id and not resolved[i]
+                    ),
+                    None,
                 )
+            if index is None:
+                continue
+
+            resolved[index] = True
+            try:
+                results[index] = _extract_item_result(item, rpc_id)
+            except RPCError as e:
+                results[index] = e
+
+    return results
+
 
-            if item[0] == "wrb.fr" and item[1] == rpc_id:
-                result_data = item[2]
+_XSSI_PREFIX = re.compile(r"\)]\}'\r?\n")
+_LEADING_SPACE = re.compile(r"\s*")
+# Leading entry of a chunk, e.g. [["wrb.fr","wXbhsf",... (captures the RPC ID)
+_LEADING_ENTRY = re.compile(r'\s*\[\s*\[\s*"(?:wrb\.fr|er)"\s*,\s*"([^"\\]*)"')
 
-                # Check for embedded UserDisplayableError when result is null
-                # This indicates rate limiting, quota exceeded, or other API restrictions
-                if result_data is None and len(item) > 5 and item[5] is not None:
-                    if _contains_user_displayable_error(item[5]):
-                        raise RateLimitError(
-                            "API rate limit or quota exceeded. Please wait before retrying.",
-                            rpc_id=rpc_id,
-                            code="USER_DISPLAYABLE_ERROR",
-                        )
 
-                if isinstance(result_data, str):
+class ResponseIndex:
+    """Single-pass index of a batchexecute response, keyed by RPC ID.
+
+    The response is framed once. Chunks that start with a ``wrb.fr``/``er``
+    entry are indexed by that entry's RPC ID and kept as raw text; they are
+    only JSON-decoded when a lookup needs them, and the inner payload string
+    is only decoded for the requested RPC ID. Error diagnostics (found IDs,
+    response preview) are only assembled when an error is actually raised.
+
+    Lookups return the first matching entry in response order, the same as
+    extract_rpc_result(). Malformed chunks are handled like
+    parse_chunked_response(), except that raw chunks which are never looked
+    up are never validated.
+    """
+
+    def __init__(self, raw_response: str):
+        self._text = raw_response
+        # Offset of the body after the anti-XSSI prefix (no copy, unlike strip_anti_xssi)
+        self._body_start = 0
+        if raw_response.startswith(")]}'"):
+            match = _XSSI_PREFIX.match(raw_response)
+            if match:
+                self._body_start = match.end()
+
+        # Parsed chunks in response order; deferred chunks hold None until decoded
+        self._chunks: list[Any] = []
+        self._raw: dict[int, tuple[int, int]] = {}
+        self._dropped: set[int] = set()
+        self._leading: dict[str, int] = {}
+        self._entries: dict[str, tuple[int, list[Any]]] = {}
+        self._line_count = 0
+        self._skipped_count = 0
+        self._index()
+
+    def _index(self) -> None:
+        text = self._text
+        # Bounds of the stripped body, found without copying the response
+        space = _LEADING_SPACE.match(text, self._body_start)
+        start = space.end() if space else self._body_start
+        end = len(text)
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start == end:
+            return
+
+        expect_payload = False
+        line_no = 0
+        pos = start
+        while True:
+            newline = text.find("\n", pos, end)
+            stop = end if newline == -1 else newline
+            line_no += 1
+
+            if expect_payload:
+                # Line after a byte count is the JSON payload
+                expect_payload = False
+                self._add_line(pos, stop, line_no, "Skipping malformed chunk at line %d")
+            elif _LEADING_ENTRY.match(text, pos, stop):
+                self._add_line(pos, stop, line_no, "Skipping non-JSON line at %d")
+            else:
+                line = text[pos:stop].strip()
+                if line:
                     try:
-                        return json.loads(result_data)
-                    except json.JSONDecodeError:
-                        return result_data
-                return result_data
+                        int(line)
+                        expect_payload = True
+                    except ValueError:
+                        self._add_line(pos, stop, line_no, "Skipping non-JSON line at %d")
 
-    return None
+            if newline == -1:
+                break
+            pos = newline + 1
+
+        self._line_count = line_no
+        if self._skipped_count > 0:
+            self._check_error_rate()
+
+    def _add_line(self, pos: int, stop: int, line_no: int, skip_message: str) -> None:
+        match = _LEADING_ENTRY.match(self._text, pos, stop)
+        if match:
+            position = len(self._chunks)
+            self._leading.setdefault(match.group(1), position)
+            self._raw[position] = (pos, stop)
+            self._chunks.append(None)
+            return
+
+        line = self._text[pos:stop]
+        try:
+            chunk = codec.loads(line)
+        except json.JSONDecodeError as e:
+            self._skipped_count += 1
+            logger.warning(skip_message + ": %s. Preview: %s", line_no, e, line.strip()[:100])
+            return
+        self._add_chunk(len(self._chunks), chunk)
+        self._chunks.append(chunk)
+
+    def _add_chunk(self, position: int, chunk: Any) -> None:
+        if not isinstance(chunk, list):
+            return
+
+        items = chunk if (chunk and isinstance(chunk[0], list)) else [chunk]
+        for item in items:
+            if not isinstance(item, list) or len(item) < 3:
+                continue
+            if item[0] in ("er", "wrb.fr") and isinstance(item[1], str):
+                known = self._entries.get(item[1])
+                if known is None or known[0] > position:
+                    self._entries[item[1]] = (position, item)
+
+    def _check_error_rate(self) -> None:
+        error_rate = self._skipped_count / self._line_count
+        if error_rate > 0.1:  # More than 10% malformed
+            raise RPCError(
+                f"Response parsing failed: {self._skipped_count} of {self._line_count} "
+                f"chunks malformed. This may indicate API changes or data corruption.",
+                raw_response_preview=self.preview,
+            )
+        logger.warning(
+            "Parsed response but skipped %d malformed chunks (%d%%). Results may be incomplete.",
+            self._skipped_count,
+            int(error_rate * 100),
+        )
+
+    def _decode_raw(self, stop: int) -> None:
+        """Decode deferred chunks that come before position ``stop``."""
+        for position in [p for p in self._raw if p < stop]:
+            start, end = self._raw.pop(position)
+            text = self._text[start:end]
+            try:
+                chunk = codec.loads(text)
+            except json.JSONDecodeError as e:
+                self._skipped_count += 1
+                self._dropped.add(position)
+                logger.warning("Skipping malformed chunk: %s. Preview: %s", e, text[:100])
+                self._check_error_rate()
+                continue
+            self._chunks[position] = chunk
+            self._add_chunk(position, chunk)
+
+    def _find(self, rpc_id: str) -> list[Any] | None:
+        known = [self._leading.get(rpc_id), self._entries.get(rpc_id, (None,))[0]]
+        positions = [p for p in known if p is not None]
+        # An earlier deferred chunk may still hold rpc_id as a non-leading entry
+        self._decode_raw(min(positions) + 1 if positions else len(self._chunks))
+        entry = self._entries.get(rpc_id)
+        return entry[1] if entry is not None else None
+
+    @property
+    def chunk_count(self) -> int:
+        """Number of chunks framed from the response."""
+        return len(self._chunks) - len(self._dropped)
+
+    @property
+    def found_ids(self) -> list[str]:
+        """All RPC IDs present in the response (decodes every chunk on access)."""
+        self._decode_raw(len(self._chunks))
+        return collect_rpc_ids([c for i, c in enumerate(self._chunks) if i not in self._dropped])
+
+    @property
+    def preview(self) -> str:
+        """First 500 characters of the response, for error context."""
+        return self._text[self._body_start : self._body_start + 500]
+
+    def __contains__(self, rpc_id: object) -> bool:
+        return isinstance(rpc_id, str) and self._find(rpc_id) is not None
+
+    def result(self, rpc_id: str, allow_null: bool = False) -> Any:
+        """
+        Decode the result for ``rpc_id`` from the indexed response.
+
+        Args:
+            rpc_id: RPC method ID to extract result for
+            allow_null: If True, return None instead of raising error when result is null
+
+        Returns:
+            Decoded result data
+
+        Raises:
+            RPCError: If RPC returned an error or result not found (when allow_null=False)
+        """
+        item = self._find(rpc_id)
+        try:
+            result = _extract_item_result(item, rpc_id) if item is not None else None
+        except RPCError as e:
+            if not e.found_ids:
+                e.found_ids = self.found_ids
+            if not e.raw_response_preview:
+                e.raw_response_preview = self.preview
+            raise
+
+        if result is None and not allow_null:
+            raise _missing_result_error(rpc_id, self.found_ids, self.chunk_count, self.preview)
+
+        return result
 
 
 def decode_response(raw_response: str, rpc_id: str, allow_null: bool = False) -> Any:
     """
-    Complete decode pipeline: strip prefix -> parse chunks -> extract result.
+    Complete decode pipeline: strip prefix -> index chunks -> extract result.
+
+    Uses ResponseIndex, so the response is parsed in a single pass and only
+    the entry for ``rpc_id`` has its inner JSON decoded.
 
     Args:
         raw_response: Raw response text from batchexecute
@@ -463,52 +748,346 @@ def decode_response(raw_response: str, rpc_id: str, allow_null: bool = False) ->
     Raises:
         RPCError: If RPC returned an error or result not found (when allow_null=False)
     """
-    logger.debug("Decoding response: size=%d bytes", len(raw_response))
-    cleaned = strip_anti_xssi(raw_response)
-    chunks = parse_chunked_response(cleaned)
-    logger.debug("Parsed %d chunks from response", len(chunks))
-
-    # Create response preview for error context (first 500 chars)
-    response_preview = cleaned[:500] if len(cleaned) > 500 else cleaned
-
-    # Collect all RPC IDs for debugging
-    found_ids = collect_rpc_ids(chunks)
-
-    logger.debug("Looking for RPC ID: %s", rpc_id)
-    logger.debug("Found RPC IDs in response: %s", found_ids)
-
-    try:
-        result = extract_rpc_result(chunks, rpc_id)
-    except RPCError as e:
-        # Add context to errors from extract_rpc_result
-        if not e.found_ids:
-            e.found_ids = found_ids
-        if not e.raw_response_preview:
-            e.raw_response_preview = response_preview
-        raise
-
-    if result is None and not allow_null:
-        if found_ids and rpc_id not in found_ids:
-            # Method ID likely changed - provide actionable error
-            raise RPCError(
-                f"No result found for RPC ID '{rpc_id}'. "
-                f"Response contains IDs: {found_ids}. "
-                f"The RPC method ID may have changed.",
-                rpc_id=rpc_id,
-                found_ids=found_ids,
-                raw_response_preview=response_preview,
-            )
-        # Log raw response details at debug level for troubleshooting
+    index = ResponseIndex(raw_response)
+
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
-            "Empty result for RPC ID '%s'. Chunks parsed: %d. Response preview: %s",
-            rpc_id,
-            len(chunks),
-            response_preview,
+            "Decoded response: size=%d bytes, chunks=%d", len(raw_response), index.chunk_count
         )
-        raise RPCError(
-            f"No result found for RPC ID: {rpc_id}",
+        logger.debug("Looking for RPC ID: %s", rpc_id)
+        logger.debug("Found RPC IDs in response: %s", index.found_ids)
+
+    return index.result(rpc_id, allow_null=allow_null)
+
+
+def _missing_result_error(
+    rpc_id: str, found_ids: list[str], chunk_count: int, response_preview: str
+) -> RPCError:
+    """Build the error raised when a response has no usable result for ``rpc_id``."""
+    if found_ids and rpc_id not in found_ids:
+        # Method ID likely changed - provide actionable error
+        return RPCError(
+            f"No result found for RPC ID '{rpc_id}'. "
+            f"Response contains IDs: {found_ids}. "
+            f"The RPC method ID may have changed.",
             rpc_id=rpc_id,
+            found_ids=found_ids,
             raw_response_preview=response_preview,
         )
+    # Log raw response details at debug level for troubleshooting
+    logger.debug(
+        "Empty result for RPC ID '%s'. Chunks parsed: %d. Response preview: %s",
+        rpc_id,
+        chunk_count,
+        response_preview,
+    )
+    return RPCError(
+        f"No result found for RPC ID: {rpc_id}",
+        rpc_id=rpc_id,
+        raw_response_preview=response_preview,
+    )
+
+
+def decode_batch_response(
+    raw_response: str,
+    requests: list[tuple[str, str]],
+    allow_null: bool | list[bool] = False,
+) -> list[Any]:
+    """
+    Decode a multiplexed batchexecute response into per-request results.
+
+    Args:
+        raw_response: Raw response text from batchexecute
+        requests: List of (rpc_id, tag) pairs in request order
+        allow_null: Whether a null result is acceptable, either for all
+            requests or per request (aligned with ``requests``)
+
+    Returns:
+        List aligned with ``requests``. Each element is the decoded result
+        or an RPCError instance describing that request's failure.
+    """
+    logger.debug("Decoding batch response: size=%d bytes", len(raw_response))
+    cleaned = strip_anti_xssi(raw_response)
+    chunks = parse_chunked_response(cleaned)
+
+    if isinstance(allow_null, bool):
+        allow_null = [allow_null] * len(requests)
+
+    results = extract_batch_results(chunks, requests)
+
+    found_ids: list[str] | None = None
+    response_preview = cleaned[:500]
+
+    for i, ((rpc_id, _), result) in enumerate(zip(requests, results, strict=True)):
+        if result is None and not allow_null[i]:
+            result = RPCError(f"No result found for RPC ID: {rpc_id}", rpc_id=rpc_id)
+            results[i] = result
+        if isinstance(result, RPCError):
+            if found_ids is None:
+                found_ids = collect_rpc_ids(chunks)
+            if not result.found_ids:
+                result.found_ids = found_ids
+            if not result.raw_response_preview:
+                result.raw_response_preview = response_preview
+
+    return results
+
+
+# Characters outside the Basic Multilingual Plane count as two UTF-16 code units
+_ASTRAL_CHARS = re.compile("[\U00010000-\U0010ffff]")
+
+# Number of leading response characters kept for error previews
+_PREVIEW_CHARS = 500
+
+
+def _utf16_prefix_chars(text: str, start: int, units: int) -> int | None:
+    """Return how many characters from ``start`` span ``units`` UTF-16 code units.
+
+    The rt=c length prefixes count UTF-16 code units (as JavaScript string
+    lengths do), so characters outside the BMP count twice. Only those
+    characters are visited (by regex), so BMP-only text costs one scan.
+
+    Returns:
+        Number of characters, or None if ``text`` is too short.
+    """
+    pos = start
+    remaining = units
+    # The span is at most ``units`` characters, so astral ones beyond can't matter
+    for match in _ASTRAL_CHARS.finditer(text, start, start + units):
+        plain = match.start() - pos
+        if plain >= remaining:
+            break
+        # A count ending inside a surrogate pair includes the whole character
+        remaining -= plain + 2
+        pos = match.end()
+        if remaining <= 0:
+            return pos - start
+    if len(text) - pos < remaining:
+        return None
+    return pos + remaining - start
+
+
+class ChunkedResponseStream:
+    """Incremental parser for chunked (rt=c) batchexecute responses.
+
+    Feed raw response bytes as they arrive and get back each JSON chunk as
+    soon as it is complete. The length prefix in front of every chunk is used
+    to frame it, so a large chunk is only joined and parsed once all of its
+    data has arrived. If a frame does not parse (e.g. a server that counts
+    lengths differently), the chunk falls back to newline framing.
+
+    Only the unconsumed tail of the body is buffered, plus the first 500
+    characters for error previews. Text arriving while a frame is incomplete
+    is queued and joined onto the buffer once the frame can be complete;
+    parsing then advances a read offset instead of copying the tail.
+
+    Example:
+        stream = ChunkedResponseStream()
+        async for data in response.aiter_bytes():
+            for chunk in stream.feed(data):
+                ...
+        for chunk in stream.close():
+            ...
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+        self._pos = 0  # read offset into _buffer
+        self._pieces: list[str] = []  # text received since _buffer was last joined
+        self._buffered = 0  # unconsumed characters in _buffer and _pieces
+        self._needed = 0
+        self._prefix_checked = False
+        self.preview = ""
+        self.chunk_count = 0
+        self.skipped_count = 0
+
+    def feed(self, data: bytes) -> list[Any]:
+        """Add response bytes and return any chunks completed by them."""
+        return self._consume(self._decoder.decode(data), final=False)
+
+    def close(self) -> list[Any]:
+        """Signal end of stream and return any remaining chunks."""
+        return self._consume(self._decoder.decode(b"", final=True), final=True)
+
+    def _consume(self, text: str, final: bool) -> list[Any]:
+        if text:
+            if len(self.preview) < _PREVIEW_CHARS:
+                self.preview += text[: _PREVIEW_CHARS - len(self.preview)]
+            self._pieces.append(text)
+            self._buffered += len(text)
+
+        # Wait until the frame we are waiting on has fully arrived
+        if not final and self._buffered < self._needed:
+            return []
+
+        if self._pieces:
+            # Drop the consumed head while joining in the new text
+            self._buffer = self._buffer[self._pos :] + "".join(self._pieces)
+            self._pos = 0
+            self._pieces = []
+        buffer = self._buffer
+        chunks: list[Any] = []
+        pos = self._pos
+
+        if not self._prefix_checked:
+            if buffer.startswith(")]}'"):
+                match = re.match(r"\)]\}'\r?\n", buffer)
+                if not match:
+                    if not final:
+                        return []
+                    pos = len(buffer)
+                else:
+                    pos = match.end()
+            elif not final and len(buffer) < 4 and ")]}'".startswith(buffer):
+                return []
+            self._prefix_checked = True
+
+        self._needed = 0
+        while True:
+            # Skip blank lines between frames
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos >= len(buffer):
+                break
+
+            newline = buffer.find("\n", pos)
+            if newline == -1 and not final:
+                break
+            line_end = newline if newline != -1 else len(buffer)
+            line = buffer[pos:line_end].strip()
+
+            if not line.isdigit():
+                # Not a length prefix, try to parse the line as JSON directly
+                self._parse_into(line, chunks)
+                pos = line_end + 1
+                continue
+
+            # Frame = newline after the count, the payload, and its trailing newline
+            units = int(line)
+            span = _utf16_prefix_chars(buffer, line_end, units)
+            if span is None and not final:
+                # Don't rejoin the buffer until the missing code units could have arrived
+                available = len(buffer) - line_end
+                available += len(_ASTRAL_CHARS.findall(buffer, line_end))
+                self._needed = len(buffer) - pos + units - available
+                break
+
+            frame_end = line_end + span if span is not None else len(buffer)
+            try:
+                chunks.append(codec.loads(buffer[line_end:frame_end]))
+                self.chunk_count += 1
+                pos = frame_end
+                continue
+            except json.JSONDecodeError:
+                pass
+
+            # Length prefix did not frame valid JSON - fall back to the next line
+            payload_end = buffer.find("\n", line_end + 1)
+            if payload_end == -1:
+                if not final:
+                    break
+                payload_end = len(buffer)
+            self._parse_into(buffer[line_end + 1 : payload_end], chunks)
+            pos = payload_end + 1
+
+        self._pos = min(pos, len(buffer))
+        self._buffered = len(buffer) - self._pos
+        return chunks
+
+    def _parse_into(self, json_str: str, chunks: list[Any]) -> None:
+        if not json_str.strip():
+            return
+        try:
+            chunks.append(codec.loads(json_str))
+            self.chunk_count += 1
+        except json.JSONDecodeError as e:
+            self.skipped_count += 1
+            logger.warning(
+                "Skipping malformed chunk: %s. Preview: %s",
+                e,
+                json_str[:100],
+            )
+
+
+def _find_rpc_item(chunk: Any, rpc_id: str) -> list[Any] | None:
+    """Return the ``wrb.fr``/``er`` entry for ``rpc_id`` in a chunk, if present."""
+    if not isinstance(chunk, list):
+        return None
+
+    items = chunk if (chunk and isinstance(chunk[0], list)) else [chunk]
+    for item in items:
+        if (
+            isinstance(item, list)
+            and len(item) >= 3
+            and item[0] in ("er", "wrb.fr")
+            and item[1] == rpc_id
+        ):
+            return item
+    return None
+
+
+async def decode_response_stream(
+    byte_chunks: AsyncIterable[bytes], rpc_id: str, allow_null: bool = False
+) -> Any:
+    """
+    Streaming decode pipeline for a chunked batchexecute response body.
+
+    Parses chunks as the bytes arrive and returns as soon as the entry for
+    ``rpc_id`` has been decoded, without reading the rest of the body or
+    ever holding it as one string.
+
+    Args:
+        byte_chunks: Async iterable of raw body bytes (e.g. response.aiter_bytes())
+        rpc_id: RPC method ID to extract result for
+        allow_null: If True, return None instead of raising error when result is null
+
+    Returns:
+        Decoded result data
+
+    Raises:
+        RPCError: If RPC returned an error or result not found (when allow_null=False)
+    """
+    stream = ChunkedResponseStream()
+    found_ids: list[str] = []
+
+    def _check(chunks: list[Any]) -> tuple[bool, Any]:
+        for chunk in chunks:
+            found_ids.extend(collect_rpc_ids([chunk]))
+            item = _find_rpc_item(chunk, rpc_id)
+            if item is None:
+                continue
+            try:
+                result = _extract_item_result(item, rpc_id)
+            except RPCError as e:
+                if not e.found_ids:
+                    e.found_ids = list(found_ids)
+                if not e.raw_response_preview:
+                    e.raw_response_preview = stream.preview
+                raise
+            if result is None and not allow_null:
+                raise _missing_result_error(rpc_id, found_ids, stream.chunk_count, stream.preview)
+            return True, result
+        return False, None
+
+    async for data in byte_chunks:
+        done, result = _check(stream.feed(data))
+        if done:
+            logger.debug("Found RPC ID %s after %d chunks", rpc_id, stream.chunk_count)
+            return result
+
+    done, result = _check(stream.close())
+    if done:
+        return result
+
+    total = stream.chunk_count + stream.skipped_count
+    if stream.skipped_count and stream.skipped_count / total > 0.1:
+        raise RPCError(
+            f"Response parsing failed: {stream.skipped_count} of {total} chunks malformed. "
+            f"This may indicate API changes or data corruption.",
+            raw_response_preview=stream.preview,
+        )
 
-    return result
+    if not allow_null:
+        raise _missing_result_error(rpc_id, found_ids, stream.chunk_count, stream.preview)
+    return None
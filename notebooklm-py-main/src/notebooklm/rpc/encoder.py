@@ -1,10 +1,10 @@
 """Encode RPC requests for NotebookLM batchexecute API."""
 
-import json
 import logging
 from typing import Any
 from urllib.parse import quote
 
+from . import codec
 from .types import RPCMethod
 
 logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ def encode_rpc_request(method: RPCMethod, params: list[Any]) -> list:
         Triple-nested array structure for batchexecute
     """
     # JSON-encode params without spaces (compact format matching Chrome)
-    params_json = json.dumps(params, separators=(",", ":"))
+    params_json = codec.dumps(params)
     logger.debug("Encoding RPC: method=%s, param_count=%d", method.value, len(params))
 
     # Build inner request: [rpc_id, json_params, null, "generic"]
@@ -35,6 +35,33 @@ def encode_rpc_request(method: RPCMethod, params: list[Any]) -> list:
     return [[inner]]
 
 
+def encode_rpc_batch(calls: list[tuple[RPCMethod, list[Any]]]) -> list:
+    """
+    Encode several RPC requests into a single batchexecute envelope.
+
+    Each inner request is tagged with its 1-based position as a string
+    instead of "generic". The server echoes this tag back in the matching
+    wrb.fr entry, which lets the decoder route results even when the same
+    RPC ID appears more than once in a batch.
+
+    Args:
+        calls: List of (method, params) pairs, in request order
+
+    Returns:
+        Triple-nested array structure: [[inner_1, inner_2, ...]]
+    """
+    inners = []
+    for index, (method, params) in enumerate(calls, start=1):
+        params_json = codec.dumps(params)
+        inners.append([method.value, params_json, None, str(index)])
+
+    logger.debug(
+        "Encoding RPC batch: methods=%s",
+        ",".join(method.value for method, _ in calls),
+    )
+    return [inners]
+
+
 def build_request_body(
     rpc_request: list,
     csrf_token: str | None = None,
@@ -52,7 +79,7 @@ def build_request_body(
         Form-encoded body string with trailing &
     """
     # JSON-encode the request (compact, no spaces)
-    f_req = json.dumps(rpc_request, separators=(",", ":"))
+    f_req = codec.dumps(rpc_request)
 
     # URL encode with safe='' to encode all special characters
     body_parts = [f"f.req={quote(f_req, safe='')}"]
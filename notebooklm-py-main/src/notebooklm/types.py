@@ -47,6 +47,7 @@ __all__ = [
     "Artifact",
     "GenerationStatus",
     "ReportSuggestion",
+    "DownloadResult",
     "Note",
     "ConversationTurn",
     "ChatReference",
@@ -835,6 +836,18 @@ class ReportSuggestion:
         )
 
 
+@dataclass
+class DownloadResult:
+    """Outcome of one file in a batch download."""
+
+    url: str
+    path: str
+    success: bool
+    bytes_written: int = 0
+    duration: float = 0.0  # Seconds from first request to file in place
+    error: str | None = None
+
+
 # =============================================================================
 # Note Types
 # =============================================================================
@@ -5,6 +5,8 @@ import os
 
 import pytest
 
+from notebooklm._core import ClientCore
+from notebooklm.auth import AuthTokens
 from notebooklm.rpc import RPCMethod
 
 
@@ -20,6 +22,28 @@ def pytest_configure(config):
     # Force these values to ensure consistent behavior across all environments
     os.environ["NO_COLOR"] = "1"
     os.environ["TERM"] = "dumb"
+    # Keep tests from reading or writing the user's token cache; token cache
+    # tests re-enable it with monkeypatch
+    os.environ["NOTEBOOKLM_TOKEN_CACHE"] = "0"
+
+
+@pytest.fixture
+def auth():
+    """Minimal authentication tokens for ClientCore and client tests."""
+    return AuthTokens(
+        cookies={"SID": "test_sid"},
+        csrf_token="test_csrf",
+        session_id="test_session",
+    )
+
+
+@pytest.fixture
+async def core(auth):
+    """Open ClientCore built from the ``auth`` fixture, closed after the test."""
+    core = ClientCore(auth)
+    await core.open()
+    yield core
+    await core.close()
 
 
 @pytest.fixture
@@ -99,3 +123,30 @@ def build_rpc_response():
         return f")]}}'\n{len(chunk)}\n{chunk}\n"
 
     return _build
+
+
+class FakeClock:
+    """Manually advanced stand-in for ``time.monotonic``."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Factory replacing a module's ``time.monotonic`` with a FakeClock.
+
+    Args:
+        module: Dotted path of the module to patch, e.g. "notebooklm._governor".
+        start: Initial clock reading.
+    """
+
+    def _install(module: str, start: float = 0.0) -> FakeClock:
+        clock = FakeClock(start)
+        monkeypatch.setattr(f"{module}.time.monotonic", clock)
+        return clock
+
+    return _install
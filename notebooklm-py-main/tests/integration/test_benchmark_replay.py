@@ -0,0 +1,41 @@
+"""Smoke test for benchmarks/replay_api.py so the suite keeps working offline."""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARK = Path(__file__).parents[2] / "benchmarks" / "replay_api.py"
+
+
+@pytest.fixture(scope="module")
+def replay_api():
+    spec = importlib.util.spec_from_file_location("replay_api", BENCHMARK)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses resolve annotations through sys.modules
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        del sys.modules[spec.name]
+
+
+def test_every_scenario_replays(replay_api, tmp_path):
+    results = replay_api.run_suite(replay_api.SCENARIOS, repeat=1)
+
+    assert [(r.scenario, r.stream) for r in results] == [
+        (s.name, stream) for s in replay_api.SCENARIOS for stream in (False, True)
+    ]
+    for result in results:
+        assert result.requests > 0
+        assert result.response_bytes > 0
+        assert result.best_ms > 0
+
+    output = tmp_path / "results.json"
+    replay_api.save(results, output)
+    assert len(json.loads(output.read_text())["results"]) == len(results)
+    assert replay_api.compare(results, output, threshold=1000.0)
@@ -0,0 +1,236 @@
+"""Tests for benchmarks/fake_server.py, the local NotebookLM stand-in."""
+
+import asyncio
+import importlib.util
+import os
+import re
+import sys
+import textwrap
+from pathlib import Path
+
+import httpx
+import pytest
+
+from notebooklm.rpc import (
+    RateLimitError,
+    RPCError,
+    RPCMethod,
+    build_request_body,
+    decode_response,
+    encode_rpc_request,
+)
+
+FAKE_SERVER = Path(__file__).parents[2] / "benchmarks" / "fake_server.py"
+
+# The flow backend/main.py runs, executed in a subprocess so the URL
+# overrides (read at import time) take effect
+CLIENT_SCRIPT = textwrap.dedent(
+    """
+    import asyncio
+    import sys
+    from pathlib import Path
+
+    from notebooklm import NotebookLMClient
+
+
+    async def main():
+        async with await NotebookLMClient.from_storage(timeout=30) as client:
+            await client.settings.set_output_language("zh_Hans")
+            nb = await client.notebooks.create("Load test")
+            source = await client.sources.add_file(nb.id, Path(sys.argv[1]), wait=True)
+            status = await client.artifacts.generate_slide_deck(nb.id)
+            await client.artifacts.wait_for_completion(
+                nb.id, status.task_id, initial_interval=0.05, timeout=10
+            )
+            await client.artifacts.download_slide_deck(nb.id, sys.argv[2])
+            answer = await client.chat.ask(nb.id, "What is this about?")
+            print(source.status, answer.answer)
+
+
+    asyncio.run(main())
+    """
+)
+
+
+@pytest.fixture(scope="module")
+def fake_server():
+    spec = importlib.util.spec_from_file_location("fake_server", FAKE_SERVER)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses resolve annotations through sys.modules
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        del sys.modules[spec.name]
+
+
+def _client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://fake",
+        headers={"Cookie": "SID=account-1"},
+    )
+
+
+async def _csrf(client: httpx.AsyncClient) -> str:
+    response = await client.get("/")
+    match = re.search(r'"SNlM0e":"([^"]+)"', response.text)
+    assert match is not None
+    return match.group(1)
+
+
+async def _rpc(client, fake_server, method: RPCMethod, params, csrf: str):
+    body = build_request_body(encode_rpc_request(method, params), csrf)
+    return await client.post(
+        fake_server.BATCHEXECUTE_PATH,
+        params={"rpcids": method.value},
+        content=body,
+        headers={"Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_backend_flow_end_to_end(fake_server, tmp_path):
+    app = fake_server.FakeNotebookLM(
+        fake_server.FakeServerConfig(generation_seconds=0.2, media_bytes=1024)
+    )
+    server = await fake_server.start_server(app, port=0)
+    port = server.sockets[0].getsockname()[1]
+    upload = tmp_path / "notes.pdf"
+    upload.write_bytes(b"%PDF-1.4 test")
+    output = tmp_path / "deck.pdf"
+
+    env = {**os.environ, **fake_server.client_env(f"http://127.0.0.1:{port}")}
+    env["NOTEBOOKLM_HOME"] = str(tmp_path)
+    async with server:
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            CLIENT_SCRIPT,
+            str(upload),
+            str(output),
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+
+    assert process.returncode == 0, stderr.decode()
+    assert stdout.decode().startswith("2 This is a fake answer to the question: What is this")
+    assert output.read_bytes().startswith(b"%PDF")
+    assert output.stat().st_size == 1024
+    assert app.stats["upload_bytes"] == len(b"%PDF-1.4 test")
+    assert app.stats["rpc_R7cb6c"] == 1
+    assert app.stats["chat"] == 1
+    assert app.stats["download"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_returns_429(fake_server):
+    app = fake_server.FakeNotebookLM(fake_server.FakeServerConfig(rate_limit=2))
+    async with _client(app) as client:
+        csrf = await _csrf(client)
+        statuses = [
+            (await _rpc(client, fake_server, RPCMethod.LIST_NOTEBOOKS, [], csrf)).status_code
+            for _ in range(3)
+        ]
+        throttled = await _rpc(client, fake_server, RPCMethod.LIST_NOTEBOOKS, [], csrf)
+
+    assert statuses == [200, 200, 429]
+    assert throttled.headers["retry-after"] == "1"
+    assert app.stats["http_429"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_injection_spares_homepage(fake_server):
+    app = fake_server.FakeNotebookLM(
+        fake_server.FakeServerConfig(failure_rate=1.0, failure_status=503)
+    )
+    async with _client(app) as client:
+        csrf = await _csrf(client)
+        response = await _rpc(client, fake_server, RPCMethod.LIST_NOTEBOOKS, [], csrf)
+
+    assert response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_unknown_csrf_token_rejected(fake_server):
+    app = fake_server.FakeNotebookLM()
+    async with _client(app) as client:
+        response = await _rpc(client, fake_server, RPCMethod.LIST_NOTEBOOKS, [], "stale")
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_generation_quota(fake_server):
+    app = fake_server.FakeNotebookLM(fake_server.FakeServerConfig(generation_quota=1))
+    async with _client(app) as client:
+        csrf = await _csrf(client)
+        created = await _rpc(
+            client, fake_server, RPCMethod.CREATE_NOTEBOOK, ["nb", None, None, [2], [1]], csrf
+        )
+        notebook_id = decode_response(created.text, RPCMethod.CREATE_NOTEBOOK.value)[2]
+        params = [[2], notebook_id, [None, None, 8, []]]
+        first = await _rpc(client, fake_server, RPCMethod.CREATE_VIDEO, params, csrf)
+        second = await _rpc(client, fake_server, RPCMethod.CREATE_VIDEO, params, csrf)
+
+    result = decode_response(first.text, RPCMethod.CREATE_VIDEO.value)
+    assert result[0][4] == 1  # processing
+    with pytest.raises(RateLimitError):
+        decode_response(second.text, RPCMethod.CREATE_VIDEO.value)
+
+
+@pytest.mark.asyncio
+async def test_accounts_are_isolated(fake_server):
+    app = fake_server.FakeNotebookLM()
+    async with _client(app) as client:
+        csrf = await _csrf(client)
+        created = await _rpc(
+            client, fake_server, RPCMethod.CREATE_NOTEBOOK, ["nb", None, None, [2], [1]], csrf
+        )
+        notebook_id = decode_response(created.text, RPCMethod.CREATE_NOTEBOOK.value)[2]
+
+        client.headers["Cookie"] = "SID=account-2"
+        listed = await _rpc(client, fake_server, RPCMethod.LIST_NOTEBOOKS, [], csrf)
+        missing = await _rpc(
+            client, fake_server, RPCMethod.GET_NOTEBOOK, [notebook_id, None, [2], None, 0], csrf
+        )
+
+    assert decode_response(listed.text, RPCMethod.LIST_NOTEBOOKS.value) == [[]]
+    with pytest.raises(RPCError):
+        decode_response(missing.text, RPCMethod.GET_NOTEBOOK.value)
+
+
+@pytest.mark.asyncio
+async def test_media_download_honors_range(fake_server):
+    app = fake_server.FakeNotebookLM(
+        fake_server.FakeServerConfig(generation_seconds=0, media_bytes=1000)
+    )
+    async with _client(app) as client:
+        csrf = await _csrf(client)
+        created = await _rpc(
+            client, fake_server, RPCMethod.CREATE_NOTEBOOK, ["nb", None, None, [2], [1]], csrf
+        )
+        notebook_id = decode_response(created.text, RPCMethod.CREATE_NOTEBOOK.value)[2]
+        params = [[2], notebook_id, [None, None, 8, []]]
+        generated = await _rpc(client, fake_server, RPCMethod.CREATE_VIDEO, params, csrf)
+        artifact_id = decode_response(generated.text, RPCMethod.CREATE_VIDEO.value)[0][0]
+        url = fake_server.MEDIA_PATH + artifact_id
+
+        full = await client.get(url)
+        resumed = await client.get(
+            url, headers={"Range": "bytes=400-", "If-Range": full.headers["etag"]}
+        )
+        changed = await client.get(url, headers={"Range": "bytes=400-", "If-Range": '"other"'})
+        beyond = await client.get(url, headers={"Range": "bytes=1000-"})
+
+    assert resumed.status_code == 206
+    assert resumed.headers["content-range"] == "bytes 400-999/1000"
+    assert resumed.content == full.content[400:]
+    assert changed.status_code == 200
+    assert len(changed.content) == 1000
+    assert beyond.status_code == 416
+    assert app.stats["download_resumed"] == 1
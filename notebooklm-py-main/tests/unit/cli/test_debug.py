@@ -0,0 +1,46 @@
+"""Tests for debug CLI commands."""
+
+import json
+
+import pytest
+
+from notebooklm.notebooklm_cli import cli
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOTEBOOKLM_HOME", str(tmp_path))
+    return tmp_path
+
+
+def _write_records(home, methods):
+    lines = [json.dumps({"method": m, "outcome": "ok"}) + "\n" for m in methods]
+    (home / "flight_recorder.jsonl").write_text("".join(lines))
+
+
+class TestDebugDump:
+    def test_dump_to_stdout(self, runner, home):
+        _write_records(home, ["LIST_NOTEBOOKS", "GET_NOTEBOOK"])
+
+        result = runner.invoke(cli, ["debug", "dump"])
+
+        assert result.exit_code == 0
+        methods = [json.loads(line)["method"] for line in result.output.splitlines()]
+        assert methods == ["LIST_NOTEBOOKS", "GET_NOTEBOOK"]
+
+    def test_dump_to_file_and_clear(self, runner, home):
+        _write_records(home, ["LIST_NOTEBOOKS"])
+        output = home / "out.jsonl"
+
+        result = runner.invoke(cli, ["debug", "dump", "-o", str(output), "--clear"])
+
+        assert result.exit_code == 0
+        assert "Wrote 1 requests" in result.output
+        assert output.read_text().count("LIST_NOTEBOOKS") == 1
+        assert not (home / "flight_recorder.jsonl").exists()
+
+    def test_nothing_recorded(self, runner, home):
+        result = runner.invoke(cli, ["debug", "dump"])
+
+        assert result.exit_code == 0
+        assert "NOTEBOOKLM_FLIGHT_RECORDER" in result.output
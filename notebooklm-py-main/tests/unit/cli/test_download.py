@@ -1,5 +1,6 @@
 """Tests for download CLI commands."""
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -630,6 +631,63 @@ class TestDownloadAll:
         # Second file should be downloaded
         assert (output_dir / "Second Audio.mp3").exists()
 
+    def test_download_all_parallel(self, runner, mock_auth, mock_fetch_tokens, tmp_path):
+        """Test --all --parallel overlaps downloads and keeps result order."""
+        with patch_client_for_module("download") as mock_client_cls:
+            mock_client = create_mock_client()
+
+            output_dir = tmp_path / "downloads"
+            in_flight = 0
+            peak = 0
+
+            async def mock_download_audio(notebook_id, output_path, artifact_id=None):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                if artifact_id == "audio_2":
+                    raise Exception("Network error")
+                Path(output_path).write_bytes(b"audio content")
+                return output_path
+
+            mock_client.artifacts.list = AsyncMock(
+                return_value=[make_artifact(f"audio_{i}", f"Audio {i}", 1) for i in range(1, 5)]
+            )
+            mock_client.artifacts.download_audio = mock_download_audio
+            mock_client_cls.return_value = mock_client
+
+            result = runner.invoke(
+                cli,
+                [
+                    "download",
+                    "audio",
+                    "--all",
+                    "--parallel",
+                    "2",
+                    str(output_dir),
+                    "-n",
+                    "nb_123",
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert peak == 2
+        assert sorted(p.name for p in output_dir.glob("*.mp3")) == [
+            "Audio 1.mp3",
+            "Audio 3.mp3",
+            "Audio 4.mp3",
+        ]
+        assert "Audio 2.mp3: Network error" in result.output
+        # Results are listed in artifact order, not completion order
+        assert result.output.index("Audio 1.mp3 <-") < result.output.index("Audio 3.mp3 <-")
+
+    def test_parallel_must_be_positive(self, runner, mock_auth, mock_fetch_tokens):
+        result = runner.invoke(cli, ["download", "audio", "--all", "--parallel", "0"])
+
+        assert result.exit_code != 0
+        assert "--parallel" in result.output
+
 
 # =============================================================================
 # DOWNLOAD ERROR HANDLING TESTS
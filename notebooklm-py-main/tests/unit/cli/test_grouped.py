@@ -1,9 +1,11 @@
-"""Tests for SectionedGroup CLI help formatting."""
+"""Tests for SectionedGroup CLI help formatting and LazyGroup loading."""
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from notebooklm.notebooklm_cli import cli
+from notebooklm.cli.grouped import LazyGroup
+from notebooklm.notebooklm_cli import LAZY_COMMANDS, cli
 
 
 @pytest.fixture
@@ -126,3 +128,42 @@ class TestSectionedHelpOrder:
 
         # Verify order
         assert session_pos < notebooks_pos < chat_pos < groups_pos < actions_pos
+
+
+class TestLazyGroup:
+    """Test that commands are imported on first use."""
+
+    def test_loads_command_on_first_lookup(self, runner):
+        group = LazyGroup(lazy_commands={"dump": "notebooklm.cli.debug:debug"})
+        assert group.commands == {}
+        assert "dump" in group.list_commands(click.Context(group))
+
+        result = runner.invoke(group, ["dump", "--help"])
+
+        assert result.exit_code == 0
+        assert "Inspect recorded client activity" in result.output
+        assert "dump" in group.commands
+
+    def test_static_help_matches_commands(self):
+        """The help text kept in LAZY_COMMANDS must match the commands themselves."""
+        ctx = click.Context(cli)
+        groups = set(sum(cli.command_groups.values(), []))
+        for name, (_, help_text) in LAZY_COMMANDS.items():
+            cmd = cli.get_command(ctx, name)
+            if name in groups:
+                assert help_text == ", ".join(sorted(cmd.list_commands(ctx))), name
+            else:
+                assert help_text == cmd.get_short_help_str(limit=1000), name
+
+    def test_help_lists_static_text_without_loading(self, runner):
+        group = LazyGroup(lazy_commands={"dump": ("notebooklm.cli.debug:debug", "Dump things.")})
+
+        result = runner.invoke(group, ["--help"])
+
+        assert "dump  Dump things." in result.output
+        assert group.commands == {}
+
+    def test_register_function_must_register_name(self):
+        group = LazyGroup(lazy_commands={"nope": "notebooklm.cli.chat:register_chat_commands"})
+        with pytest.raises(RuntimeError, match="did not register 'nope'"):
+            group.get_command(click.Context(group), "nope")
@@ -536,6 +536,23 @@ class TestGetClient:
 
         mock_load.assert_called_once_with("/custom/path")
 
+    def test_reuses_cached_tokens(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("NOTEBOOKLM_TOKEN_CACHE", raising=False)
+        ctx = MagicMock()
+        ctx.obj = {"storage_path": tmp_path / "storage_state.json"}
+
+        with patch("notebooklm.cli.helpers.load_auth_from_storage") as mock_load:
+            mock_load.return_value = {"SID": "test"}
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+
+                first = get_client(ctx)
+                second = get_client(ctx)
+
+        assert first == second == ({"SID": "test"}, "csrf", "session")
+        mock_fetch.assert_called_once()
+        assert (tmp_path / "token_cache.json").exists()
+
 
 class TestGetAuthTokens:
     def test_returns_auth_tokens_object(self):
@@ -0,0 +1,86 @@
+"""Startup cost checks for the notebooklm CLI.
+
+Each check runs in a fresh interpreter so modules imported by other tests
+don't hide an eager import.
+"""
+
+import subprocess
+import sys
+
+# Generous: catches eager imports creeping back in, not machine-to-machine noise
+IMPORT_BUDGET_SECONDS = 0.5
+
+COMMAND_MODULES = [
+    "notebooklm.cli.artifact",
+    "notebooklm.cli.chat",
+    "notebooklm.cli.debug",
+    "notebooklm.cli.download",
+    "notebooklm.cli.generate",
+    "notebooklm.cli.language",
+    "notebooklm.cli.note",
+    "notebooklm.cli.notebook",
+    "notebooklm.cli.research",
+    "notebooklm.cli.session",
+    "notebooklm.cli.skill",
+    "notebooklm.cli.source",
+]
+
+
+def _python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _loaded_modules(code: str) -> set[str]:
+    result = _python(code + "\nimport sys\nprint('\\n'.join(sys.modules))")
+    return set(result.stdout.split())
+
+
+def test_no_command_modules_imported_at_startup():
+    loaded = _loaded_modules("import notebooklm.notebooklm_cli")
+    assert loaded.isdisjoint(COMMAND_MODULES)
+    assert loaded.isdisjoint(["httpx", "rich", "notebooklm.client"])
+
+
+def test_command_lookup_imports_only_its_module():
+    loaded = _loaded_modules(
+        "import click\n"
+        "from notebooklm.notebooklm_cli import cli\n"
+        "cli.get_command(click.Context(cli), 'research')"
+    )
+    assert "notebooklm.cli.research" in loaded
+    assert loaded.isdisjoint(set(COMMAND_MODULES) - {"notebooklm.cli.research"})
+
+
+def test_top_level_help_imports_no_commands():
+    result = _python(
+        "import sys\n"
+        "from notebooklm.notebooklm_cli import cli\n"
+        "try:\n"
+        "    cli(['--help'], prog_name='notebooklm')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('\\n'.join(sys.modules))"
+    )
+    assert "Session:" in result.stdout
+    loaded = set(result.stdout.split())
+    assert loaded.isdisjoint(COMMAND_MODULES)
+    assert loaded.isdisjoint(["httpx", "rich", "notebooklm.client"])
+
+
+def test_import_time_budget():
+    result = _python("import notebooklm.notebooklm_cli", "-X", "importtime")
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    cumulative = {
+        parts[2].strip(): int(parts[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+        and len(parts := line[12:].split("|")) == 3
+        and parts[1].strip().isdigit()
+    }
+    seconds = cumulative["notebooklm.notebooklm_cli"] / 1_000_000
+    assert seconds < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,225 @@
+"""Tests for the on-disk ArtifactCache."""
+
+import json
+import multiprocessing
+from contextlib import nullcontext
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from notebooklm import ArtifactCache
+from notebooklm._artifacts import ArtifactsAPI
+from notebooklm._metrics import RequestMetrics
+
+URL = "https://example.com/media/1"
+
+
+def _store_many(directory: str, prefix: str, count: int) -> None:
+    """Run in a child process: store ``count`` distinct small files."""
+    cache = ArtifactCache(directory, max_bytes=10**6)
+    source = Path(directory).parent / f"{prefix}.src"
+    for i in range(count):
+        source.write_bytes(f"{prefix}-{i}".encode())
+        cache.store(f"{prefix}_{i}", URL, source)
+
+
+def _file(tmp_path, name: str, data: bytes):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ArtifactCache(tmp_path / "cache", max_bytes=250)
+
+
+class TestArtifactCache:
+    def test_restore_after_store(self, cache, tmp_path):
+        cache.store("art_1", URL, _file(tmp_path, "a.pdf", b"%PDF deck"), etag='"v1"')
+
+        output = tmp_path / "out" / "copy.pdf"
+        assert cache.restore("art_1", URL, output)
+
+        assert output.read_bytes() == b"%PDF deck"
+        assert cache.stats == {
+            "hits": 1,
+            "misses": 0,
+            "evictions": 0,
+            "bytes_saved": 9,
+            "entries": 1,
+            "bytes": 9,
+        }
+
+    def test_miss_for_unknown_artifact_or_other_url(self, cache, tmp_path):
+        cache.store("art_1", URL, _file(tmp_path, "a.pdf", b"data"))
+
+        assert not cache.restore("art_2", URL, tmp_path / "x")
+        assert not cache.restore("art_1", "https://example.com/media/other", tmp_path / "x")
+        assert cache.misses == 2
+        assert not (tmp_path / "x").exists()
+
+    def test_index_persists_across_instances(self, cache, tmp_path):
+        cache.store("art_1", URL, _file(tmp_path, "a.pdf", b"data"))
+
+        reopened = ArtifactCache(cache.directory)
+
+        assert len(reopened) == 1
+        assert reopened.restore("art_1", URL, tmp_path / "copy.pdf")
+
+    def test_identical_content_stored_once(self, cache, tmp_path):
+        cache.store("art_1", URL, _file(tmp_path, "a.png", b"same"))
+        cache.store("art_2", URL + "?2", _file(tmp_path, "b.png", b"same"))
+
+        objects = [p for p in (cache.directory / "objects").rglob("*") if p.is_file()]
+        assert len(objects) == 1
+        assert cache.stats["bytes"] == 4
+        assert len(cache) == 2
+
+    def test_least_recently_used_evicted(self, cache, tmp_path):
+        cache.store("old", URL + "old", _file(tmp_path, "1", b"a" * 100))
+        cache.store("used", URL + "used", _file(tmp_path, "2", b"b" * 100))
+        assert cache.restore("old", URL + "old", tmp_path / "touch")
+
+        cache.store("new", URL + "new", _file(tmp_path, "3", b"c" * 100))
+
+        assert not cache.restore("used", URL + "used", tmp_path / "x")
+        assert cache.restore("old", URL + "old", tmp_path / "y")
+        assert cache.restore("new", URL + "new", tmp_path / "z")
+        assert cache.evictions == 1
+        assert cache.stats["bytes"] == 200
+
+    def test_file_over_budget_not_cached(self, cache, tmp_path):
+        cache.store("big", URL, _file(tmp_path, "big", b"x" * 300))
+
+        assert len(cache) == 0
+
+    def test_missing_object_is_a_miss(self, cache, tmp_path):
+        cache.store("art_1", URL, _file(tmp_path, "a.pdf", b"data"))
+        for path in (cache.directory / "objects").rglob("*"):
+            if path.is_file():
+                path.unlink()
+
+        assert not cache.restore("art_1", URL, tmp_path / "copy.pdf")
+        assert len(cache) == 0
+
+    def test_restore_replaces_existing_output(self, cache, tmp_path):
+        cache.store("art_1", URL, _file(tmp_path, "a.pdf", b"cached"))
+        output = _file(tmp_path, "existing.pdf", b"old")
+
+        assert cache.restore("art_1", URL, output)
+
+        assert output.read_bytes() == b"cached"
+
+    def test_malformed_index_entries_ignored(self, cache, tmp_path):
+        cache.store("art_1", URL, _file(tmp_path, "a.pdf", b"data"))
+        index = json.loads(cache._index_path.read_text())
+        index["artifacts"]["broken"] = {"url": URL}
+        cache._index_path.write_text(json.dumps(index))
+
+        assert not cache.restore("broken", URL, tmp_path / "x")
+        cache.store("art_2", URL, _file(tmp_path, "b.pdf", b"more"))
+        assert len(cache) == 2
+
+    def test_processes_sharing_a_directory_keep_every_entry(self, tmp_path):
+        directory = tmp_path / "shared"
+        ctx = multiprocessing.get_context("spawn")
+        workers = [
+            ctx.Process(target=_store_many, args=(str(directory), f"p{n}", 15)) for n in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        cache = ArtifactCache(directory)
+        assert len(cache) == 45
+        assert cache.restore("p2_14", URL, tmp_path / "out")
+        assert (tmp_path / "out").read_bytes() == b"p2-14"
+
+    def test_clear(self, cache, tmp_path):
+        cache.store("art_1", URL, _file(tmp_path, "a.pdf", b"data"))
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert not cache.directory.exists()
+
+    @pytest.mark.parametrize(
+        "value,max_bytes",
+        [("1", 2 * 1024**3), ("500M", 500 * 1024**2), ("2GiB", 2 * 1024**3), ("4096", 4096)],
+    )
+    def test_from_env(self, monkeypatch, tmp_path, value, max_bytes):
+        monkeypatch.setenv("NOTEBOOKLM_HOME", str(tmp_path))
+        monkeypatch.setenv("NOTEBOOKLM_ARTIFACT_CACHE", value)
+
+        cache = ArtifactCache.from_env()
+
+        assert cache is not None
+        assert cache.max_bytes == max_bytes
+        assert cache.directory == tmp_path.resolve() / "artifact_cache"
+
+    @pytest.mark.parametrize("value", ["", "0", "lots"])
+    def test_from_env_disabled(self, monkeypatch, value):
+        monkeypatch.setenv("NOTEBOOKLM_ARTIFACT_CACHE", value)
+
+        assert ArtifactCache.from_env() is None
+
+
+class TestDownloadWithCache:
+    @pytest.mark.asyncio
+    async def test_second_download_served_from_cache(self, cache, tmp_path):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200, headers={"content-type": "application/pdf", "etag": '"v1"'}, content=b"%PDF"
+            )
+
+        core = MagicMock()
+        core.artifact_cache = cache
+        core.get_download_client.return_value = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        core.measure.side_effect = lambda *args, **kwargs: nullcontext(RequestMetrics("download"))
+        core.throttle.side_effect = lambda *args: nullcontext()
+        api = ArtifactsAPI(core, notes_api=MagicMock())
+
+        await api._download_url(URL, str(tmp_path / "first.pdf"), artifact_id="art_1")
+        await api._download_url(URL, str(tmp_path / "second.pdf"), artifact_id="art_1")
+
+        assert len(requests) == 1
+        assert (tmp_path / "second.pdf").read_bytes() == b"%PDF"
+        assert cache.hits == 1
+        assert cache._load()["art_1"]["etag"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_cache_error_falls_back_to_download(self, cache, tmp_path):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, headers={"content-type": "application/pdf"}, content=b"%PDF")
+
+        core = MagicMock()
+        core.artifact_cache = cache
+        core.get_download_client.return_value = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        core.measure.side_effect = lambda *args, **kwargs: nullcontext(RequestMetrics("download"))
+        core.throttle.side_effect = lambda *args: nullcontext()
+        api = ArtifactsAPI(core, notes_api=MagicMock())
+        output = tmp_path / "out.pdf"
+
+        with (
+            patch.object(cache, "restore", side_effect=OSError("disk gone")),
+            patch.object(cache, "store", side_effect=KeyError("hash")),
+        ):
+            assert await api._download_url(URL, str(output), artifact_id="art_1") == str(output)
+
+        assert len(requests) == 1
+        assert output.read_bytes() == b"%PDF"
@@ -2,11 +2,14 @@
 
 import os
 import tempfile
+from contextlib import nullcontext
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from notebooklm._artifacts import ArtifactsAPI
+from notebooklm._metrics import RequestMetrics
 from notebooklm.auth import AuthTokens
 from notebooklm.types import (
     ArtifactNotFoundError,
@@ -370,28 +373,26 @@ class TestDownloadUrl:
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = os.path.join(tmpdir, "file.mp4")
 
-            # Create a mock httpx module
-            import httpx as real_httpx
+            requests = []
 
-            mock_response = MagicMock()
-            mock_response.headers = {"content-type": "video/mp4"}
-            mock_response.content = b"fake video content"
-            mock_response.raise_for_status = MagicMock()
+            def handler(request: httpx.Request) -> httpx.Response:
+                requests.append(request)
+                return httpx.Response(
+                    200, headers={"content-type": "video/mp4"}, content=b"fake video content"
+                )
 
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_core.get_download_client.return_value = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            mock_core.measure.return_value = nullcontext(RequestMetrics("download"))
+            mock_core.throttle.return_value = nullcontext()
 
-            # Mock load_httpx_cookies to avoid requiring real auth files
-            mock_cookies = MagicMock()
-            with (
-                patch.object(real_httpx, "AsyncClient", return_value=mock_client),
-                patch("notebooklm._artifacts.load_httpx_cookies", return_value=mock_cookies),
-            ):
-                result = await api._download_url("https://other.example.com/file.mp4", output_path)
+            result = await api._download_url("https://other.example.com/file.mp4", output_path)
 
             assert result == output_path
+            assert len(requests) == 1
+            with open(output_path, "rb") as f:
+                assert f.read() == b"fake video content"
 
 
 class TestDownloadReport:
@@ -4,13 +4,17 @@ These tests target specific uncovered lines identified by coverage analysis.
 """
 
 import asyncio
+import json
 import warnings
+from contextlib import nullcontext
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from notebooklm._artifacts import ArtifactsAPI
+from notebooklm._artifacts import DOWNLOAD_CHUNK_SIZE, ArtifactsAPI
+from notebooklm._metrics import RequestMetrics
+from notebooklm.rpc import RPCMethod
 from notebooklm.rpc.decoder import RPCError
 from notebooklm.types import ArtifactDownloadError
 
@@ -30,6 +34,15 @@ def mock_artifacts_api():
     return api, mock_core
 
 
+def _use_download_client(mock_core, handler) -> None:
+    """Answer the core's download requests with handler."""
+    mock_core.get_download_client.return_value = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    mock_core.measure.side_effect = lambda *args, **kwargs: nullcontext(RequestMetrics("download"))
+    mock_core.throttle.side_effect = lambda *args: nullcontext()
+
+
 # =============================================================================
 # TIER 1: _download_urls_batch tests (lines 1360-1390)
 # =============================================================================
@@ -41,94 +54,332 @@ class TestDownloadUrlsBatch:
     @pytest.mark.asyncio
     async def test_batch_download_success(self, mock_artifacts_api, tmp_path):
         """Test successful batch download of multiple files."""
-        api, _ = mock_artifacts_api
+        api, mock_core = mock_artifacts_api
 
-        # Create mock response with binary content
-        mock_response = MagicMock()
-        mock_response.content = b"binary media content"
-        mock_response.headers = {"content-type": "video/mp4"}
-        mock_response.raise_for_status = MagicMock()
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"content-type": "video/mp4"}, content=b"binary media content"
+            )
 
-        with (
-            patch("notebooklm._artifacts.load_httpx_cookies", return_value={}),
-            patch("httpx.AsyncClient") as mock_client_cls,
-        ):
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
+        _use_download_client(mock_core, handler)
 
-            urls_and_paths = [
-                ("https://example.com/file1.mp4", str(tmp_path / "file1.mp4")),
-                ("https://example.com/file2.mp4", str(tmp_path / "file2.mp4")),
-            ]
+        urls_and_paths = [
+            ("https://example.com/file1.mp4", str(tmp_path / "file1.mp4")),
+            ("https://example.com/file2.mp4", str(tmp_path / "file2.mp4")),
+        ]
 
-            result = await api._download_urls_batch(urls_and_paths)
+        result = await api._download_urls_batch(urls_and_paths)
 
-        assert len(result) == 2
-        assert str(tmp_path / "file1.mp4") in result
-        assert str(tmp_path / "file2.mp4") in result
+        assert [r.path for r in result] == [p for _, p in urls_and_paths]
+        assert all(r.success and r.error is None for r in result)
+        assert result[0].bytes_written == len(b"binary media content")
+        assert (tmp_path / "file1.mp4").read_bytes() == b"binary media content"
 
     @pytest.mark.asyncio
     async def test_batch_download_html_response_rejected(self, mock_artifacts_api, tmp_path):
         """Test that HTML responses raise ArtifactDownloadError (auth expired)."""
-        api, _ = mock_artifacts_api
+        api, mock_core = mock_artifacts_api
 
         # Mock response returning HTML instead of media
-        mock_response = MagicMock()
-        mock_response.content = b"<html>Login page</html>"
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.raise_for_status = MagicMock()
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"content-type": "text/html"}, content=b"<html>Login page</html>"
+            )
 
-        with (
-            patch("notebooklm._artifacts.load_httpx_cookies", return_value={}),
-            patch("httpx.AsyncClient") as mock_client_cls,
-        ):
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
+        _use_download_client(mock_core, handler)
 
-            urls_and_paths = [
-                ("https://example.com/file.mp4", str(tmp_path / "file.mp4")),
-            ]
+        urls_and_paths = [
+            ("https://example.com/file.mp4", str(tmp_path / "file.mp4")),
+        ]
 
-            # HTML response should raise ArtifactDownloadError
-            with pytest.raises(ArtifactDownloadError, match="Received HTML instead of media"):
-                await api._download_urls_batch(urls_and_paths)
+        # HTML response should raise ArtifactDownloadError
+        with pytest.raises(ArtifactDownloadError, match="received HTML instead of media"):
+            await api._download_urls_batch(urls_and_paths)
+        assert list(tmp_path.iterdir()) == []
 
     @pytest.mark.asyncio
     async def test_batch_download_partial_failure(self, mock_artifacts_api, tmp_path):
         """Test batch download with one success and one failure."""
+        api, mock_core = mock_artifacts_api
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/file2.mp4":
+                raise httpx.ConnectError("Network error", request=request)
+            return httpx.Response(200, headers={"content-type": "video/mp4"}, content=b"valid")
+
+        _use_download_client(mock_core, handler)
+
+        urls_and_paths = [
+            ("https://example.com/file1.mp4", str(tmp_path / "file1.mp4")),
+            ("https://example.com/file2.mp4", str(tmp_path / "file2.mp4")),
+        ]
+
+        with patch("notebooklm._artifacts.DOWNLOAD_RETRY_DELAY", 0):
+            result = await api._download_urls_batch(urls_and_paths)
+
+        # The failure is reported, not dropped
+        assert [r.success for r in result] == [True, False]
+        assert result[1].url == "https://example.com/file2.mp4"
+        assert result[1].bytes_written == 0
+        assert "Network error" in result[1].error
+        assert not (tmp_path / "file2.mp4").exists()
+
+    @pytest.mark.asyncio
+    async def test_batch_download_bounded_concurrency(self, mock_artifacts_api, tmp_path):
+        """Test no more than `concurrency` downloads run at once."""
+        api, mock_core = mock_artifacts_api
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, headers={"content-type": "video/mp4"}, content=b"data")
+
+        _use_download_client(mock_core, handler)
+        urls_and_paths = [
+            (f"https://example.com/{i}.mp4", str(tmp_path / f"{i}.mp4")) for i in range(6)
+        ]
+
+        result = await api._download_urls_batch(urls_and_paths, concurrency=2)
+
+        assert peak == 2
+        assert all(r.success for r in result)
+        assert mock_core.get_download_client.call_count >= 1
+        assert len(list(tmp_path.glob("*.mp4"))) == 6
+
+    @pytest.mark.asyncio
+    async def test_batch_download_rejects_zero_concurrency(self, mock_artifacts_api):
         api, _ = mock_artifacts_api
 
-        success_response = MagicMock()
-        success_response.content = b"valid content"
-        success_response.headers = {"content-type": "video/mp4"}
-        success_response.raise_for_status = MagicMock()
+        with pytest.raises(ValueError, match="concurrency"):
+            await api._download_urls_batch([], concurrency=0)
+
+
+class TestStreamToFile:
+    """Test streamed downloads are written atomically in chunks."""
+
+    @pytest.mark.asyncio
+    async def test_streams_in_chunks(self, mock_artifacts_api, tmp_path):
+        api, mock_core = mock_artifacts_api
+        body = b"x" * (DOWNLOAD_CHUNK_SIZE * 2 + 10)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, headers={"content-type": "video/mp4"}, content=body)
+
+        _use_download_client(mock_core, handler)
+        writes = []
+        real_to_thread = asyncio.to_thread
+
+        async def spy(func, *args, **kwargs):
+            if getattr(func, "__name__", "") == "write":
+                writes.append(len(args[0]))
+            return await real_to_thread(func, *args, **kwargs)
+
+        output = tmp_path / "nested" / "video.mp4"
+        with patch("notebooklm._artifacts.asyncio.to_thread", side_effect=spy):
+            download = await api._stream_to_file("https://example.com/v.mp4", str(output))
+
+        assert download["size"] == len(body)
+        assert output.read_bytes() == body
+        assert writes == [DOWNLOAD_CHUNK_SIZE, DOWNLOAD_CHUNK_SIZE, 10]
+        assert [p.name for p in output.parent.iterdir()] == ["video.mp4"]
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_existing_file(self, mock_artifacts_api, tmp_path):
+        api, mock_core = mock_artifacts_api
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"content-type": "audio/mp4"}, stream=_BrokenStream(b"partial")
+            )
+
+        _use_download_client(mock_core, handler)
+        output = tmp_path / "audio.mp4"
+        output.write_bytes(b"previous download")
 
         with (
-            patch("notebooklm._artifacts.load_httpx_cookies", return_value={}),
-            patch("httpx.AsyncClient") as mock_client_cls,
+            patch("notebooklm._artifacts.DOWNLOAD_RETRY_DELAY", 0),
+            pytest.raises(httpx.ReadError),
         ):
-            mock_client = AsyncMock()
-            mock_client.get.side_effect = [success_response, httpx.HTTPError("Network error")]
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_cls.return_value = mock_client
+            await api._stream_to_file("https://example.com/a.mp4", str(output))
+
+        assert output.read_bytes() == b"previous download"
+        # The partial file is kept for a later resume
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            ".audio.mp4.part",
+            ".audio.mp4.part.json",
+            "audio.mp4",
+        ]
 
-            urls_and_paths = [
-                ("https://example.com/file1.mp4", str(tmp_path / "file1.mp4")),
-                ("https://example.com/file2.mp4", str(tmp_path / "file2.mp4")),
-            ]
 
-            result = await api._download_urls_batch(urls_and_paths)
+class _BrokenStream(httpx.AsyncByteStream):
+    """A response body that drops the connection after some bytes."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    async def __aiter__(self):
+        yield self._data
+        raise httpx.ReadError("connection reset")
+
+
+def _write_partial(output, data: bytes, **meta) -> None:
+    (output.parent / f".{output.name}.part").write_bytes(data)
+    (output.parent / f".{output.name}.part.json").write_text(json.dumps(meta))
+
+
+class TestResumableDownload:
+    """Test interrupted downloads continue with Range requests."""
+
+    URL = "https://example.com/video.mp4"
+    BODY = bytes(range(256)) * 40
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self):
+        # Bytes buffered short of a full chunk are lost when a connection drops
+        with (
+            patch("notebooklm._artifacts.DOWNLOAD_CHUNK_SIZE", 1024),
+            patch("notebooklm._artifacts.DOWNLOAD_RETRY_DELAY", 0),
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_dropped_connection(self, mock_artifacts_api, tmp_path):
+        api, mock_core = mock_artifacts_api
+        half = len(self.BODY) // 2
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                return httpx.Response(
+                    200,
+                    headers={
+                        "content-type": "video/mp4",
+                        "content-length": str(len(self.BODY)),
+                        "etag": '"v1"',
+                    },
+                    stream=_BrokenStream(self.BODY[:half]),
+                )
+            return httpx.Response(
+                206,
+                headers={
+                    "content-type": "video/mp4",
+                    "content-range": f"bytes {half}-{len(self.BODY) - 1}/{len(self.BODY)}",
+                },
+                content=self.BODY[half:],
+            )
+
+        _use_download_client(mock_core, handler)
+        output = tmp_path / "video.mp4"
+
+        download = await api._stream_to_file(self.URL, str(output))
+
+        assert download == {
+            "url": self.URL,
+            "length": len(self.BODY),
+            "etag": '"v1"',
+            "last_modified": None,
+            "size": len(self.BODY),
+        }
+        assert output.read_bytes() == self.BODY
+        assert "range" not in requests[0].headers
+        assert requests[1].headers["range"] == f"bytes={half}-"
+        assert requests[1].headers["if-range"] == '"v1"'
+        assert [p.name for p in tmp_path.iterdir()] == ["video.mp4"]
+
+    @pytest.mark.asyncio
+    async def test_resumes_partial_file_from_earlier_run(self, mock_artifacts_api, tmp_path):
+        api, mock_core = mock_artifacts_api
+        output = tmp_path / "video.mp4"
+        _write_partial(
+            output,
+            self.BODY[:1000],
+            url=self.URL,
+            length=len(self.BODY),
+            etag=None,
+            last_modified="Wed, 01 Oct 2025 10:00:00 GMT",
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["range"] == "bytes=1000-"
+            assert request.headers["if-range"] == "Wed, 01 Oct 2025 10:00:00 GMT"
+            return httpx.Response(
+                206,
+                headers={"content-range": f"bytes 1000-{len(self.BODY) - 1}/{len(self.BODY)}"},
+                content=self.BODY[1000:],
+            )
+
+        _use_download_client(mock_core, handler)
+
+        await api._stream_to_file(self.URL, str(output))
+
+        assert output.read_bytes() == self.BODY
+
+    @pytest.mark.asyncio
+    async def test_full_fetch_when_range_ignored(self, mock_artifacts_api, tmp_path):
+        api, mock_core = mock_artifacts_api
+        output = tmp_path / "video.mp4"
+        _write_partial(output, b"stale bytes", url=self.URL, length=None, etag='"v0"')
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["range"] == "bytes=11-"
+            return httpx.Response(200, content=self.BODY)
+
+        _use_download_client(mock_core, handler)
+
+        await api._stream_to_file(self.URL, str(output))
+
+        assert output.read_bytes() == self.BODY
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "status,headers",
+        [
+            (416, {}),
+            (206, {"content-range": "bytes 0-9/10"}),
+        ],
+    )
+    async def test_mismatched_range_starts_over(
+        self, mock_artifacts_api, tmp_path, status, headers
+    ):
+        api, mock_core = mock_artifacts_api
+        output = tmp_path / "video.mp4"
+        _write_partial(output, b"stale bytes", url=self.URL, length=None, etag=None)
+        ranges = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ranges.append(request.headers.get("range"))
+            if "range" in request.headers:
+                return httpx.Response(status, headers=headers, content=b"0123456789")
+            return httpx.Response(200, content=self.BODY)
+
+        _use_download_client(mock_core, handler)
+
+        await api._stream_to_file(self.URL, str(output))
+
+        assert ranges == ["bytes=11-", None]
+        assert output.read_bytes() == self.BODY
+
+    @pytest.mark.asyncio
+    async def test_partial_file_for_other_url_ignored(self, mock_artifacts_api, tmp_path):
+        api, mock_core = mock_artifacts_api
+        output = tmp_path / "video.mp4"
+        _write_partial(output, b"other", url="https://example.com/other.mp4", length=None)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "range" not in request.headers
+            return httpx.Response(200, content=self.BODY)
+
+        _use_download_client(mock_core, handler)
 
-        # Only first file should succeed
-        assert len(result) == 1
-        assert str(tmp_path / "file1.mp4") in result
+        await api._stream_to_file(self.URL, str(output))
+
+        assert output.read_bytes() == self.BODY
 
 
 # =============================================================================
@@ -637,6 +888,75 @@ class TestIsMediaReady:
         assert api._is_media_ready(art, 1) is False
 
 
+def _listing(*rows):
+    """A LIST_ARTIFACTS result holding the given artifact rows."""
+    return [list(rows)]
+
+
+def _audio_row(task_id: str, status: int, url: str | None = None):
+    media = [[url, None, "audio/mp4"]] if url else []
+    return [task_id, "Audio Overview", 1, None, status, None, [None] * 5 + [media]]
+
+
+class TestWaitForMany:
+    """Test wait_for_many resolves many tasks from one listing per interval."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self, mock_artifacts_api):
+        api, mock_core = mock_artifacts_api
+        mock_core.rpc_call.side_effect = [
+            _listing(_audio_row("a", 1), _audio_row("b", 1), _audio_row("c", 1)),
+            # b done; a COMPLETED but its URL isn't populated yet
+            _listing(
+                _audio_row("a", 3),
+                _audio_row("b", 3, "https://audio.url/b.mp4"),
+                _audio_row("c", 1),
+            ),
+            _listing(
+                _audio_row("a", 3, "https://audio.url/a.mp4"),
+                _audio_row("b", 3, "https://audio.url/b.mp4"),
+                _audio_row("c", 3, "https://audio.url/c.mp4"),
+            ),
+        ]
+
+        statuses = [
+            s async for s in api.wait_for_many("nb_123", ["a", "b", "c", "b"], initial_interval=0)
+        ]
+
+        assert [(s.task_id, s.status) for s in statuses] == [
+            ("b", "completed"),
+            ("a", "completed"),
+            ("c", "completed"),
+        ]
+        # One LIST_ARTIFACTS call per interval, none per task
+        assert mock_core.rpc_call.call_count == 3
+        assert {c.args[0] for c in mock_core.rpc_call.call_args_list} == {RPCMethod.LIST_ARTIFACTS}
+        assert mock_core.fresh_reads.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_after_yielding_finished(self, mock_artifacts_api):
+        api, mock_core = mock_artifacts_api
+        mock_core.rpc_call.return_value = _listing(
+            _audio_row("done", 3, "https://audio.url/done.mp4"), _audio_row("slow", 1)
+        )
+
+        finished = []
+        with pytest.raises(TimeoutError, match="slow"):
+            async for status in api.wait_for_many(
+                "nb_123", ["done", "slow"], initial_interval=0.01, timeout=0.05
+            ):
+                finished.append(status.task_id)
+
+        assert finished == ["done"]
+
+    @pytest.mark.asyncio
+    async def test_no_tasks(self, mock_artifacts_api):
+        api, mock_core = mock_artifacts_api
+
+        assert [s async for s in api.wait_for_many("nb_123", [])] == []
+        mock_core.rpc_call.assert_not_called()
+
+
 class TestPollStatusMediaReadiness:
     """Test poll_status with media readiness checking."""
 
@@ -1,6 +1,7 @@
 """Tests for authentication module."""
 
 import json
+import threading
 from pathlib import Path
 
 import pytest
@@ -13,7 +14,10 @@ from notebooklm.auth import (
     extract_session_id_from_html,
     fetch_tokens,
     load_auth_from_storage,
+    load_cached_tokens,
     load_httpx_cookies,
+    save_cached_tokens,
+    token_cache_path_for,
 )
 
 
@@ -586,6 +590,108 @@ class TestAuthTokensFromStorage:
             await AuthTokens.from_storage(tmp_path / "nonexistent.json")
 
 
+class TestTokenCache:
+    """Test the on-disk CSRF/session token cache."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, monkeypatch):
+        monkeypatch.delenv("NOTEBOOKLM_TOKEN_CACHE", raising=False)
+
+    @pytest.fixture
+    def storage_file(self, tmp_path):
+        path = tmp_path / "storage_state.json"
+        path.write_text(
+            json.dumps({"cookies": [{"name": "SID", "value": "sid", "domain": ".google.com"}]})
+        )
+        return path
+
+    def test_path_next_to_storage_file(self, tmp_path, monkeypatch):
+        assert token_cache_path_for(tmp_path / "state.json") == tmp_path / "token_cache.json"
+        monkeypatch.setenv("NOTEBOOKLM_TOKEN_CACHE", "0")
+        assert token_cache_path_for(tmp_path / "state.json") is None
+
+    def test_round_trip_keyed_by_cookies(self, tmp_path):
+        cache = tmp_path / "token_cache.json"
+        save_cached_tokens({"SID": "a"}, "csrf_a", "sess_a", cache)
+
+        assert load_cached_tokens({"SID": "a"}, cache) == ("csrf_a", "sess_a")
+        assert load_cached_tokens({"SID": "b"}, cache) is None
+        assert "SID" not in cache.read_text()
+        assert cache.stat().st_mode & 0o777 == 0o600
+
+    def test_expired_entries_ignored(self, tmp_path, monkeypatch):
+        cache = tmp_path / "token_cache.json"
+        save_cached_tokens({"SID": "a"}, "csrf", "sess", cache)
+        monkeypatch.setattr("notebooklm.auth.time.time", lambda: 10**10)
+        assert load_cached_tokens({"SID": "a"}, cache, ttl=60) is None
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path, monkeypatch, caplog):
+        cache = tmp_path / "token_cache.json"
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("notebooklm.auth.os.replace", fail)
+        save_cached_tokens({"SID": "a"}, "csrf", "sess", cache)
+
+        assert list(tmp_path.iterdir()) == []
+        assert "Failed to write token cache" in caplog.text
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        cache = tmp_path / "token_cache.json"
+        cache.write_text("not json")
+        assert load_cached_tokens({"SID": "a"}, cache) is None
+        save_cached_tokens({"SID": "a"}, "csrf", "sess", cache)
+        assert load_cached_tokens({"SID": "a"}, cache) == ("csrf", "sess")
+
+    @pytest.mark.asyncio
+    async def test_from_storage_skips_homepage_when_cached(
+        self, storage_file, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(content=b'"SNlM0e":"csrf_token" "FdrFJe":"session_id"')
+
+        first = await AuthTokens.from_storage(storage_file)
+        second = await AuthTokens.from_storage(storage_file)
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert (second.csrf_token, second.session_id) == ("csrf_token", "session_id")
+        assert first.token_cache_path == storage_file.with_name("token_cache.json")
+
+    @pytest.mark.asyncio
+    async def test_from_storage_cache_io_off_event_loop(
+        self, storage_file, httpx_mock: HTTPXMock, monkeypatch
+    ):
+        httpx_mock.add_response(content=b'"SNlM0e":"csrf_token" "FdrFJe":"session_id"')
+        threads = []
+
+        def record(fn):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return fn(*args, **kwargs)
+
+            return wrapper
+
+        monkeypatch.setattr("notebooklm.auth.load_cached_tokens", record(load_cached_tokens))
+        monkeypatch.setattr("notebooklm.auth.save_cached_tokens", record(save_cached_tokens))
+        await AuthTokens.from_storage(storage_file)
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_from_storage_without_cache(self, storage_file, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            content=b'"SNlM0e":"csrf_token" "FdrFJe":"session_id"', is_reusable=True
+        )
+
+        await AuthTokens.from_storage(storage_file, use_token_cache=False)
+        tokens = await AuthTokens.from_storage(storage_file, use_token_cache=False)
+
+        assert len(httpx_mock.get_requests()) == 2
+        assert tokens.token_cache_path is None
+        assert not storage_file.with_name("token_cache.json").exists()
+
+
 # =============================================================================
 # COOKIE DOMAIN VALIDATION TESTS
 # =============================================================================
@@ -0,0 +1,215 @@
+"""Tests for the read-through ResponseCache."""
+
+import asyncio
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notebooklm import NotebookLMClient, ResponseCache
+from notebooklm._cache import notebook_id_from_path
+from notebooklm._core import ClientCore
+from notebooklm.rpc import RPCMethod
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock("notebooklm._cache", start=100.0)
+
+
+def _key(method=RPCMethod.GET_NOTEBOOK, notebook_id="nb_1"):
+    return ResponseCache.key(method, [notebook_id], f"/notebook/{notebook_id}", False)
+
+
+class TestResponseCache:
+    def test_notebook_id_from_path(self):
+        assert notebook_id_from_path("/notebook/abc-123") == "abc-123"
+        assert notebook_id_from_path("/notebook/abc?x=1") == "abc"
+        assert notebook_id_from_path("/") is None
+
+    def test_hit_until_ttl_expires(self, clock):
+        cache = ResponseCache(ttls={RPCMethod.GET_NOTEBOOK: 10})
+        key = _key()
+        assert cache.get(key) == (False, None)
+        cache.put(key, ["nb"], cache.generation)
+
+        clock.now += 9
+        assert cache.get(key) == (True, ["nb"])
+        clock.now += 2
+        assert cache.get(key) == (False, None)
+        assert cache.stats == {"hits": 1, "misses": 2, "invalidations": 0, "entries": 0}
+
+    def test_hits_return_independent_copies(self, clock):
+        cache = ResponseCache()
+        cache.put(_key(), [["source"]], cache.generation)
+        _, first = cache.get(_key())
+        first[0].append("mutated")
+        assert cache.get(_key()) == (True, [["source"]])
+
+    def test_only_configured_methods_cached(self):
+        cache = ResponseCache(ttls={RPCMethod.LIST_NOTEBOOKS: 5})
+        assert cache.is_cached(RPCMethod.LIST_NOTEBOOKS)
+        assert not cache.is_cached(RPCMethod.GET_NOTEBOOK)
+
+    def test_invalidate_scoped_to_notebook_and_account_listings(self, clock):
+        cache = ResponseCache()
+        listing = ResponseCache.key(RPCMethod.LIST_NOTEBOOKS, [], "/", False)
+        for key in (_key(notebook_id="nb_1"), _key(notebook_id="nb_2"), listing):
+            cache.put(key, [], cache.generation)
+
+        cache.invalidate("nb_1")
+
+        assert cache.get(_key(notebook_id="nb_2"))[0]
+        assert not cache.get(_key(notebook_id="nb_1"))[0]
+        assert not cache.get(listing)[0]
+
+    def test_read_overlapping_invalidation_not_stored(self, clock):
+        cache = ResponseCache()
+        generation = cache.generation
+        cache.invalidate("nb_1")
+        cache.put(_key(), ["stale"], generation)
+        assert len(cache) == 0
+
+    def test_oldest_entries_evicted(self, clock):
+        cache = ResponseCache(max_entries=2)
+        for nb in ("a", "b", "c"):
+            cache.put(_key(notebook_id=nb), [nb], cache.generation)
+        assert not cache.get(_key(notebook_id="a"))[0]
+        assert cache.get(_key(notebook_id="c")) == (True, ["c"])
+
+
+class TestClientCoreCaching:
+    @pytest.mark.asyncio
+    async def test_repeat_listing_served_from_cache(
+        self, auth, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(text=build_rpc_response(RPCMethod.LIST_NOTEBOOKS, [["nb"]]))
+        cache = ResponseCache()
+        core = ClientCore(auth, response_cache=cache)
+        await core.open()
+        try:
+            first = await core.rpc_call(RPCMethod.LIST_NOTEBOOKS, [None, 1])
+            second = await core.rpc_call(RPCMethod.LIST_NOTEBOOKS, [None, 1])
+        finally:
+            await core.close()
+
+        assert first == second == [["nb"]]
+        assert len(httpx_mock.get_requests()) == 1
+        assert cache.hits == 1 and cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates_notebook(
+        self, auth, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        get, rename = RPCMethod.GET_NOTEBOOK, RPCMethod.RENAME_NOTEBOOK
+        httpx_mock.add_response(text=build_rpc_response(get, ["old"]))
+        httpx_mock.add_response(text=build_rpc_response(rename, []))
+        httpx_mock.add_response(text=build_rpc_response(get, ["new"]))
+        core = ClientCore(auth, response_cache=ResponseCache())
+        path = "/notebook/nb_1"
+        await core.open()
+        try:
+            assert await core.rpc_call(get, ["nb_1"], path) == ["old"]
+            await core.rpc_call(rename, ["nb_1", "New"], path, allow_null=True)
+            assert await core.rpc_call(get, ["nb_1"], path) == ["new"]
+        finally:
+            await core.close()
+        assert len(httpx_mock.get_requests()) == 3
+
+    @pytest.mark.asyncio
+    async def test_read_only_call_keeps_notebook_cached(self, auth, monkeypatch):
+        get, path = RPCMethod.GET_NOTEBOOK, "/notebook/nb_1"
+        calls = []
+
+        async def call(method, params, source_path="/", allow_null=False, _is_retry=False):
+            calls.append(method)
+            return [method.value]
+
+        cache = ResponseCache()
+        core = ClientCore(auth, response_cache=cache)
+        monkeypatch.setattr(core, "_rpc_call_with_retries", call)
+        await core.rpc_call(get, ["nb_1"], path)
+        await core.rpc_call(RPCMethod.GET_SOURCE_GUIDE, [["src"]], path)
+        await core.rpc_call(get, ["nb_1"], path)
+
+        assert calls == [get, RPCMethod.GET_SOURCE_GUIDE]
+        assert cache.invalidations == 0
+
+    @pytest.mark.asyncio
+    async def test_fresh_reads_bypass_and_refresh_cache(
+        self, auth, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        method = RPCMethod.GET_NOTEBOOK
+        httpx_mock.add_response(text=build_rpc_response(method, ["processing"]))
+        httpx_mock.add_response(text=build_rpc_response(method, ["ready"]))
+        core = ClientCore(auth, response_cache=ResponseCache())
+        await core.open()
+        try:
+            await core.rpc_call(method, ["nb_1"])
+            with core.fresh_reads():
+                assert await core.rpc_call(method, ["nb_1"]) == ["ready"]
+            assert await core.rpc_call(method, ["nb_1"]) == ["ready"]
+        finally:
+            await core.close()
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_read_overlapping_mutation_not_cached(self, auth, monkeypatch):
+        get, path = RPCMethod.GET_NOTEBOOK, "/notebook/nb_1"
+        release = asyncio.Event()
+        state = {"sources": 0}
+
+        async def call(method, params, source_path="/", allow_null=False, _is_retry=False):
+            if method == RPCMethod.ADD_SOURCE:
+                state["sources"] += 1
+                return None
+            seen = state["sources"]
+            if seen == 0:
+                await release.wait()
+            return seen
+
+        cache = ResponseCache()
+        core = ClientCore(auth, response_cache=cache)
+        monkeypatch.setattr(core, "_rpc_call_with_retries", call)
+        first = asyncio.create_task(core.rpc_call(get, ["nb_1"], path))
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        await core.rpc_call(RPCMethod.ADD_SOURCE, ["nb_1"], path)
+        second = asyncio.create_task(core.rpc_call(get, ["nb_1"], path))
+        for _ in range(3):
+            await asyncio.sleep(0)
+        release.set()
+
+        assert await first == 0
+        assert await second == 1
+        assert await core.rpc_call(get, ["nb_1"], path) == 1
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_joined_read_keeps_generation_of_its_request(self, auth, monkeypatch):
+        get = RPCMethod.GET_NOTEBOOK
+        release = asyncio.Event()
+
+        async def call(*args, **kwargs):
+            await release.wait()
+            return ["old"]
+
+        cache = ResponseCache()
+        core = ClientCore(auth, response_cache=cache)
+        monkeypatch.setattr(core, "_rpc_call_with_retries", call)
+        first = asyncio.create_task(core.rpc_call(get, ["nb_1"]))
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        cache.invalidate()
+        second = asyncio.create_task(core.rpc_call(get, ["nb_1"]))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == await second == ["old"]
+        assert core.coalesced_calls == 1
+        # Sent before the invalidation, so the shared result is not stored
+        assert len(cache) == 0
+
+    def test_no_cache_by_default(self, auth):
+        assert NotebookLMClient(auth)._core._response_cache is None
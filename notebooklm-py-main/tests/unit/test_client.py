@@ -2,14 +2,15 @@
 
 import asyncio
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
-from pytest_httpx import HTTPXMock
+from pytest_httpx import HTTPXMock, IteratorStream
 
 from notebooklm._core import ClientCore, is_auth_error
-from notebooklm.auth import AuthTokens
+from notebooklm.auth import AuthTokens, load_cached_tokens, save_cached_tokens
 from notebooklm.client import NotebookLMClient
 from notebooklm.rpc import AuthError, RPCError, RPCMethod
 
@@ -250,6 +251,46 @@ class TestRefreshAuth:
             with pytest.raises(ValueError, match="Failed to extract session ID"):
                 await client.refresh_auth()
 
+    @pytest.mark.asyncio
+    async def test_refresh_auth_rewrites_token_cache(
+        self, mock_auth, tmp_path, httpx_mock: HTTPXMock
+    ):
+        """Test refreshed tokens replace the stale ones in the token cache."""
+        cache = tmp_path / "token_cache.json"
+        save_cached_tokens(mock_auth.cookies, "stale_csrf", "stale_session", cache)
+        mock_auth.token_cache_path = cache
+        httpx_mock.add_response(
+            url="https://notebooklm.google.com/",
+            content=b'"SNlM0e":"new_csrf" "FdrFJe":"new_session"',
+        )
+
+        async with NotebookLMClient(mock_auth) as client:
+            await client.refresh_auth()
+
+        assert load_cached_tokens(mock_auth.cookies, cache) == ("new_csrf", "new_session")
+
+    @pytest.mark.asyncio
+    async def test_refresh_auth_writes_token_cache_off_event_loop(
+        self, mock_auth, tmp_path, httpx_mock: HTTPXMock
+    ):
+        """Test the token cache write runs in a worker thread, not on the event loop."""
+        mock_auth.token_cache_path = tmp_path / "token_cache.json"
+        httpx_mock.add_response(
+            url="https://notebooklm.google.com/",
+            content=b'"SNlM0e":"new_csrf" "FdrFJe":"new_session"',
+        )
+        threads = []
+
+        def record(*args):
+            threads.append(threading.current_thread())
+            save_cached_tokens(*args)
+
+        async with NotebookLMClient(mock_auth) as client:
+            with patch("notebooklm.client.save_cached_tokens", record):
+                await client.refresh_auth()
+
+        assert threads and threads[0] is not threading.main_thread()
+
 
 # =============================================================================
 # AUTH PROPERTY TESTS
@@ -437,6 +478,67 @@ class TestClientCoreRefreshCallback:
         assert core._refresh_lock is None
 
 
+class TestBackgroundTokenRefresh:
+    @pytest.mark.asyncio
+    async def test_refreshes_tokens_on_schedule(self, mock_auth, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url="https://notebooklm.google.com/",
+            content=b'"SNlM0e":"new_csrf" "FdrFJe":"new_session"',
+            is_reusable=True,
+        )
+
+        async with NotebookLMClient(mock_auth, token_refresh_interval=0.05) as client:
+            for _ in range(50):
+                if client.auth.csrf_token == "new_csrf":
+                    break
+                await asyncio.sleep(0.01)
+            assert client.auth.csrf_token == "new_csrf"
+            assert client.auth.session_id == "new_session"
+            refresher = client._core._token_refresher
+            assert refresher is not None and not refresher.done()
+
+        assert refresher.done()
+        assert client._core._token_refresher is None
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_tokens_and_retries(self, mock_auth, caplog):
+        calls = 0
+
+        async def failing_refresh():
+            nonlocal calls
+            calls += 1
+            raise ValueError("homepage unavailable")
+
+        core = ClientCore(mock_auth, refresh_callback=failing_refresh, token_refresh_interval=0.01)
+        await core.open()
+        try:
+            for _ in range(50):
+                if calls >= 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await core.close()
+
+        assert calls >= 2
+        assert core.auth.csrf_token == "test_csrf"
+        assert "Background token refresh failed" in caplog.text
+
+    def test_disabled_by_default(self, mock_auth):
+        assert NotebookLMClient(mock_auth)._core._token_refresh_interval is None
+
+    @pytest.mark.parametrize("interval,callback", [(60.0, False), (0.0, True)])
+    def test_invalid_configuration(self, mock_auth, interval, callback):
+        async def refresh():
+            return mock_auth
+
+        with pytest.raises(ValueError, match="token_refresh_interval"):
+            ClientCore(
+                mock_auth,
+                refresh_callback=refresh if callback else None,
+                token_refresh_interval=interval,
+            )
+
+
 # =============================================================================
 # RPC CALL AUTO-RETRY TESTS
 # =============================================================================
@@ -706,3 +808,41 @@ class TestRpcCallAutoRetry:
         assert refresh_count[0] == 1, (
             f"Refresh should be called exactly once, got {refresh_count[0]}"
         )
+
+
+# =============================================================================
+# STREAMING RESPONSE DECODING TESTS
+# =============================================================================
+
+
+class TestStreamingResponses:
+    @pytest.mark.asyncio
+    async def test_stream_responses_decodes_chunked_body(self, mock_auth, httpx_mock: HTTPXMock):
+        chunk = json.dumps([["wrb.fr", RPCMethod.LIST_NOTEBOOKS.value, json.dumps([["nb"]])]])
+        body = f")]}}'\n{len(chunk) + 2}\n{chunk}\n".encode()
+        httpx_mock.add_response(stream=IteratorStream([body[:10], body[10:25], body[25:]]))
+
+        core = ClientCore(mock_auth, stream_responses=True)
+        await core.open()
+        try:
+            result = await core.rpc_call(RPCMethod.LIST_NOTEBOOKS, [])
+        finally:
+            await core.close()
+
+        assert result == [["nb"]]
+
+    @pytest.mark.asyncio
+    async def test_stream_responses_maps_http_errors(self, mock_auth, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=500)
+
+        core = ClientCore(mock_auth, stream_responses=True)
+        await core.open()
+        try:
+            with pytest.raises(RPCError, match="Server error 500"):
+                await core.rpc_call(RPCMethod.LIST_NOTEBOOKS, [])
+        finally:
+            await core.close()
+
+    def test_client_passes_stream_option(self, mock_auth):
+        client = NotebookLMClient(mock_auth, stream_responses=True)
+        assert client._core._stream_responses is True
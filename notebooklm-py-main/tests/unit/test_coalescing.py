@@ -0,0 +1,158 @@
+"""Tests for single-flight coalescing of identical in-flight read RPCs."""
+
+import asyncio
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notebooklm import NotebookLMClient
+from notebooklm.rpc import RPCMethod, ServerError
+
+GET_NOTEBOOK = RPCMethod.GET_NOTEBOOK
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_reads_share_one_request(
+        self, core, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(text=build_rpc_response(GET_NOTEBOOK, ["nb"]))
+
+        results = await asyncio.gather(
+            *(core.rpc_call(GET_NOTEBOOK, ["nb_1"], "/notebook/nb_1") for _ in range(20))
+        )
+
+        assert results == [["nb"]] * 20
+        assert len(httpx_mock.get_requests()) == 1
+        assert core.coalesced_calls == 19
+        assert core._flights == {}
+
+    @pytest.mark.asyncio
+    async def test_different_params_or_paths_not_shared(
+        self, core, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(text=build_rpc_response(GET_NOTEBOOK, ["nb"]), is_reusable=True)
+
+        await asyncio.gather(
+            core.rpc_call(GET_NOTEBOOK, ["nb_1"], "/notebook/nb_1"),
+            core.rpc_call(GET_NOTEBOOK, ["nb_2"], "/notebook/nb_1"),
+            core.rpc_call(GET_NOTEBOOK, ["nb_1"], "/notebook/nb_2"),
+        )
+
+        assert len(httpx_mock.get_requests()) == 3
+        assert core.coalesced_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_each_hit_network(
+        self, core, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(text=build_rpc_response(GET_NOTEBOOK, ["nb"]), is_reusable=True)
+
+        await core.rpc_call(GET_NOTEBOOK, ["nb_1"])
+        await core.rpc_call(GET_NOTEBOOK, ["nb_1"])
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_methods_not_coalesced(
+        self, core, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        method = RPCMethod.CREATE_NOTEBOOK
+        httpx_mock.add_response(text=build_rpc_response(method, ["new"]), is_reusable=True)
+
+        await asyncio.gather(*(core.rpc_call(method, ["Title"]) for _ in range(3)))
+
+        assert len(httpx_mock.get_requests()) == 3
+
+    @pytest.mark.asyncio
+    async def test_updates_not_coalesced(self, core, build_rpc_response, httpx_mock: HTTPXMock):
+        method = RPCMethod.RENAME_NOTEBOOK
+        httpx_mock.add_response(text=build_rpc_response(method, None), is_reusable=True)
+
+        await asyncio.gather(
+            *(
+                core.rpc_call(method, ["nb_1", title], "/notebook/nb_1", allow_null=True)
+                for title in ("x", "y", "x")
+            )
+        )
+
+        assert len(httpx_mock.get_requests()) == 3
+        assert core.coalesced_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_read_after_mutation_does_not_join_earlier_flight(self, core, monkeypatch):
+        release = asyncio.Event()
+        state = {"sources": 0}
+
+        async def call(method, params, source_path="/", allow_null=False, _is_retry=False):
+            if method == RPCMethod.ADD_SOURCE:
+                state["sources"] += 1
+                return None
+            seen = state["sources"]
+            await release.wait()
+            return seen
+
+        monkeypatch.setattr(core, "_rpc_call_with_retries", call)
+        before = asyncio.create_task(core.rpc_call(GET_NOTEBOOK, ["nb_1"], "/notebook/nb_1"))
+        other = asyncio.create_task(core.rpc_call(GET_NOTEBOOK, ["nb_2"], "/notebook/nb_2"))
+        # Let both flights send their request
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        await core.rpc_call(RPCMethod.ADD_SOURCE, ["nb_1"], "/notebook/nb_1")
+        after = asyncio.create_task(core.rpc_call(GET_NOTEBOOK, ["nb_1"], "/notebook/nb_1"))
+        unrelated = asyncio.create_task(core.rpc_call(GET_NOTEBOOK, ["nb_2"], "/notebook/nb_2"))
+        for _ in range(3):
+            await asyncio.sleep(0)
+        release.set()
+
+        assert await before == 0
+        assert await after == 1
+        # Flights of other notebooks are still shared
+        assert await other == await unrelated == 0
+        assert core.coalesced_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_error_shared_by_all_callers(self, core, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=500)
+
+        results = await asyncio.gather(
+            *(core.rpc_call(GET_NOTEBOOK, ["nb_1"]) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ServerError) for r in results)
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self, core, monkeypatch):
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_call(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return ["nb"]
+
+        monkeypatch.setattr(core, "_rpc_call_with_retries", slow_call)
+        first = asyncio.create_task(core.rpc_call(GET_NOTEBOOK, ["nb_1"]))
+        second = asyncio.create_task(core.rpc_call(GET_NOTEBOOK, ["nb_1"]))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == ["nb"]
+        assert first.cancelled()
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, auth, build_rpc_response, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(text=build_rpc_response(GET_NOTEBOOK, ["nb"]), is_reusable=True)
+        client = NotebookLMClient(auth, coalesce_reads=False)
+
+        async with client:
+            await asyncio.gather(*(client._core.rpc_call(GET_NOTEBOOK, ["nb_1"]) for _ in range(3)))
+
+        assert len(httpx_mock.get_requests()) == 3
@@ -0,0 +1,77 @@
+"""Unit tests for the pluggable JSON codec."""
+
+import importlib.util
+import json
+
+import pytest
+
+from notebooklm.rpc import RPCMethod, codec, encode_rpc_request
+from notebooklm.rpc.decoder import decode_response
+
+AVAILABLE = [b for b in codec.BACKENDS if b == "json" or importlib.util.find_spec(b)]
+
+
+@pytest.fixture(params=AVAILABLE)
+def backend(request):
+    previous = codec.get_backend()
+    codec.set_backend(request.param)
+    yield request.param
+    codec.set_backend(previous)
+
+
+# Shaped like a LIST_ARTIFACTS poll result: many small nested lists
+POLL_RESULT = [
+    [
+        [f"artifact-{i:04d}", f"Artifact title {i} – ünïcode", 4, [[["src-a"]], [["src-b"]]], 3]
+        + [None] * 10
+        + [[1736000000 + i, 123000000]]
+        for i in range(200)
+    ]
+]
+
+
+class TestCodec:
+    def test_dumps_is_compact(self, backend):
+        assert codec.dumps([1, "a", None, {"k": True}]) == '[1,"a",null,{"k":true}]'
+
+    def test_round_trip_matches_stdlib(self, backend):
+        text = codec.dumps(POLL_RESULT)
+        assert json.loads(text) == POLL_RESULT
+        assert codec.loads(text) == json.loads(text)
+
+    def test_invalid_input_raises_stdlib_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads("[1,")
+
+    def test_stdlib_only_inputs_fall_back(self, backend):
+        assert codec.loads("[NaN]")[0] != codec.loads("[NaN]")[0]  # NaN != NaN
+        assert codec.loads(codec.dumps([2**70])) == [2**70]
+
+    def test_request_encoding_round_trips(self, backend):
+        inner = encode_rpc_request(RPCMethod.LIST_NOTEBOOKS, [None, 1, None, [2]])[0][0]
+        assert json.loads(inner[1]) == [None, 1, None, [2]]
+
+    def test_decode_response_uses_backend(self, backend):
+        payload = json.dumps([["wrb.fr", "abc", json.dumps(POLL_RESULT), None, None]])
+        raw = f")]}}'\n{len(payload)}\n{payload}\n"
+        assert decode_response(raw, "abc") == POLL_RESULT
+
+
+class TestBackendSelection:
+    def test_auto_prefers_fast_backend(self):
+        previous = codec.get_backend()
+        try:
+            assert codec.set_backend("auto") == AVAILABLE[0]
+        finally:
+            codec.set_backend(previous)
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            codec.set_backend("simplejson")
+
+    def test_missing_backend_rejected(self):
+        missing = [b for b in codec.BACKENDS if b not in AVAILABLE]
+        if not missing:
+            pytest.skip("all JSON backends installed")
+        with pytest.raises(ValueError, match="not installed"):
+            codec.set_backend(missing[0])
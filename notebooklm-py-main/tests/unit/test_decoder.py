@@ -1,14 +1,20 @@
 """Unit tests for RPC response decoder."""
 
 import json
+from pathlib import Path
 
 import pytest
+import yaml
 
+from notebooklm.rpc import codec, decoder
 from notebooklm.rpc.decoder import (
+    ChunkedResponseStream,
     RateLimitError,
+    ResponseIndex,
     RPCError,
     collect_rpc_ids,
     decode_response,
+    decode_response_stream,
     extract_rpc_result,
     parse_chunked_response,
     strip_anti_xssi,
@@ -422,3 +428,211 @@ class TestAuthError:
         error = AuthError("Token expired", rpc_id="abc123")
         assert str(error) == "Token expired"
         assert error.rpc_id == "abc123"
+
+
+def _frame(payload: list) -> str:
+    """Frame a chunk the way batchexecute does (length counts UTF-16 units + newlines)."""
+    text = json.dumps(payload, ensure_ascii=False)
+    units = len(("\n" + text + "\n").encode("utf-16-le")) // 2
+    return f"{units}\n{text}\n"
+
+
+async def _aiter(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+class TestChunkedResponseStream:
+    def _feed_all(self, data: bytes, size: int) -> list:
+        stream = ChunkedResponseStream()
+        chunks = []
+        for i in range(0, len(data), size):
+            chunks.extend(stream.feed(data[i : i + size]))
+        chunks.extend(stream.close())
+        return chunks
+
+    @pytest.mark.parametrize("size", [1, 3, 64, 100_000])
+    def test_frames_by_length_prefix(self, size):
+        body = ")]}'\n\n" + _frame([["wrb.fr", "a", "[1]"]]) + _frame([["di", 42]])
+        assert self._feed_all(body.encode(), size) == [[["wrb.fr", "a", "[1]"]], [["di", 42]]]
+
+    @pytest.mark.parametrize("size", [1, 5])
+    def test_counts_astral_characters_as_two_units(self, size):
+        body = ")]}'\n" + _frame([["wrb.fr", "a", "📘 emoji ü"]]) + _frame([["e", 4]])
+        chunks = self._feed_all(body.encode(), size)
+        assert chunks == [[["wrb.fr", "a", "📘 emoji ü"]], [["e", 4]]]
+
+    @pytest.mark.parametrize("size", [1, 7, 100_000])
+    def test_many_frames_with_astral_characters(self, size):
+        payloads = [[["wrb.fr", str(i), "📘" * i + "text 🎉 ü" * (i % 3)]] for i in range(20)]
+        body = ")]}'\n" + "".join(_frame(p) for p in payloads)
+        assert self._feed_all(body.encode(), size) == payloads
+
+    @pytest.mark.parametrize("text", ["plain", "a📘b", "📘📘x", "ü📘🎉\n"])
+    def test_utf16_prefix_chars(self, text):
+        for start in range(len(text) + 1):
+            for end in range(start, len(text) + 1):
+                units = len(text[start:end].encode("utf-16-le")) // 2
+                assert decoder._utf16_prefix_chars(text, start, units) == end - start
+        assert decoder._utf16_prefix_chars(text, 0, len(text) * 2 + 1) is None
+
+    def test_consumed_text_released(self):
+        stream = ChunkedResponseStream()
+        frame = _frame([["wrb.fr", "a", "x" * 1000]])
+        for _ in range(10):
+            stream.feed(frame.encode())
+        assert stream._buffered == 0
+        # Each feed drops the frames already parsed instead of growing the buffer
+        assert len(stream._buffer) <= len(frame)
+
+    def test_falls_back_to_line_framing(self):
+        """Counts that don't match the frame (e.g. payload-only lengths) still parse."""
+        chunk = json.dumps([["wrb.fr", "a", "[1]"]])
+        body = f")]}}'\n{len(chunk)}\n{chunk}\n"
+        assert self._feed_all(body.encode(), 4) == [[["wrb.fr", "a", "[1]"]]]
+
+    def test_matches_parse_chunked_response(self):
+        body = ")]}'\n" + _frame([["wrb.fr", "x", "[]"]]) + '[["bare", 1]]\n'
+        expected = parse_chunked_response(strip_anti_xssi(body))
+        assert self._feed_all(body.encode(), 2) == expected
+
+    def test_preview_is_bounded(self):
+        stream = ChunkedResponseStream()
+        stream.feed((")]}'\n" + _frame([["wrb.fr", "a", "x" * 5000]])).encode())
+        assert len(stream.preview) == 500
+
+
+class TestDecodeResponseStream:
+    @pytest.mark.asyncio
+    async def test_returns_result(self):
+        body = ")]}'\n" + _frame([["wrb.fr", "abc", json.dumps({"k": 1})]])
+        result = await decode_response_stream(_aiter(body.encode(), 7), "abc")
+        assert result == {"k": 1}
+
+    @pytest.mark.asyncio
+    async def test_returns_before_reading_rest_of_body(self):
+        consumed = []
+
+        async def body():
+            for part in (
+                b")]}'\n",
+                _frame([["wrb.fr", "abc", "[1]"]]).encode(),
+                _frame([["di", 1]]).encode(),
+            ):
+                consumed.append(part)
+                yield part
+
+        assert await decode_response_stream(body(), "abc") == [1]
+        assert len(consumed) == 2
+
+    @pytest.mark.asyncio
+    async def test_raises_on_error_entry(self):
+        body = ")]}'\n" + _frame([["er", "abc", 404]])
+        with pytest.raises(RPCError) as exc_info:
+            await decode_response_stream(_aiter(body.encode(), 3), "abc")
+        assert exc_info.value.code == 404
+        assert exc_info.value.found_ids == ["abc"]
+
+    @pytest.mark.asyncio
+    async def test_missing_id_includes_found_ids(self):
+        body = ")]}'\n" + _frame([["wrb.fr", "other", "[]"]])
+        with pytest.raises(RPCError, match="may have changed") as exc_info:
+            await decode_response_stream(_aiter(body.encode(), 100), "abc")
+        assert exc_info.value.found_ids == ["other"]
+
+    @pytest.mark.asyncio
+    async def test_allow_null(self):
+        body = ")]}'\n" + _frame([["wrb.fr", "abc", None]])
+        assert await decode_response_stream(_aiter(body.encode(), 100), "abc", True) is None
+        with pytest.raises(RPCError, match="No result found"):
+            await decode_response_stream(_aiter(body.encode(), 100), "abc")
+
+
+CASSETTES_DIR = Path(__file__).parent.parent / "cassettes"
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _cassette_responses() -> list:
+    """Collect (rpc_id, body) pairs for every batchexecute call in the cassettes."""
+    responses = []
+    for path in sorted(CASSETTES_DIR.glob("*.yaml")):
+        for interaction in yaml.load(path.read_text(), Loader=_YAML_LOADER)["interactions"]:
+            uri = interaction["request"]["uri"]
+            if "batchexecute" not in uri or "rpcids=" not in uri:
+                continue
+            rpc_id = uri.split("rpcids=")[1].split("&")[0]
+            responses.append(
+                pytest.param(rpc_id, interaction["response"]["body"]["string"], id=path.stem)
+            )
+    return responses
+
+
+class TestResponseIndex:
+    def test_decodes_only_requested_entry(self, monkeypatch):
+        body = ")]}'\n" + _frame([["wrb.fr", "abc", "[1]"], ["wrb.fr", "other", "[2]"]])
+        calls = []
+        real_loads = codec.loads
+
+        def counting_loads(s):
+            calls.append(s)
+            return real_loads(s)
+
+        monkeypatch.setattr(codec, "loads", counting_loads)
+        assert ResponseIndex(body).result("abc") == [1]
+        assert "[2]" not in calls
+        assert len(calls) == 2  # outer chunk + requested inner payload
+
+    def test_diagnostics_skipped_on_success(self, monkeypatch):
+        def fail(_chunks):
+            raise AssertionError("collect_rpc_ids should not run on success")
+
+        monkeypatch.setattr(decoder, "collect_rpc_ids", fail)
+        body = ")]}'\n" + _frame([["wrb.fr", "abc", "[1]"]])
+        assert decode_response(body, "abc") == [1]
+
+    def test_first_entry_wins(self):
+        body = ")]}'\n" + _frame([["wrb.fr", "abc", "[1]"]]) + _frame([["wrb.fr", "abc", "[2]"]])
+        index = ResponseIndex(body)
+        assert index.result("abc") == [1]
+        assert "abc" in index
+        assert index.chunk_count == 2
+
+    def test_unrequested_chunks_stay_raw(self):
+        body = ")]}'\n" + _frame([["wrb.fr", "abc", "[1]"]]) + '9\n[["wrb.fr","other",\n'
+        assert ResponseIndex(body).result("abc") == [1]
+
+    def test_earlier_non_leading_entry_wins(self):
+        body = (
+            ")]}'\n"
+            + _frame([["wrb.fr", "other", "[]"], ["wrb.fr", "abc", "[1]"]])
+            + _frame([["wrb.fr", "abc", "[2]"]])
+        )
+        assert ResponseIndex(body).result("abc") == [1]
+
+    def test_error_entry_gets_context(self):
+        body = ")]}'\n" + _frame([["er", "abc", 404], ["wrb.fr", "other", "[]"]])
+        with pytest.raises(RPCError) as exc_info:
+            ResponseIndex(body).result("abc")
+        assert exc_info.value.code == 404
+        assert exc_info.value.found_ids == ["abc", "other"]
+        assert exc_info.value.raw_response_preview
+
+    def test_too_many_malformed_chunks_raises(self):
+        with pytest.raises(RPCError, match="chunks malformed"):
+            ResponseIndex(")]}'\nnot json\nalso not json\n")
+
+    @pytest.mark.parametrize("rpc_id,body", _cassette_responses())
+    def test_matches_legacy_pipeline_on_cassettes(self, rpc_id, body):
+        cleaned = strip_anti_xssi(body)
+        chunks = parse_chunked_response(cleaned)
+        index = ResponseIndex(body)
+
+        assert index.chunk_count == len(chunks)
+        assert index.found_ids == collect_rpc_ids(chunks)
+        try:
+            expected = extract_rpc_result(chunks, rpc_id)
+        except RPCError as e:
+            with pytest.raises(type(e)):
+                index.result(rpc_id, allow_null=True)
+        else:
+            assert index.result(rpc_id, allow_null=True) == expected
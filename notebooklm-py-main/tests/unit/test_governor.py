@@ -0,0 +1,223 @@
+"""Tests for the client-side RateGovernor."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notebooklm import NotebookLMClient, RateGovernor, RateLimit
+from notebooklm._core import ClientCore
+from notebooklm._governor import TokenBucket
+from notebooklm.rpc import RPCMethod
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock("notebooklm._governor")
+
+
+class TestRateLimit:
+    @pytest.mark.parametrize("rate,burst", [(0, 1), (-1, 1), (1, 0)])
+    def test_invalid_limits_rejected(self, rate, burst):
+        with pytest.raises(ValueError):
+            RateLimit(rate=rate, burst=burst)
+
+    def test_invalid_in_flight_rejected(self):
+        with pytest.raises(ValueError, match="max_in_flight"):
+            RateGovernor(max_in_flight=0)
+
+
+class TestTokenBucket:
+    def test_burst_then_queued_reservations(self, clock):
+        bucket = TokenBucket(RateLimit(rate=2, burst=2))
+        assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    def test_refills_over_time_up_to_burst(self, clock):
+        bucket = TokenBucket(RateLimit(rate=1, burst=2))
+        bucket.reserve()
+        bucket.reserve()
+        clock.now = 10.0
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+    def test_refund_returns_token(self, clock):
+        bucket = TokenBucket(RateLimit(rate=1, burst=1))
+        bucket.reserve()
+        assert bucket.reserve() == 1.0
+        bucket.refund()
+        assert bucket.reserve() == 1.0
+
+
+class TestRateGovernor:
+    @pytest.mark.asyncio
+    async def test_method_limit_paces_only_that_method(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("notebooklm._governor.asyncio.sleep", fake_sleep)
+        governor = RateGovernor(
+            method_limits={RPCMethod.LIST_ARTIFACTS: RateLimit(rate=10, burst=1)}
+        )
+        for _ in range(3):
+            async with governor.acquire(RPCMethod.LIST_NOTEBOOKS):
+                pass
+        assert sleeps == []
+
+        for _ in range(2):
+            async with governor.acquire(RPCMethod.LIST_ARTIFACTS):
+                pass
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(0.1, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_global_limit_applies_across_keys(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("notebooklm._governor.asyncio.sleep", fake_sleep)
+        governor = RateGovernor(global_limit=RateLimit(rate=10, burst=1))
+        async with governor.acquire(RateGovernor.CHAT):
+            pass
+        async with governor.acquire(RateGovernor.DOWNLOAD):
+            pass
+        assert len(sleeps) == 1
+        assert governor.stats["throttled"] == 0  # fake sleep takes no time
+
+    @pytest.mark.asyncio
+    async def test_max_in_flight_caps_concurrency(self):
+        governor = RateGovernor(max_in_flight=2)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with governor.acquire(RPCMethod.GET_NOTEBOOK):
+                peak = max(peak, governor.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        assert peak == 2
+        assert governor.in_flight == 0
+        assert governor.stats["requests"] == 6
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_arrival_order(self):
+        governor = RateGovernor(global_limit=RateLimit(rate=100, burst=1))
+        order = []
+
+        async def request(i):
+            async with governor.acquire(RPCMethod.GET_NOTEBOOK):
+                order.append(i)
+
+        await asyncio.gather(*(request(i) for i in range(5)))
+        assert order == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_refunds_token(self):
+        governor = RateGovernor(global_limit=RateLimit(rate=1, burst=1))
+        async with governor.acquire("x"):
+            pass
+
+        async def waiting():
+            async with governor.acquire("x"):
+                pass
+
+        task = asyncio.create_task(waiting())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The refunded token means the next caller waits about 1s, not 2s
+        assert governor._global.reserve() <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_slot_waiter_refunds_token(self):
+        governor = RateGovernor(global_limit=RateLimit(rate=0.01, burst=2), max_in_flight=1)
+        release = asyncio.Event()
+
+        async def holder():
+            async with governor.acquire("x"):
+                await release.wait()
+
+        async def waiting():
+            async with governor.acquire("x"):
+                pass
+
+        held = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        task = asyncio.create_task(waiting())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+        await held
+
+        # The token the cancelled waiter reserved is back in the bucket
+        assert governor._global.reserve() == 0.0
+
+
+class TestClientCoreIntegration:
+    @pytest.mark.asyncio
+    async def test_rpc_call_goes_through_governor(
+        self, auth, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(text=build_rpc_response(RPCMethod.LIST_NOTEBOOKS, [1]))
+        governor = RateGovernor()
+        core = ClientCore(auth, rate_governor=governor)
+        await core.open()
+        try:
+            assert await core.rpc_call(RPCMethod.LIST_NOTEBOOKS, []) == [1]
+        finally:
+            await core.close()
+        assert governor.stats["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_burst_of_calls_is_paced(self, auth, build_rpc_response, httpx_mock: HTTPXMock):
+        for _ in range(3):
+            httpx_mock.add_response(text=build_rpc_response(RPCMethod.LIST_NOTEBOOKS, []))
+        governor = RateGovernor(
+            method_limits={RPCMethod.LIST_NOTEBOOKS: RateLimit(rate=50, burst=1)}
+        )
+        core = ClientCore(auth, rate_governor=governor, coalesce_reads=False)
+        await core.open()
+        try:
+            start = time.monotonic()
+            await asyncio.gather(*(core.rpc_call(RPCMethod.LIST_NOTEBOOKS, []) for _ in range(3)))
+            elapsed = time.monotonic() - start
+        finally:
+            await core.close()
+        assert elapsed >= 0.035
+        assert governor.stats["throttled"] == 2
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_read_while_holding_slot(
+        self, auth, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        governor = RateGovernor(max_in_flight=1)
+        in_flight_while_reading = []
+
+        class Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                in_flight_while_reading.append(governor.in_flight)
+                yield build_rpc_response(RPCMethod.LIST_NOTEBOOKS, [1]).encode()
+
+        httpx_mock.add_response(stream=Body())
+        core = ClientCore(auth, rate_governor=governor, stream_responses=True)
+        await core.open()
+        try:
+            assert await core.rpc_call(RPCMethod.LIST_NOTEBOOKS, []) == [1]
+        finally:
+            await core.close()
+
+        assert in_flight_while_reading == [1]
+        assert governor.in_flight == 0
+
+    def test_client_passes_governor_to_core(self, auth):
+        governor = RateGovernor()
+        client = NotebookLMClient(auth, rate_governor=governor)
+        assert client._core._rate_governor is governor
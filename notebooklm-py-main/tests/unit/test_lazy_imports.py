@@ -0,0 +1,51 @@
+"""Tests for lazy attribute loading in the notebooklm package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import notebooklm
+
+
+def _loaded_modules(code: str) -> set[str]:
+    # Fresh interpreter: modules imported by other tests would hide eager imports
+    result = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyPackage:
+    def test_import_loads_no_submodules(self):
+        loaded = _loaded_modules("import notebooklm")
+        assert "httpx" not in loaded
+        assert not {m for m in loaded if m.startswith("notebooklm.")} - {"notebooklm._logging"}
+
+    @pytest.mark.parametrize("name", ["RPCError", "RateLimitError", "Notebook", "AudioFormat"])
+    def test_types_and_errors_skip_client(self, name):
+        loaded = _loaded_modules(f"from notebooklm import {name}")
+        assert "notebooklm.client" not in loaded
+        assert "httpx" not in loaded
+
+    @pytest.mark.parametrize("name", notebooklm.__all__)
+    def test_every_public_name_resolves(self, name):
+        assert getattr(notebooklm, name) is not None
+        assert name in dir(notebooklm)
+
+    def test_resolves_to_defining_module(self):
+        from notebooklm.client import NotebookLMClient
+        from notebooklm.rpc import RPCError
+
+        assert notebooklm.NotebookLMClient is NotebookLMClient
+        assert notebooklm.RPCError is RPCError
+
+    def test_submodules_still_reachable_as_attributes(self):
+        assert notebooklm.types.Notebook is notebooklm.Notebook
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            notebooklm.Missing  # noqa: B018
@@ -0,0 +1,160 @@
+"""Tests for request metrics hooks and the MetricsAggregator."""
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notebooklm import (
+    MetricsAggregator,
+    MetricsHook,
+    NotebookLMClient,
+    RequestMetrics,
+    RetryPolicy,
+)
+from notebooklm._core import ClientCore
+from notebooklm._metrics import Instrumentation
+from notebooklm.rpc import RPCMethod, ServerError
+
+
+class RecordingHook(MetricsHook):
+    def __init__(self):
+        self.events: list[tuple[str, RequestMetrics]] = []
+
+    def on_request(self, metrics):
+        self.events.append(("request", metrics))
+
+    def on_response(self, metrics):
+        self.events.append(("response", metrics))
+
+    def on_error(self, metrics):
+        self.events.append(("error", metrics))
+
+
+class TestMetricsAggregator:
+    def test_percentiles_and_error_rate(self):
+        aggregator = MetricsAggregator()
+        for i in range(1, 101):
+            metrics = RequestMetrics("GET_NOTEBOOK", latency=i / 100, response_bytes=10)
+            if i % 10 == 0:
+                aggregator.on_error(metrics)
+            else:
+                aggregator.on_response(metrics)
+
+        stats = aggregator.summary()["GET_NOTEBOOK"]
+        assert stats["count"] == 100
+        assert stats["error_rate"] == pytest.approx(0.1)
+        assert stats["p50"] == pytest.approx(0.5)
+        assert stats["p95"] == pytest.approx(0.95)
+        assert stats["p99"] == pytest.approx(0.99)
+        assert stats["response_bytes"] == 1000
+
+    def test_summary_sorted_by_total_time(self):
+        aggregator = MetricsAggregator()
+        aggregator.on_response(RequestMetrics("fast", latency=0.1))
+        aggregator.on_response(RequestMetrics("slow", latency=2.0))
+        assert list(aggregator.summary()) == ["slow", "fast"]
+        aggregator.reset()
+        assert aggregator.summary() == {}
+
+    def test_window_bounds_latency_samples(self):
+        aggregator = MetricsAggregator(window=2)
+        for latency in (5.0, 1.0, 1.0):
+            aggregator.on_response(RequestMetrics("m", latency=latency))
+        stats = aggregator.summary()["m"]
+        assert stats["count"] == 3
+        assert stats["p99"] == 1.0
+
+
+class TestInstrumentation:
+    def test_hook_exceptions_are_swallowed(self):
+        class BrokenHook(MetricsHook):
+            def on_request(self, metrics):
+                raise RuntimeError("boom")
+
+        instrumentation = Instrumentation(BrokenHook())
+        metrics = instrumentation.start("chat")
+        instrumentation.finish(metrics)
+        assert metrics.latency >= 0
+
+    def test_status_taken_from_http_error(self):
+        hook = RecordingHook()
+        instrumentation = Instrumentation(hook)
+        response = httpx.Response(503, request=httpx.Request("GET", "https://x"))
+        error = httpx.HTTPStatusError("fail", request=response.request, response=response)
+
+        instrumentation.finish(instrumentation.start("download"), error=error)
+
+        kind, metrics = hook.events[-1]
+        assert kind == "error"
+        assert metrics.status_code == 503
+        assert metrics.error is error
+
+
+class TestClientCoreMetrics:
+    @pytest.mark.asyncio
+    async def test_rpc_call_reported(self, auth, build_rpc_response, httpx_mock: HTTPXMock):
+        text = build_rpc_response(RPCMethod.GET_NOTEBOOK, ["nb"])
+        httpx_mock.add_response(text=text)
+        hook = RecordingHook()
+        core = ClientCore(auth, metrics=hook)
+        await core.open()
+        try:
+            await core.rpc_call(RPCMethod.GET_NOTEBOOK, ["nb_1"], "/notebook/nb_1")
+        finally:
+            await core.close()
+
+        assert [kind for kind, _ in hook.events] == ["request", "response"]
+        metrics = hook.events[-1][1]
+        assert metrics.method == "GET_NOTEBOOK"
+        assert metrics.source_path == "/notebook/nb_1"
+        assert metrics.status_code == 200
+        assert metrics.request_bytes > 0
+        assert metrics.response_bytes == len(text)
+        assert metrics.retries == 0
+
+    @pytest.mark.asyncio
+    async def test_retried_errors_reported_per_attempt(self, auth, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=500, is_reusable=True)
+        hook = RecordingHook()
+        core = ClientCore(
+            auth,
+            metrics=hook,
+            retry_policy=RetryPolicy(max_attempts={ServerError: 3}, base_delay=0),
+        )
+        await core.open()
+        try:
+            with pytest.raises(ServerError):
+                await core.rpc_call(RPCMethod.GET_NOTEBOOK, ["nb_1"])
+        finally:
+            await core.close()
+
+        errors = [m for kind, m in hook.events if kind == "error"]
+        assert [m.retries for m in errors] == [0, 1, 2]
+        assert all(m.status_code == 500 for m in errors)
+
+    @pytest.mark.asyncio
+    async def test_measure_reports_sub_api_requests(self, auth, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(content=b"abc")
+        hook = RecordingHook()
+        core = ClientCore(auth, metrics=hook)
+
+        async with httpx.AsyncClient() as client, core.measure("download") as metrics:
+            metrics.record(await client.get("https://example.com/file"))
+        with pytest.raises(ValueError):
+            async with core.measure("download"):
+                raise ValueError("bad")
+
+        assert [kind for kind, _ in hook.events] == ["request", "response", "request", "error"]
+        assert hook.events[1][1].response_bytes == 3
+
+    @pytest.mark.asyncio
+    async def test_measure_without_hook(self, auth):
+        core = ClientCore(auth)
+        async with core.measure("chat") as metrics:
+            assert isinstance(metrics, RequestMetrics)
+        assert core.metrics_start("chat") is None
+
+    def test_client_passes_hook_to_core(self, auth):
+        aggregator = MetricsAggregator()
+        client = NotebookLMClient(auth, metrics=aggregator)
+        assert client._core._instrumentation.hooks == (aggregator,)
@@ -0,0 +1,151 @@
+"""Tests for the multi-account NotebookLMClientPool."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from notebooklm import AuthError, Notebook, NotebookLMClient, NotebookLMClientPool, RateLimitError
+from notebooklm.auth import AuthTokens
+
+
+def _client(name: str) -> NotebookLMClient:
+    return NotebookLMClient(
+        AuthTokens(cookies={"SID": name}, csrf_token=f"csrf_{name}", session_id=name)
+    )
+
+
+@pytest.fixture
+def clients():
+    return [_client("a"), _client("b"), _client("c")]
+
+
+async def _name(client: NotebookLMClient) -> str:
+    return client.auth.session_id
+
+
+class TestScheduling:
+    @pytest.mark.asyncio
+    async def test_round_robin(self, clients):
+        async with NotebookLMClientPool(clients, strategy="round_robin") as pool:
+            used = [await pool.run(_name) for _ in range(6)]
+        assert used == ["a", "b", "c", "a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_least_loaded_spreads_concurrent_calls(self, clients):
+        release = asyncio.Event()
+
+        async def slow(client):
+            await release.wait()
+            return client.auth.session_id
+
+        async with NotebookLMClientPool(clients) as pool:
+            tasks = [asyncio.create_task(pool.run(slow)) for _ in range(3)]
+            await asyncio.sleep(0)
+            assert [h.in_flight for h in pool.health()] == [1, 1, 1]
+            release.set()
+            assert sorted(await asyncio.gather(*tasks)) == ["a", "b", "c"]
+
+        assert [h.requests for h in pool.health()] == [1, 1, 1]
+
+    def test_invalid_arguments(self, clients):
+        with pytest.raises(ValueError, match="at least one"):
+            NotebookLMClientPool([])
+        with pytest.raises(ValueError, match="strategy"):
+            NotebookLMClientPool(clients, strategy="random")  # type: ignore[arg-type]
+
+
+class TestHealth:
+    @pytest.mark.asyncio
+    async def test_rate_limited_account_cools_down(self, clients):
+        async def throttled(client):
+            raise RateLimitError("slow down", retry_after=120)
+
+        async with NotebookLMClientPool(clients, strategy="round_robin") as pool:
+            with pytest.raises(RateLimitError):
+                await pool.run(throttled)
+            used = [await pool.run(_name) for _ in range(4)]
+
+        assert "a" not in used
+        health = pool.health()[0]
+        assert health.rate_limits == 1
+        assert health.cooling_down
+        assert health.cooldown_until - time.monotonic() > 100
+
+    @pytest.mark.asyncio
+    async def test_cooldown_doubles_and_resets(self, clients):
+        async def expired(client):
+            raise AuthError("expired")
+
+        pool = NotebookLMClientPool(clients[:1], cooldown=10)
+        with patch("notebooklm._pool.asyncio.sleep"):
+            for expected in (10, 20, 40):
+                with pytest.raises(AuthError):
+                    await pool.run(expired)
+                remaining = pool.health()[0].cooldown_until - time.monotonic()
+                assert expected - 1 < remaining <= expected
+
+            await pool.run(_name)
+
+        health = pool.health()[0]
+        assert (health.auth_failures, health.consecutive_failures) == (3, 0)
+
+    @pytest.mark.asyncio
+    async def test_waits_when_all_accounts_cool_down(self, clients):
+        pool = NotebookLMClientPool(clients[:1], cooldown=0.05)
+
+        async def throttled(client):
+            raise RateLimitError("slow down")
+
+        with pytest.raises(RateLimitError):
+            await pool.run(throttled)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await pool.run(_name) == "a"
+        assert loop.time() - start >= 0.04
+
+
+class TestAffinity:
+    @pytest.mark.asyncio
+    async def test_created_notebook_bound_to_its_account(self, clients):
+        async def create(client):
+            return Notebook(id=f"nb_{client.auth.session_id}", title="x")
+
+        async with NotebookLMClientPool(clients, strategy="round_robin") as pool:
+            await pool.run(_name)  # advance the rotation past "a"
+            notebook = await pool.run(create)
+            used = [await pool.run(_name, notebook_id=notebook.id) for _ in range(3)]
+
+        assert notebook.id == "nb_b"
+        assert used == ["b", "b", "b"]
+        assert pool.client_for("nb_b") is clients[1]
+        assert pool.client_for("unknown") is None
+
+    def test_bind_rejects_foreign_client(self, clients):
+        pool = NotebookLMClientPool(clients[:2])
+        pool.bind("nb", clients[1])
+        assert pool.client_for("nb") is clients[1]
+        with pytest.raises(ValueError, match="not part"):
+            pool.bind("nb", clients[2])
+
+
+class TestLifecycle:
+    @pytest.mark.asyncio
+    async def test_opens_and_closes_all_clients(self, clients):
+        async with NotebookLMClientPool(clients) as pool:
+            assert all(c.is_connected for c in pool.clients)
+        assert not any(c.is_connected for c in clients)
+
+    @pytest.mark.asyncio
+    async def test_from_storage_names_accounts(self, tmp_path):
+        paths = [tmp_path / "work.json", tmp_path / "personal.json"]
+
+        async def fake_from_storage(path):
+            return AuthTokens(cookies={"SID": path.stem}, csrf_token="c", session_id=path.stem)
+
+        with patch("notebooklm._pool.AuthTokens.from_storage", side_effect=fake_from_storage):
+            pool = await NotebookLMClientPool.from_storage(paths, timeout=5)
+
+        assert [h.name for h in pool.health()] == ["work", "personal"]
+        assert [c.auth.session_id for c in pool.clients] == ["work", "personal"]
@@ -0,0 +1,156 @@
+"""Tests for the FlightRecorder ring buffer."""
+
+import io
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notebooklm import FlightRecorder, NotebookLMClient, RequestMetrics
+from notebooklm._core import ClientCore
+from notebooklm._metrics import Instrumentation
+from notebooklm.rpc import RPCMethod, ServerError
+
+
+class TestFlightRecorder:
+    def test_ring_buffer_keeps_newest(self):
+        recorder = FlightRecorder(capacity=3)
+        instrumentation = Instrumentation(recorder)
+        for i in range(5):
+            instrumentation.finish(instrumentation.start(f"M{i}"))
+        assert [r.method for r in recorder.records()] == ["M2", "M3", "M4"]
+
+    def test_bodies_truncated_and_csrf_redacted(self):
+        recorder = FlightRecorder(body_limit=40)
+        instrumentation = Instrumentation(recorder)
+        body = "f.req=" + "x" * 100 + "&at=secret_token&"
+        instrumentation.finish(instrumentation.start("chat", request_body=body))
+
+        request_body = recorder.records()[0].request_body
+        assert request_body.startswith("f.req=xxx")
+        assert "more bytes" in request_body
+        assert "secret_token" not in request_body
+
+    def test_body_limit_counts_utf8_bytes(self):
+        recorder = FlightRecorder(body_limit=5)
+        instrumentation = Instrumentation(recorder)
+        instrumentation.finish(instrumentation.start("chat", request_body="ééé"))
+
+        # Six bytes: the third character is cut, never split into U+FFFD
+        assert recorder.records()[0].request_body == "éé...[2 more bytes]"
+
+    def test_error_outcome(self):
+        recorder = FlightRecorder()
+        instrumentation = Instrumentation(recorder)
+        instrumentation.finish(instrumentation.start("upload"), error=ValueError("boom"))
+        record = recorder.records()[0]
+        assert record.outcome == "error"
+        assert record.error == "ValueError: boom"
+
+    @pytest.mark.asyncio
+    async def test_trace_events_split_into_phases(self):
+        metrics = Instrumentation(FlightRecorder()).start("GET_NOTEBOOK")
+        for event in (
+            "connection.connect_tcp.started",
+            "connection.connect_tcp.complete",
+            "connection.start_tls.started",
+            "connection.start_tls.complete",
+            "http11.send_request_headers.started",
+            "http11.receive_response_headers.complete",
+            "http11.receive_response_body.started",
+            "http11.receive_response_body.complete",
+        ):
+            await metrics.extensions["trace"](event, {})
+        metrics._finish(None)
+
+        for phase in (metrics.connect, metrics.ttfb, metrics.download):
+            assert phase is not None and phase >= 0
+
+    def test_unreported_requests_not_traced(self):
+        assert RequestMetrics("chat").extensions == {}
+
+    def test_dump_writes_jsonl(self, tmp_path):
+        recorder = FlightRecorder()
+        instrumentation = Instrumentation(recorder)
+        instrumentation.finish(instrumentation.start("A"))
+        instrumentation.finish(instrumentation.start("B"))
+
+        buffer = io.StringIO()
+        assert recorder.dump(buffer) == 2
+        lines = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        assert [line["method"] for line in lines] == ["A", "B"]
+        assert {"connect", "ttfb", "download", "decode", "outcome"} <= set(lines[0])
+
+        recorder.dump(tmp_path / "out.jsonl")
+        assert len((tmp_path / "out.jsonl").read_text().splitlines()) == 2
+
+    def test_spool_appends_and_stays_bounded(self, tmp_path):
+        path = tmp_path / "flight.jsonl"
+        recorder = FlightRecorder(capacity=3)
+        instrumentation = Instrumentation(recorder)
+        for batch in (["A", "B"], ["C", "D"]):
+            for method in batch:
+                instrumentation.finish(instrumentation.start(method))
+            recorder.spool(path)
+
+        assert len(recorder) == 0
+        methods = [json.loads(line)["method"] for line in path.read_text().splitlines()]
+        assert methods == ["B", "C", "D"]
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert list(tmp_path.iterdir()) == [path]
+
+    @pytest.mark.parametrize(
+        "value,capacity", [("", None), ("0", None), ("1", 256), ("50", 50), ("junk", None)]
+    )
+    def test_from_env(self, monkeypatch, value, capacity):
+        monkeypatch.setenv("NOTEBOOKLM_FLIGHT_RECORDER", value)
+        recorder = FlightRecorder.from_env()
+        assert (recorder.capacity if recorder is not None else None) == capacity
+
+
+class TestClientCoreRecording:
+    @pytest.mark.asyncio
+    async def test_rpc_calls_recorded(self, auth, build_rpc_response, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(text=build_rpc_response(RPCMethod.GET_NOTEBOOK, ["nb"]))
+        httpx_mock.add_response(status_code=500)
+        recorder = FlightRecorder()
+        core = ClientCore(auth, flight_recorder=recorder)
+        await core.open()
+        try:
+            await core.rpc_call(RPCMethod.GET_NOTEBOOK, ["nb_1"], "/notebook/nb_1")
+            with pytest.raises(ServerError):
+                await core.rpc_call(RPCMethod.RENAME_NOTEBOOK, ["nb_1", "x"])
+        finally:
+            await core.close()
+
+        ok, failed = recorder.records()
+        assert (ok.method, ok.outcome, ok.status_code) == ("GET_NOTEBOOK", "ok", 200)
+        assert "at=REDACTED" in ok.request_body
+        assert "wrb.fr" in ok.response_body
+        assert ok.decode is not None
+        assert (failed.method, failed.outcome, failed.status_code) == (
+            "RENAME_NOTEBOOK",
+            "error",
+            500,
+        )
+
+    @pytest.mark.asyncio
+    async def test_env_recorder_spooled_on_close(
+        self, auth, build_rpc_response, httpx_mock, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("NOTEBOOKLM_FLIGHT_RECORDER", "1")
+        monkeypatch.setenv("NOTEBOOKLM_HOME", str(tmp_path))
+        httpx_mock.add_response(text=build_rpc_response(RPCMethod.LIST_NOTEBOOKS, []))
+
+        async with NotebookLMClient(auth) as client:
+            assert client.flight_recorder is not None
+            await client._core.rpc_call(RPCMethod.LIST_NOTEBOOKS, [None, 1])
+
+        lines = (tmp_path / "flight_recorder.jsonl").read_text().splitlines()
+        assert json.loads(lines[0])["method"] == "LIST_NOTEBOOKS"
+
+    def test_disabled_by_default(self, auth, monkeypatch):
+        monkeypatch.delenv("NOTEBOOKLM_FLIGHT_RECORDER", raising=False)
+        client = NotebookLMClient(auth)
+        assert client.flight_recorder is None
+        assert client._core._instrumentation is None
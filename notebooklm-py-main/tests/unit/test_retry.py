@@ -0,0 +1,150 @@
+"""Tests for RetryPolicy and transient-failure retries in ClientCore."""
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notebooklm import NotebookLMClient, RetryPolicy
+from notebooklm._cache import READ_ONLY_METHODS
+from notebooklm._core import ClientCore
+from notebooklm._retry import IDEMPOTENT_METHODS
+from notebooklm.rpc import (
+    ClientError,
+    NetworkError,
+    RateLimitError,
+    RPCMethod,
+    RPCTimeoutError,
+    ServerError,
+)
+
+
+class TestRetryPolicy:
+    def test_attempts_resolved_by_closest_error_class(self):
+        policy = RetryPolicy(max_attempts={NetworkError: 2, RPCTimeoutError: 6})
+        assert policy.attempts_for(RPCTimeoutError("t")) == 6
+        assert policy.attempts_for(NetworkError("n")) == 2
+        assert policy.attempts_for(ServerError("s")) == 1
+
+    def test_full_jitter_bounded_by_exponential_cap(self, monkeypatch):
+        bounds = []
+        monkeypatch.setattr("notebooklm._retry.random.uniform", lambda a, b: bounds.append(b) or b)
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        for attempt in range(1, 5):
+            policy.backoff(attempt, ServerError("s"))
+        assert bounds == [1.0, 2.0, 4.0, 5.0]
+
+    def test_retry_after_is_lower_bound(self, monkeypatch):
+        monkeypatch.setattr("notebooklm._retry.random.uniform", lambda a, b: 0.0)
+        policy = RetryPolicy()
+        assert policy.backoff(1, RateLimitError("r", retry_after=7)) == 7.0
+
+    def test_budget_stops_retries(self, monkeypatch):
+        monkeypatch.setattr("notebooklm._retry.random.uniform", lambda a, b: b)
+        policy = RetryPolicy(base_delay=4.0, max_elapsed=10.0)
+        error = ServerError("s")
+        assert policy.next_delay(RPCMethod.LIST_NOTEBOOKS, error, 1, elapsed=5.0) == 4.0
+        assert policy.next_delay(RPCMethod.LIST_NOTEBOOKS, error, 1, elapsed=7.0) is None
+
+    def test_rate_limit_beyond_budget_not_retried(self):
+        policy = RetryPolicy(max_elapsed=30.0)
+        error = RateLimitError("r", retry_after=60)
+        assert policy.next_delay(RPCMethod.LIST_NOTEBOOKS, error, 1, elapsed=0.0) is None
+
+    def test_every_read_only_method_is_idempotent(self):
+        assert READ_ONLY_METHODS <= IDEMPOTENT_METHODS
+        assert RetryPolicy().is_retry_safe(RPCMethod.GET_USER_SETTINGS, ServerError("s"))
+
+    def test_non_idempotent_only_retried_when_request_never_reached_server(self):
+        policy = RetryPolicy()
+        assert RPCMethod.CREATE_ARTIFACT not in IDEMPOTENT_METHODS
+        assert not policy.is_retry_safe(RPCMethod.CREATE_ARTIFACT, ServerError("s"))
+        assert not policy.is_retry_safe(RPCMethod.CREATE_ARTIFACT, RPCTimeoutError("t"))
+        assert policy.is_retry_safe(RPCMethod.CREATE_ARTIFACT, RateLimitError("r"))
+        connect_failed = NetworkError("n", original_error=httpx.ConnectError("refused"))
+        assert policy.is_retry_safe(RPCMethod.CREATE_ARTIFACT, connect_failed)
+        assert policy.is_retry_safe(RPCMethod.LIST_ARTIFACTS, ServerError("s"))
+
+    def test_unlisted_errors_not_retried(self):
+        policy = RetryPolicy()
+        assert policy.next_delay(RPCMethod.LIST_NOTEBOOKS, ClientError("c"), 1, 0.0) is None
+
+
+class TestRpcCallRetries:
+    @pytest.mark.asyncio
+    async def test_server_error_retried_for_idempotent_method(
+        self, auth, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(status_code=503)
+        httpx_mock.add_response(status_code=500)
+        httpx_mock.add_response(text=build_rpc_response(RPCMethod.LIST_NOTEBOOKS, [1]))
+
+        core = ClientCore(auth, retry_policy=RetryPolicy(base_delay=0))
+        await core.open()
+        try:
+            assert await core.rpc_call(RPCMethod.LIST_NOTEBOOKS, []) == [1]
+        finally:
+            await core.close()
+        assert len(httpx_mock.get_requests()) == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, auth, httpx_mock: HTTPXMock):
+        for _ in range(2):
+            httpx_mock.add_response(status_code=500)
+
+        policy = RetryPolicy(max_attempts={ServerError: 2}, base_delay=0)
+        core = ClientCore(auth, retry_policy=policy)
+        await core.open()
+        try:
+            with pytest.raises(ServerError):
+                await core.rpc_call(RPCMethod.LIST_NOTEBOOKS, [])
+        finally:
+            await core.close()
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_create_artifact_not_replayed_after_server_error(
+        self, auth, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(status_code=500)
+
+        core = ClientCore(auth, retry_policy=RetryPolicy(base_delay=0))
+        await core.open()
+        try:
+            with pytest.raises(ServerError):
+                await core.rpc_call(RPCMethod.CREATE_ARTIFACT, [])
+        finally:
+            await core.close()
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_create_artifact_retried_after_rate_limit(
+        self, auth, build_rpc_response, httpx_mock: HTTPXMock
+    ):
+        httpx_mock.add_response(status_code=429)
+        httpx_mock.add_response(text=build_rpc_response(RPCMethod.CREATE_ARTIFACT, ["task"]))
+
+        core = ClientCore(auth, retry_policy=RetryPolicy(base_delay=0))
+        await core.open()
+        try:
+            assert await core.rpc_call(RPCMethod.CREATE_ARTIFACT, []) == ["task"]
+        finally:
+            await core.close()
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_policy_keeps_single_attempt(self, auth, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=503)
+
+        core = ClientCore(auth)
+        await core.open()
+        try:
+            with pytest.raises(ServerError):
+                await core.rpc_call(RPCMethod.LIST_NOTEBOOKS, [])
+        finally:
+            await core.close()
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_client_passes_policy_to_core(self, auth):
+        policy = RetryPolicy()
+        client = NotebookLMClient(auth, retry_policy=policy)
+        assert client._core._retry_policy is policy
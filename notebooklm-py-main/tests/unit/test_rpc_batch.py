@@ -0,0 +1,287 @@
+"""Tests for multiplexed batchexecute calls (rpc_batch / batch collector)."""
+
+import json
+from urllib.parse import parse_qs, unquote, urlparse
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notebooklm import ResponseCache, RetryPolicy
+from notebooklm._core import ClientCore, RPCCall
+from notebooklm.rpc import (
+    RateLimitError,
+    RPCError,
+    RPCMethod,
+    ServerError,
+    encode_rpc_batch,
+    extract_batch_results,
+)
+
+
+def _wrb(rpc_id: str, data, tag: str | None = None) -> list:
+    item = ["wrb.fr", rpc_id, json.dumps(data), None, None, None]
+    if tag is not None:
+        item.append(tag)
+    return item
+
+
+def _response(*items: list) -> str:
+    body = ")]}'\n"
+    for item in items:
+        chunk = json.dumps([item])
+        body += f"{len(chunk)}\n{chunk}\n"
+    return body
+
+
+class TestEncodeRpcBatch:
+    def test_tags_each_call_with_position(self):
+        result = encode_rpc_batch(
+            [
+                (RPCMethod.GET_NOTEBOOK, ["nb1"]),
+                (RPCMethod.LIST_ARTIFACTS, [[2], "nb1"]),
+            ]
+        )
+
+        assert len(result) == 1
+        inners = result[0]
+        assert [i[0] for i in inners] == [
+            RPCMethod.GET_NOTEBOOK.value,
+            RPCMethod.LIST_ARTIFACTS.value,
+        ]
+        assert [i[3] for i in inners] == ["1", "2"]
+        assert json.loads(inners[1][1]) == [[2], "nb1"]
+
+
+class TestExtractBatchResults:
+    def test_routes_by_tag(self):
+        chunks = [
+            [_wrb("bbb", {"b": 1}, "2")],
+            [_wrb("aaa", {"a": 1}, "1")],
+        ]
+        results = extract_batch_results(chunks, [("aaa", "1"), ("bbb", "2")])
+        assert results == [{"a": 1}, {"b": 1}]
+
+    def test_duplicate_rpc_ids_resolved_by_tag(self):
+        chunks = [[_wrb("gArtLc", "second", "2"), _wrb("gArtLc", "first", "1")]]
+        results = extract_batch_results(chunks, [("gArtLc", "1"), ("gArtLc", "2")])
+        assert results == ["first", "second"]
+
+    def test_untagged_entries_fall_back_to_request_order(self):
+        chunks = [[_wrb("aaa", 1), _wrb("aaa", 2)]]
+        results = extract_batch_results(chunks, [("aaa", "1"), ("aaa", "2")])
+        assert results == [1, 2]
+
+    def test_errors_returned_in_place(self):
+        chunks = [[["er", "bbb", 404, None, None, None, "2"], _wrb("aaa", [1], "1")]]
+        results = extract_batch_results(chunks, [("aaa", "1"), ("bbb", "2")])
+        assert results[0] == [1]
+        assert isinstance(results[1], RPCError)
+        assert results[1].code == 404
+
+    def test_user_displayable_error_returned_as_rate_limit(self):
+        item = ["wrb.fr", "aaa", None, None, None, [8, None, ["UserDisplayableError"]], "1"]
+        results = extract_batch_results([[item]], [("aaa", "1")])
+        assert isinstance(results[0], RateLimitError)
+
+    def test_missing_entry_is_none(self):
+        results = extract_batch_results([[_wrb("aaa", 1, "1")]], [("aaa", "1"), ("bbb", "2")])
+        assert results == [1, None]
+
+
+class TestRpcBatch:
+    @pytest.mark.asyncio
+    async def test_sends_one_request_with_joined_rpcids(self, core, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            text=_response(
+                _wrb(RPCMethod.GET_NOTEBOOK.value, ["notebook"], "1"),
+                _wrb(RPCMethod.GET_NOTES_AND_MIND_MAPS.value, ["notes"], "2"),
+            )
+        )
+        notebook, notes = await core.rpc_batch(
+            [
+                RPCCall(RPCMethod.GET_NOTEBOOK, ["nb1"]),
+                (RPCMethod.GET_NOTES_AND_MIND_MAPS, ["nb1"]),
+            ],
+            source_path="/notebook/nb1",
+        )
+
+        assert notebook == ["notebook"]
+        assert notes == ["notes"]
+
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 1
+        query = parse_qs(urlparse(str(requests[0].url)).query)
+        assert query["rpcids"] == [
+            f"{RPCMethod.GET_NOTEBOOK.value},{RPCMethod.GET_NOTES_AND_MIND_MAPS.value}"
+        ]
+        assert query["source-path"] == ["/notebook/nb1"]
+        f_req = unquote(requests[0].content.decode().split("f.req=")[1].split("&")[0])
+        assert len(json.loads(f_req)[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_per_call_error_raised_by_default(self, core, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            text=_response(
+                _wrb(RPCMethod.GET_NOTEBOOK.value, [1], "1"),
+                ["er", RPCMethod.LIST_ARTIFACTS.value, 500, None, None, None, "2"],
+            )
+        )
+        with pytest.raises(RPCError) as exc_info:
+            await core.rpc_batch([(RPCMethod.GET_NOTEBOOK, []), (RPCMethod.LIST_ARTIFACTS, [])])
+
+        assert exc_info.value.rpc_id == RPCMethod.LIST_ARTIFACTS.value
+
+    @pytest.mark.asyncio
+    async def test_return_exceptions_keeps_other_results(self, core, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(text=_response(_wrb(RPCMethod.GET_NOTEBOOK.value, [1], "1")))
+        results = await core.rpc_batch(
+            [
+                RPCCall(RPCMethod.GET_NOTEBOOK, []),
+                RPCCall(RPCMethod.LIST_ARTIFACTS, []),
+                RPCCall(RPCMethod.GET_NOTES_AND_MIND_MAPS, [], allow_null=True),
+            ],
+            return_exceptions=True,
+        )
+
+        assert results[0] == [1]
+        assert isinstance(results[1], RPCError)
+        assert "No result found" in str(results[1])
+        assert results[1].found_ids == [RPCMethod.GET_NOTEBOOK.value]
+        assert results[2] is None
+
+    @pytest.mark.asyncio
+    async def test_single_call_uses_plain_envelope(self, core, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(text=_response(_wrb(RPCMethod.LIST_NOTEBOOKS.value, [1])))
+        assert await core.rpc_batch([(RPCMethod.LIST_NOTEBOOKS, [])]) == [[1]]
+
+        f_req = unquote(httpx_mock.get_request().content.decode().split("f.req=")[1])
+        assert '"generic"' in f_req
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_makes_no_request(self, core):
+        assert await core.rpc_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_auth_error_refreshes_and_retries_batch(self, auth, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=401)
+        httpx_mock.add_response(
+            text=_response(_wrb("wXbhsf", [1], "1"), _wrb(RPCMethod.GET_NOTEBOOK.value, [2], "2"))
+        )
+        refreshes = []
+
+        async def refresh():
+            refreshes.append(True)
+            return auth
+
+        core = ClientCore(auth, refresh_callback=refresh, refresh_retry_delay=0)
+        await core.open()
+        try:
+            results = await core.rpc_batch(
+                [(RPCMethod.LIST_NOTEBOOKS, []), (RPCMethod.GET_NOTEBOOK, [])]
+            )
+        finally:
+            await core.close()
+
+        assert results == [[1], [2]]
+        assert len(refreshes) == 1
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates_cached_reads(self, auth, httpx_mock: HTTPXMock):
+        get, path = RPCMethod.GET_NOTEBOOK, "/notebook/nb1"
+        httpx_mock.add_response(text=_response(_wrb(get.value, ["old"])))
+        httpx_mock.add_response(
+            text=_response(
+                _wrb(RPCMethod.RENAME_NOTEBOOK.value, None, "1"),
+                _wrb(RPCMethod.LIST_ARTIFACTS.value, [], "2"),
+            )
+        )
+        httpx_mock.add_response(text=_response(_wrb(get.value, ["new"])))
+        cache = ResponseCache()
+        core = ClientCore(auth, response_cache=cache)
+        await core.open()
+        try:
+            assert await core.rpc_call(get, ["nb1"], path) == ["old"]
+            await core.rpc_batch(
+                [
+                    RPCCall(RPCMethod.RENAME_NOTEBOOK, ["nb1", "New"], allow_null=True),
+                    RPCCall(RPCMethod.LIST_ARTIFACTS, ["nb1"]),
+                ],
+                source_path=path,
+            )
+            assert await core.rpc_call(get, ["nb1"], path) == ["new"]
+        finally:
+            await core.close()
+
+        assert cache.invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_policy_retries_batch_of_safe_calls(self, auth, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=503)
+        httpx_mock.add_response(
+            text=_response(_wrb("wXbhsf", [1], "1"), _wrb(RPCMethod.GET_NOTEBOOK.value, [2], "2"))
+        )
+        core = ClientCore(auth, retry_policy=RetryPolicy(base_delay=0))
+        await core.open()
+        try:
+            results = await core.rpc_batch(
+                [(RPCMethod.LIST_NOTEBOOKS, []), (RPCMethod.GET_NOTEBOOK, [])]
+            )
+        finally:
+            await core.close()
+
+        assert results == [[1], [2]]
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_policy_skips_batch_with_unsafe_call(self, auth, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=503)
+        core = ClientCore(auth, retry_policy=RetryPolicy(base_delay=0))
+        await core.open()
+        try:
+            with pytest.raises(ServerError):
+                await core.rpc_batch(
+                    [(RPCMethod.CREATE_NOTEBOOK, ["Title"]), (RPCMethod.LIST_NOTEBOOKS, [])]
+                )
+        finally:
+            await core.close()
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_not_initialized_raises(self, auth):
+        core = ClientCore(auth)
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await core.rpc_batch([(RPCMethod.LIST_NOTEBOOKS, [])])
+
+
+class TestBatchCollector:
+    @pytest.mark.asyncio
+    async def test_collects_and_resolves_on_exit(self, core, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            text=_response(
+                _wrb(RPCMethod.GET_NOTEBOOK.value, ["nb"], "1"),
+                ["er", RPCMethod.LIST_ARTIFACTS.value, 404, None, None, None, "2"],
+            )
+        )
+        async with core.batch(source_path="/notebook/nb1") as batch:
+            notebook = batch.add(RPCMethod.GET_NOTEBOOK, ["nb1"])
+            artifacts = batch.add(RPCMethod.LIST_ARTIFACTS, [[2], "nb1"])
+            assert not notebook.done
+            with pytest.raises(RuntimeError, match="not been sent"):
+                notebook.result()
+
+        assert notebook.result() == ["nb"]
+        assert artifacts.done
+        with pytest.raises(RPCError):
+            artifacts.result()
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_exception_in_block_sends_nothing(self, core):
+        with pytest.raises(ValueError):
+            async with core.batch() as batch:
+                handle = batch.add(RPCMethod.LIST_NOTEBOOKS, [])
+                raise ValueError("abort")
+
+        assert not handle.done
@@ -1,19 +1,34 @@
 """Unit tests for SourcesAPI file upload pipeline and YouTube detection."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from contextlib import nullcontext
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from notebooklm import RequestMetrics
 from notebooklm._sources import SourcesAPI
 
 
 @pytest.fixture
 def mock_core():
-    """Create a mocked ClientCore for SourcesAPI."""
+    """Create a mocked ClientCore for SourcesAPI.
+
+    Upload requests are measured into ``core.measured``.
+    """
     core = MagicMock()
     core.rpc_call = AsyncMock()
     core.auth = MagicMock()
     core.auth.cookie_header = "SID=test_sid; HSID=test_hsid"
+    core.get_upload_client = MagicMock(return_value=AsyncMock())
+    core.measured = []
+
+    def measure(method, source_path="/", request_body=None, request_bytes=None):
+        metrics = RequestMetrics(method, source_path, request_bytes=request_bytes or 0)
+        core.measured.append(metrics)
+        return nullcontext(metrics)
+
+    core.measure.side_effect = measure
+    core.throttle.side_effect = lambda *args: nullcontext()
     return core
 
 
@@ -162,16 +177,10 @@ class TestStartResumableUpload:
         mock_response = MagicMock()
         mock_response.headers = {"x-goog-upload-url": "https://upload.example.com/session123"}
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.return_value = mock_response
 
-            result = await sources_api._start_resumable_upload(
-                "nb_123", "test.pdf", 1024, "src_456"
-            )
+        result = await sources_api._start_resumable_upload("nb_123", "test.pdf", 1024, "src_456")
 
         assert result == "https://upload.example.com/session123"
 
@@ -181,22 +190,18 @@ class TestStartResumableUpload:
         mock_response = MagicMock()
         mock_response.headers = {"x-goog-upload-url": "https://upload.example.com"}
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.return_value = mock_response
 
-            await sources_api._start_resumable_upload("nb_123", "test.pdf", 2048, "src_789")
+        await sources_api._start_resumable_upload("nb_123", "test.pdf", 2048, "src_789")
 
-            call_kwargs = mock_client.post.call_args[1]
-            headers = call_kwargs["headers"]
+        call_kwargs = mock_client.post.call_args[1]
+        headers = call_kwargs["headers"]
 
-            assert headers["x-goog-upload-command"] == "start"
-            assert headers["x-goog-upload-header-content-length"] == "2048"
-            assert headers["x-goog-upload-protocol"] == "resumable"
-            assert "Cookie" in headers
+        assert headers["x-goog-upload-command"] == "start"
+        assert headers["x-goog-upload-header-content-length"] == "2048"
+        assert headers["x-goog-upload-protocol"] == "resumable"
+        assert "Cookie" in headers
 
     @pytest.mark.asyncio
     async def test_start_resumable_upload_includes_json_body(self, sources_api, mock_core):
@@ -206,21 +211,17 @@ class TestStartResumableUpload:
         mock_response = MagicMock()
         mock_response.headers = {"x-goog-upload-url": "https://upload.example.com"}
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.return_value = mock_response
 
-            await sources_api._start_resumable_upload("nb_test", "myfile.pdf", 1000, "src_abc")
+        await sources_api._start_resumable_upload("nb_test", "myfile.pdf", 1000, "src_abc")
 
-            call_kwargs = mock_client.post.call_args[1]
-            body = json.loads(call_kwargs["content"])
+        call_kwargs = mock_client.post.call_args[1]
+        body = json.loads(call_kwargs["content"])
 
-            assert body["PROJECT_ID"] == "nb_test"
-            assert body["SOURCE_NAME"] == "myfile.pdf"
-            assert body["SOURCE_ID"] == "src_abc"
+        assert body["PROJECT_ID"] == "nb_test"
+        assert body["SOURCE_NAME"] == "myfile.pdf"
+        assert body["SOURCE_ID"] == "src_abc"
 
     @pytest.mark.asyncio
     async def test_start_resumable_upload_raises_on_missing_url_header(
@@ -230,32 +231,24 @@ class TestStartResumableUpload:
         mock_response = MagicMock()
         mock_response.headers = {}  # No x-goog-upload-url
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.return_value = mock_response
 
-            with pytest.raises(ValueError, match="Failed to get upload URL"):
-                await sources_api._start_resumable_upload("nb_123", "test.pdf", 1024, "src_456")
+        with pytest.raises(ValueError, match="Failed to get upload URL"):
+            await sources_api._start_resumable_upload("nb_123", "test.pdf", 1024, "src_456")
 
     @pytest.mark.asyncio
     async def test_start_resumable_upload_raises_on_http_error(self, sources_api, mock_core):
         """Test that HTTP error raises exception."""
         import httpx
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.side_effect = httpx.HTTPStatusError(
-                "Server Error", request=MagicMock(), response=MagicMock()
-            )
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.side_effect = httpx.HTTPStatusError(
+            "Server Error", request=MagicMock(), response=MagicMock()
+        )
 
-            with pytest.raises(httpx.HTTPStatusError):
-                await sources_api._start_resumable_upload("nb_123", "test.pdf", 1024, "src_456")
+        with pytest.raises(httpx.HTTPStatusError):
+            await sources_api._start_resumable_upload("nb_123", "test.pdf", 1024, "src_456")
 
 
 # =============================================================================
@@ -273,19 +266,13 @@ class TestUploadFileStreaming:
         test_file.write_bytes(b"file content here")
         mock_response = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.return_value = mock_response
 
-            # Should not raise
-            await sources_api._upload_file_streaming(
-                "https://upload.example.com/session", test_file
-            )
+        # Should not raise
+        await sources_api._upload_file_streaming("https://upload.example.com/session", test_file)
 
-            mock_client.post.assert_called_once()
+        mock_client.post.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_upload_file_streaming_includes_correct_headers(
@@ -296,23 +283,17 @@ class TestUploadFileStreaming:
         test_file.write_bytes(b"content")
         mock_response = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.return_value = mock_response
 
-            await sources_api._upload_file_streaming(
-                "https://upload.example.com/session", test_file
-            )
+        await sources_api._upload_file_streaming("https://upload.example.com/session", test_file)
 
-            call_kwargs = mock_client.post.call_args[1]
-            headers = call_kwargs["headers"]
+        call_kwargs = mock_client.post.call_args[1]
+        headers = call_kwargs["headers"]
 
-            assert headers["x-goog-upload-command"] == "upload, finalize"
-            assert headers["x-goog-upload-offset"] == "0"
-            assert "Cookie" in headers
+        assert headers["x-goog-upload-command"] == "upload, finalize"
+        assert headers["x-goog-upload-offset"] == "0"
+        assert "Cookie" in headers
 
     @pytest.mark.asyncio
     async def test_upload_file_streaming_uses_generator(self, sources_api, mock_core, tmp_path):
@@ -322,21 +303,17 @@ class TestUploadFileStreaming:
         test_file.write_bytes(test_content)
         mock_response = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.return_value = mock_response
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.return_value = mock_response
 
-            await sources_api._upload_file_streaming("https://upload.example.com", test_file)
+        await sources_api._upload_file_streaming("https://upload.example.com", test_file)
 
-            call_kwargs = mock_client.post.call_args[1]
-            # Content should be a generator, not bytes
-            content = call_kwargs["content"]
-            # Consume the generator to verify it yields the file content
-            chunks = [chunk async for chunk in content]
-            assert b"".join(chunks) == test_content
+        call_kwargs = mock_client.post.call_args[1]
+        # Content should be a generator, not bytes
+        content = call_kwargs["content"]
+        # Consume the generator to verify it yields the file content
+        chunks = [chunk async for chunk in content]
+        assert b"".join(chunks) == test_content
 
     @pytest.mark.asyncio
     async def test_upload_file_streaming_raises_on_http_error(
@@ -348,17 +325,13 @@ class TestUploadFileStreaming:
         test_file = tmp_path / "test.txt"
         test_file.write_bytes(b"content")
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.side_effect = httpx.HTTPStatusError(
-                "Upload Failed", request=MagicMock(), response=MagicMock()
-            )
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.side_effect = httpx.HTTPStatusError(
+            "Upload Failed", request=MagicMock(), response=MagicMock()
+        )
 
-            with pytest.raises(httpx.HTTPStatusError):
-                await sources_api._upload_file_streaming("https://upload.example.com", test_file)
+        with pytest.raises(httpx.HTTPStatusError):
+            await sources_api._upload_file_streaming("https://upload.example.com", test_file)
 
 
 # =============================================================================
@@ -385,19 +358,22 @@ class TestAddFile:
 
         mock_upload_response = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.side_effect = [mock_start_response, mock_upload_response]
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.side_effect = [mock_start_response, mock_upload_response]
 
-            result = await sources_api.add_file("nb_123", str(test_file))
+        result = await sources_api.add_file("nb_123", str(test_file))
 
         assert result.id == "src_new_123"
         assert result.title == "test.pdf"
         assert result.source_type == "upload"
 
+        start, upload = mock_core.measured
+        assert (start.method, start.source_path) == ("upload", "/notebook/nb_123")
+        assert start.response is mock_start_response
+        assert upload.method == "upload"
+        assert upload.request_bytes == len(b"fake pdf content")
+        assert upload.response is mock_upload_response
+
     @pytest.mark.asyncio
     async def test_add_file_raises_file_not_found(self, sources_api, mock_core):
         """Test that non-existent file raises FileNotFoundError."""
@@ -416,17 +392,17 @@ class TestAddFile:
         mock_start_response.headers = {"x-goog-upload-url": "https://upload.example.com"}
         mock_upload_response = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.post.side_effect = [mock_start_response, mock_upload_response]
-            mock_client_cls.return_value = mock_client
+        mock_client = mock_core.get_upload_client.return_value
+        mock_client.post.side_effect = [mock_start_response, mock_upload_response]
 
-            result = await sources_api.add_file("nb_123", test_file)  # Path object
+        result = await sources_api.add_file("nb_123", test_file)  # Path object
 
         assert result.id == "src_txt"
         assert result.title == "doc.txt"
+        assert [m.response for m in mock_core.measured] == [
+            mock_start_response,
+            mock_upload_response,
+        ]
 
 
 # =============================================================================
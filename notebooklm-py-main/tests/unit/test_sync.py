@@ -0,0 +1,102 @@
+"""Tests for the blocking SyncNotebookLMClient facade."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from notebooklm import SyncNotebookLMClient
+from notebooklm.rpc import RPCError, RPCMethod
+
+
+def _loop_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "notebooklm-sync"]
+
+
+class TestSyncNotebookLMClient:
+    def test_blocking_calls_share_one_client(self, auth, build_rpc_response, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            text=build_rpc_response(RPCMethod.LIST_NOTEBOOKS, [[["Title", None, "nb_1"]]]),
+            is_reusable=True,
+        )
+
+        with SyncNotebookLMClient(auth) as client:
+            assert client.is_connected
+            http_client = client._client._core._http_client
+            first = client.notebooks.list()
+            second = client.notebooks.list()
+            assert client._client._core._http_client is http_client
+
+        assert [nb.id for nb in first] == [nb.id for nb in second] == ["nb_1"]
+        assert not client.is_connected
+
+    def test_close_stops_loop_thread(self, auth):
+        before = len(_loop_threads())
+        client = SyncNotebookLMClient(auth)
+        assert len(_loop_threads()) == before + 1
+
+        client.close()
+        client.close()  # idempotent
+
+        assert len(_loop_threads()) == before
+        assert client._runner.loop.is_closed()
+
+    def test_errors_propagate(self, auth, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=400)
+
+        with SyncNotebookLMClient(auth) as client, pytest.raises(RPCError):
+            client.notebooks.rename("nb_1", "New title")
+
+    def test_concurrent_threads(self, auth, build_rpc_response, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            text=build_rpc_response(RPCMethod.LIST_NOTEBOOKS, []),
+            is_reusable=True,
+        )
+
+        with SyncNotebookLMClient(auth) as client, ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(lambda _: client.notebooks.list(), range(8)))
+
+        assert results == [[]] * 8
+
+    def test_sub_api_exposes_async_methods_as_blocking(self, auth):
+        with SyncNotebookLMClient(auth) as client:
+            assert client.chat.ask.__name__ == "ask"
+            assert "ask" in dir(client.chat)
+            assert client.chat.get_cached_turns("c") == []
+
+    def test_async_iterator_returns_list(self, auth, build_rpc_response, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            text=build_rpc_response(
+                RPCMethod.LIST_ARTIFACTS.value,
+                [[["task_1", "Report", 2, None, 3], ["task_2", "Report", 2, None, 3]]],
+            ),
+        )
+
+        with SyncNotebookLMClient(auth) as client:
+            statuses = client.artifacts.wait_for_many("nb_1", ["task_1", "task_2"])
+
+        assert [(s.task_id, s.status) for s in statuses] == [
+            ("task_1", "completed"),
+            ("task_2", "completed"),
+        ]
+
+    def test_reentrant_call_rejected(self, auth):
+        with SyncNotebookLMClient(auth) as client:
+
+            async def call_back_in():
+                client.refresh_auth()
+
+            with pytest.raises(RuntimeError, match="own event loop"):
+                client._runner.run(call_back_in())
+
+    def test_from_storage(self, auth):
+        async def fake_from_storage(path):
+            assert path is None
+            return auth
+
+        with patch("notebooklm._sync.AuthTokens.from_storage", side_effect=fake_from_storage):
+            client = SyncNotebookLMClient.from_storage(timeout=5)
+        with client:
+            assert client.auth is auth
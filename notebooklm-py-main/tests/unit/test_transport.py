@@ -0,0 +1,156 @@
+"""Tests for the pooled transport and connection-reuse stats."""
+
+import asyncio
+import importlib.util
+
+import httpx
+import pytest
+
+from notebooklm import ConnectionStats, NotebookLMClient
+from notebooklm._core import ClientCore
+from notebooklm._transport import DEFAULT_LIMITS, PooledTransport
+from notebooklm.auth import AuthTokens, fetch_tokens
+from notebooklm.rpc import RPCMethod
+
+
+@pytest.fixture
+async def keepalive_server(build_rpc_response):
+    """Minimal HTTP/1.1 keep-alive server answering every POST with a LIST_NOTEBOOKS result."""
+    connections = 0
+    body = build_rpc_response(RPCMethod.LIST_NOTEBOOKS, [1]).encode()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        nonlocal connections
+        connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+                await asyncio.sleep(0.005)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", lambda: connections
+    server.close()
+    await server.wait_closed()
+
+
+class TestConnectionStats:
+    def test_reuse_ratio(self):
+        assert ConnectionStats().reuse_ratio == 0.0
+        assert ConnectionStats(new_connections=1, reused_connections=3).reuse_ratio == 0.75
+
+
+class TestPooledTransport:
+    @pytest.mark.asyncio
+    async def test_sequential_requests_share_connection(self, keepalive_server):
+        url, connections = keepalive_server
+        transport = PooledTransport()
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(5):
+                (await client.post(url, content=b"x")).raise_for_status()
+
+        assert transport.stats.requests == 5
+        assert transport.stats.new_connections == 1
+        assert transport.stats.reused_connections == 4
+        assert connections() == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_polls_bounded_by_pool(self, keepalive_server, monkeypatch):
+        url, connections = keepalive_server
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+        core = ClientCore(
+            AuthTokens(cookies={"SID": "x"}, csrf_token="c", session_id="s"),
+            limits=limits,
+            coalesce_reads=False,
+        )
+        monkeypatch.setattr(core, "_build_url", lambda method, source_path="/": url)
+        await core.open()
+        try:
+            for _ in range(3):
+                await asyncio.gather(
+                    *(core.rpc_call(RPCMethod.LIST_NOTEBOOKS, []) for _ in range(8))
+                )
+        finally:
+            await core.close()
+
+        stats = core.connection_stats
+        assert stats.requests == 24
+        assert stats.new_connections == connections() <= 4
+        assert stats.reused_connections == 24 - connections()
+
+
+class TestClientOptions:
+    def test_defaults(self, auth):
+        core = ClientCore(auth)
+        assert core._limits == DEFAULT_LIMITS
+        assert core._http2 is False
+        assert core.connection_stats == ConnectionStats()
+
+    @pytest.mark.asyncio
+    async def test_client_passes_pool_options(self, auth):
+        limits = httpx.Limits(max_connections=7, keepalive_expiry=90)
+        client = NotebookLMClient(auth, limits=limits)
+        async with client:
+            pool = client._core._transport._pool
+            assert pool._max_connections == 7
+            assert pool._keepalive_expiry == 90
+        assert client.connection_stats.requests == 0
+
+    @pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 installed")
+    @pytest.mark.asyncio
+    async def test_http2_requires_h2(self, auth):
+        with pytest.raises(ImportError, match="h2"):
+            await ClientCore(auth, http2=True).open()
+
+
+class TestSharedClients:
+    @pytest.mark.asyncio
+    async def test_upload_and_download_clients_reused_until_close(self, auth, monkeypatch):
+        loads = []
+        monkeypatch.setattr(
+            "notebooklm._core.load_httpx_cookies", lambda: loads.append(1) or httpx.Cookies()
+        )
+        core = ClientCore(auth)
+        with pytest.raises(RuntimeError):
+            core.get_upload_client()
+
+        await core.open()
+        upload = core.get_upload_client()
+        download = core.get_download_client()
+        assert core.get_upload_client() is upload
+        assert core.get_download_client() is download
+        assert upload is not download is not core.get_http_client()
+        assert download.follow_redirects
+        assert len(loads) == 1
+
+        await core.close()
+        assert upload.is_closed and download.is_closed
+        assert core._upload_client is None and core._download_client is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_tokens_reuses_given_client(self, keepalive_server, monkeypatch):
+        url, connections = keepalive_server
+        monkeypatch.setenv("NOTEBOOKLM_HOMEPAGE_URL", url)
+        transport = PooledTransport()
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.post(url, content=b"warm up")
+            with pytest.raises(ValueError):  # the test server returns no tokens
+                await fetch_tokens({"SID": "x"}, client=client)
+
+        assert transport.stats.reused_connections == 1
+        assert connections() == 1